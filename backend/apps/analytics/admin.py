@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import ExerciseSessionSnapshot
+from .models import ExerciseSessionSnapshot, WorkoutAdherenceRollup
 
 
 @admin.register(ExerciseSessionSnapshot)
@@ -37,3 +37,39 @@ class ExerciseSessionSnapshotAdmin(admin.ModelAdmin):
         "weight_ceiling",
         "computed_at",
     )
+
+
+@admin.register(WorkoutAdherenceRollup)
+class WorkoutAdherenceRollupAdmin(admin.ModelAdmin):
+    """Admin interface for the WorkoutAdherenceRollup model.
+
+    Rollups are derived from workouts and sessions by the adherence service,
+    so every count is read-only here.
+    """
+
+    list_display = (
+        "client",
+        "program",
+        "program_phase",
+        "iso_year",
+        "iso_week",
+        "planned_count",
+        "completed_count",
+        "skipped_count",
+        "missed_count",
+        "in_progress_count",
+        "as_of",
+    )
+
+    list_filter = ("iso_year", "program")
+
+    search_fields = ("client__email", "program__program_name")
+
+    readonly_fields = (
+        "planned_count",
+        "completed_count",
+        "skipped_count",
+        "missed_count",
+        "in_progress_count",
+        "as_of",
+    )
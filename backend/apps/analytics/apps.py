@@ -10,3 +10,12 @@ class AnalyticsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.analytics"
+
+    def ready(self):
+        """Initializes the application once it is fully loaded.
+
+        Imports signal handlers so adherence rollups follow workout and
+        session writes.
+        """
+        # noqa Exception. Needs import but not used.
+        import apps.analytics.signals  # noqa: F401
@@ -0,0 +1,52 @@
+import django_filters
+
+from .models import ExerciseSessionSnapshot, WorkoutAdherenceRollup
+
+
+class WorkoutAdherenceRollupFilter(django_filters.FilterSet):
+    """Filter set for WorkoutAdherenceRollup rows behind the adherence endpoint.
+
+    Attributes:
+        client: A UUID filter for the client user.
+        program: A UUID filter for the program.
+        program_phase: A UUID filter for the phase.
+        week_from: Earliest week start to include (inclusive).
+        week_to: Latest week start to include (inclusive).
+    """
+
+    client = django_filters.UUIDFilter(field_name="client")
+    program = django_filters.UUIDFilter(field_name="program")
+    program_phase = django_filters.UUIDFilter(field_name="program_phase")
+    week_from = django_filters.DateFilter(field_name="week_start", lookup_expr="gte")
+    week_to = django_filters.DateFilter(field_name="week_start", lookup_expr="lte")
+
+    class Meta:
+        """Metadata options for WorkoutAdherenceRollupFilter."""
+
+        model = WorkoutAdherenceRollup
+        fields = ["client", "program", "program_phase", "week_from", "week_to"]
+
+
+class ExerciseSessionSnapshotFilter(django_filters.FilterSet):
+    """Filter set for the snapshots behind the load history endpoint.
+
+    The bounds filter on computed_at, the table's partition column, so on
+    PostgreSQL only the matching months are scanned (see core.partitioning).
+
+    Attributes:
+        computed_from: Earliest computation timestamp to include (inclusive).
+        computed_to: Latest computation timestamp to include (inclusive).
+    """
+
+    computed_from = django_filters.IsoDateTimeFilter(
+        field_name="computed_at", lookup_expr="gte"
+    )
+    computed_to = django_filters.IsoDateTimeFilter(
+        field_name="computed_at", lookup_expr="lte"
+    )
+
+    class Meta:
+        """Metadata options for ExerciseSessionSnapshotFilter."""
+
+        model = ExerciseSessionSnapshot
+        fields = ["computed_from", "computed_to"]
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from apps.analytics.models import WorkoutAdherenceRollup
+from apps.analytics.services.adherence import (
+    rebuild_all_adherence,
+    refresh_stale_adherence,
+)
+from core.caching import invalidate_shared_tags
+from core.constants import CacheTagVocabulary
+
+
+class Command(BaseCommand):
+    """Django management command to rebuild the workout adherence rollups.
+
+    Rollups are kept current by signals when workouts and sessions change.
+    This command recomputes every phase, for example after a deploy or bulk
+    import. With --stale it only recomputes the weeks whose missed counts
+    changed because a day has passed; it runs daily as a cron job.
+    """
+
+    help = "Rebuilds the per-phase, per-ISO-week workout adherence rollups"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="Only recompute weeks whose missed counts changed since computed.",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuilds the WorkoutAdherenceRollup table, or its stale weeks.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+        """
+        if options["stale"]:
+            weeks = refresh_stale_adherence(WorkoutAdherenceRollup.objects.all())
+            message = f"Stale adherence weeks refreshed: {weeks}"
+        else:
+            weeks = rebuild_all_adherence()
+            message = f"Adherence rollups rebuilt. Rows: {weeks}"
+
+        # Bulk writes send no signals, and this may run in another service
+        # than the API, so the cached responses are invalidated through the
+        # database.
+        if weeks:
+            invalidate_shared_tags(CacheTagVocabulary.ADHERENCE)
+        self.stdout.write(self.style.SUCCESS(message))
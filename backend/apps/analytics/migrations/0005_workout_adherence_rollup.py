@@ -0,0 +1,87 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:50
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0004_initial"),
+        ("programs", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkoutAdherenceRollup",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("week_start", models.DateField()),
+                ("iso_year", models.PositiveSmallIntegerField()),
+                ("iso_week", models.PositiveSmallIntegerField()),
+                ("planned_count", models.PositiveIntegerField(default=0)),
+                ("completed_count", models.PositiveIntegerField(default=0)),
+                ("skipped_count", models.PositiveIntegerField(default=0)),
+                ("missed_count", models.PositiveIntegerField(default=0)),
+                ("in_progress_count", models.PositiveIntegerField(default=0)),
+                ("as_of", models.DateField()),
+                (
+                    "client",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adherence_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "program",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adherence_rollups",
+                        to="programs.program",
+                    ),
+                ),
+                (
+                    "program_phase",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adherence_rollups",
+                        to="programs.programphase",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["week_start", "program_phase"],
+                "indexes": [
+                    models.Index(
+                        fields=["client", "week_start"],
+                        name="analytics_w_client__542e90_idx",
+                    ),
+                    models.Index(
+                        fields=["program", "week_start"],
+                        name="analytics_w_program_5a50a3_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("program_phase", "week_start"),
+                        name="unique_adherence_rollup_per_phase_week",
+                    )
+                ],
+            },
+        ),
+    ]
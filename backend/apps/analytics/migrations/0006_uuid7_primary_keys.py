@@ -0,0 +1,35 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:01
+
+from django.db import migrations, models
+
+import core.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0005_workout_adherence_rollup"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exercisesessionsnapshot",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workoutadherencerollup",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.11 on 2026-10-19 02:01
+
+from django.conf import settings
+from django.db import migrations
+
+from core.partitioning import partition_table, unpartition_table
+
+
+def partition_snapshots(apps, schema_editor):
+    # Opt-in and PostgreSQL-only; partition_table skips everything else.
+    partition_table(
+        schema_editor,
+        apps.get_model("analytics", "ExerciseSessionSnapshot"),
+        settings.PARTITION_MONTHS_AHEAD,
+    )
+
+
+def unpartition_snapshots(apps, schema_editor):
+    unpartition_table(
+        schema_editor, apps.get_model("analytics", "ExerciseSessionSnapshot")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0006_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_snapshots, unpartition_snapshots),
+    ]
@@ -1,10 +1,13 @@
+from django.contrib.auth import get_user_model
 from django.db import models
 
 from apps.exercises.models import Exercise
-from apps.programs.models import Program
+from apps.programs.models import Program, ProgramPhase
 from apps.workouts.models import WorkoutCompletionRecord
 from core.models import ApexModel
 
+User = get_user_model()
+
 
 class ExerciseSessionSnapshot(ApexModel):
     """Model representing a point-in-time analytical capture of an exercise session.
@@ -101,3 +104,82 @@ class ExerciseSessionSnapshot(ApexModel):
             f"in {self.program.program_name} "
             f"@ session {self.session_id}"
         )
+
+
+class WorkoutAdherenceRollup(ApexModel):
+    """Precomputed planned-vs-actual workout counts for one phase and ISO week.
+
+    Workouts are bucketed by the ISO week of their planned date. Outcomes
+    reflect the state of the workouts on the as_of date: a workout planned
+    before as_of without a session counts as missed. Rows are refreshed by
+    the adherence service whenever a session or workout changes, and rows
+    whose as_of date has fallen behind are recomputed when read.
+
+    Attributes:
+        client: The user the program was written for.
+        program: The program the phase belongs to.
+        program_phase: The phase the workouts belong to.
+        week_start: The Monday starting the ISO week.
+        iso_year: The ISO year of the week.
+        iso_week: The ISO week number.
+        planned_count: Workouts planned in the week.
+        completed_count: Workouts with a finished, non-skipped session.
+        skipped_count: Workouts the client skipped.
+        missed_count: Workouts planned before as_of with no session at all.
+        in_progress_count: Workouts with a session that is still open.
+        as_of: The date the counts were computed for.
+    """
+
+    client = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        related_name="adherence_rollups",
+    )
+
+    program = models.ForeignKey(
+        to=Program,
+        on_delete=models.CASCADE,
+        related_name="adherence_rollups",
+    )
+
+    program_phase = models.ForeignKey(
+        to=ProgramPhase,
+        on_delete=models.CASCADE,
+        related_name="adherence_rollups",
+    )
+
+    week_start = models.DateField()
+    iso_year = models.PositiveSmallIntegerField()
+    iso_week = models.PositiveSmallIntegerField()
+
+    planned_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    missed_count = models.PositiveIntegerField(default=0)
+    in_progress_count = models.PositiveIntegerField(default=0)
+
+    as_of = models.DateField()
+
+    class Meta:
+        """Metadata for the WorkoutAdherenceRollup model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["program_phase", "week_start"],
+                name="unique_adherence_rollup_per_phase_week",
+            )
+        ]
+        ordering = ["week_start", "program_phase"]
+        indexes = [
+            models.Index(fields=["client", "week_start"]),
+            models.Index(fields=["program", "week_start"]),
+        ]
+
+    def __str__(self):
+        """Returns a human-readable identifier for the rollup.
+
+        Returns:
+            str: The phase and ISO week the counts cover.
+        """
+        week = f"{self.iso_year}-W{self.iso_week:02d}"
+        return f"Adherence: {self.program_phase_id} @ {week}"
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.users.serializers import ImageVariantsField
+
 
 class MuscleLoadSerializer(serializers.Serializer):
     """Serializer for individual muscle load contributions.
@@ -80,3 +82,51 @@ class ExerciseSnapshotSerializer(serializers.Serializer):
     weight_ceiling = serializers.DecimalField(
         max_digits=6, decimal_places=2, allow_null=True
     )
+
+
+class TrainerRosterEntrySerializer(serializers.Serializer):
+    """Serializer for one client row of a trainer's roster.
+
+    Reads the metrics annotated by get_trainer_roster, so rendering a full
+    roster needs no queries beyond the roster query itself.
+    """
+
+    membership_id = serializers.UUIDField(source="id")
+    membership_started_at = serializers.DateTimeField(source="started_at")
+    client_profile_id = serializers.UUIDField(source="client.id")
+    client_user_id = serializers.UUIDField(source="client.user.id")
+    client_name = serializers.CharField(source="client.user.get_full_name")
+    client_email = serializers.EmailField(source="client.user.email")
+    client_avatar_variants = ImageVariantsField(image_field="avatar", source="client")
+    active_program_id = serializers.UUIDField(allow_null=True)
+    active_program_name = serializers.CharField(allow_null=True)
+    last_session_at = serializers.DateTimeField(allow_null=True)
+    sessions_this_week = serializers.IntegerField()
+    planned_to_date = serializers.IntegerField()
+    completed_to_date = serializers.IntegerField()
+    adherence = serializers.FloatField(allow_null=True)
+    adherence_rank = serializers.IntegerField()
+
+
+class AdherenceSummarySerializer(serializers.Serializer):
+    """Serializer for one group of planned-vs-actual workout outcomes.
+
+    Key fields are only present for the levels the results are grouped by;
+    coarser groupings omit the finer keys.
+    """
+
+    client_id = serializers.UUIDField()
+    program_id = serializers.UUIDField(required=False)
+    program_phase_id = serializers.UUIDField(required=False)
+    week_start = serializers.DateField(required=False)
+    iso_year = serializers.IntegerField(required=False)
+    iso_week = serializers.IntegerField(required=False)
+    planned = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    missed = serializers.IntegerField()
+    in_progress = serializers.IntegerField()
+    due = serializers.IntegerField()
+    completion_rate = serializers.FloatField(allow_null=True)
+    skip_rate = serializers.FloatField(allow_null=True)
+    miss_rate = serializers.FloatField(allow_null=True)
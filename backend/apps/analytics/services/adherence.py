@@ -0,0 +1,255 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, FloatField, Q, Sum, Value
+from django.db.models.functions import Cast, NullIf, Round, TruncWeek
+from django.utils import timezone
+
+from apps.analytics.models import WorkoutAdherenceRollup
+from apps.programs.models import ProgramPhase
+from apps.workouts.models import Workout
+from core.routers import primary_reads
+
+ROLLUP_COUNT_FIELDS = (
+    "planned_count",
+    "completed_count",
+    "skipped_count",
+    "missed_count",
+    "in_progress_count",
+)
+
+# Grouping levels exposed by the adherence endpoint, finest first.
+ADHERENCE_GROUPINGS = {
+    "week": (
+        "client_id",
+        "program_id",
+        "program_phase_id",
+        "week_start",
+        "iso_year",
+        "iso_week",
+    ),
+    "phase": ("client_id", "program_id", "program_phase_id"),
+    "program": ("client_id", "program_id"),
+    "client": ("client_id",),
+}
+
+
+def week_start_for(day):
+    """Returns the Monday starting the ISO week that contains the given date."""
+    return day - timedelta(days=day.weekday())
+
+
+def compute_phase_adherence(phase_id, as_of, week_starts=None):
+    """Counts planned workout outcomes per ISO week for one phase in SQL.
+
+    Args:
+        phase_id: The ProgramPhase to count.
+        as_of: Workouts planned before this date without a session are missed.
+        week_starts: Optional Mondays restricting the weeks that are counted.
+
+    Returns:
+        QuerySet: One dict per week with "week_start" and every field in
+            ROLLUP_COUNT_FIELDS.
+    """
+    workouts = Workout.objects.filter(
+        program_phase_id=phase_id, planned_date__isnull=False
+    )
+    if week_starts is not None:
+        in_weeks = Q(pk__in=[])
+        for monday in week_starts:
+            in_weeks |= Q(planned_date__range=(monday, monday + timedelta(days=6)))
+        workouts = workouts.filter(in_weeks)
+
+    return (
+        workouts.annotate(week_start=TruncWeek("planned_date"))
+        .values("week_start")
+        .annotate(
+            planned_count=Count("pk"),
+            completed_count=Count(
+                "pk",
+                filter=Q(
+                    completion_record__completed_at__isnull=False,
+                    completion_record__is_skipped=False,
+                ),
+            ),
+            skipped_count=Count("pk", filter=Q(completion_record__is_skipped=True)),
+            missed_count=Count(
+                "pk",
+                filter=Q(completion_record__isnull=True, planned_date__lt=as_of),
+            ),
+            in_progress_count=Count(
+                "pk",
+                filter=Q(
+                    completion_record__isnull=False,
+                    completion_record__completed_at__isnull=True,
+                ),
+            ),
+        )
+        .order_by("week_start")
+    )
+
+
+@primary_reads()
+def refresh_phase_adherence(phase_id, week_starts=None, as_of=None):
+    """Recomputes and upserts the adherence rollups of one phase.
+
+    Weeks that no longer have planned workouts are removed, so moving or
+    deleting workouts keeps the table exact. Counts are read from the
+    primary database, as a replica may not have the latest sessions yet.
+
+    Args:
+        phase_id: The ProgramPhase to refresh.
+        week_starts: Optional Mondays limiting the refresh to those weeks.
+        as_of: The date outcomes are evaluated for. Defaults to today.
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    as_of = as_of or timezone.localdate()
+    phase = (
+        ProgramPhase.objects.select_related(
+            "program__trainer_client_membership__client"
+        )
+        .filter(pk=phase_id)
+        .first()
+    )
+    existing = WorkoutAdherenceRollup.objects.filter(program_phase_id=phase_id)
+    if week_starts is not None:
+        existing = existing.filter(week_start__in=week_starts)
+
+    membership = phase.program.trainer_client_membership if phase else None
+    if membership is None:
+        existing.delete()
+        return 0
+
+    rows = []
+    for counts in compute_phase_adherence(phase_id, as_of, week_starts):
+        iso_year, iso_week, _ = counts["week_start"].isocalendar()
+        rows.append(
+            WorkoutAdherenceRollup(
+                client_id=membership.client.user_id,
+                program_id=phase.program_id,
+                program_phase_id=phase_id,
+                iso_year=iso_year,
+                iso_week=iso_week,
+                as_of=as_of,
+                **counts,
+            )
+        )
+
+    with transaction.atomic():
+        existing.exclude(week_start__in=[row.week_start for row in rows]).delete()
+        WorkoutAdherenceRollup.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["program_phase", "week_start"],
+            update_fields=[
+                "client",
+                "program",
+                "iso_year",
+                "iso_week",
+                *ROLLUP_COUNT_FIELDS,
+                "as_of",
+                "updated_at",
+            ],
+        )
+    return len(rows)
+
+
+def schedule_adherence_refresh(phase_id, planned_date=None):
+    """Refreshes a phase's rollups once the current transaction commits.
+
+    Args:
+        phase_id: The ProgramPhase whose workouts or sessions changed.
+        planned_date: When given, only the ISO week containing it is refreshed.
+    """
+    week_starts = None if planned_date is None else [week_start_for(planned_date)]
+    transaction.on_commit(lambda: refresh_phase_adherence(phase_id, week_starts))
+
+
+def refresh_stale_adherence(rollups, today=None):
+    """Recomputes rollups whose missed counts may have changed since as_of.
+
+    A week's counts only depend on time until its last day has passed, so
+    only rows computed before the end of their week and before today are
+    refreshed. Typically that is just the current week. Run daily by
+    rebuild_adherence_rollups --stale rather than on read, so the adherence
+    endpoint stays read-only.
+
+    Args:
+        rollups: The WorkoutAdherenceRollup queryset to check.
+        today: The current local date. Defaults to today.
+
+    Returns:
+        int: The number of phase-weeks recomputed.
+    """
+    today = today or timezone.localdate()
+    stale = {}
+    for phase_id, week_start, as_of in rollups.filter(as_of__lt=today).values_list(
+        "program_phase_id", "week_start", "as_of"
+    ):
+        if as_of <= week_start + timedelta(days=6):
+            stale.setdefault(phase_id, []).append(week_start)
+
+    for phase_id, week_starts in stale.items():
+        refresh_phase_adherence(phase_id, week_starts, as_of=today)
+    return sum(len(week_starts) for week_starts in stale.values())
+
+
+def rebuild_all_adherence(as_of=None):
+    """Recomputes the rollups of every phase that has planned workouts.
+
+    Args:
+        as_of: The date outcomes are evaluated for. Defaults to today.
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    phase_ids = (
+        Workout.objects.filter(planned_date__isnull=False)
+        .values_list("program_phase_id", flat=True)
+        .distinct()
+    )
+    WorkoutAdherenceRollup.objects.exclude(program_phase_id__in=phase_ids).delete()
+    return sum(
+        refresh_phase_adherence(phase_id, as_of=as_of) for phase_id in set(phase_ids)
+    )
+
+
+def _rate(outcome):
+    return Round(Cast(F(outcome), FloatField()) / NullIf(F("due"), Value(0)), 4)
+
+
+def summarise_adherence(rollups, group_by="week"):
+    """Aggregates rollups to the requested level and derives outcome rates.
+
+    Rates are relative to due workouts: those completed, skipped or missed.
+    Upcoming and in-progress workouts are counted but excluded from rates.
+
+    Args:
+        rollups: The WorkoutAdherenceRollup queryset to aggregate.
+        group_by: One of the keys of ADHERENCE_GROUPINGS.
+
+    Returns:
+        QuerySet: One dict per group with its key fields, the summed
+            "planned", "completed", "skipped", "missed", "in_progress" and
+            "due" counts, and the completion, skip and miss rates.
+    """
+    fields = ADHERENCE_GROUPINGS[group_by]
+    return (
+        rollups.order_by()
+        .values(*fields)
+        .annotate(
+            **{
+                field.removesuffix("_count"): Sum(field)
+                for field in ROLLUP_COUNT_FIELDS
+            }
+        )
+        .annotate(due=F("completed") + F("skipped") + F("missed"))
+        .annotate(
+            completion_rate=_rate("completed"),
+            skip_rate=_rate("skipped"),
+            miss_rate=_rate("missed"),
+        )
+        .order_by(*fields)
+    )
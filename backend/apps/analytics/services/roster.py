@@ -0,0 +1,112 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import (
+    F,
+    FloatField,
+    Func,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Value,
+    Window,
+)
+from django.db.models.functions import Cast, Coalesce, NullIf, Rank, Round
+from django.utils import timezone
+
+from apps.programs.constants import ProgramStatusesVocabulary
+from apps.programs.models import Program
+from apps.users.constants import MembershipVocabulary
+from apps.users.models import TrainerClientMembership
+from apps.workouts.models import Workout, WorkoutCompletionRecord
+
+
+def _count(queryset):
+    """Wraps a correlated queryset as a scalar COUNT subquery."""
+    counted = queryset.order_by().annotate(
+        total=Func(F("pk"), function="COUNT", output_field=IntegerField())
+    )
+    return Coalesce(Subquery(counted.values("total")[:1]), Value(0))
+
+
+def _week_start(today):
+    """Returns the aware start of the ISO week (Monday) containing today."""
+    monday = today - timedelta(days=today.weekday())
+    return timezone.make_aware(datetime.combine(monday, time.min))
+
+
+def get_trainer_roster(trainer_profile, today=None):
+    """Builds the trainer's active client roster with training metrics.
+
+    Every metric is a correlated subquery on the membership row, so the whole
+    roster is fetched in a single query regardless of its size:
+
+    - active_program_id / active_program_name: the most recently started
+      in-progress program.
+    - last_session_at: the latest completed (not skipped) session.
+    - sessions_this_week: completed sessions since Monday of the ISO week.
+    - planned_to_date / completed_to_date: workouts of in-progress programs
+      planned up to today, and how many of those were completed.
+    - adherence: completed_to_date / planned_to_date, None when nothing is due.
+    - adherence_rank: position of the client by adherence within the roster.
+
+    Args:
+        trainer_profile: The TrainerProfile whose roster is requested.
+        today: The local date the metrics are computed for. Defaults to today.
+
+    Returns:
+        QuerySet: Active TrainerClientMembership rows with the metrics
+            annotated, ordered by client name.
+    """
+    today = today or timezone.localdate()
+    membership = OuterRef("pk")
+
+    active_programs = Program.objects.filter(
+        trainer_client_membership=membership,
+        status__code=ProgramStatusesVocabulary.IN_PROGRESS,
+    ).order_by("-started_at", "-created_at")
+
+    sessions = WorkoutCompletionRecord.objects.filter(
+        workout__program_phase__program__trainer_client_membership=membership,
+        completed_at__isnull=False,
+        is_skipped=False,
+    )
+
+    due_workouts = Workout.objects.filter(
+        program_phase__program__trainer_client_membership=membership,
+        program_phase__program__status__code=ProgramStatusesVocabulary.IN_PROGRESS,
+        planned_date__lte=today,
+    )
+    completed_workouts = due_workouts.filter(
+        completion_record__completed_at__isnull=False,
+        completion_record__is_skipped=False,
+    )
+
+    adherence = Round(
+        Cast(F("completed_to_date"), FloatField())
+        / NullIf(F("planned_to_date"), Value(0)),
+        4,
+    )
+
+    return (
+        TrainerClientMembership.objects.filter(
+            trainer=trainer_profile, status__code=MembershipVocabulary.ACTIVE
+        )
+        .select_related("client__user")
+        .annotate(
+            active_program_id=Subquery(active_programs.values("id")[:1]),
+            active_program_name=Subquery(active_programs.values("program_name")[:1]),
+            last_session_at=Subquery(
+                sessions.order_by("-completed_at").values("completed_at")[:1]
+            ),
+            sessions_this_week=_count(
+                sessions.filter(completed_at__gte=_week_start(today))
+            ),
+            planned_to_date=_count(due_workouts),
+            completed_to_date=_count(completed_workouts),
+        )
+        .annotate(adherence=adherence)
+        .annotate(
+            adherence_rank=Window(Rank(), order_by=F("adherence").desc(nulls_last=True))
+        )
+        .order_by("client__user__first_name", "client__user__last_name", "pk")
+    )
@@ -1,9 +1,13 @@
 from decimal import ROUND_HALF_UP, Decimal
 
+from django.db import transaction
+
 from apps.analytics.constants import epley_one_rep_max, weight_at_reps
 from apps.analytics.models import ExerciseSessionSnapshot
 from apps.analytics.services.load import calculate_session_load
 from apps.workouts.models import WorkoutCompletionRecord, WorkoutSetCompletionRecord
+from core.metrics import timed
+from core.partitioning import not_before
 
 
 def get_program_1rm_for_exercise(program, exercise):
@@ -23,6 +27,7 @@ def get_program_1rm_for_exercise(program, exercise):
     set_records = WorkoutSetCompletionRecord.objects.filter(
         workout_set__workout_exercise__exercise=exercise,
         workout_set__workout_exercise__workout__program_phase__program=program,
+        created_at__gte=not_before(program.created_at),
         is_skipped=False,
     ).select_related("workout_set")
 
@@ -150,6 +155,7 @@ def _rolling_1rm(program, exercise, up_to_session):
         exercise_completion_record__workout_completion_record__completed_at__lte=(
             up_to_session.completed_at
         ),
+        created_at__gte=not_before(program.created_at),
         is_skipped=False,
     ).select_related("workout_set")
 
@@ -196,6 +202,7 @@ def _previous_session_load(program, exercise, before_session):
     return calculate_session_load(set_records)
 
 
+@timed("analytics.snapshot")
 def compute_and_save_snapshot(program, exercise, session):
     """Persists a snapshot of exercise performance and targets for a specific session.
 
@@ -256,18 +263,27 @@ def compute_and_save_snapshot(program, exercise, session):
             Decimal("0.01"), rounding=ROUND_HALF_UP
         )
 
-    snapshot, _ = ExerciseSessionSnapshot.objects.update_or_create(
-        program=program,
-        exercise=exercise,
-        session=session,
-        defaults={
-            "one_rep_max": one_rm,
-            "session_load": current_load.quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
-            ),
-            "target_load": target_load,
-            "weight_floor": weight_floor,
-            "weight_ceiling": weight_ceiling,
-        },
-    )
+    # Snapshots are partitioned on PostgreSQL, where the unique key no longer
+    # covers (program, exercise, session) alone. Locking the session makes a
+    # concurrent writer wait and then update the snapshot created first.
+    with transaction.atomic():
+        list(
+            WorkoutCompletionRecord.objects.select_for_update()
+            .filter(pk=session.pk)
+            .values_list("pk")
+        )
+        snapshot, _ = ExerciseSessionSnapshot.objects.update_or_create(
+            program=program,
+            exercise=exercise,
+            session=session,
+            defaults={
+                "one_rep_max": one_rm,
+                "session_load": current_load.quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                ),
+                "target_load": target_load,
+                "weight_floor": weight_floor,
+                "weight_ceiling": weight_ceiling,
+            },
+        )
     return snapshot
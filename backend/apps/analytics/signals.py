@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.workouts.models import Workout, WorkoutCompletionRecord
+
+from .services.adherence import schedule_adherence_refresh
+
+
+@receiver(post_save, sender=Workout)
+@receiver(post_delete, sender=Workout)
+def refresh_adherence_for_workout(sender, instance, **kwargs):
+    """Refreshes a phase's adherence rollups when its planned workouts change.
+
+    The whole phase is recomputed because a moved workout affects both the
+    week it left and the week it joined.
+
+    Args:
+        sender: The Workout model class.
+        instance: The workout that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    schedule_adherence_refresh(instance.program_phase_id)
+
+
+@receiver(post_save, sender=WorkoutCompletionRecord)
+@receiver(post_delete, sender=WorkoutCompletionRecord)
+def refresh_adherence_for_session(sender, instance, **kwargs):
+    """Refreshes the adherence rollup of the week a session was planned in.
+
+    Args:
+        sender: The WorkoutCompletionRecord model class.
+        instance: The session that was started, skipped, finished or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    workout = instance.workout
+    if workout.planned_date is not None:
+        schedule_adherence_refresh(workout.program_phase_id, workout.planned_date)
@@ -0,0 +1,200 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.analytics.models import WorkoutAdherenceRollup
+from apps.analytics.services.adherence import (
+    refresh_phase_adherence,
+    refresh_stale_adherence,
+    summarise_adherence,
+    week_start_for,
+)
+from factories import WorkoutCompletionRecordFactory, WorkoutFactory
+
+pytestmark = pytest.mark.django_db
+
+ADHERENCE_URL = reverse("workout-adherence")
+
+OTHER_PROCESS_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "other-process",
+    }
+}
+
+
+@pytest.fixture
+def last_monday():
+    return week_start_for(timezone.localdate()) - timedelta(days=7)
+
+
+@pytest.fixture
+def planned_week(active_phase, client_user, last_monday):
+    """Last week's plan: one workout each completed, skipped, missed and open."""
+    now = timezone.now()
+    workouts = {
+        outcome: WorkoutFactory(
+            program_phase=active_phase, planned_date=last_monday + timedelta(days=i)
+        )
+        for i, outcome in enumerate(["completed", "skipped", "missed", "open"])
+    }
+    WorkoutCompletionRecordFactory(
+        workout=workouts["completed"],
+        client=client_user,
+        started_at=now,
+        completed_at=now,
+    )
+    WorkoutCompletionRecordFactory(
+        workout=workouts["skipped"],
+        client=client_user,
+        is_skipped=True,
+        started_at=now,
+        completed_at=now,
+    )
+    WorkoutCompletionRecordFactory(workout=workouts["open"], client=client_user)
+    WorkoutFactory(
+        program_phase=active_phase, planned_date=last_monday + timedelta(days=14)
+    )
+    refresh_phase_adherence(active_phase.id)
+    return workouts
+
+
+class TestAdherenceRollups:
+
+    def test_counts_outcomes_per_iso_week(
+        self, active_phase, client_user, planned_week, last_monday
+    ):
+        rollups = list(WorkoutAdherenceRollup.objects.order_by("week_start"))
+
+        assert [rollup.week_start for rollup in rollups] == [
+            last_monday,
+            last_monday + timedelta(days=14),
+        ]
+        past = rollups[0]
+        assert past.client_id == client_user.id
+        assert past.program_id == active_phase.program_id
+        assert (past.iso_year, past.iso_week) == last_monday.isocalendar()[:2]
+        assert past.planned_count == 4
+        assert past.completed_count == 1
+        assert past.skipped_count == 1
+        assert past.missed_count == 1
+        assert past.in_progress_count == 1
+        assert rollups[1].planned_count == 1
+        assert rollups[1].missed_count == 0
+
+    def test_session_write_refreshes_its_week(
+        self,
+        active_phase,
+        client_user,
+        planned_week,
+        last_monday,
+        django_capture_on_commit_callbacks,
+    ):
+        now = timezone.now()
+        with django_capture_on_commit_callbacks(execute=True):
+            WorkoutCompletionRecordFactory(
+                workout=planned_week["missed"],
+                client=client_user,
+                started_at=now,
+                completed_at=now,
+            )
+
+        rollup = WorkoutAdherenceRollup.objects.get(week_start=last_monday)
+        assert rollup.completed_count == 2
+        assert rollup.missed_count == 0
+
+    def test_moving_workouts_out_of_a_week_removes_it(
+        self, planned_week, last_monday, django_capture_on_commit_callbacks
+    ):
+        later = last_monday + timedelta(days=14)
+        with django_capture_on_commit_callbacks(execute=True):
+            for workout in planned_week.values():
+                workout.planned_date = later
+                workout.save()
+
+        weeks = list(
+            WorkoutAdherenceRollup.objects.values_list("week_start", flat=True)
+        )
+        assert weeks == [later]
+
+    def test_stale_rows_are_recomputed(self, active_phase, last_monday):
+        workout = WorkoutFactory(
+            program_phase=active_phase, planned_date=last_monday + timedelta(days=2)
+        )
+        refresh_phase_adherence(active_phase.id, as_of=last_monday)
+
+        refreshed = refresh_stale_adherence(WorkoutAdherenceRollup.objects.all())
+
+        rollup = WorkoutAdherenceRollup.objects.get(program_phase=workout.program_phase)
+        assert refreshed == 1
+        assert rollup.missed_count == 1
+        assert rollup.as_of == timezone.localdate()
+
+    def test_summary_derives_rates_from_due_workouts(self, planned_week):
+        summary = summarise_adherence(WorkoutAdherenceRollup.objects.all(), "program")
+
+        (row,) = summary
+        assert row["planned"] == 5
+        assert row["due"] == 3
+        assert row["completion_rate"] == pytest.approx(0.3333)
+        assert row["skip_rate"] == pytest.approx(0.3333)
+        assert row["miss_rate"] == pytest.approx(0.3333)
+
+
+class TestWorkoutAdherenceView:
+
+    def test_trainer_sees_weekly_rows(self, trainer_api_client, planned_week):
+        response = trainer_api_client.get(ADHERENCE_URL)
+
+        assert response.status_code == 200
+        assert response.data["count"] == 2
+        first = response.data["results"][0]
+        assert first["completed"] == 1
+        assert first["missed"] == 1
+        assert "iso_week" in first
+
+    def test_results_can_be_grouped_by_phase(
+        self, trainer_api_client, planned_week, active_phase
+    ):
+        response = trainer_api_client.get(ADHERENCE_URL, {"group_by": "phase"})
+
+        (row,) = response.data["results"]
+        assert row["program_phase_id"] == str(active_phase.id)
+        assert row["planned"] == 5
+        assert "week_start" not in row
+
+    def test_client_sees_own_adherence(self, client_api_client, planned_week):
+        response = client_api_client.get(ADHERENCE_URL, {"group_by": "client"})
+
+        assert response.data["results"][0]["due"] == 3
+
+    def test_other_trainer_sees_nothing(self, other_trainer_api_client, planned_week):
+        response = other_trainer_api_client.get(ADHERENCE_URL)
+
+        assert response.data["count"] == 0
+
+    def test_reads_leave_stale_rows_to_the_daily_refresh(
+        self, trainer_api_client, active_phase, last_monday
+    ):
+        WorkoutFactory(
+            program_phase=active_phase, planned_date=last_monday + timedelta(days=2)
+        )
+        refresh_phase_adherence(active_phase.id, as_of=last_monday)
+
+        before = trainer_api_client.get(ADHERENCE_URL).data["results"]
+        # The cron job runs in another service, whose cache the API never sees.
+        with override_settings(CACHES=OTHER_PROCESS_CACHES):
+            call_command("rebuild_adherence_rollups", stale=True)
+        after = trainer_api_client.get(ADHERENCE_URL).data["results"]
+
+        assert before[0]["missed"] == 0
+        assert after[0]["missed"] == 1
+
+    def test_unknown_grouping_is_rejected(self, trainer_api_client):
+        response = trainer_api_client.get(ADHERENCE_URL, {"group_by": "month"})
+
+        assert response.status_code == 400
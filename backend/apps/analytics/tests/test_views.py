@@ -7,12 +7,14 @@ Uses the full workout + session fixture chain.
 from decimal import Decimal
 
 import pytest
-from django.urls import reverse
+from asgiref.sync import iscoroutinefunction
+from django.urls import resolve, reverse
 from django.utils import timezone
 
 from factories import (
     WorkoutCompletionRecordFactory,
     WorkoutExerciseCompletionRecordFactory,
+    WorkoutFactory,
     WorkoutSetCompletionRecordFactory,
 )
 
@@ -205,6 +207,64 @@ class TestExerciseLoadHistoryView:
         # No antagonist involvements in fixtures — should be empty
         assert entry["muscle_breakdown"] == []
 
+    def test_computed_bounds_limit_the_history(
+        self,
+        trainer_api_client,
+        active_phase,
+        workout_exercise,
+        snapshot,
+    ):
+        url = reverse(
+            "exercise-load-history",
+            kwargs={
+                "program_id": active_phase.program.id,
+                "exercise_id": workout_exercise.exercise.id,
+            },
+        )
+        later = (snapshot.computed_at + timezone.timedelta(days=1)).isoformat()
+        earlier = (snapshot.computed_at - timezone.timedelta(days=1)).isoformat()
+
+        assert trainer_api_client.get(url, {"computed_from": later}).status_code == 204
+        response = trainer_api_client.get(
+            url, {"computed_from": earlier, "computed_to": later}
+        )
+        assert len(response.data) == 1
+
+    def test_history_is_bounded_by_the_program_creation(
+        self,
+        trainer_api_client,
+        active_phase,
+        workout_exercise,
+        snapshot,
+    ):
+        url = reverse(
+            "exercise-load-history",
+            kwargs={
+                "program_id": active_phase.program.id,
+                "exercise_id": workout_exercise.exercise.id,
+            },
+        )
+        # A snapshot can only be computed after its program was created, so
+        # older months are never searched.
+        type(snapshot).objects.filter(pk=snapshot.pk).update(
+            computed_at=active_phase.program.created_at - timezone.timedelta(days=2)
+        )
+
+        assert trainer_api_client.get(url).status_code == 204
+
+    def test_invalid_computed_bound_is_rejected(
+        self, trainer_api_client, active_phase, workout_exercise
+    ):
+        url = reverse(
+            "exercise-load-history",
+            kwargs={
+                "program_id": active_phase.program.id,
+                "exercise_id": workout_exercise.exercise.id,
+            },
+        )
+        response = trainer_api_client.get(url, {"computed_from": "last week"})
+        assert response.status_code == 400
+
 
 class TestNextSessionRecommendationView:
 
@@ -319,3 +379,122 @@ class TestNextSessionRecommendationView:
         )
         response = trainer_api_client.get(url)
         assert response.data["target_load"] is None
+
+
+class TestAsyncAnalyticsViews:
+
+    @pytest.mark.parametrize(
+        "url_name", ["exercise-load-history", "next-session-recommendation"]
+    )
+    def test_views_are_async(self, url_name, active_phase, exercise):
+        url = reverse(
+            url_name,
+            kwargs={"program_id": active_phase.program.id, "exercise_id": exercise.id},
+        )
+
+        assert iscoroutinefunction(resolve(url).func)
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize(
+        "url_name", ["exercise-load-history", "next-session-recommendation"]
+    )
+    def test_concurrent_reads_match_serial_reads(
+        self,
+        settings,
+        trainer_api_client,
+        active_phase,
+        workout_exercise,
+        snapshot,
+        url_name,
+    ):
+        settings.API_CACHE_ENABLED = False
+        url = reverse(
+            url_name,
+            kwargs={
+                "program_id": active_phase.program.id,
+                "exercise_id": workout_exercise.exercise.id,
+            },
+        )
+
+        concurrent = trainer_api_client.get(url)
+        settings.CONCURRENT_DB_READS = False
+        serial = trainer_api_client.get(url)
+
+        assert concurrent.status_code == 200
+        assert concurrent.data == serial.data
+
+    @pytest.mark.django_db(transaction=True)
+    def test_other_trainer_is_denied_with_concurrent_reads(
+        self, api_client, other_trainer_user, active_phase, workout_exercise, snapshot
+    ):
+        api_client.force_authenticate(user=other_trainer_user)
+        url = reverse(
+            "exercise-load-history",
+            kwargs={
+                "program_id": active_phase.program.id,
+                "exercise_id": workout_exercise.exercise.id,
+            },
+        )
+
+        assert api_client.get(url).status_code == 403
+
+
+class TestTrainerRosterView:
+
+    def test_lists_active_clients_with_metrics(
+        self, trainer_api_client, active_membership, completed_session, workout
+    ):
+        WorkoutFactory(
+            program_phase=workout.program_phase,
+            planned_date=timezone.localdate() - timezone.timedelta(days=1),
+        )
+
+        response = trainer_api_client.get(reverse("trainer-roster"))
+
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        entry = response.data[0]
+        program = workout.program_phase.program
+        assert entry["membership_id"] == str(active_membership.id)
+        assert entry["active_program_id"] == str(program.id)
+        assert entry["active_program_name"] == program.program_name
+        assert entry["last_session_at"] is not None
+        assert entry["sessions_this_week"] == 1
+        assert entry["planned_to_date"] == 2
+        assert entry["completed_to_date"] == 1
+        assert entry["adherence"] == 0.5
+        assert entry["adherence_rank"] == 1
+
+    def test_client_without_program_has_empty_metrics(
+        self, trainer_api_client, active_membership
+    ):
+        response = trainer_api_client.get(reverse("trainer-roster"))
+
+        entry = response.data[0]
+        assert entry["active_program_id"] is None
+        assert entry["last_session_at"] is None
+        assert entry["sessions_this_week"] == 0
+        assert entry["adherence"] is None
+
+    def test_roster_is_a_single_query(
+        self,
+        trainer_api_client,
+        active_membership,
+        completed_session,
+        django_assert_num_queries,
+    ):
+        # The roster, after the cached profile image version.
+        with django_assert_num_queries(2):
+            response = trainer_api_client.get(reverse("trainer-roster"))
+
+        assert response.status_code == 200
+
+    def test_excludes_pending_memberships(self, trainer_api_client, pending_membership):
+        response = trainer_api_client.get(reverse("trainer-roster"))
+
+        assert response.data == []
+
+    def test_client_cannot_view_roster(self, client_api_client):
+        response = client_api_client.get(reverse("trainer-roster"))
+
+        assert response.status_code == 403
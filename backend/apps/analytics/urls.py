@@ -6,7 +6,12 @@ historical load tracking and predictive next-session recommendations.
 
 from django.urls import path
 
-from .views import ExerciseLoadHistoryView, NextSessionRecommendationView
+from .views import (
+    ExerciseLoadHistoryView,
+    NextSessionRecommendationView,
+    TrainerRosterView,
+    WorkoutAdherenceView,
+)
 
 urlpatterns = [
     # Endpoint to retrieve the historical progression of load and 1RM for an exercise
@@ -21,4 +26,8 @@ urlpatterns = [
         NextSessionRecommendationView.as_view(),
         name="next-session-recommendation",
     ),
+    # Endpoint to retrieve the trainer's active clients with training metrics
+    path("roster/", TrainerRosterView.as_view(), name="trainer-roster"),
+    # Endpoint to retrieve planned vs completed workouts per phase and ISO week
+    path("adherence/", WorkoutAdherenceView.as_view(), name="workout-adherence"),
 ]
@@ -1,17 +1,64 @@
 from decimal import Decimal
 
+from django.db.models import Subquery
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, permissions, status
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
 
-from apps.analytics.models import ExerciseSessionSnapshot
+from apps.analytics.filters import (
+    ExerciseSessionSnapshotFilter,
+    WorkoutAdherenceRollupFilter,
+)
+from apps.analytics.models import ExerciseSessionSnapshot, WorkoutAdherenceRollup
 from apps.analytics.serializers import (
+    AdherenceSummarySerializer,
     ExerciseSnapshotSerializer,
     NextSessionRecommendationSerializer,
+    TrainerRosterEntrySerializer,
+)
+from apps.analytics.services.adherence import (
+    ADHERENCE_GROUPINGS,
+    summarise_adherence,
 )
 from apps.analytics.services.load import calculate_joint_load, calculate_muscle_load
+from apps.analytics.services.roster import get_trainer_roster
 from apps.exercises.models import Exercise
 from apps.programs.models import Program
+from core.caching import CachedResponseMixin, cache_response
+from core.concurrency import gather_reads
+from core.constants import CacheTagVocabulary
+from core.partitioning import not_before
+from core.views import AsyncAPIViewMixin, ReplicaReadsMixin
+
+# Snapshot analytics are read per program, so ownership changes count too.
+ANALYTICS_CACHE_TAGS = (
+    CacheTagVocabulary.ANALYTICS,
+    CacheTagVocabulary.PROGRAMS,
+    CacheTagVocabulary.MEMBERSHIPS,
+)
+# Rosters and adherence are derived from planned and completed workouts.
+ACTIVITY_CACHE_TAGS = (
+    CacheTagVocabulary.WORKOUTS,
+    CacheTagVocabulary.PROGRAMS,
+    CacheTagVocabulary.MEMBERSHIPS,
+)
+
+
+def _program_snapshots(program_id, exercise_id):
+    """Returns a program's snapshots of an exercise, bounded for pruning.
+
+    Snapshots are never computed before their program was created, so the
+    program's creation time bounds computed_at and older monthly partitions
+    are skipped. It is read in a subquery to keep the snapshot read
+    independent of the program fetch.
+    """
+    created_at = Program.objects.filter(pk=program_id).values("created_at")
+    return ExerciseSessionSnapshot.objects.filter(
+        program_id=program_id,
+        exercise_id=exercise_id,
+        computed_at__gte=not_before(Subquery(created_at)),
+    )
 
 
 def _get_program_for_trainer(program_id, trainer_user):
@@ -48,22 +95,51 @@ def _get_program_for_trainer(program_id, trainer_user):
     return program
 
 
-class ExerciseLoadHistoryView(generics.GenericAPIView):
+def _get_exercise(exercise_id, *prefetches):
+    """Retrieves an exercise with optional prefetches.
+
+    Args:
+        exercise_id: The UUID of the exercise to retrieve.
+        *prefetches: Lookups passed to prefetch_related.
+
+    Returns:
+        Exercise: The exercise instance.
+
+    Raises:
+        NotFound: If the exercise does not exist.
+    """
+    try:
+        return Exercise.objects.prefetch_related(*prefetches).get(pk=exercise_id)
+    except Exercise.DoesNotExist:
+        raise NotFound("Exercise not found.")
+
+
+class ExerciseLoadHistoryView(
+    ReplicaReadsMixin, AsyncAPIViewMixin, generics.GenericAPIView
+):
     """API view to retrieve the historical load progression for an exercise.
 
     This view reads from pre-computed ExerciseSessionSnapshot records for speed.
     It performs on-the-fly muscle-level load breakdown calculations because
     joint/muscle mapping is considered static reference data.
 
+    The program, the exercise's joint and muscle graph and the snapshots are
+    independent reads, so the async handler fetches them concurrently. The
+    snapshots are discarded unless the program check passes.
+
     Query parameters:
         muscle_group (optional): Filter the breakdown to a specific muscle group.
         role (optional): Filter the breakdown by muscle role (e.g., AGONIST).
+        computed_from, computed_to (optional): Inclusive ISO 8601 bounds on
+            when snapshots were computed. Without them, snapshots from the
+            program's creation onwards are scanned.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ExerciseSnapshotSerializer
 
-    def get(self, request, program_id, exercise_id):
+    @cache_response(*ANALYTICS_CACHE_TAGS)
+    async def get(self, request, program_id, exercise_id):
         """Handles GET requests for exercise load history.
 
         Args:
@@ -77,31 +153,35 @@ class ExerciseLoadHistoryView(generics.GenericAPIView):
         Raises:
             PermissionDenied: If the user is not a trainer.
             NotFound: If the program or exercise is not found.
+            ValidationError: If a computed_from or computed_to bound is invalid.
         """
         if not request.user.is_trainer:
             raise PermissionDenied("Only trainers can access analytics.")
 
-        program = _get_program_for_trainer(program_id, request.user)
+        snapshot_filter = ExerciseSessionSnapshotFilter(
+            request.query_params,
+            queryset=_program_snapshots(program_id, exercise_id),
+        )
+        if not snapshot_filter.is_valid():
+            raise ValidationError(snapshot_filter.errors)
 
-        try:
-            exercise = Exercise.objects.prefetch_related(
+        _, exercise, snapshots = await gather_reads(
+            lambda: _get_program_for_trainer(program_id, request.user),
+            lambda: _get_exercise(
+                exercise_id,
                 "exercise_movements__joint_contributions__joint_action__muscles__muscle__muscle_group",
                 "exercise_movements__joint_contributions__joint_action__muscles__role",
                 "exercise_movements__joint_contributions__joint_range_of_motion",
-            ).get(pk=exercise_id)
-        except Exercise.DoesNotExist:
-            raise NotFound("Exercise not found.")
-
-        snapshots = (
-            ExerciseSessionSnapshot.objects.filter(program=program, exercise=exercise)
-            .select_related(
-                "session",
-                "session__workout",
-            )
-            .order_by("session__completed_at")
+            ),
+            lambda: list(
+                snapshot_filter.qs.select_related(
+                    "session",
+                    "session__workout",
+                ).order_by("session__completed_at")
+            ),
         )
 
-        if not snapshots.exists():
+        if not snapshots:
             return Response(
                 {"detail": "No session data available for this exercise yet."},
                 status=status.HTTP_204_NO_CONTENT,
@@ -159,18 +239,22 @@ class ExerciseLoadHistoryView(generics.GenericAPIView):
         return Response(results)
 
 
-class NextSessionRecommendationView(generics.GenericAPIView):
+class NextSessionRecommendationView(
+    ReplicaReadsMixin, AsyncAPIViewMixin, generics.GenericAPIView
+):
     """API view to retrieve recommendations for the next exercise session.
 
     This view identifies the most recent performance snapshot and extracts
     computed targets (1RM, target load, and weight bands) to guide the
-    trainer's programming for the next session.
+    trainer's programming for the next session. The program, exercise and
+    latest snapshot are fetched concurrently.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = NextSessionRecommendationSerializer
 
-    def get(self, request, program_id, exercise_id):
+    @cache_response(*ANALYTICS_CACHE_TAGS)
+    async def get(self, request, program_id, exercise_id):
         """Handles GET requests for next session recommendations.
 
         Args:
@@ -188,19 +272,15 @@ class NextSessionRecommendationView(generics.GenericAPIView):
         if not request.user.is_trainer:
             raise PermissionDenied("Only trainers can access analytics.")
 
-        program = _get_program_for_trainer(program_id, request.user)
-
-        try:
-            exercise = Exercise.objects.get(pk=exercise_id)
-        except Exercise.DoesNotExist:
-            raise NotFound("Exercise not found.")
-
         # Find the latest completed session snapshot for this exercise.
-        latest_snapshot = (
-            ExerciseSessionSnapshot.objects.filter(program=program, exercise=exercise)
-            .select_related("session")
-            .order_by("-session__completed_at")
-            .first()
+        program, exercise, latest_snapshot = await gather_reads(
+            lambda: _get_program_for_trainer(program_id, request.user),
+            lambda: _get_exercise(exercise_id),
+            lambda: (
+                _program_snapshots(program_id, exercise_id)
+                .order_by("-session__completed_at")
+                .first()
+            ),
         )
 
         if not latest_snapshot:
@@ -227,3 +307,95 @@ class NextSessionRecommendationView(generics.GenericAPIView):
 
         serializer = self.get_serializer(data)
         return Response(serializer.data)
+
+
+class TrainerRosterView(ReplicaReadsMixin, CachedResponseMixin, generics.ListAPIView):
+    """API view listing a trainer's active clients with their training metrics.
+
+    Returns the active program, last session, sessions this week and
+    adherence for every active membership in one unpaginated response, built
+    from a single annotated query.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = TrainerRosterEntrySerializer
+    pagination_class = None
+    cache_tags = ACTIVITY_CACHE_TAGS
+    cache_shared_tags = (CacheTagVocabulary.PROFILE_IMAGES,)
+
+    def get_queryset(self):
+        """Returns the requesting trainer's annotated roster.
+
+        Returns:
+            QuerySet: Active memberships annotated by get_trainer_roster.
+
+        Raises:
+            PermissionDenied: If the user is not a trainer.
+        """
+        user = self.request.user
+        if not user.is_trainer or not hasattr(user, "trainer_profile"):
+            raise PermissionDenied("Only trainers can view a client roster.")
+        return get_trainer_roster(user.trainer_profile)
+
+
+class WorkoutAdherenceView(
+    ReplicaReadsMixin, CachedResponseMixin, generics.ListAPIView
+):
+    """API view reporting completed, skipped and missed planned workouts.
+
+    Reads the WorkoutAdherenceRollup table, aggregated in SQL per client,
+    program, phase or ISO week. Trainers see their clients' programs and
+    clients see their own. Reads never write: missed counts that change with
+    the date are refreshed daily by rebuild_adherence_rollups --stale.
+
+    Query parameters:
+        group_by (optional): One of week (default), phase, program or client.
+        client, program, program_phase (optional): UUIDs narrowing the rows.
+        week_from, week_to (optional): Inclusive bounds on the week start.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = AdherenceSummarySerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = WorkoutAdherenceRollupFilter
+    cache_tags = ACTIVITY_CACHE_TAGS
+    cache_shared_tags = (CacheTagVocabulary.ADHERENCE,)
+
+    def get_queryset(self):
+        """Returns the rollups visible to the requesting user.
+
+        Returns:
+            QuerySet: WorkoutAdherenceRollup rows for the trainer's clients or
+                for the client themself.
+
+        Raises:
+            PermissionDenied: If the user is neither a trainer nor a client.
+        """
+        user = self.request.user
+        if user.is_trainer:
+            return WorkoutAdherenceRollup.objects.filter(
+                program__trainer_client_membership__trainer__user=user
+            )
+        if user.is_client:
+            return WorkoutAdherenceRollup.objects.filter(client=user)
+        raise PermissionDenied("Only trainers and clients can view adherence.")
+
+    def filter_queryset(self, queryset):
+        """Aggregates the rollups in scope to the requested grouping.
+
+        Args:
+            queryset: The rollups visible to the user.
+
+        Returns:
+            QuerySet: Aggregated adherence dicts for the requested grouping.
+
+        Raises:
+            ValidationError: If group_by is not a supported grouping.
+        """
+        group_by = self.request.query_params.get("group_by", "week")
+        if group_by not in ADHERENCE_GROUPINGS:
+            raise ValidationError(
+                {"group_by": f"Choose one of: {', '.join(ADHERENCE_GROUPINGS)}."}
+            )
+
+        return summarise_adherence(super().filter_queryset(queryset), group_by)
@@ -2,6 +2,7 @@ import json
 import os
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from apps.biology.models import (
     AnatomicalDirection,
@@ -14,135 +15,48 @@ from apps.biology.models import (
     MuscleRole,
     PlaneOfMotion,
 )
+from apps.exercises.services.muscle_index import ExerciseMuscleIndexService
+from core.seeding import BulkSeeder, resolve
 
 
 class Command(BaseCommand):
     """Management command to seed biology lookup tables and relational data.
 
     This command reads a JSON file containing biomechanical data (planes,
-    directions, joints, muscles, etc.) and populates the database using
-    update_or_create logic to ensure idempotency.
+    directions, joints, muscles, etc.) and upserts each table in bulk with
+    BulkSeeder, so re-running it only writes rows that changed.
     """
 
     help = "Seeds biology lookup tables and joint/muscle relational data"
+    stealth_options = ("key_maps",)
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes without writing them.",
+        )
+
+    def handle(self, *args, **options):
         """Executes the seeding logic by parsing the local JSON data file.
 
         Args:
             *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
+            **options: Parsed command options.
         """
         base_dir = os.path.dirname(__file__)
         file_path = os.path.join(base_dir, "seed_biology_data.json")
-        objects_written = 0
+        seeder = BulkSeeder(
+            dry_run=options["dry_run"], key_maps=options.get("key_maps")
+        )
 
         try:
             with open(file_path) as f:
                 data = json.load(f)
                 self.stdout.write("Seeding Biology Data...")
 
-            # --- Simple lookup table population ---
-
-            for item in data.get("planes_of_motion", []):
-                _, created = PlaneOfMotion.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created PlaneOfMotion: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("anatomical_directions", []):
-                _, created = AnatomicalDirection.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(
-                        f"    Created AnatomicalDirection: {item['label']}"
-                    )
-                    objects_written += 1
-
-            for item in data.get("movement_patterns", []):
-                _, created = MovementPattern.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created MovementPattern: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("joints", []):
-                _, created = Joint.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created Joint: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("muscle_roles", []):
-                _, created = MuscleRole.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created MuscleRole: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("muscle_groups", []):
-                _, created = MuscleGroup.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created MuscleGroup: {item['label']}")
-                    objects_written += 1
-
-            # --- Muscles (requires resolving foreign keys for direction and group) ---
-
-            for item in data.get("muscles", []):
-                direction = AnatomicalDirection.objects.get(code=item["direction"])
-                group = MuscleGroup.objects.get(code=item["group"])
-                _, created = Muscle.objects.update_or_create(
-                    code=item["code"],
-                    defaults={
-                        "label": item["label"],
-                        "anatomical_direction": direction,
-                        "muscle_group": group,
-                    },
-                )
-                if created:
-                    self.stdout.write(f"    Created Muscle: {item['label']}")
-                    objects_written += 1
-
-            # --- Joint actions and their respective muscle involvements ---
-
-            for action_data in data.get("joint_actions", []):
-                joint = Joint.objects.get(code=action_data["joint"])
-                movement = MovementPattern.objects.get(code=action_data["movement"])
-                plane = PlaneOfMotion.objects.get(code=action_data["plane"])
-
-                joint_action, ja_created = JointAction.objects.get_or_create(
-                    joint=joint, movement=movement, plane=plane
-                )
-                if ja_created:
-                    self.stdout.write(
-                        f"    Created JointAction: {joint.label} {movement.label}"
-                    )
-                    objects_written += 1
-
-                for m_data in action_data.get("muscles", []):
-                    muscle = Muscle.objects.get(code=m_data["code"])
-                    role = MuscleRole.objects.get(code=m_data["role"])
-                    _, mi_created = MuscleInvolvement.objects.update_or_create(
-                        muscle=muscle,
-                        joint_action=joint_action,
-                        defaults={
-                            "role": role,
-                            "impact_factor": m_data["impact"],
-                        },
-                    )
-                    if mi_created:
-                        self.stdout.write(
-                            f"        Created MuscleInvolvement: {muscle.label}"
-                        )
-                        objects_written += 1
+            with transaction.atomic():
+                self._seed(seeder, data)
 
         except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f"Could not find file at: {file_path}"))
@@ -151,8 +65,100 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Error seeding biology: {e}"))
             return
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Biology seeded successfully. Objects created: {objects_written}"
+        for line in seeder.report(verbose=options["verbosity"] > 1):
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS("Biology seeded successfully."))
+
+    @staticmethod
+    def _seed(seeder, data):
+        """Upserts every biology table, resolving foreign keys from code maps.
+
+        Args:
+            seeder: The BulkSeeder recording the diff.
+            data: The parsed seed file.
+        """
+        # --- Simple lookup table population ---
+
+        lookups = [
+            (PlaneOfMotion, "planes_of_motion"),
+            (AnatomicalDirection, "anatomical_directions"),
+            (MovementPattern, "movement_patterns"),
+            (Joint, "joints"),
+            (MuscleRole, "muscle_roles"),
+            (MuscleGroup, "muscle_groups"),
+        ]
+        for model, key in lookups:
+            seeder.upsert(
+                model,
+                data.get(key, []),
+                unique_fields=["code"],
+                update_fields=["label"],
             )
+
+        # --- Muscles (foreign keys resolved from the direction and group maps) ---
+
+        directions = seeder.code_map(AnatomicalDirection)
+        groups = seeder.code_map(MuscleGroup)
+        seeder.upsert(
+            Muscle,
+            [
+                {
+                    "code": item["code"],
+                    "label": item["label"],
+                    "anatomical_direction": resolve(
+                        directions, item["direction"], "AnatomicalDirection"
+                    ),
+                    "muscle_group": resolve(groups, item["group"], "MuscleGroup"),
+                }
+                for item in data.get("muscles", [])
+            ],
+            unique_fields=["code"],
+            update_fields=["label", "anatomical_direction", "muscle_group"],
+        )
+
+        # --- Joint actions and their respective muscle involvements ---
+
+        joints = seeder.code_map(Joint)
+        movements = seeder.code_map(MovementPattern)
+        planes = seeder.code_map(PlaneOfMotion)
+        actions = data.get("joint_actions", [])
+        action_ids = seeder.upsert(
+            JointAction,
+            [
+                {
+                    "joint": resolve(joints, item["joint"], "Joint"),
+                    "movement": resolve(movements, item["movement"], "MovementPattern"),
+                    "plane": resolve(planes, item["plane"], "PlaneOfMotion"),
+                }
+                for item in actions
+            ],
+            unique_fields=["joint", "movement"],
+            update_fields=["plane"],
         )
+
+        muscles = seeder.code_map(Muscle)
+        roles = seeder.code_map(MuscleRole)
+        seeder.upsert(
+            MuscleInvolvement,
+            [
+                {
+                    "muscle": resolve(muscles, m_data["code"], "Muscle"),
+                    "joint_action": action_ids[
+                        (joints[action["joint"]], movements[action["movement"]])
+                    ],
+                    "role": resolve(roles, m_data["role"], "MuscleRole"),
+                    "impact_factor": m_data["impact"],
+                }
+                for action in actions
+                for m_data in action.get("muscles", [])
+            ],
+            unique_fields=["muscle", "joint_action"],
+            update_fields=["role", "impact_factor"],
+        )
+
+        # Bulk writes send no signals; rebuild the exercises' muscle index
+        # (deferred to one rebuild when run from seed_db).
+        if not seeder.dry_run and seeder.changed(
+            Muscle, JointAction, MuscleInvolvement
+        ):
+            ExerciseMuscleIndexService.rebuild()
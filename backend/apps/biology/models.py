@@ -199,6 +199,6 @@ class MuscleInvolvement(ApexModel):
             raise ValidationError("Impact factor must be between 0.00 and 1.00")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
@@ -6,3 +6,8 @@ class ExercisesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.exercises"
+
+    def ready(self):
+        """Imports signal handlers so the muscle index tracks biomechanics."""
+        # noqa Exception. Needs import but not used.
+        import apps.exercises.signals  # noqa: F401
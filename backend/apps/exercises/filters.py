@@ -1,16 +1,28 @@
 import django_filters
+from django.db.models import (
+    DecimalField,
+    Exists,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+)
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
 
 from apps.biology.constants import MuscleRoleVocabulary
 
-from .models import Exercise
+from .models import Exercise, ExerciseMuscleTarget
+from .services.search import ExerciseSearchService
 
 
 class ExerciseFilter(django_filters.FilterSet):
     """Filter set for Exercise objects allowing filtering by muscle, group, and equipment.
 
-    This filter set provides specialized methods to traverse the complex relationship
-    between exercises, movements, joint contributions, and muscle roles to identify
-    target muscles (agonists).
+    Target muscle filters read the denormalised ExerciseMuscleTarget index to find
+    exercises where a muscle acts as an agonist, and expose the summed impact as
+    target_impact for ordering.
     """
 
     target_muscle_id = django_filters.UUIDFilter(method="filter_target_muscle_id")
@@ -26,6 +38,34 @@ class ExerciseFilter(django_filters.FilterSet):
     experience_level = django_filters.UUIDFilter(field_name="experience_level__id")
     equipment = django_filters.UUIDFilter(field_name="equipment__id")
 
+    @staticmethod
+    def _filter_targets(queryset, **lookups):
+        """Restricts exercises to those with an agonist target matching lookups.
+
+        Reads the ExerciseMuscleTarget index instead of traversing the
+        biomechanics chain, and annotates the summed agonist impact of the
+        matching muscles as target_impact so results can be ordered by it.
+
+        Args:
+            queryset: The QuerySet of Exercise objects to filter.
+            **lookups: Field lookups applied to the ExerciseMuscleTarget rows.
+
+        Returns:
+            The filtered QuerySet annotated with target_impact.
+        """
+        targets = ExerciseMuscleTarget.objects.filter(
+            exercise=OuterRef("pk"),
+            role__code=MuscleRoleVocabulary.AGONIST,
+            **lookups,
+        )
+        impact = (
+            targets.order_by()
+            .values("exercise")
+            .annotate(total=Sum("impact"))
+            .values("total")
+        )
+        return queryset.filter(Exists(targets)).annotate(target_impact=Subquery(impact))
+
     def filter_target_muscle_id(self, queryset, name, value):
         """Filters exercises by a specific target muscle ID.
 
@@ -37,12 +77,7 @@ class ExerciseFilter(django_filters.FilterSet):
         Returns:
             A QuerySet containing exercises where the specified muscle acts as an agonist.
         """
-        # Traverses Exercise -> Movement -> JointContribution -> JointAction -> MuscleLink
-        # filtering specifically for muscles with the 'AGONIST' role.
-        return queryset.filter(
-            exercise_movements__joint_contributions__joint_action__muscles__muscle__id=value,
-            exercise_movements__joint_contributions__joint_action__muscles__role__code=MuscleRoleVocabulary.AGONIST,
-        ).distinct()
+        return self._filter_targets(queryset, muscle_id=value)
 
     def filter_target_muscle_label(self, queryset, name, value):
         """Filters exercises by a target muscle's label (case-insensitive partial match).
@@ -55,10 +90,7 @@ class ExerciseFilter(django_filters.FilterSet):
         Returns:
             A QuerySet containing exercises where a matching muscle acts as an agonist.
         """
-        return queryset.filter(
-            exercise_movements__joint_contributions__joint_action__muscles__muscle__label__icontains=value,
-            exercise_movements__joint_contributions__joint_action__muscles__role__code=MuscleRoleVocabulary.AGONIST,
-        ).distinct()
+        return self._filter_targets(queryset, muscle__label__icontains=value)
 
     def filter_target_muscle_group_id(self, queryset, name, value):
         """Filters exercises by a specific muscle group ID.
@@ -71,10 +103,7 @@ class ExerciseFilter(django_filters.FilterSet):
         Returns:
             A QuerySet containing exercises targeting muscles within the specified group.
         """
-        return queryset.filter(
-            exercise_movements__joint_contributions__joint_action__muscles__muscle__muscle_group__id=value,
-            exercise_movements__joint_contributions__joint_action__muscles__role__code=MuscleRoleVocabulary.AGONIST,
-        ).distinct()
+        return self._filter_targets(queryset, muscle_group_id=value)
 
     def filter_target_muscle_group_label(self, queryset, name, value):
         """Filters exercises by a muscle group's label (case-insensitive partial match).
@@ -87,10 +116,20 @@ class ExerciseFilter(django_filters.FilterSet):
         Returns:
             A QuerySet containing exercises targeting muscles within matching groups.
         """
-        return queryset.filter(
-            exercise_movements__joint_contributions__joint_action__muscles__muscle__muscle_group__label__icontains=value,
-            exercise_movements__joint_contributions__joint_action__muscles__role__code=MuscleRoleVocabulary.AGONIST,
-        ).distinct()
+        return self._filter_targets(queryset, muscle_group__label__icontains=value)
+
+    def filter_queryset(self, queryset):
+        """Applies the filters, guaranteeing a target_impact annotation.
+
+        Ordering by target_impact is only meaningful with a target filter, but
+        the annotation is always present so the ordering backend never fails.
+        """
+        queryset = super().filter_queryset(queryset)
+        if "target_impact" not in queryset.query.annotations:
+            queryset = queryset.annotate(
+                target_impact=Value(None, output_field=DecimalField())
+            )
+        return queryset
 
     class Meta:
         model = Exercise
@@ -103,3 +142,31 @@ class ExerciseFilter(django_filters.FilterSet):
             "target_muscle_group_id",
             "target_muscle_group_label",
         ]
+
+
+class ExerciseSearchFilter(SearchFilter):
+    """Ranked exercise search backend with a substring fallback.
+
+    On PostgreSQL, delegates to ExerciseSearchService for prefix full-text and
+    trigram matching, ordering by relevance unless the client asked for an
+    explicit ordering. Elsewhere (SQLite in tests) it behaves exactly like
+    DRF's SearchFilter over the view's search_fields.
+
+    Must be listed after OrderingFilter so the relevance order is not
+    replaced by the view's default ordering.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not ExerciseSearchService.is_supported():
+            return super().filter_queryset(request, queryset, view)
+
+        term = " ".join(self.get_search_terms(request))
+        if not term:
+            return queryset
+
+        queryset = ExerciseSearchService.search(queryset, term)
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by(
+            F("search_rank").desc(nulls_last=True), "exercise_name"
+        )
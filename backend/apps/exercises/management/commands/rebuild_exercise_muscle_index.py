@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.exercises.services.muscle_index import ExerciseMuscleIndexService
+
+
+class Command(BaseCommand):
+    """Django management command to rebuild the exercise muscle target index.
+
+    The index is normally kept current by signals; this command recomputes it
+    from scratch, for example after bulk edits that bypass model signals.
+    """
+
+    help = "Rebuilds the denormalised exercise -> target muscle index"
+
+    def handle(self, *args, **kwargs):
+        """Executes a full rebuild of the ExerciseMuscleTarget table.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **kwargs: Keyword arguments passed to the command.
+        """
+        rows_written = ExerciseMuscleIndexService.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Exercise muscle index rebuilt. Rows: {rows_written}")
+        )
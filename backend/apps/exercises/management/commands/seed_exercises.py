@@ -5,6 +5,7 @@ import time
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from requests import get
 
 from apps.biology.models import Joint, JointAction, MovementPattern
@@ -16,7 +17,10 @@ from apps.exercises.models import (
     JointContribution,
     JointRangeOfMotion,
 )
+from apps.exercises.services.muscle_index import ExerciseMuscleIndexService
+from apps.exercises.services.search import ExerciseSearchService
 from apps.users.models import ExperienceLevel
+from core.seeding import BulkSeeder, resolve
 
 
 class Command(BaseCommand):
@@ -25,29 +29,41 @@ class Command(BaseCommand):
     This command orchestrates the population of exercise phases, joint ranges of
     motion, exercises (enriched via API Ninja), equipment, and complex
     biomechanical movement data. It utilizes a local cache to minimize
-    redundant API calls.
+    redundant API calls, and upserts each table in bulk with BulkSeeder so
+    re-running it only writes rows that changed.
     """
 
     help = (
         "Seeds exercise phases, ROM lookups, exercises, and biomechanical movement data"
     )
+    stealth_options = ("key_maps",)
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes without writing them.",
+        )
+
+    def handle(self, *args, **options):
         """Executes the seeding logic for the exercise module.
 
         Args:
             *args: Positional arguments passed to the command.
-            **kwargs: Keyword arguments passed to the command.
+            **options: Parsed command options.
 
         Raises:
-            ImproperlyConfigured: If the required NINJA_API_KEY is not in settings.
-            ValueError: If referenced lookup data (ExperienceLevel, ExercisePhase,
-                Joint, etc.) is missing from the database.
+            ImproperlyConfigured: If an exercise is missing from the enrichment
+                cache and NINJA_API_KEY is not in settings.
+            ValidationError: If referenced lookup data (ExperienceLevel,
+                ExercisePhase, JointAction, etc.) is missing from the database.
         """
         base_dir = os.path.dirname(__file__)
         file_path = os.path.join(base_dir, "seed_exercises_data.json")
         cache_file_path = os.path.join(base_dir, "enrichment_data.json")
-        objects_written = 0
+        seeder = BulkSeeder(
+            dry_run=options["dry_run"], key_maps=options.get("key_maps")
+        )
 
         # Load or initialize the API response cache to minimize external requests.
         api_cache = {}
@@ -64,167 +80,12 @@ class Command(BaseCommand):
                 data = json.load(f)
                 self.stdout.write("Seeding Exercises & Biomechanics...")
 
-            # ── Exercise phases ───────────────────────────────────────────────
-
-            for item in data.get("exercise_phases", []):
-                _, created = ExercisePhase.objects.update_or_create(
-                    code=item["code"], defaults={"label": item["label"]}
-                )
-                if created:
-                    self.stdout.write(f"    Created ExercisePhase: {item['label']}")
-                    objects_written += 1
-
-            # ── Ranges of motion ──────────────────────────────────────────────
-
-            for item in data.get("ranges_of_motion", []):
-                _, created = JointRangeOfMotion.objects.update_or_create(
-                    code=item["code"],
-                    defaults={
-                        "label": item["label"],
-                        "impact_factor": item["impact"],
-                    },
-                )
-                if created:
-                    self.stdout.write(
-                        f"    Created JointRangeOfMotion: {item['label']}"
-                    )
-                    objects_written += 1
-
-            # ── Exercises ─────────────────────────────────────────────────────
-
-            api_key = getattr(settings, "NINJA_API_KEY", None)
-            if not api_key:
-                raise ImproperlyConfigured("Missing NINJA_API_KEY in settings")
-
             for exercise_data in data.get("exercises", []):
-                exercise_name = exercise_data["name"]
-                api_name = exercise_data["api_name"]
-                level_code = exercise_data["level"]
-
-                # Fetch supplemental data from API Ninjas with a 2-second delay
-                # to respect potential rate limits if not already cached.
-                if api_name not in api_cache:
-                    self.stdout.write(f"    Fetching from API Ninja: {api_name}")
-                    time.sleep(2)
-
-                    response = get(
-                        f"https://api.api-ninjas.com/v1/exercises?name={api_name}",
-                        headers={"X-Api-Key": api_key},
-                    )
-                    data_arr = response.json()
-
-                    if not data_arr:
-                        raise ValueError(
-                            f"API Ninja returned no results for '{api_name}'"
-                        )
-
-                    enrichment = data_arr[0]
-                    api_cache[api_name] = {
-                        "instructions": enrichment.get("instructions", ""),
-                        "equipment": enrichment.get("equipments", []),
-                        "safety_info": enrichment.get("safety_info", ""),
-                    }
-                    with open(cache_file_path, "w") as cf:
-                        json.dump(api_cache, cf, indent=4)
-                    self.stdout.write(self.style.SUCCESS(f"    Cached: {api_name}"))
-
-                cached = api_cache[api_name]
-
-                try:
-                    level_obj = ExperienceLevel.objects.get(code=level_code)
-                except ExperienceLevel.DoesNotExist:
-                    raise ValueError(
-                        f"ExperienceLevel '{level_code}' not found — run seed_users first"
-                    )
-
-                exercise_obj, ex_created = Exercise.objects.get_or_create(
-                    exercise_name=exercise_name,
-                    defaults={
-                        "api_name": api_name,
-                        "experience_level": level_obj,
-                        "instructions": cached["instructions"],
-                        "safety_tips": cached["safety_info"],
-                        "is_enriched": False,
-                    },
-                )
-
-                for equip_name in cached["equipment"]:
-                    equip_obj, equip_created = Equipment.objects.update_or_create(
-                        code=equip_name.upper().replace(" ", "_"),
-                        defaults={"label": equip_name},
-                    )
-                    exercise_obj.equipment.add(equip_obj)
-                    if equip_created:
-                        objects_written += 1
-
-                # Update enrichment status based on presence of API-provided content.
-                if exercise_obj.instructions and exercise_obj.safety_tips:
-                    exercise_obj.is_enriched = True
-                exercise_obj.save()
-
-                if ex_created:
-                    self.stdout.write(f"    Created Exercise: {exercise_name}")
-                    objects_written += 1
-
-                # ── Movements + joint contributions ───────────────────────────
-
-                for movement_data in exercise_data.get("movements", []):
-                    phase_code = movement_data["phase"]
-
-                    try:
-                        phase_obj = ExercisePhase.objects.get(code=phase_code)
-                    except ExercisePhase.DoesNotExist:
-                        raise ValueError(f"ExercisePhase '{phase_code}' not found")
-
-                    movement_obj, mv_created = ExerciseMovement.objects.get_or_create(
-                        phase=phase_obj, exercise=exercise_obj
-                    )
-                    if mv_created:
-                        self.stdout.write(
-                            f"        Created ExerciseMovement: {phase_obj.label} of {exercise_name}"
-                        )
-                        objects_written += 1
-
-                    for contrib_data in movement_data.get("contributions", []):
-                        joint_code = contrib_data["joint"]
-                        action_code = contrib_data["action"]
-                        rom_code = contrib_data["rom"]
-
-                        try:
-                            joint_obj = Joint.objects.get(code=joint_code)
-                        except Joint.DoesNotExist:
-                            raise ValueError(f"Joint '{joint_code}' not found")
-
-                        # Link biomechanical data: Joint + MovementPattern -> JointAction.
-                        movement_pattern = MovementPattern.objects.get(code=action_code)
-                        joint_action_obj = JointAction.objects.filter(
-                            joint=joint_obj,
-                            movement=movement_pattern,
-                        ).first()
-
-                        if not joint_action_obj:
-                            raise ValueError(
-                                f"No JointAction for {joint_code} → {action_code}. "
-                                f"Check seed_biology_data.json."
-                            )
-
-                        try:
-                            rom_obj = JointRangeOfMotion.objects.get(code=rom_code)
-                        except JointRangeOfMotion.DoesNotExist:
-                            raise ValueError(
-                                f"JointRangeOfMotion '{rom_code}' not found"
-                            )
-
-                        _, cb_created = JointContribution.objects.get_or_create(
-                            joint_action=joint_action_obj,
-                            joint_range_of_motion=rom_obj,
-                            exercise_movement=movement_obj,
-                        )
-                        if cb_created:
-                            self.stdout.write(
-                                f"            Created JointContribution: {joint_code} {action_code} ({rom_code})"
-                            )
-                            objects_written += 1
+                if exercise_data["api_name"] not in api_cache:
+                    self._fetch(exercise_data["api_name"], api_cache, cache_file_path)
+
+            with transaction.atomic():
+                self._seed(seeder, data, api_cache)
 
         except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f"Could not find file at: {file_path}"))
@@ -233,8 +94,194 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Error seeding exercises: {e}"))
             return
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Exercises seeded successfully. Objects created: {objects_written}"
-            )
+        for line in seeder.report(verbose=options["verbosity"] > 1):
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS("Exercises seeded successfully."))
+
+    def _fetch(self, api_name, api_cache, cache_file_path):
+        """Fetches one exercise's enrichment from API Ninjas into the cache.
+
+        Requests are spaced by a 2-second delay to respect rate limits.
+
+        Args:
+            api_name: The exercise name known to the API.
+            api_cache: The enrichment cache, updated in place.
+            cache_file_path: Where the cache is persisted.
+
+        Raises:
+            ImproperlyConfigured: If NINJA_API_KEY is not in settings.
+            ValueError: If the API returns no results.
+        """
+        api_key = getattr(settings, "NINJA_API_KEY", None)
+        if not api_key:
+            raise ImproperlyConfigured("Missing NINJA_API_KEY in settings")
+
+        self.stdout.write(f"    Fetching from API Ninja: {api_name}")
+        time.sleep(2)
+
+        response = get(
+            f"https://api.api-ninjas.com/v1/exercises?name={api_name}",
+            headers={"X-Api-Key": api_key},
         )
+        data_arr = response.json()
+
+        if not data_arr:
+            raise ValueError(f"API Ninja returned no results for '{api_name}'")
+
+        enrichment = data_arr[0]
+        api_cache[api_name] = {
+            "instructions": enrichment.get("instructions", ""),
+            "equipment": enrichment.get("equipments", []),
+            "safety_info": enrichment.get("safety_info", ""),
+        }
+        with open(cache_file_path, "w") as cf:
+            json.dump(api_cache, cf, indent=4)
+        self.stdout.write(self.style.SUCCESS(f"    Cached: {api_name}"))
+
+    @staticmethod
+    def _seed(seeder, data, api_cache):
+        """Upserts every exercise table, resolving foreign keys from code maps.
+
+        Args:
+            seeder: The BulkSeeder recording the diff.
+            data: The parsed seed file.
+            api_cache: The enrichment cache holding every seeded exercise.
+        """
+        exercises = data.get("exercises", [])
+
+        # ── Exercise phases and ranges of motion ──────────────────────────────
+
+        seeder.upsert(
+            ExercisePhase,
+            data.get("exercise_phases", []),
+            unique_fields=["code"],
+            update_fields=["label"],
+        )
+        seeder.upsert(
+            JointRangeOfMotion,
+            [
+                {**item, "impact_factor": item["impact"]}
+                for item in data.get("ranges_of_motion", [])
+            ],
+            unique_fields=["code"],
+            update_fields=["label", "impact_factor"],
+        )
+
+        # ── Equipment and exercises ───────────────────────────────────────────
+
+        equipment_ids = seeder.upsert(
+            Equipment,
+            {
+                name.upper().replace(" ", "_"): {
+                    "code": name.upper().replace(" ", "_"),
+                    "label": name,
+                }
+                for item in exercises
+                for name in api_cache[item["api_name"]]["equipment"]
+            }.values(),
+            unique_fields=["code"],
+            update_fields=["label"],
+        )
+
+        levels = seeder.code_map(ExperienceLevel)
+        exercise_ids = seeder.upsert(
+            Exercise,
+            [
+                {
+                    "exercise_name": item["name"],
+                    "api_name": item["api_name"],
+                    "experience_level": resolve(
+                        levels, item["level"], "ExperienceLevel"
+                    ),
+                    "instructions": api_cache[item["api_name"]]["instructions"],
+                    "safety_tips": api_cache[item["api_name"]]["safety_info"],
+                    # Enriched once the API provided both pieces of content.
+                    "is_enriched": bool(
+                        api_cache[item["api_name"]]["instructions"]
+                        and api_cache[item["api_name"]]["safety_info"]
+                    ),
+                }
+                for item in exercises
+            ],
+            unique_fields=["exercise_name"],
+            # Exercise content is edited in the admin; re-seeding keeps it.
+            insert_fields=[
+                "api_name",
+                "experience_level",
+                "instructions",
+                "safety_tips",
+                "is_enriched",
+            ],
+        )
+        seeder.upsert(
+            Exercise.equipment.through,
+            [
+                {
+                    "exercise": exercise_ids[item["name"]],
+                    "equipment": equipment_ids[name.upper().replace(" ", "_")],
+                }
+                for item in exercises
+                for name in api_cache[item["api_name"]]["equipment"]
+            ],
+            unique_fields=["exercise", "equipment"],
+        )
+
+        # ── Movements + joint contributions ───────────────────────────────────
+
+        phases = seeder.code_map(ExercisePhase)
+        movement_ids = seeder.upsert(
+            ExerciseMovement,
+            [
+                {
+                    "phase": resolve(phases, movement["phase"], "ExercisePhase"),
+                    "exercise": exercise_ids[item["name"]],
+                }
+                for item in exercises
+                for movement in item.get("movements", [])
+            ],
+            unique_fields=["phase", "exercise"],
+        )
+
+        # Link biomechanical data: Joint + MovementPattern -> JointAction.
+        joint_codes = {pk: code for code, pk in seeder.code_map(Joint).items()}
+        movement_codes = {
+            pk: code for code, pk in seeder.code_map(MovementPattern).items()
+        }
+        joint_actions = {
+            (joint_codes[joint], movement_codes[movement]): pk
+            for (joint, movement), pk in seeder.key_map(
+                JointAction, "joint", "movement"
+            ).items()
+        }
+        ranges = seeder.code_map(JointRangeOfMotion)
+        seeder.upsert(
+            JointContribution,
+            [
+                {
+                    "exercise_movement": movement_ids[
+                        (phases[movement["phase"]], exercise_ids[item["name"]])
+                    ],
+                    "joint_action": resolve(
+                        joint_actions,
+                        (contribution["joint"], contribution["action"]),
+                        "JointAction",
+                    ),
+                    "joint_range_of_motion": resolve(
+                        ranges, contribution["rom"], "JointRangeOfMotion"
+                    ),
+                }
+                for item in exercises
+                for movement in item.get("movements", [])
+                for contribution in movement.get("contributions", [])
+            ],
+            unique_fields=["exercise_movement", "joint_action"],
+            update_fields=["joint_range_of_motion"],
+        )
+
+        # Bulk writes send no signals; refresh the derived exercise data.
+        if seeder.dry_run:
+            return
+        if seeder.changed(ExerciseMovement, JointContribution):
+            ExerciseMuscleIndexService.rebuild()
+        if seeder.changed(Exercise, Equipment, Exercise.equipment.through):
+            ExerciseSearchService.refresh()
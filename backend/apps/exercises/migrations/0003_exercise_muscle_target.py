@@ -0,0 +1,114 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:33
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def build_muscle_index(apps, schema_editor):
+    JointContribution = apps.get_model("exercises", "JointContribution")
+    ExerciseMuscleTarget = apps.get_model("exercises", "ExerciseMuscleTarget")
+
+    rows = (
+        JointContribution.objects.filter(joint_action__muscles__isnull=False)
+        .values(
+            exercise_id=F("exercise_movement__exercise_id"),
+            muscle_id=F("joint_action__muscles__muscle_id"),
+            muscle_group_id=F("joint_action__muscles__muscle__muscle_group_id"),
+            role_id=F("joint_action__muscles__role_id"),
+        )
+        .annotate(
+            impact=Sum(
+                F("joint_range_of_motion__impact_factor")
+                * F("joint_action__muscles__impact_factor")
+            )
+        )
+    )
+    ExerciseMuscleTarget.objects.bulk_create(
+        [ExerciseMuscleTarget(**row) for row in rows], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biology", "0001_initial"),
+        ("exercises", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseMuscleTarget",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("impact", models.DecimalField(decimal_places=4, max_digits=6)),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="muscle_targets",
+                        to="exercises.exercise",
+                    ),
+                ),
+                (
+                    "muscle",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_targets",
+                        to="biology.muscle",
+                    ),
+                ),
+                (
+                    "muscle_group",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_targets",
+                        to="biology.musclegroup",
+                    ),
+                ),
+                (
+                    "role",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_targets",
+                        to="biology.musclerole",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Exercise Muscle Targets",
+                "ordering": ["-impact"],
+                "indexes": [
+                    models.Index(
+                        fields=["muscle", "role", "-impact"],
+                        name="exercises_e_muscle__1d2438_idx",
+                    ),
+                    models.Index(
+                        fields=["muscle_group", "role", "-impact"],
+                        name="exercises_e_muscle__9df43b_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("exercise", "muscle", "role"),
+                        name="unique_exercise_muscle_role_target",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_muscle_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:37
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_INDEX_SQL = [
+    "CREATE INDEX IF NOT EXISTS exercises_exercise_search_vector_gin "
+    "ON exercises_exercise USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS exercises_exercise_name_trgm_gin "
+    "ON exercises_exercise USING gin (exercise_name gin_trgm_ops)",
+]
+
+DROP_SEARCH_INDEX_SQL = [
+    "DROP INDEX IF EXISTS exercises_exercise_search_vector_gin",
+    "DROP INDEX IF EXISTS exercises_exercise_name_trgm_gin",
+]
+
+BACKFILL_SQL = """
+    UPDATE exercises_exercise AS e
+    SET search_vector =
+        setweight(to_tsvector('english', coalesce(e.exercise_name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce((
+            SELECT string_agg(q.label, ' ')
+            FROM exercises_exercise_equipment AS ee
+            JOIN exercises_equipment AS q ON q.id = ee.equipment_id
+            WHERE ee.exercise_id = e.id
+        ), '')), 'B')
+        || setweight(to_tsvector('english', coalesce(e.instructions, '')), 'C')
+"""
+
+
+def _run_on_postgres(statements):
+    # GIN and tsvector are PostgreSQL-only; SQLite keeps the plain column and
+    # the search backend falls back to substring matching there.
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises", "0003_exercise_muscle_target"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="exercise",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(SEARCH_INDEX_SQL + [BACKFILL_SQL]),
+            _run_on_postgres(DROP_SEARCH_INDEX_SQL),
+        ),
+    ]
@@ -1,7 +1,8 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from apps.biology.models import JointAction
+from apps.biology.models import JointAction, Muscle, MuscleGroup, MuscleRole
 from apps.users.models import ExperienceLevel
 from core.models import ApexModel, NormalisedLookupModel
 
@@ -48,6 +49,9 @@ class Exercise(ApexModel):
         instructions: Detailed steps for performing the exercise.
         safety_tips: Precautions to avoid injury.
         is_enriched: Boolean flag indicating if instructions and safety tips are present.
+        search_vector: Weighted full-text vector over name, equipment and
+            instructions. Maintained by ExerciseSearchService on PostgreSQL and
+            left empty on other databases.
     """
 
     exercise_name = models.CharField(max_length=100, unique=True)
@@ -61,6 +65,7 @@ class Exercise(ApexModel):
     instructions = models.TextField(blank=True)
     safety_tips = models.TextField(blank=True)
     is_enriched = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name_plural = "Exercises"
@@ -83,10 +88,10 @@ class Exercise(ApexModel):
             )
 
     def save(self, *args, **kwargs):
-        """Updates enrichment status and performs full validation before saving."""
+        """Updates enrichment status and validates the instance before saving."""
         self.is_enriched = bool(self.instructions and self.safety_tips)
 
-        self.full_clean()
+        self.validate_for_save(kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -164,3 +169,58 @@ class JointContribution(ApexModel):
 
     def __str__(self) -> str:
         return f"{self.exercise_movement} -> {self.joint_action}"
+
+
+class ExerciseMuscleTarget(ApexModel):
+    """Denormalised index of the muscles an exercise works and how strongly.
+
+    Flattens the Exercise -> ExerciseMovement -> JointContribution ->
+    JointAction -> MuscleInvolvement chain into one row per exercise, muscle
+    and role so muscle-based exercise searches avoid the six-way join. Rows
+    are derived data, maintained by ExerciseMuscleIndexService whenever the
+    biomechanics behind them change, and should never be edited directly.
+
+    Attributes:
+        exercise: The exercise being indexed.
+        muscle: A muscle involved in the exercise.
+        muscle_group: The muscle's group, copied to allow group filters
+            without joining through Muscle.
+        role: The role the muscle plays in the exercise's joint actions.
+        impact: Sum of range of motion impact x involvement impact across
+            every joint contribution of the exercise.
+    """
+
+    exercise = models.ForeignKey(
+        to=Exercise, on_delete=models.CASCADE, related_name="muscle_targets"
+    )
+    muscle = models.ForeignKey(
+        to=Muscle, on_delete=models.CASCADE, related_name="exercise_targets"
+    )
+    muscle_group = models.ForeignKey(
+        to=MuscleGroup,
+        on_delete=models.CASCADE,
+        related_name="exercise_targets",
+        null=True,
+        blank=True,
+    )
+    role = models.ForeignKey(
+        to=MuscleRole, on_delete=models.CASCADE, related_name="exercise_targets"
+    )
+    impact = models.DecimalField(max_digits=6, decimal_places=4)
+
+    class Meta:
+        verbose_name_plural = "Exercise Muscle Targets"
+        ordering = ["-impact"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["exercise", "muscle", "role"],
+                name="unique_exercise_muscle_role_target",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["muscle", "role", "-impact"]),
+            models.Index(fields=["muscle_group", "role", "-impact"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.exercise} -> {self.muscle} ({self.impact})"
@@ -0,0 +1,122 @@
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import F, Sum
+
+from apps.exercises.models import ExerciseMuscleTarget, JointContribution
+
+_state = threading.local()
+
+
+class ExerciseMuscleIndexService:
+    """Domain service maintaining the ExerciseMuscleTarget index.
+
+    Aggregates each exercise's biomechanics into one row per muscle and role,
+    with the impact of every joint contribution summed. Rebuilds are scoped
+    to the exercises affected by a change so admin edits stay cheap, and can
+    be deferred to a single full rebuild for bulk loads such as seeding.
+    """
+
+    @classmethod
+    def _aggregate_rows(cls, exercise_ids=None):
+        """Computes index rows straight from the biomechanics tables.
+
+        Args:
+            exercise_ids: Optional iterable of exercise IDs to limit the
+                aggregation to. All exercises are aggregated when None.
+
+        Returns:
+            A list of unsaved ExerciseMuscleTarget instances.
+        """
+        contributions = JointContribution.objects.filter(
+            joint_action__muscles__isnull=False
+        )
+        if exercise_ids is not None:
+            contributions = contributions.filter(
+                exercise_movement__exercise_id__in=exercise_ids
+            )
+
+        rows = contributions.values(
+            exercise_id=F("exercise_movement__exercise_id"),
+            muscle_id=F("joint_action__muscles__muscle_id"),
+            muscle_group_id=F("joint_action__muscles__muscle__muscle_group_id"),
+            role_id=F("joint_action__muscles__role_id"),
+        ).annotate(
+            impact=Sum(
+                F("joint_range_of_motion__impact_factor")
+                * F("joint_action__muscles__impact_factor")
+            )
+        )
+        return [ExerciseMuscleTarget(**row) for row in rows]
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, exercise_ids=None):
+        """Replaces index rows for the given exercises, or for all of them.
+
+        Args:
+            exercise_ids: Optional iterable of exercise IDs to rebuild. The
+                whole index is rebuilt when None.
+
+        Returns:
+            The number of index rows written.
+        """
+        if exercise_ids is not None:
+            exercise_ids = set(exercise_ids)
+            if not exercise_ids:
+                return 0
+
+        if cls.is_deferred():
+            cls._mark_pending()
+            return 0
+
+        stale = ExerciseMuscleTarget.objects.all()
+        if exercise_ids is not None:
+            stale = stale.filter(exercise_id__in=exercise_ids)
+        stale.delete()
+
+        rows = cls._aggregate_rows(exercise_ids)
+        ExerciseMuscleTarget.objects.bulk_create(rows, batch_size=500)
+        return len(rows)
+
+    @classmethod
+    def rebuild_for_joint_actions(cls, joint_action_ids):
+        """Rebuilds the exercises that use any of the given joint actions.
+
+        Args:
+            joint_action_ids: Iterable of JointAction IDs that changed.
+
+        Returns:
+            The number of index rows written.
+        """
+        exercise_ids = JointContribution.objects.filter(
+            joint_action_id__in=joint_action_ids
+        ).values_list("exercise_movement__exercise_id", flat=True)
+        return cls.rebuild(exercise_ids)
+
+    @classmethod
+    def is_deferred(cls):
+        """Returns whether rebuilds are currently deferred on this thread."""
+        return getattr(_state, "depth", 0) > 0
+
+    @classmethod
+    def _mark_pending(cls):
+        _state.pending = True
+
+    @classmethod
+    @contextmanager
+    def deferred(cls):
+        """Defers scoped rebuilds to one full rebuild when the block exits.
+
+        Intended for bulk loads where every saved contribution or involvement
+        would otherwise trigger its own rebuild.
+        """
+        _state.depth = getattr(_state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            _state.depth -= 1
+            if _state.depth == 0 and getattr(_state, "pending", False):
+                _state.pending = False
+                cls.rebuild()
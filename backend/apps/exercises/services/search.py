@@ -0,0 +1,109 @@
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Coalesce
+
+SEARCH_CONFIG = "english"
+
+# Name outranks equipment, which outranks the free-text instructions.
+REFRESH_SEARCH_VECTOR_SQL = """
+    UPDATE exercises_exercise AS e
+    SET search_vector =
+        setweight(to_tsvector(%(config)s, coalesce(e.exercise_name, '')), 'A')
+        || setweight(to_tsvector(%(config)s, coalesce((
+            SELECT string_agg(q.label, ' ')
+            FROM exercises_exercise_equipment AS ee
+            JOIN exercises_equipment AS q ON q.id = ee.equipment_id
+            WHERE ee.exercise_id = e.id
+        ), '')), 'B')
+        || setweight(to_tsvector(%(config)s, coalesce(e.instructions, '')), 'C')
+"""
+
+
+class ExerciseSearchService:
+    """Domain service for ranked exercise catalogue search.
+
+    On PostgreSQL, matches a prefix full-text query against the stored search
+    vector and a trigram word similarity against the exercise name, so partial
+    words and typos still match while the trainer types. Other databases have
+    no search vector, and callers fall back to plain substring search.
+    """
+
+    @staticmethod
+    def is_supported():
+        """Returns whether ranked search is available on the default database."""
+        return connection.vendor == "postgresql"
+
+    @staticmethod
+    def _prefix_query(term):
+        """Builds a raw tsquery that prefix-matches every word in the term.
+
+        Args:
+            term: The user's search text.
+
+        Returns:
+            A raw tsquery string such as "bench:* & pre:*", or an empty
+            string when the term holds no searchable words.
+        """
+        words = re.findall(r"\w+", term.lower())
+        return " & ".join(f"{word}:*" for word in words)
+
+    @classmethod
+    def search(cls, queryset, term):
+        """Filters and ranks exercises against the search term.
+
+        Args:
+            queryset: The QuerySet of Exercise objects to search.
+            term: The user's search text.
+
+        Returns:
+            The matching exercises annotated with search_rank.
+        """
+        raw_query = cls._prefix_query(term)
+        if not raw_query:
+            return queryset
+
+        query = SearchQuery(raw_query, config=SEARCH_CONFIG, search_type="raw")
+        similarity = TrigramWordSimilarity(term, "exercise_name")
+
+        # Rows whose vector has not been computed yet rank NULL, which
+        # PostgreSQL sorts first in descending order; they rank on
+        # similarity alone instead.
+        rank = Coalesce(
+            SearchRank(F("search_vector"), query),
+            Value(0.0),
+            output_field=FloatField(),
+        )
+
+        # Both predicates are served by GIN indexes (see migration 0004).
+        return queryset.filter(
+            Q(search_vector=query) | Q(exercise_name__trigram_word_similar=term)
+        ).annotate(search_rank=rank + similarity)
+
+    @classmethod
+    def refresh(cls, exercise_ids=None):
+        """Recomputes the stored search vector for the given exercises.
+
+        Args:
+            exercise_ids: Optional iterable of exercise IDs to refresh. All
+                exercises are refreshed when None.
+        """
+        if not cls.is_supported():
+            return
+
+        sql = REFRESH_SEARCH_VECTOR_SQL
+        params = {"config": SEARCH_CONFIG}
+        if exercise_ids is not None:
+            params["ids"] = list(exercise_ids)
+            if not params["ids"]:
+                return
+            sql += " WHERE e.id = ANY(%(ids)s)"
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
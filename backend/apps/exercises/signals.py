@@ -0,0 +1,140 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.biology.models import Muscle, MuscleInvolvement
+
+from .models import (
+    Equipment,
+    Exercise,
+    ExerciseMovement,
+    JointContribution,
+    JointRangeOfMotion,
+)
+from .services.muscle_index import ExerciseMuscleIndexService
+from .services.search import ExerciseSearchService
+
+
+@receiver(post_save, sender=JointContribution)
+@receiver(post_delete, sender=JointContribution)
+def reindex_contribution_exercise(sender, instance, **kwargs):
+    """Rebuilds the muscle index for the exercise a contribution belongs to.
+
+    Args:
+        sender: The JointContribution model class.
+        instance: The contribution that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    # During a cascade from ExerciseMovement the movement may already be gone;
+    # its own post_delete handler reindexes the exercise in that case.
+    exercise_ids = ExerciseMovement.objects.filter(
+        pk=instance.exercise_movement_id
+    ).values_list("exercise_id", flat=True)
+    ExerciseMuscleIndexService.rebuild(exercise_ids)
+
+
+@receiver(post_delete, sender=ExerciseMovement)
+def reindex_movement_exercise(sender, instance, **kwargs):
+    """Rebuilds the muscle index after an exercise loses a movement phase.
+
+    Args:
+        sender: The ExerciseMovement model class.
+        instance: The movement that was deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    ExerciseMuscleIndexService.rebuild([instance.exercise_id])
+
+
+@receiver(post_save, sender=MuscleInvolvement)
+@receiver(post_delete, sender=MuscleInvolvement)
+def reindex_involvement_exercises(sender, instance, **kwargs):
+    """Rebuilds every exercise that uses the involvement's joint action.
+
+    Args:
+        sender: The MuscleInvolvement model class.
+        instance: The involvement that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    ExerciseMuscleIndexService.rebuild_for_joint_actions([instance.joint_action_id])
+
+
+@receiver(post_save, sender=JointRangeOfMotion)
+def reindex_range_of_motion_exercises(sender, instance, created, **kwargs):
+    """Rebuilds exercises whose contributions use an edited range of motion.
+
+    Args:
+        sender: The JointRangeOfMotion model class.
+        instance: The range of motion that was saved.
+        created: Whether the row is new, in which case nothing references it.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if created:
+        return
+    ExerciseMuscleIndexService.rebuild(
+        JointContribution.objects.filter(joint_range_of_motion=instance).values_list(
+            "exercise_movement__exercise_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Muscle)
+def reindex_muscle_exercises(sender, instance, created, **kwargs):
+    """Rebuilds exercises working a muscle so its copied group stays current.
+
+    Args:
+        sender: The Muscle model class.
+        instance: The muscle that was saved.
+        created: Whether the row is new, in which case nothing references it.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if created:
+        return
+    ExerciseMuscleIndexService.rebuild_for_joint_actions(
+        instance.actions.values_list("joint_action_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Exercise)
+def refresh_exercise_search_vector(sender, instance, **kwargs):
+    """Recomputes the search vector after an exercise's text changes.
+
+    Args:
+        sender: The Exercise model class.
+        instance: The exercise that was saved.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    ExerciseSearchService.refresh([instance.pk])
+
+
+@receiver(m2m_changed, sender=Exercise.equipment.through)
+def refresh_equipment_search_vectors(sender, instance, action, reverse, **kwargs):
+    """Recomputes search vectors when exercises gain or lose equipment.
+
+    Args:
+        sender: The Exercise.equipment intermediate model.
+        instance: The exercise or equipment whose relation changed.
+        action: The m2m_changed action, only post_* actions are handled.
+        reverse: True when the change was made from the Equipment side.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if not action.startswith("post_"):
+        return
+    if reverse:
+        # pk_set is None after clearing from the Equipment side: refresh all.
+        ExerciseSearchService.refresh(kwargs.get("pk_set"))
+    else:
+        ExerciseSearchService.refresh([instance.pk])
+
+
+@receiver(post_save, sender=Equipment)
+def refresh_equipment_exercise_search_vectors(sender, instance, created, **kwargs):
+    """Recomputes search vectors of exercises using a renamed piece of equipment.
+
+    Args:
+        sender: The Equipment model class.
+        instance: The equipment that was saved.
+        created: Whether the row is new, in which case nothing references it.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if created:
+        return
+    ExerciseSearchService.refresh(instance.exercises.values_list("pk", flat=True))
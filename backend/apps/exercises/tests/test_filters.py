@@ -1,5 +1,7 @@
 import pytest
 
+from apps.exercises.models import Exercise, ExerciseMovement, JointContribution
+
 pytestmark = pytest.mark.django_db
 
 
@@ -46,6 +48,17 @@ def test_exercise_search_by_name(api_client, response_items, exercise_filter_wor
     )
 
 
+def test_exercise_search_falls_back_to_substring_match(
+    api_client, response_items, exercise_filter_world
+):
+    response = api_client.get("/api/v1/exercises/exercises/?search=ench")
+    _, data = response_items(response)
+
+    assert [item["exercise_name"] for item in data] == [
+        exercise_filter_world["barbell_bench_press"].exercise_name
+    ]
+
+
 def test_equipment_search_filters_results(
     api_client, response_items, exercise_filter_world
 ):
@@ -157,3 +170,62 @@ def test_exercise_ordering(
 
     names = [item["exercise_name"] for item in data]
     assert names == sorted(names, reverse=reverse)
+
+
+@pytest.fixture
+def partial_hammer_curl(
+    beginner_level,
+    concentric_phase,
+    elbow_flexion_joint_action,
+    partial_range_of_motion,
+):
+    exercise = Exercise.objects.create(
+        exercise_name="Hammer Curl",
+        api_name="hammer_curl",
+        experience_level=beginner_level,
+    )
+    movement = ExerciseMovement.objects.create(
+        phase=concentric_phase, exercise=exercise
+    )
+    JointContribution.objects.create(
+        joint_action=elbow_flexion_joint_action,
+        joint_range_of_motion=partial_range_of_motion,
+        exercise_movement=movement,
+    )
+    return exercise
+
+
+@pytest.mark.parametrize(
+    "ordering,expected",
+    [
+        ("-target_impact", ["Dumbbell Bicep Curl", "Hammer Curl"]),
+        ("target_impact", ["Hammer Curl", "Dumbbell Bicep Curl"]),
+    ],
+    ids=["strongest first", "weakest first"],
+)
+def test_exercises_can_be_ordered_by_target_impact(
+    api_client,
+    response_items,
+    exercise_filter_world,
+    partial_hammer_curl,
+    ordering,
+    expected,
+):
+    muscle_id = exercise_filter_world["biceps_muscle"].id
+    response = api_client.get(
+        "/api/v1/exercises/exercises/",
+        {"target_muscle_id": str(muscle_id), "ordering": ordering},
+    )
+    _, data = response_items(response)
+
+    assert [item["exercise_name"] for item in data] == expected
+
+
+def test_target_impact_ordering_without_target_filter_is_harmless(
+    api_client, response_items, exercise_filter_world
+):
+    response = api_client.get("/api/v1/exercises/exercises/?ordering=-target_impact")
+    status_code, data = response_items(response)
+
+    assert status_code == 200
+    assert len(data) == 2
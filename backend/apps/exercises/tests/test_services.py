@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+import pytest
+
+from apps.exercises.models import ExerciseMuscleTarget
+from apps.exercises.services.muscle_index import ExerciseMuscleIndexService
+from apps.exercises.services.search import ExerciseSearchService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bicep_curl_world(
+    dumbbell_bicep_curl_exercise,
+    concentric_bicep_curl_movement,
+    elbow_flexion_joint_contribution,
+    bicep_elbow_flexion_involvement,
+):
+    return {
+        "exercise": dumbbell_bicep_curl_exercise,
+        "movement": concentric_bicep_curl_movement,
+        "contribution": elbow_flexion_joint_contribution,
+        "involvement": bicep_elbow_flexion_involvement,
+    }
+
+
+class TestExerciseMuscleIndex:
+
+    def test_index_rows_are_built_from_biomechanics(
+        self, bicep_curl_world, biceps_muscle, upper_arm_group, agonist_role
+    ):
+        target = ExerciseMuscleTarget.objects.get(exercise=bicep_curl_world["exercise"])
+
+        assert target.muscle == biceps_muscle
+        assert target.muscle_group == upper_arm_group
+        assert target.role == agonist_role
+        # Full ROM (1.00) x involvement impact (0.80).
+        assert target.impact == Decimal("0.8000")
+
+    def test_involvement_change_reindexes_exercise(self, bicep_curl_world):
+        involvement = bicep_curl_world["involvement"]
+        involvement.impact_factor = Decimal("0.50")
+        involvement.save()
+
+        target = ExerciseMuscleTarget.objects.get(exercise=bicep_curl_world["exercise"])
+        assert target.impact == Decimal("0.5000")
+
+    def test_deleting_contribution_removes_rows(self, bicep_curl_world):
+        bicep_curl_world["contribution"].delete()
+
+        assert not ExerciseMuscleTarget.objects.filter(
+            exercise=bicep_curl_world["exercise"]
+        ).exists()
+
+    def test_deleting_exercise_cascades_cleanly(self, bicep_curl_world):
+        bicep_curl_world["exercise"].delete()
+
+        assert not ExerciseMuscleTarget.objects.exists()
+
+    def test_full_rebuild_restores_missing_rows(self, bicep_curl_world):
+        ExerciseMuscleTarget.objects.all().delete()
+
+        rows_written = ExerciseMuscleIndexService.rebuild()
+
+        assert rows_written == 1
+        assert ExerciseMuscleTarget.objects.count() == 1
+
+    def test_deferred_block_rebuilds_once_on_exit(self, bicep_curl_world):
+        involvement = bicep_curl_world["involvement"]
+
+        with ExerciseMuscleIndexService.deferred():
+            involvement.impact_factor = Decimal("0.30")
+            involvement.save()
+            target = ExerciseMuscleTarget.objects.get()
+            assert target.impact == Decimal("0.8000")
+
+        assert ExerciseMuscleTarget.objects.get().impact == Decimal("0.3000")
+
+
+class TestExerciseSearchService:
+
+    @pytest.mark.parametrize(
+        "term,expected",
+        [
+            ("bench", "bench:*"),
+            ("Bench  Pre", "bench:* & pre:*"),
+            ("curl's & | !", "curl:* & s:*"),
+            ("  ", ""),
+        ],
+        ids=["single word", "multiple words", "operators stripped", "blank"],
+    )
+    def test_prefix_query(self, term, expected):
+        assert ExerciseSearchService._prefix_query(term) == expected
+
+    def test_refresh_is_a_no_op_without_postgres(self, dumbbell_bicep_curl_exercise):
+        ExerciseSearchService.refresh()
+
+        dumbbell_bicep_curl_exercise.refresh_from_db()
+        assert dumbbell_bicep_curl_exercise.search_vector is None
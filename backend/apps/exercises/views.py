@@ -1,9 +1,9 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, viewsets
 
-from core.views import NormalisedLookupViewSet
+from core.views import NormalisedLookupViewSet, ReferenceDataCacheMixin
 
-from .filters import ExerciseFilter
+from .filters import ExerciseFilter, ExerciseSearchFilter
 from .models import (
     Equipment,
     Exercise,
@@ -24,22 +24,25 @@ class EquipmentViewSet(NormalisedLookupViewSet):
     queryset = Equipment.objects.all()
 
 
-class ExerciseViewSet(viewsets.ReadOnlyModelViewSet):
+class ExerciseViewSet(ReferenceDataCacheMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for public reference data of Exercises.
 
     This ViewSet is primarily used to browse and select exercises for workout
     construction. It supports filtering, searching, and ordering by exercise name.
+    Responses are versioned and cached as reference data.
 
     Attributes:
         permission_classes: Set to AllowAny for public read access.
         serializer_class: Uses ExerciseSerializer for detailed output.
         queryset: Optimized QuerySet using select_related and prefetch_related
              to reduce database hits for experience levels and equipment.
-        filter_backends: Supports DjangoFilterBackend, SearchFilter, and
-            OrderingFilter.
+        filter_backends: Supports DjangoFilterBackend, OrderingFilter and
+            ExerciseSearchFilter (ranked full-text search on PostgreSQL).
         filterset_class: Linked to ExerciseFilter for complex muscle-based filtering.
-        search_fields: Enables searching on the 'exercise_name' field.
-        ordering_fields: Allows ordering by 'exercise_name'.
+        search_fields: Substring search on 'exercise_name' where ranked search
+            is unavailable.
+        ordering_fields: Allows ordering by 'exercise_name', and by 'target_impact'
+            when a target muscle or muscle group filter is applied.
         ordering: Default sort order is alphabetical by 'exercise_name'.
     """
 
@@ -53,12 +56,12 @@ class ExerciseViewSet(viewsets.ReadOnlyModelViewSet):
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        ExerciseSearchFilter,
     ]
     filterset_class = ExerciseFilter
 
     search_fields = ["exercise_name"]
 
-    ordering_fields = ["exercise_name"]
+    ordering_fields = ["exercise_name", "target_impact"]
     ordering = ["exercise_name"]
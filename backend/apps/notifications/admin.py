@@ -0,0 +1,39 @@
+from django.contrib import admin
+
+from .models import EmailOutboxMessage
+
+
+@admin.register(EmailOutboxMessage)
+class EmailOutboxMessageAdmin(admin.ModelAdmin):
+    """Admin interface for the EmailOutboxMessage model.
+
+    Lets staff inspect delivery state and errors. Message content and
+    delivery bookkeeping are read-only; resetting a failed message to
+    PENDING is the only intended edit.
+    """
+
+    list_display = (
+        "category",
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+
+    list_filter = ("status", "category")
+
+    search_fields = ("dedup_key", "subject")
+
+    readonly_fields = (
+        "category",
+        "dedup_key",
+        "to",
+        "from_email",
+        "subject",
+        "body",
+        "html_body",
+        "attempts",
+        "last_error",
+        "sent_at",
+    )
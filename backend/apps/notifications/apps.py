@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    """Configuration class for the notifications application.
+
+    This app owns the transactional email outbox: messages are written in
+    the request transaction and delivered later by the deliver_outbox worker.
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.notifications"
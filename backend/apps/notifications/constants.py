@@ -0,0 +1,37 @@
+class EmailStatusVocabulary:
+    """Constants representing the delivery states of an outbox message.
+
+    Messages start PENDING, are claimed as SENDING by a worker and end SENT or,
+    once every attempt has failed, FAILED.
+    """
+
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    ]
+
+    # States a worker may pick up once next_attempt_at has passed.
+    DELIVERABLE_STATES = {PENDING, SENDING}
+    # States a message never leaves.
+    FINISHED_STATES = {SENT, FAILED}
+
+
+class EmailCategoryVocabulary:
+    """Constants naming the kinds of transactional email the outbox carries."""
+
+    PASSWORD_RESET = "PASSWORD_RESET"
+    MEMBERSHIP_REQUEST = "MEMBERSHIP_REQUEST"
+    PROGRAM_REVIEW = "PROGRAM_REVIEW"
+
+    CHOICES = [
+        (PASSWORD_RESET, "Password reset"),
+        (MEMBERSHIP_REQUEST, "Membership request"),
+        (PROGRAM_REVIEW, "Program review"),
+    ]
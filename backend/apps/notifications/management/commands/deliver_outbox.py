@@ -0,0 +1,71 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.notifications.services.outbox import EmailOutboxService
+
+
+class Command(BaseCommand):
+    """Django management command that delivers queued transactional email.
+
+    By default it drains every message that is currently due and exits, which
+    suits a cron-style schedule. With --loop it keeps polling, sleeping for
+    --interval seconds whenever the outbox is empty.
+
+    Whenever the outbox is idle, at most once every PRUNE_INTERVAL_SECONDS,
+    finished messages older than EMAIL_OUTBOX_RETENTION_DAYS are deleted.
+    """
+
+    PRUNE_INTERVAL_SECONDS = 60 * 60
+
+    help = "Delivers due messages from the transactional email outbox in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            help="Maximum number of messages claimed per batch.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new messages instead of exiting when idle.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EMAIL_OUTBOX_POLL_SECONDS,
+            help="Seconds to sleep between polls when the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        """Delivers outbox batches until idle, or forever with --loop.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+        """
+        totals = {"sent": 0, "failed": 0, "pruned": 0}
+        pruned_at = None
+        while True:
+            result = EmailOutboxService.deliver(batch_size=options["batch_size"])
+            for key in ("sent", "failed"):
+                totals[key] += result[key]
+
+            if result["sent"] + result["failed"] == 0:
+                now = time.monotonic()
+                if pruned_at is None or now - pruned_at >= self.PRUNE_INTERVAL_SECONDS:
+                    totals["pruned"] += EmailOutboxService.prune()
+                    pruned_at = now
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Outbox delivered. Sent: {totals['sent']}, "
+                f"failed attempts: {totals['failed']}, pruned: {totals['pruned']}"
+            )
+        )
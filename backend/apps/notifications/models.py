@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils import timezone
+
+from core.models import ApexModel
+
+from .constants import EmailCategoryVocabulary, EmailStatusVocabulary
+
+
+class EmailOutboxMessage(ApexModel):
+    """A transactional email waiting to be, or already, delivered.
+
+    Rows are written inside the transaction of the action that triggers the
+    email, so an email is only sent if that action commits. The
+    deliver_outbox worker claims due rows in batches, sends them through the
+    configured EMAIL_BACKEND and records the outcome.
+
+    Attributes:
+        category: The kind of email, from EmailCategoryVocabulary.
+        dedup_key: Unique key; enqueueing the same key twice sends once.
+        to: List of recipient addresses.
+        from_email: The sender address.
+        subject: The email subject line.
+        body: The plain text body. Blanked once the message is SENT or
+            FAILED, as it may hold a password reset link.
+        html_body: Optional HTML alternative body, blanked with body.
+        status: Delivery state, from EmailStatusVocabulary.
+        attempts: Number of delivery attempts made so far.
+        next_attempt_at: When the message is next due. For SENDING rows this
+            is the end of the worker's lease, after which it is retried.
+        last_error: The error raised by the most recent failed attempt.
+        sent_at: When the message was handed to the provider.
+    """
+
+    category = models.CharField(max_length=32, choices=EmailCategoryVocabulary.CHOICES)
+    dedup_key = models.CharField(max_length=255, unique=True)
+
+    to = models.JSONField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+
+    status = models.CharField(
+        max_length=16,
+        choices=EmailStatusVocabulary.CHOICES,
+        default=EmailStatusVocabulary.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["next_attempt_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.category} to {', '.join(self.to)} ({self.status})"
@@ -0,0 +1,246 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.notifications.constants import EmailStatusVocabulary
+from apps.notifications.models import EmailOutboxMessage
+
+
+class EmailOutboxService:
+    """Queues transactional email and delivers it outside the request cycle.
+
+    Callers enqueue inside their own transaction. A worker then claims due
+    messages in batches with row locks (SKIP LOCKED on PostgreSQL) so several
+    workers never send the same message. It sends each message over one
+    shared backend connection. Failures are retried with exponential backoff
+    until EMAIL_OUTBOX_MAX_ATTEMPTS is reached.
+
+    Bodies can hold secrets such as password reset links, so they are
+    blanked once a message is sent or given up on, and finished rows are
+    deleted after EMAIL_OUTBOX_RETENTION_DAYS.
+    """
+
+    @staticmethod
+    def _now():
+        """Returns the current timestamp."""
+        return timezone.now()
+
+    @staticmethod
+    def default_dedup_key(category, to, subject, body):
+        """Derives a dedup key from the message content.
+
+        Args:
+            category: The email category.
+            to: List of recipient addresses.
+            subject: The subject line.
+            body: The plain text body.
+
+        Returns:
+            str: A key identifying identical messages.
+        """
+        content = "\x1f".join([category, *sorted(to), subject, body])
+        return f"{category}:{hashlib.sha256(content.encode()).hexdigest()}"
+
+    @classmethod
+    @transaction.atomic
+    def enqueue(
+        cls,
+        *,
+        category,
+        to,
+        subject,
+        body,
+        html_body="",
+        dedup_key=None,
+        from_email=None,
+    ):
+        """Adds a message to the outbox unless one with the same key exists.
+
+        Args:
+            category: The kind of email, from EmailCategoryVocabulary.
+            to: List of recipient addresses.
+            subject: The subject line.
+            body: The plain text body.
+            html_body: Optional HTML alternative body.
+            dedup_key: Key identifying the logical email. Defaults to a hash
+                of the content, so exact repeats are dropped.
+            from_email: The sender. Defaults to DEFAULT_FROM_EMAIL.
+
+        Returns:
+            A tuple of the EmailOutboxMessage and whether it was newly queued.
+        """
+        to = list(to)
+        message, created = EmailOutboxMessage.objects.get_or_create(
+            dedup_key=dedup_key or cls.default_dedup_key(category, to, subject, body),
+            defaults={
+                "category": category,
+                "to": to,
+                "subject": subject,
+                "body": body,
+                "html_body": html_body,
+                "from_email": from_email or settings.DEFAULT_FROM_EMAIL,
+            },
+        )
+        if created and settings.EMAIL_OUTBOX_EAGER:
+            transaction.on_commit(lambda: cls.deliver([message.pk]))
+        return message, created
+
+    @classmethod
+    def backoff(cls, attempts):
+        """Returns the delay before retrying after the given number of attempts.
+
+        Args:
+            attempts: Attempts made so far, at least 1.
+
+        Returns:
+            timedelta: EMAIL_OUTBOX_BACKOFF_SECONDS doubled per failed attempt,
+                capped at EMAIL_OUTBOX_MAX_BACKOFF_SECONDS.
+        """
+        seconds = settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1)
+        return timedelta(
+            seconds=min(seconds, settings.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS)
+        )
+
+    @classmethod
+    @transaction.atomic
+    def claim_batch(cls, batch_size=None, message_ids=None):
+        """Locks and leases the next due messages for delivery.
+
+        Claimed messages move to SENDING with next_attempt_at set to the end
+        of the lease, so a crashed worker's messages become due again.
+
+        Args:
+            batch_size: Maximum number of messages to claim. Defaults to
+                EMAIL_OUTBOX_BATCH_SIZE.
+            message_ids: Optional primary keys restricting the claim.
+
+        Returns:
+            list[EmailOutboxMessage]: The claimed messages.
+        """
+        now = cls._now()
+        due = EmailOutboxMessage.objects.filter(
+            status__in=EmailStatusVocabulary.DELIVERABLE_STATES,
+            next_attempt_at__lte=now,
+        )
+        if message_ids is not None:
+            due = due.filter(pk__in=message_ids)
+
+        batch = list(
+            due.select_for_update(skip_locked=True).order_by("next_attempt_at")[
+                : batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+            ]
+        )
+        lease_end = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        EmailOutboxMessage.objects.filter(pk__in=[m.pk for m in batch]).update(
+            status=EmailStatusVocabulary.SENDING,
+            next_attempt_at=lease_end,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        for message in batch:
+            message.status = EmailStatusVocabulary.SENDING
+            message.attempts += 1
+        return batch
+
+    @classmethod
+    def _record_failure(cls, message, error):
+        """Schedules a retry for a failed message, or gives up on it.
+
+        Args:
+            message: The claimed EmailOutboxMessage that failed to send.
+            error: The exception raised while sending.
+        """
+        now = cls._now()
+        fields = {}
+        if message.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            status, next_attempt_at = EmailStatusVocabulary.FAILED, now
+            fields = {"body": "", "html_body": ""}
+        else:
+            status = EmailStatusVocabulary.PENDING
+            next_attempt_at = now + cls.backoff(message.attempts)
+
+        EmailOutboxMessage.objects.filter(pk=message.pk).update(
+            status=status,
+            next_attempt_at=next_attempt_at,
+            last_error=f"{type(error).__name__}: {error}",
+            updated_at=now,
+            **fields,
+        )
+
+    @classmethod
+    def deliver(cls, message_ids=None, batch_size=None):
+        """Claims one batch of due messages and sends them.
+
+        Args:
+            message_ids: Optional primary keys restricting the batch.
+            batch_size: Maximum number of messages to send.
+
+        Returns:
+            dict: Counts of "sent" and "failed" messages in the batch.
+        """
+        batch = cls.claim_batch(batch_size=batch_size, message_ids=message_ids)
+        result = {"sent": 0, "failed": 0}
+        if not batch:
+            return result
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            for message in batch:
+                cls._record_failure(message, error)
+            result["failed"] = len(batch)
+            return result
+
+        try:
+            for message in batch:
+                email = EmailMultiAlternatives(
+                    subject=message.subject,
+                    body=message.body,
+                    from_email=message.from_email,
+                    to=message.to,
+                    headers={"X-Apex-Outbox-Id": str(message.pk)},
+                    connection=connection,
+                )
+                if message.html_body:
+                    email.attach_alternative(message.html_body, "text/html")
+
+                try:
+                    email.send()
+                except Exception as error:
+                    cls._record_failure(message, error)
+                    result["failed"] += 1
+                    continue
+
+                now = cls._now()
+                EmailOutboxMessage.objects.filter(pk=message.pk).update(
+                    status=EmailStatusVocabulary.SENT,
+                    sent_at=now,
+                    body="",
+                    html_body="",
+                    last_error="",
+                    updated_at=now,
+                )
+                result["sent"] += 1
+        finally:
+            connection.close()
+        return result
+
+    @classmethod
+    def prune(cls):
+        """Deletes sent and failed messages older than the retention period.
+
+        Returns:
+            int: The number of messages deleted.
+        """
+        cutoff = cls._now() - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+        deleted, _ = EmailOutboxMessage.objects.filter(
+            status__in=EmailStatusVocabulary.FINISHED_STATES,
+            updated_at__lt=cutoff,
+        ).delete()
+        return deleted
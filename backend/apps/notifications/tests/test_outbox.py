@@ -0,0 +1,229 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.notifications.constants import (
+    EmailCategoryVocabulary,
+    EmailStatusVocabulary,
+)
+from apps.notifications.models import EmailOutboxMessage
+from apps.notifications.services.outbox import EmailOutboxService
+
+pytestmark = pytest.mark.django_db
+
+PASSWORD_RESET_URL = "/api/v1/auth/password/reset/"
+
+
+@pytest.fixture(autouse=True)
+def outbox_settings(settings):
+    settings.EMAIL_OUTBOX_EAGER = False
+    settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 3
+    settings.EMAIL_OUTBOX_BACKOFF_SECONDS = 30
+    settings.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = 60
+    return settings
+
+
+def enqueue(**overrides):
+    fields = {
+        "category": EmailCategoryVocabulary.MEMBERSHIP_REQUEST,
+        "to": ["client@example.com"],
+        "subject": "New membership request",
+        "body": "Someone wants to train with you.",
+    }
+    fields.update(overrides)
+    return EmailOutboxService.enqueue(**fields)
+
+
+@pytest.fixture
+def failing_send(monkeypatch):
+    def send(self, fail_silently=False):
+        raise ConnectionError("provider unavailable")
+
+    monkeypatch.setattr(EmailMultiAlternatives, "send", send)
+
+
+class TestEnqueue:
+
+    def test_identical_messages_are_queued_once(self):
+        first, created = enqueue()
+        second, created_again = enqueue()
+
+        assert created
+        assert not created_again
+        assert first.pk == second.pk
+        assert EmailOutboxMessage.objects.count() == 1
+
+    def test_explicit_dedup_key_collapses_different_content(self):
+        enqueue(dedup_key="review:1", body="First draft")
+        enqueue(dedup_key="review:1", body="Second draft")
+
+        assert EmailOutboxMessage.objects.get().body == "First draft"
+
+    def test_nothing_is_sent_until_delivery(self):
+        enqueue()
+
+        assert mail.outbox == []
+        assert EmailOutboxMessage.objects.get().status == EmailStatusVocabulary.PENDING
+
+    def test_eager_mode_delivers_on_commit(
+        self, outbox_settings, django_capture_on_commit_callbacks
+    ):
+        outbox_settings.EMAIL_OUTBOX_EAGER = True
+
+        with django_capture_on_commit_callbacks(execute=True):
+            message, _ = enqueue()
+
+        message.refresh_from_db()
+        assert message.status == EmailStatusVocabulary.SENT
+        assert len(mail.outbox) == 1
+
+
+class TestDeliver:
+
+    def test_sends_due_messages_and_marks_them_sent(self):
+        message, _ = enqueue(html_body="<p>Hi</p>")
+
+        result = EmailOutboxService.deliver()
+
+        assert result == {"sent": 1, "failed": 0}
+        (email,) = mail.outbox
+        assert email.to == ["client@example.com"]
+        assert email.alternatives[0][1] == "text/html"
+        assert email.extra_headers["X-Apex-Outbox-Id"] == str(message.pk)
+        message.refresh_from_db()
+        assert message.status == EmailStatusVocabulary.SENT
+        assert message.attempts == 1
+        assert message.sent_at is not None
+        assert email.body == "Someone wants to train with you."
+        assert message.body == ""
+        assert message.html_body == ""
+
+    def test_sent_messages_are_not_delivered_again(self):
+        enqueue()
+        EmailOutboxService.deliver()
+
+        assert EmailOutboxService.deliver() == {"sent": 0, "failed": 0}
+        assert len(mail.outbox) == 1
+
+    def test_messages_are_sent_in_batches(self):
+        for index in range(3):
+            enqueue(to=[f"client{index}@example.com"])
+
+        assert EmailOutboxService.deliver(batch_size=2)["sent"] == 2
+        assert EmailOutboxService.deliver(batch_size=2)["sent"] == 1
+
+    def test_failure_is_retried_with_backoff(self, failing_send):
+        message, _ = enqueue()
+        before = timezone.now()
+
+        result = EmailOutboxService.deliver()
+
+        assert result == {"sent": 0, "failed": 1}
+        message.refresh_from_db()
+        assert message.status == EmailStatusVocabulary.PENDING
+        assert message.next_attempt_at >= before + timedelta(seconds=30)
+        assert "provider unavailable" in message.last_error
+        assert EmailOutboxService.deliver() == {"sent": 0, "failed": 0}
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        delays = [EmailOutboxService.backoff(n).total_seconds() for n in (1, 2, 3)]
+
+        assert delays == [30, 60, 60]
+
+    def test_message_fails_after_max_attempts(self, failing_send):
+        message, _ = enqueue()
+
+        for _ in range(3):
+            EmailOutboxMessage.objects.filter(pk=message.pk).update(
+                next_attempt_at=timezone.now()
+            )
+            EmailOutboxService.deliver()
+
+        message.refresh_from_db()
+        assert message.status == EmailStatusVocabulary.FAILED
+        assert message.attempts == 3
+        assert message.body == ""
+
+    def test_finished_messages_are_pruned_after_retention(self, outbox_settings):
+        outbox_settings.EMAIL_OUTBOX_RETENTION_DAYS = 7
+        old, _ = enqueue(to=["old@example.com"])
+        recent, _ = enqueue(to=["recent@example.com"])
+        pending, _ = enqueue(to=["pending@example.com"])
+        EmailOutboxService.deliver(message_ids=[old.pk, recent.pk])
+        EmailOutboxMessage.objects.filter(pk__in=[old.pk, pending.pk]).update(
+            updated_at=timezone.now() - timedelta(days=8)
+        )
+
+        assert EmailOutboxService.prune() == 1
+        assert set(EmailOutboxMessage.objects.values_list("pk", flat=True)) == {
+            recent.pk,
+            pending.pk,
+        }
+
+    def test_expired_lease_is_claimed_again(self):
+        message, _ = enqueue()
+        EmailOutboxMessage.objects.filter(pk=message.pk).update(
+            status=EmailStatusVocabulary.SENDING,
+            next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        assert EmailOutboxService.deliver()["sent"] == 1
+
+
+class TestDeliverOutboxCommand:
+
+    def test_drains_every_due_message(self):
+        for index in range(3):
+            enqueue(to=[f"client{index}@example.com"])
+
+        call_command("deliver_outbox", batch_size=2)
+
+        assert len(mail.outbox) == 3
+        assert not EmailOutboxMessage.objects.exclude(
+            status=EmailStatusVocabulary.SENT
+        ).exists()
+
+
+class TestPasswordResetEmail:
+
+    def test_reset_request_is_queued(self, api_client, client_user):
+        response = api_client.post(
+            PASSWORD_RESET_URL, {"email": client_user.email}, format="json"
+        )
+
+        assert response.status_code == 200
+        message = EmailOutboxMessage.objects.get()
+        assert message.category == EmailCategoryVocabulary.PASSWORD_RESET
+        assert message.to == [client_user.email]
+        assert "token=" in message.body
+        assert mail.outbox == []
+
+    def test_repeated_requests_send_one_email(
+        self,
+        api_client,
+        client_user,
+        outbox_settings,
+        django_capture_on_commit_callbacks,
+    ):
+        outbox_settings.EMAIL_OUTBOX_EAGER = True
+        outbox_settings.PASSWORD_RESET_EMAIL_DEDUP_SECONDS = 3600
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for _ in range(2):
+                api_client.post(
+                    PASSWORD_RESET_URL, {"email": client_user.email}, format="json"
+                )
+
+        assert EmailOutboxMessage.objects.count() == 1
+        assert len(mail.outbox) == 1
+
+    def test_unknown_email_queues_nothing(self, api_client):
+        api_client.post(
+            PASSWORD_RESET_URL, {"email": "nobody@example.com"}, format="json"
+        )
+
+        assert not EmailOutboxMessage.objects.exists()
@@ -2,64 +2,66 @@ import json
 import os
 
 from django.core.management import BaseCommand
+from django.db import transaction
 
 from apps.programs.models import (
     ProgramPhaseOption,
     ProgramPhaseStatusOption,
     ProgramStatusOption,
 )
+from core.seeding import BulkSeeder
 
 
 class Command(BaseCommand):
     help = "Seeds programs lookup tables: statuses and phase options"
+    stealth_options = ("key_maps",)
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes without writing them.",
+        )
 
     def handle(self, *args, **options):
         base_dir = os.path.dirname(__file__)
         file_path = os.path.join(base_dir, "seed_programs_data.json")
-        objects_written = 0
+        seeder = BulkSeeder(
+            dry_run=options["dry_run"], key_maps=options.get("key_maps")
+        )
 
         try:
             with open(file_path) as f:
                 data = json.load(f)
                 self.stdout.write("Seeding Programs lookup tables...")
 
-            for item in data.get("program_statuses", []):
-                _, created = ProgramStatusOption.objects.update_or_create(
-                    code=item["code"],
-                    defaults={"label": item["label"]},
+            with transaction.atomic():
+                seeder.upsert(
+                    ProgramStatusOption,
+                    data.get("program_statuses", []),
+                    unique_fields=["code"],
+                    update_fields=["label"],
                 )
-                if created:
-                    self.stdout.write(f"    Created ProgramStatus: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("phase_statuses", []):
-                _, created = ProgramPhaseStatusOption.objects.update_or_create(
-                    code=item["code"],
-                    defaults={"label": item["label"]},
+                seeder.upsert(
+                    ProgramPhaseStatusOption,
+                    data.get("phase_statuses", []),
+                    unique_fields=["code"],
+                    update_fields=["label"],
                 )
-                if created:
-                    self.stdout.write(f"    Created PhaseStatus: {item['label']}")
-                    objects_written += 1
-
-            for item in data.get("phase_options", []):
-                _, created = ProgramPhaseOption.objects.update_or_create(
-                    code=item["code"],
-                    defaults={
-                        "label": item["label"],
-                        "default_duration_days": item["default_duration_days"],
-                        "description": item.get("description", ""),
-                    },
+                seeder.upsert(
+                    ProgramPhaseOption,
+                    [
+                        {"description": "", **item}
+                        for item in data.get("phase_options", [])
+                    ],
+                    unique_fields=["code"],
+                    update_fields=["label", "default_duration_days", "description"],
                 )
-                if created:
-                    self.stdout.write(f"    Created PhaseOption: {item['label']}")
-                    objects_written += 1
 
         except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f"Could not find file at: {file_path}"))
             return
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Programs seeded successfully. Objects created: {objects_written}"
-            )
-        )
+        for line in seeder.report(verbose=options["verbosity"] > 1):
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS("Programs seeded successfully."))
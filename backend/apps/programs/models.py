@@ -50,7 +50,7 @@ class ProgramPhaseOption(NormalisedLookupModel):
 
     def save(self, *args, **kwargs):
         """Validates the model before saving."""
-        self.full_clean()
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
 
@@ -355,7 +355,7 @@ class Program(ApexModel):
 
     def save(self, *args, **kwargs):
         """Validates the model before saving."""
-        self.full_clean()
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -584,7 +584,7 @@ class ProgramPhase(ApexModel):
 
     def save(self, *args, **kwargs):
         """Validates the model before saving."""
-        self.full_clean()
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     def __str__(self) -> str:
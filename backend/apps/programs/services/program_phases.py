@@ -7,8 +7,13 @@ from apps.programs.constants import (
     ProgramStatusesVocabulary,
 )
 from apps.programs.models import ProgramPhase, ProgramPhaseStatusOption
+from core.caching import cache_tag_owners, schedule_tag_invalidation
+from core.constants import CacheTagVocabulary, ValidationModeVocabulary
+from core.metrics import instrument
+from core.models import validation_mode
 
 
+@instrument
 class ProgramPhaseService:
     """Domain service for managing individual ProgramPhase lifecycles.
 
@@ -44,6 +49,21 @@ class ProgramPhaseService:
         except ProgramPhaseStatusOption.DoesNotExist as exc:
             raise ValidationError(f"Unknown program phase status: {code}.") from exc
 
+    @staticmethod
+    def _save(phase, update_fields):
+        """Saves the given fields of a phase the service has already validated.
+
+        Transition and lifecycle rules are checked by the service, so only the
+        touched fields and the model's clean() are re-validated. Uniqueness
+        and foreign keys are left to the database constraints.
+
+        Args:
+            phase: The ProgramPhase instance to save.
+            update_fields: The fields that changed.
+        """
+        with validation_mode(ValidationModeVocabulary.FAST):
+            phase.save(update_fields=update_fields)
+
     @classmethod
     def _transition_map(cls):
         """Defines the allowed status transitions for a ProgramPhase.
@@ -307,7 +327,7 @@ class ProgramPhaseService:
                 raise ValidationError("save_fields must be a list, tuple, or set.")
             update_fields.extend(save_fields)
 
-        phase.save(update_fields=update_fields)
+        cls._save(phase, update_fields)
         return phase
 
     @classmethod
@@ -317,6 +337,11 @@ class ProgramPhaseService:
             program_id=program.id,
             status__code=ProgramPhaseStatusesVocabulary.NEXT,
         ).update(status=cls._get_status(ProgramPhaseStatusesVocabulary.PLANNED))
+        # Queryset updates send no post_save, so the cached reads are
+        # invalidated here.
+        schedule_tag_invalidation(
+            CacheTagVocabulary.PROGRAMS, owners=cache_tag_owners(program)
+        )
 
     @classmethod
     def _sync_next_phase(cls, program):
@@ -369,7 +394,7 @@ class ProgramPhaseService:
                 ProgramPhaseStatusesVocabulary.NEXT,
             )
             candidate.status = cls._get_status(ProgramPhaseStatusesVocabulary.NEXT)
-            candidate.save(update_fields=["status"])
+            cls._save(candidate, ["status"])
 
         return candidate
 
@@ -396,7 +421,7 @@ class ProgramPhaseService:
                 phase.last_edited_by = edited_by
                 update_fields.append("last_edited_by")
 
-            phase.save(update_fields=update_fields)
+            cls._save(phase, update_fields)
 
         cls._sync_next_phase(phase.program)
         phase.refresh_from_db()
@@ -437,7 +462,7 @@ class ProgramPhaseService:
             phase.last_edited_by = edited_by
             update_fields.append("last_edited_by")
 
-        phase.save(update_fields=update_fields)
+        cls._save(phase, update_fields)
 
         cls._sync_next_phase(phase.program)
         phase.refresh_from_db()
@@ -488,7 +513,7 @@ class ProgramPhaseService:
             phase.last_edited_by = edited_by
             update_fields.append("last_edited_by")
 
-        phase.save(update_fields=update_fields)
+        cls._save(phase, update_fields)
 
         cls._sync_next_phase(phase.program)
         phase.refresh_from_db()
@@ -536,7 +561,7 @@ class ProgramPhaseService:
             phase.last_edited_by = edited_by
             update_fields.append("last_edited_by")
 
-        phase.save(update_fields=update_fields)
+        cls._save(phase, update_fields)
 
         cls._sync_next_phase(phase.program)
         phase.refresh_from_db()
@@ -579,7 +604,7 @@ class ProgramPhaseService:
             phase.last_edited_by = edited_by
             update_fields.append("last_edited_by")
 
-        phase.save(update_fields=update_fields)
+        cls._save(phase, update_fields)
 
         cls._sync_next_phase(phase.program)
         phase.refresh_from_db()
@@ -641,6 +666,6 @@ class ProgramPhaseService:
                 phase.last_edited_by = edited_by
                 update_fields.append("last_edited_by")
 
-            phase.save(update_fields=update_fields)
+            cls._save(phase, update_fields)
 
         return live_phase_count
@@ -3,10 +3,12 @@ from django.utils import timezone
 
 from apps.programs.constants import ProgramStatusesVocabulary
 from apps.programs.models import Program, ProgramStatusOption
+from core.metrics import instrument
 
 from .program_phases import ProgramPhaseService
 
 
+@instrument
 class ProgramService:
     """Domain service for managing training program lifecycles.
 
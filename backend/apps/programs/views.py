@@ -22,7 +22,9 @@ from apps.programs.serializers import (
 )
 from apps.programs.services.program_phases import ProgramPhaseService
 from apps.programs.services.programs import ProgramService
-from core.views import NormalisedLookupViewSet
+from core.caching import CachedResponseMixin
+from core.constants import CacheTagVocabulary
+from core.views import NormalisedLookupViewSet, ReplicaReadsMixin
 
 from .filters import ProgramFilter
 
@@ -35,6 +37,7 @@ class ProgramPhaseOptionViewSet(NormalisedLookupViewSet):
 
 
 class ProgramPhaseViewSet(
+    CachedResponseMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -49,6 +52,7 @@ class ProgramPhaseViewSet(
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["program", "status", "phase_option", "sequence_order"]
+    cache_tags = (CacheTagVocabulary.PROGRAMS, CacheTagVocabulary.MEMBERSHIPS)
 
     def get_queryset(self):
         """Filters phases based on the user's role and associated membership.
@@ -248,6 +252,8 @@ class ProgramPhaseViewSet(
 
 
 class ProgramViewSet(
+    ReplicaReadsMixin,
+    CachedResponseMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -261,6 +267,7 @@ class ProgramViewSet(
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProgramFilter
+    cache_tags = (CacheTagVocabulary.PROGRAMS, CacheTagVocabulary.MEMBERSHIPS)
 
     def get_queryset(self):
         """Filters programs based on whether the user is a trainer or a client."""
@@ -0,0 +1,258 @@
+"""JWT authentication that answers common user lookups from token claims.
+
+Access tokens issued by ApexTokenObtainPairSerializer carry the user's role
+flags and profile ids. ClaimsJWTCookieAuthentication turns those claims into a
+ClaimsUser, which behaves like a CustomUser but only reads the database row
+when something outside the claims is accessed.
+
+Revocation is handled by a claims version: a hash over the fields that should
+invalidate outstanding tokens (activation, roles, password). The current
+version for each user is held in the default cache for a short time and
+refreshed whenever the user row is saved, so a password change or
+deactivation rejects existing tokens without a per-request user query.
+"""
+
+import uuid
+
+from dj_rest_auth.jwt_auth import JWTCookieAuthentication
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.crypto import salted_hmac
+from django.utils.functional import LazyObject
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .models import ClientProfile, TrainerProfile
+
+User = get_user_model()
+
+CLAIMS_VERSION_CLAIM = "cv"
+CLAIMS_VERSION_FIELDS = ("is_active", "is_trainer", "is_client", "is_staff")
+CLAIMS_VERSION_CACHE_KEY = "auth:claims-version:{user_id}"
+
+_CLAIMS_VERSION_SALT = "apps.users.authentication.claims_version"
+
+
+def get_user_role(user) -> str:
+    """Determines the role name exposed to the frontend for a user.
+
+    Args:
+        user: Anything exposing the CustomUser role flags.
+
+    Returns:
+        str: One of 'admin', 'trainer', 'client', or 'unknown'.
+    """
+    if user.is_superuser:
+        return "admin"
+    if user.is_trainer:
+        return "trainer"
+    if user.is_client:
+        return "client"
+    return "unknown"
+
+
+def compute_claims_version(values: dict) -> str:
+    """Hashes the user fields that must invalidate tokens when they change.
+
+    Args:
+        values: A mapping holding every field in CLAIMS_VERSION_FIELDS plus
+            "is_superuser" and "password".
+
+    Returns:
+        A short keyed hash, safe to embed in a readable token.
+    """
+    parts = [str(values[field]) for field in CLAIMS_VERSION_FIELDS]
+    parts += [str(values["is_superuser"]), values["password"]]
+    return salted_hmac(_CLAIMS_VERSION_SALT, "|".join(parts)).hexdigest()[:16]
+
+
+def claims_version_for_user(user) -> str:
+    """Computes the claims version of a loaded user instance.
+
+    Args:
+        user: The CustomUser instance.
+
+    Returns:
+        The claims version, as produced by compute_claims_version.
+    """
+    fields = (*CLAIMS_VERSION_FIELDS, "is_superuser", "password")
+    return compute_claims_version({field: getattr(user, field) for field in fields})
+
+
+def cache_claims_version(user) -> None:
+    """Stores the current claims version of a user for token checks.
+
+    Args:
+        user: The CustomUser instance that was just saved.
+    """
+    cache.set(
+        CLAIMS_VERSION_CACHE_KEY.format(user_id=user.pk),
+        claims_version_for_user(user),
+        timeout=settings.AUTH_CLAIMS_CACHE_TIMEOUT,
+    )
+
+
+def get_claims_version(user_id) -> str | None:
+    """Returns the current claims version for a user, reading the DB on a miss.
+
+    Args:
+        user_id: The primary key carried by the token.
+
+    Returns:
+        The claims version, or None when the user no longer exists.
+    """
+    key = CLAIMS_VERSION_CACHE_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        values = (
+            User.objects.filter(pk=user_id)
+            .values(*CLAIMS_VERSION_FIELDS, "is_superuser", "password")
+            .first()
+        )
+        if values is None:
+            return None
+        version = compute_claims_version(values)
+        cache.set(key, version, timeout=settings.AUTH_CLAIMS_CACHE_TIMEOUT)
+    return version
+
+
+def _as_uuid(value):
+    return None if value is None else uuid.UUID(str(value))
+
+
+class ClaimsUser(LazyObject):
+    """A CustomUser stand-in built from access token claims.
+
+    Identity, role flags and profile ids are answered from the token. Any
+    other attribute loads the full user row once and is proxied to it, so code
+    written against CustomUser keeps working unchanged. Profiles are returned
+    as deferred instances holding only their primary key, which is enough for
+    filtering and foreign key assignment.
+    """
+
+    def __init__(self, token):
+        super().__init__()
+        # LazyObject forwards attribute writes to the wrapped object, so the
+        # claims are stored on the instance dict directly.
+        self.__dict__["_token"] = token
+        self.__dict__["_profiles"] = {}
+
+    def _setup(self):
+        self._wrapped = User.objects.get(pk=self.pk)
+
+    @property
+    def pk(self):
+        return _as_uuid(self._token[jwt_settings.USER_ID_CLAIM])
+
+    id = pk
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    @property
+    def is_trainer(self):
+        return self._token["is_trainer"]
+
+    @property
+    def is_client(self):
+        return self._token["is_client"]
+
+    @property
+    def is_staff(self):
+        return self._token["is_staff"]
+
+    @property
+    def is_superuser(self):
+        return self._token["is_superuser"]
+
+    @property
+    def trainer_profile(self):
+        return self._profile("trainer_profile", TrainerProfile)
+
+    @property
+    def client_profile(self):
+        return self._profile("client_profile", ClientProfile)
+
+    def _profile(self, name, model):
+        if name not in self._profiles:
+            profile_id = _as_uuid(self._token.get(f"{name}_id"))
+            if profile_id is None:
+                self._profiles[name] = None
+            else:
+                profile = model.from_db(
+                    DEFAULT_DB_ALIAS, ["id", "user_id"], [profile_id, self.pk]
+                )
+                model._meta.get_field("user").set_cached_value(profile, self)
+                self._profiles[name] = profile
+
+        profile = self._profiles[name]
+        if profile is None:
+            raise getattr(User, name).RelatedObjectDoesNotExist(
+                f"{User.__name__} has no {name}."
+            )
+        return profile
+
+    def __eq__(self, other):
+        if isinstance(other, (ClaimsUser, User)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __bool__(self):
+        return True
+
+
+class ClaimsJWTCookieAuthentication(JWTCookieAuthentication):
+    """JWTCookieAuthentication that skips the user query for claims tokens.
+
+    Tokens carrying a claims version resolve to a ClaimsUser once the version
+    matches the cached one. Tokens issued before claims were added, and every
+    token when AUTH_CLAIMS_FAST_PATH is disabled, fall back to the regular
+    database lookup.
+    """
+
+    def get_user(self, validated_token):
+        """Resolves the request user from a validated token.
+
+        Args:
+            validated_token: The decoded access token.
+
+        Returns:
+            A ClaimsUser for claims tokens, otherwise a CustomUser instance.
+
+        Raises:
+            AuthenticationFailed: If the token has no user id, the user no
+                longer exists, or its claims version is outdated.
+        """
+        if (
+            not settings.AUTH_CLAIMS_FAST_PATH
+            or CLAIMS_VERSION_CLAIM not in validated_token
+        ):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise AuthenticationFailed(
+                "Token contained no recognizable user identification",
+                code="token_not_valid",
+            )
+
+        current = get_claims_version(user_id)
+        if current is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if current != validated_token[CLAIMS_VERSION_CLAIM]:
+            raise AuthenticationFailed(
+                "Token is no longer valid for this user", code="token_revoked"
+            )
+
+        return ClaimsUser(validated_token)
@@ -14,3 +14,26 @@ class MembershipVocabulary:
     # Sets for logical grouping of states
     ACTIVE_STATES = {PENDING, ACTIVE}
     INACTIVE_STATES = {REJECTED, DISSOLVED_BY_CLIENT, DISSOLVED_BY_TRAINER}
+
+
+class ProfileImageStatusVocabulary:
+    """Processing states of an uploaded trainer logo or client avatar.
+
+    An empty status means no image has been uploaded. New uploads start as
+    PENDING until the background stage has rendered their variants.
+    """
+
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSING, "Processing"),
+        (READY, "Ready"),
+        (FAILED, "Failed"),
+    ]
+
+    # States the background stage still has to pick up
+    QUEUED_STATES = {PENDING, PROCESSING}
@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.users.services.images import ProfileImageService
+
+
+class Command(BaseCommand):
+    """Django management command that renders queued logos and avatars.
+
+    By default it processes every queued upload and exits. With --loop it
+    keeps polling, sleeping for --interval seconds whenever nothing is queued.
+    """
+
+    help = "Validates queued profile images and renders their resized variants"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PROFILE_IMAGE_BATCH_SIZE,
+            help="Maximum number of profiles of each kind processed per batch.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new uploads instead of exiting when idle.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.PROFILE_IMAGE_POLL_SECONDS,
+            help="Seconds to sleep between polls when nothing is queued.",
+        )
+
+    def handle(self, *args, **options):
+        """Processes queued images until idle, or forever with --loop.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+        """
+        totals = {"ready": 0, "failed": 0}
+        while True:
+            result = ProfileImageService.process_queued(
+                batch_size=options["batch_size"]
+            )
+            for key in totals:
+                totals[key] += result[key]
+
+            if result["ready"] + result["failed"] == 0:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Profile images processed. Ready: {totals['ready']}, "
+                f"rejected: {totals['failed']}"
+            )
+        )
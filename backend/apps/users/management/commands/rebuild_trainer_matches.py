@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.users.services.matching import TrainerMatchingService
+
+
+class Command(BaseCommand):
+    """Django management command to rebuild the trainer matching directory.
+
+    The directory is normally kept current by signals; this command recomputes
+    it from scratch, for example after a deploy or bulk membership changes.
+    """
+
+    help = "Rebuilds the precomputed (goal, level) -> trainer matching directory"
+
+    def handle(self, *args, **kwargs):
+        """Executes a full rebuild of the TrainerMatch table.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **kwargs: Keyword arguments passed to the command.
+        """
+        rows_written = TrainerMatchingService.rebuild_all()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Trainer matching directory rebuilt. Rows: {rows_written}"
+            )
+        )
@@ -9,21 +9,31 @@ import json
 import os
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from apps.users.models import ExperienceLevel, MembershipStatus, TrainingGoal
+from core.seeding import BulkSeeder
 
 
 class Command(BaseCommand):
     """Management command to seed users app lookup tables.
 
     Iterates through experience levels, training goals, and membership
-    statuses defined in a JSON file and ensures they exist in the
-    database using update_or_create logic.
+    statuses defined in a JSON file and upserts them in bulk, writing only
+    rows that are new or changed.
     """
 
     help = (
         "Seeds users app lookup tables: ExperienceLevel, TrainingGoal, MembershipStatus"
     )
+    stealth_options = ("key_maps",)
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes without writing them.",
+        )
 
     def handle(self, *args, **options):
         """Executes the seeding process for lookup tables.
@@ -40,56 +50,39 @@ class Command(BaseCommand):
         """
         base_dir = os.path.dirname(__file__)
         file_path = os.path.join(base_dir, "seed_users_data.json")
-        objects_written = 0
+        seeder = BulkSeeder(
+            dry_run=options["dry_run"], key_maps=options.get("key_maps")
+        )
 
         try:
             with open(file_path) as f:
                 data = json.load(f)
                 self.stdout.write("Seeding Users lookup tables...")
 
-            # Seed ExperienceLevel records
-            for item in data.get("experience_levels", []):
-                _, created = ExperienceLevel.objects.update_or_create(
-                    code=item["code"],
-                    defaults={
-                        "label": item["label"],
-                        "progression_cap_percent": item["progression_cap_percent"],
-                    },
+            with transaction.atomic():
+                seeder.upsert(
+                    ExperienceLevel,
+                    data.get("experience_levels", []),
+                    unique_fields=["code"],
+                    update_fields=["label", "progression_cap_percent"],
                 )
-                if created:
-                    self.stdout.write(f"    Created ExperienceLevel: {item['label']}")
-                    objects_written += 1
-
-            # Seed TrainingGoal records
-            for item in data.get("training_goals", []):
-                _, created = TrainingGoal.objects.update_or_create(
-                    code=item["code"],
-                    defaults={
-                        "label": item["label"],
-                        "rep_range_min": item["rep_range_min"],
-                        "rep_range_max": item["rep_range_max"],
-                    },
+                seeder.upsert(
+                    TrainingGoal,
+                    data.get("training_goals", []),
+                    unique_fields=["code"],
+                    update_fields=["label", "rep_range_min", "rep_range_max"],
                 )
-                if created:
-                    self.stdout.write(f"    Created TrainingGoal: {item['label']}")
-                    objects_written += 1
-
-            # Seed MembershipStatus records
-            for item in data.get("membership_statuses", []):
-                _, created = MembershipStatus.objects.update_or_create(
-                    code=item["code"],
-                    defaults={"label": item["label"]},
+                seeder.upsert(
+                    MembershipStatus,
+                    data.get("membership_statuses", []),
+                    unique_fields=["code"],
+                    update_fields=["label"],
                 )
-                if created:
-                    self.stdout.write(f"    Created MembershipStatus: {item['label']}")
-                    objects_written += 1
 
         except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f"Could not find file at: {file_path}"))
             return
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Users seeded successfully. Objects created: {objects_written}"
-            )
-        )
+        for line in seeder.report(verbose=options["verbosity"] > 1):
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS("Users seeded successfully."))
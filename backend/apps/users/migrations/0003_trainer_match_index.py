@@ -0,0 +1,109 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:39
+
+import uuid
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+# icontains compiles to UPPER(...) LIKE UPPER(...) on PostgreSQL, so the
+# trigram index is built over the same expression to serve directory search.
+SEARCH_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS users_trainermatch_search_trgm_gin "
+    "ON users_trainermatch USING gin (UPPER(search_text) gin_trgm_ops)"
+)
+DROP_SEARCH_INDEX_SQL = "DROP INDEX IF EXISTS users_trainermatch_search_trgm_gin"
+
+
+def _run_on_postgres(statement):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_clientprofile_avatar"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trainerprofile",
+            name="max_clients",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="TrainerMatch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("active_client_count", models.PositiveIntegerField(default=0)),
+                ("pending_request_count", models.PositiveIntegerField(default=0)),
+                ("has_capacity", models.BooleanField(default=True)),
+                (
+                    "score",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0"), max_digits=6
+                    ),
+                ),
+                ("search_text", models.TextField(blank=True)),
+                (
+                    "goal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trainer_matches",
+                        to="users.traininggoal",
+                    ),
+                ),
+                (
+                    "level",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trainer_matches",
+                        to="users.experiencelevel",
+                    ),
+                ),
+                (
+                    "trainer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_entries",
+                        to="users.trainerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Trainer Matches",
+                "indexes": [
+                    models.Index(
+                        fields=["goal", "level", "has_capacity", "-score"],
+                        name="users_train_goal_id_4dbedf_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("goal", "level", "trainer"),
+                        name="unique_trainer_match_per_goal_level",
+                    )
+                ],
+            },
+        ),
+        TrigramExtension(),
+        migrations.RunPython(
+            _run_on_postgres(SEARCH_INDEX_SQL),
+            _run_on_postgres(DROP_SEARCH_INDEX_SQL),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_trainer_match_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientprofile",
+            name="avatar_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("PROCESSING", "Processing"),
+                    ("READY", "Ready"),
+                    ("FAILED", "Failed"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="clientprofile",
+            name="avatar_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="trainerprofile",
+            name="logo_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("PROCESSING", "Processing"),
+                    ("READY", "Ready"),
+                    ("FAILED", "Failed"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="trainerprofile",
+            name="logo_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
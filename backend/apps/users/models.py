@@ -9,7 +9,7 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as get_text_value
 
-from apps.users.constants import MembershipVocabulary
+from apps.users.constants import MembershipVocabulary, ProfileImageStatusVocabulary
 from core.models import ApexModel, NormalisedLookupModel
 
 
@@ -190,11 +190,11 @@ class CustomUser(ApexModel, AbstractBaseUser, PermissionsMixin):
         return super().clean()
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the user instance."""
+        """Validates the user instance per the active validation mode before saving."""
         exclude = []
         if self.pk:
             exclude.append("email")
-        self.full_clean(exclude=exclude)
+        self.validate_for_save(kwargs.get("update_fields"), exclude=exclude)
         super().save(*args, **kwargs)
 
     def get_full_name(self):
@@ -218,7 +218,12 @@ class TrainerProfile(ApexModel):
         accepted_levels: Experience levels the trainer accommodates.
         company: Trainer's company name.
         website: Trainer's professional website.
-        logo: Trainer's company logo.
+        logo: Trainer's company logo as uploaded.
+        logo_variants: Storage names of the resized logo renditions, keyed by
+            size and then format. Empty until the logo has been processed.
+        logo_status: Processing state of the logo, blank when there is none.
+        max_clients: Maximum number of active clients the trainer will take
+            on. Null means no limit.
     """
 
     user = models.OneToOneField(
@@ -238,6 +243,11 @@ class TrainerProfile(ApexModel):
     company = models.CharField(max_length=150, blank=True)
     website = models.URLField(max_length=150, blank=True)
     logo = models.ImageField(upload_to="trainer_company_logos/", blank=True)
+    logo_variants = models.JSONField(default=dict, blank=True)
+    logo_status = models.CharField(
+        max_length=20, choices=ProfileImageStatusVocabulary.CHOICES, blank=True
+    )
+    max_clients = models.PositiveSmallIntegerField(null=True, blank=True)
 
     def __str__(self) -> str:
         return f"Trainer: {self.user.email}"
@@ -250,7 +260,10 @@ class ClientProfile(ApexModel):
         user: One-to-one relationship with CustomUser.
         goal: The client's current training goal.
         level: The client's current experience level.
-        avatar: Client's profile picture.
+        avatar: Client's profile picture as uploaded.
+        avatar_variants: Storage names of the resized avatar renditions, keyed
+            by size and then format. Empty until the avatar has been processed.
+        avatar_status: Processing state of the avatar, blank when there is none.
     """
 
     user = models.OneToOneField(
@@ -276,6 +289,10 @@ class ClientProfile(ApexModel):
     )
 
     avatar = models.ImageField(upload_to="client_avatars/", blank=True)
+    avatar_variants = models.JSONField(default=dict, blank=True)
+    avatar_status = models.CharField(
+        max_length=20, choices=ProfileImageStatusVocabulary.CHOICES, blank=True
+    )
 
     def __str__(self):
         return f"Client: {self.user.email}"
@@ -383,10 +400,61 @@ class TrainerClientMembership(ApexModel):
         return super().clean()
 
     def save(self, *args, **kwargs):
-        """Sets active flag based on status and performs full validation."""
+        """Sets active flag based on status and validates before saving."""
         self.is_active = self.status and self.status.code == MembershipVocabulary.ACTIVE
-        self.full_clean()
+        self.validate_for_save(kwargs.get("update_fields"))
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"Trainer: {self.trainer.user.email}. Client: {self.client.user.email}. Status: {self.status.code}"
+
+
+class TrainerMatch(ApexModel):
+    """Precomputed trainer directory entry for one (goal, level) pair.
+
+    One row exists per trainer for every combination of accepted goal and
+    accepted level, carrying the capacity figures, relevance score and search
+    text used to rank trainers for a client. Rows are derived data kept up to
+    date by TrainerMatchingService and should never be edited directly.
+
+    Attributes:
+        goal: A training goal the trainer accepts.
+        level: An experience level the trainer accepts.
+        trainer: The trainer this entry describes.
+        active_client_count: Number of the trainer's active memberships.
+        pending_request_count: Number of pending membership requests.
+        has_capacity: Whether the trainer can take on another client.
+        score: Relevance score used to rank matches, highest first.
+        search_text: Lower-cased name, email, company and website for search.
+    """
+
+    goal = models.ForeignKey(
+        to=TrainingGoal, on_delete=models.CASCADE, related_name="trainer_matches"
+    )
+    level = models.ForeignKey(
+        to=ExperienceLevel, on_delete=models.CASCADE, related_name="trainer_matches"
+    )
+    trainer = models.ForeignKey(
+        to=TrainerProfile, on_delete=models.CASCADE, related_name="match_entries"
+    )
+
+    active_client_count = models.PositiveIntegerField(default=0)
+    pending_request_count = models.PositiveIntegerField(default=0)
+    has_capacity = models.BooleanField(default=True)
+    score = models.DecimalField(max_digits=6, decimal_places=4, default=Decimal("0"))
+    search_text = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name_plural = "Trainer Matches"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["goal", "level", "trainer"],
+                name="unique_trainer_match_per_goal_level",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["goal", "level", "has_capacity", "-score"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.trainer} ({self.goal.code}/{self.level.code})"
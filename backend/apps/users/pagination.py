@@ -0,0 +1,114 @@
+import uuid
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class TrainerMatchCursorPagination(CursorPagination):
+    """Keyset pagination over ranked trainer matches.
+
+    Pages are addressed by the last seen (score, id) pair rather than an
+    offset, so deep pages cost the same as the first and stay stable while
+    the directory is being updated. DRF's cursor only records the first
+    ordering field and falls back to an offset among equal scores, which
+    skips or repeats trainers when matches are rebuilt between requests;
+    here the cursor holds the full, unique ordering key instead.
+    """
+
+    ordering = ("-match_score", "id")
+    position_separator = "|"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Returns the page after (or before) the cursor's ordering key.
+
+        Mirrors CursorPagination.paginate_queryset, filtering on the whole
+        ordering key instead of its first field.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or Cursor(0, False, None)
+
+        ordering = (
+            [self._reversed(order) for order in self.ordering]
+            if reverse
+            else self.ordering
+        )
+        queryset = queryset.order_by(*ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self._after(current_position, reverse))
+
+        # One extra row tells whether a page follows this one.
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+        following_position = None
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+
+        has_current = current_position is not None or offset > 0
+        has_following = following_position is not None
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = has_current, has_following
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next, self.has_previous = has_following, has_current
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def decode_cursor(self, request):
+        """Decodes the cursor, rejecting positions that are not a valid key.
+
+        Raises:
+            NotFound: If the cursor or its position is malformed.
+        """
+        cursor = super().decode_cursor(request)
+        if cursor is not None and cursor.position is not None:
+            self._parse_position(cursor.position)
+        return cursor
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            field_name = order.lstrip("-")
+            if isinstance(instance, dict):
+                values.append(instance[field_name])
+            else:
+                values.append(getattr(instance, field_name))
+        return self.position_separator.join(str(value) for value in values)
+
+    def _parse_position(self, position):
+        try:
+            score, pk = position.split(self.position_separator)
+            return Decimal(score), uuid.UUID(pk)
+        except (ValueError, InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _after(self, position, reverse):
+        """Builds the filter for rows following a position in page order."""
+        condition = Q()
+        equal = {}
+        for order, value in zip(self.ordering, self._parse_position(position)):
+            field_name = order.lstrip("-")
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            condition |= Q(**equal, **{f"{field_name}__{lookup}": value})
+            equal[field_name] = value
+        return condition
+
+    @staticmethod
+    def _reversed(order):
+        return order[1:] if order.startswith("-") else f"-{order}"
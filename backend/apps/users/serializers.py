@@ -1,3 +1,5 @@
+import time
+
 from dj_rest_auth.registration.serializers import RegisterSerializer
 from dj_rest_auth.serializers import PasswordResetSerializer
 from django.conf import settings
@@ -8,9 +10,18 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from apps.notifications.constants import EmailCategoryVocabulary
+from apps.notifications.services.outbox import EmailOutboxService
 from core.serializers import ApexSerializer, LabelLookupSerializer
 
+from .authentication import (
+    CLAIMS_VERSION_CLAIM,
+    claims_version_for_user,
+    get_user_role,
+)
+from .constants import ProfileImageStatusVocabulary
 from .models import (
     ClientProfile,
     ExperienceLevel,
@@ -45,6 +56,49 @@ class ExperienceLevelSerializer(LabelLookupSerializer):
         model = ExperienceLevel
 
 
+class ImageVariantsField(serializers.Field):
+    """Read-only field exposing a profile image's variants as URLs.
+
+    Renders {size: {extension: url}} from the profile's <image>_variants
+    once the image is READY, and an empty mapping while it is processing or
+    absent. URLs are absolute when the request is in the serializer context.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs["read_only"] = True
+        kwargs.setdefault("source", "*")
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """Maps each stored variant name to its URL.
+
+        Args:
+            value: The TrainerProfile or ClientProfile instance.
+
+        Returns:
+            dict: Variant URLs keyed by size and then file extension.
+        """
+        status = getattr(value, f"{self.image_field}_status")
+        if status != ProfileImageStatusVocabulary.READY:
+            return {}
+
+        storage = getattr(value, self.image_field).storage
+        variants = getattr(value, f"{self.image_field}_variants")
+        request = self.context.get("request")
+        return {
+            size: {
+                extension: (
+                    request.build_absolute_uri(storage.url(name))
+                    if request
+                    else storage.url(name)
+                )
+                for extension, name in formats.items()
+            }
+            for size, formats in variants.items()
+        }
+
+
 class ClientProfileSerializer(ApexSerializer):
     """Serializer for ClientProfile including goal and experience details.
 
@@ -54,6 +108,7 @@ class ClientProfileSerializer(ApexSerializer):
 
     goal = TrainingGoalSerializer(read_only=True)
     level = ExperienceLevelSerializer(read_only=True)
+    avatar_variants = ImageVariantsField(image_field="avatar")
 
     goal_id = serializers.PrimaryKeyRelatedField(
         queryset=TrainingGoal.objects.all(),
@@ -79,8 +134,14 @@ class ClientProfileSerializer(ApexSerializer):
             "goal_id",
             "level_id",
             "avatar",
+            "avatar_status",
+            "avatar_variants",
+        ]
+        read_only_fields = ApexSerializer.Meta.read_only_fields + [
+            "goal",
+            "level",
+            "avatar_status",
         ]
-        read_only_fields = ApexSerializer.Meta.read_only_fields + ["goal", "level"]
 
 
 class TrainerProfileSerializer(ApexSerializer):
@@ -92,6 +153,7 @@ class TrainerProfileSerializer(ApexSerializer):
 
     accepted_goals = TrainingGoalSerializer(many=True, read_only=True)
     accepted_levels = ExperienceLevelSerializer(many=True, read_only=True)
+    logo_variants = ImageVariantsField(image_field="logo")
 
     accepted_goal_ids = serializers.PrimaryKeyRelatedField(
         queryset=TrainingGoal.objects.all(),
@@ -119,18 +181,23 @@ class TrainerProfileSerializer(ApexSerializer):
             "company",
             "website",
             "logo",
+            "logo_status",
+            "logo_variants",
+            "max_clients",
         ]
 
         read_only_fields = ApexSerializer.Meta.read_only_fields + [
             "accepted_goals",
             "accepted_levels",
+            "logo_status",
         ]
 
 
 class TrainerMatchingSerializer(ApexSerializer):
     """Specialized serializer for matching clients with trainers.
 
-    Includes basic user identification and trainer-specific capabilities.
+    Includes basic user identification and trainer-specific capabilities,
+    plus the ranking figures annotated from the TrainerMatch directory.
     """
 
     first_name = serializers.CharField(source="user.first_name", read_only=True)
@@ -140,6 +207,13 @@ class TrainerMatchingSerializer(ApexSerializer):
     accepted_goals = TrainingGoalSerializer(many=True, read_only=True)
     accepted_levels = ExperienceLevelSerializer(many=True, read_only=True)
 
+    match_score = serializers.DecimalField(
+        max_digits=6, decimal_places=4, read_only=True
+    )
+    active_client_count = serializers.IntegerField(read_only=True)
+    pending_request_count = serializers.IntegerField(read_only=True)
+    logo_variants = ImageVariantsField(image_field="logo")
+
     class Meta(ApexSerializer.Meta):
         model = TrainerProfile
         fields = ApexSerializer.Meta.fields + [
@@ -148,6 +222,11 @@ class TrainerMatchingSerializer(ApexSerializer):
             "email",
             "accepted_goals",
             "accepted_levels",
+            "logo_variants",
+            "max_clients",
+            "match_score",
+            "active_client_count",
+            "pending_request_count",
         ]
 
         read_only_fields = ApexSerializer.Meta.fields + fields
@@ -187,13 +266,7 @@ class CustomUserSerializer(ApexSerializer):
         Returns:
             str: One of 'admin', 'trainer', 'client', or 'unknown'.
         """
-        if obj.is_superuser:
-            return "admin"
-        if obj.is_trainer:
-            return "trainer"
-        if obj.is_client:
-            return "client"
-        return "unknown"
+        return get_user_role(obj)
 
     def get_profile(self, obj):
         """Returns serialized profile data based on user type.
@@ -210,11 +283,47 @@ class CustomUserSerializer(ApexSerializer):
         return None
 
 
+class ApexTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Issues JWTs that carry the user's role and profile ids as claims.
+
+    The claims let ClaimsJWTCookieAuthentication build the request user
+    without querying the database. Refreshed access tokens copy them from the
+    refresh token, and the claims version rejects tokens whose roles or
+    credentials have changed since they were issued.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        """Creates a refresh token for the user with role and profile claims.
+
+        Args:
+            user: The CustomUser the token is issued to.
+
+        Returns:
+            RefreshToken: The token, with claims added.
+        """
+        token = super().get_token(user)
+        trainer_profile = getattr(user, "trainer_profile", None)
+        client_profile = getattr(user, "client_profile", None)
+
+        token["role"] = get_user_role(user)
+        token["is_trainer"] = user.is_trainer
+        token["is_client"] = user.is_client
+        token["is_staff"] = user.is_staff
+        token["is_superuser"] = user.is_superuser
+        token["trainer_profile_id"] = (
+            str(trainer_profile.pk) if trainer_profile else None
+        )
+        token["client_profile_id"] = str(client_profile.pk) if client_profile else None
+        token[CLAIMS_VERSION_CLAIM] = claims_version_for_user(user)
+        return token
+
+
 class ApexPasswordResetSerializer(PasswordResetSerializer):
     """Custom serializer to send password reset emails via frontend routes."""
 
     def save(self):
-        """Generates reset tokens and sends the email to the user."""
+        """Generates reset tokens and queues the email to the user."""
         email = self.data.get("email", "")
 
         try:
@@ -226,36 +335,21 @@ class ApexPasswordResetSerializer(PasswordResetSerializer):
         token = default_token_generator.make_token(user)
         reset_url = f"{settings.PASSWORD_RESET_LINK}?uid={uid}&token={token}"
 
-        if settings.IS_PROD:
-            from anymail.message import AnymailMessage
-
-            msg = AnymailMessage(
-                subject="Reset your Apex password",
-                body=(
-                    f"Hi {user.get_full_name() or user.email},\n\n"
-                    f"Click the link below to reset your password:\n\n"
-                    f"{reset_url}\n\n"
-                    f"If you didn't request this, ignore this email.\n"
-                ),
-                to=[user.email],
-                from_email=settings.DEFAULT_FROM_EMAIL,
-            )
-            msg.send()
-        else:
-            from django.core.mail import send_mail
-
-            send_mail(
-                subject="Reset your Apex password",
-                message=(
-                    f"Hi {user.get_full_name() or user.email},\n\n"
-                    f"Click the link below to reset your password:\n\n"
-                    f"{reset_url}\n\n"
-                    f"If you didn't request this, ignore this email.\n"
-                ),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-                fail_silently=False,
-            )
+        # Queued in the outbox so the provider round trip happens in the
+        # deliver_outbox worker rather than in this request.
+        window = int(time.time()) // settings.PASSWORD_RESET_EMAIL_DEDUP_SECONDS
+        EmailOutboxService.enqueue(
+            category=EmailCategoryVocabulary.PASSWORD_RESET,
+            to=[user.email],
+            subject="Reset your Apex password",
+            body=(
+                f"Hi {user.get_full_name() or user.email},\n\n"
+                f"Click the link below to reset your password:\n\n"
+                f"{reset_url}\n\n"
+                f"If you didn't request this, ignore this email.\n"
+            ),
+            dedup_key=f"password-reset:{user.pk}:{window}",
+        )
 
 
 class ApexPasswordResetConfirmSerializer(serializers.Serializer):
@@ -445,6 +539,7 @@ class TrainerProfileWriteSerializer(ApexSerializer):
 
     accepted_goals = TrainingGoalSerializer(many=True, read_only=True)
     accepted_levels = ExperienceLevelSerializer(many=True, read_only=True)
+    logo_variants = ImageVariantsField(image_field="logo")
 
     class Meta(ApexSerializer.Meta):
         model = TrainerProfile
@@ -456,8 +551,12 @@ class TrainerProfileWriteSerializer(ApexSerializer):
             "company",
             "website",
             "logo",
+            "logo_status",
+            "logo_variants",
+            "max_clients",
         ]
         read_only_fields = ApexSerializer.Meta.read_only_fields + [
             "accepted_goals",
             "accepted_levels",
+            "logo_status",
         ]
@@ -0,0 +1,285 @@
+from datetime import timedelta
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.users.constants import ProfileImageStatusVocabulary
+from apps.users.models import ClientProfile, TrainerClientMembership, TrainerProfile
+from apps.users.services.matching import TrainerMatchingService
+from apps.users.services.user_details import UserDetailsCacheService
+from core.caching import invalidate_shared_tags
+from core.constants import CacheTagVocabulary
+
+
+class ProfileImageService:
+    """Renders uploaded trainer logos and client avatars into small variants.
+
+    Uploads are stored as-is during the request and marked PENDING. The
+    background stage then validates each image, strips its metadata and
+    renders one WebP and one JPEG (PNG when transparent) per size in
+    PROFILE_IMAGE_SIZES through the field's storage backend. Serializers
+    only expose the variants once the image is READY, so lists never link to
+    the full resolution upload.
+
+    The background stage usually runs in a separate worker service. It
+    bumps the user's /auth/user/ version (UserDetailsCacheService) and the
+    PROFILE_IMAGES shared cache tag of everyone shown the image, both stored
+    in the database, so the web service stops serving the pending image
+    fields without sharing a cache with the worker.
+    """
+
+    # Image field per profile model, and whether it is cropped to a square.
+    # Avatars fill their square; logos are scaled to fit inside it.
+    IMAGE_FIELDS = {
+        TrainerProfile: ("logo", False),
+        ClientProfile: ("avatar", True),
+    }
+
+    @staticmethod
+    def _now():
+        """Returns the current timestamp."""
+        return timezone.now()
+
+    @staticmethod
+    def render_variants(source, crop=True):
+        """Validates an image and renders its resized variants in memory.
+
+        Args:
+            source: A readable binary file containing the upload.
+            crop: Whether to crop to a square rather than fit inside one.
+
+        Returns:
+            dict: Encoded bytes keyed by size name and then file extension.
+
+        Raises:
+            ValidationError: If the file is not a readable image or exceeds
+                PROFILE_IMAGE_MAX_PIXELS.
+        """
+        try:
+            with Image.open(source) as image:
+                if image.width * image.height > settings.PROFILE_IMAGE_MAX_PIXELS:
+                    raise ValidationError("Image dimensions are too large.")
+                image = ImageOps.exif_transpose(image)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            raise ValidationError("Upload is not a valid image.") from e
+
+        has_alpha = image.mode in ("RGBA", "LA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        # Drops EXIF (location, device), ICC and comment metadata.
+        image.info = {}
+        fallback = ("png", "PNG") if has_alpha else ("jpeg", "JPEG")
+
+        variants = {}
+        for size, edge in settings.PROFILE_IMAGE_SIZES.items():
+            if crop:
+                resized = ImageOps.fit(image, (edge, edge), Image.Resampling.LANCZOS)
+            else:
+                resized = ImageOps.contain(
+                    image, (edge, edge), Image.Resampling.LANCZOS
+                )
+
+            variants[size] = {}
+            for extension, image_format in (("webp", "WEBP"), fallback):
+                buffer = BytesIO()
+                resized.save(
+                    buffer,
+                    format=image_format,
+                    quality=settings.PROFILE_IMAGE_QUALITY,
+                    optimize=image_format != "WEBP",
+                )
+                variants[size][extension] = buffer.getvalue()
+        return variants
+
+    @staticmethod
+    def variant_name(name, size, extension):
+        """Builds the storage name of one variant of an uploaded image.
+
+        Args:
+            name: The storage name of the original upload.
+            size: The size name from PROFILE_IMAGE_SIZES.
+            extension: The file extension of the variant.
+
+        Returns:
+            str: A name beside the upload, under a variants/ folder.
+        """
+        path = PurePosixPath(name)
+        return str(path.parent / "variants" / f"{path.stem}-{size}.{extension}")
+
+    @staticmethod
+    def delete_variants(storage, variants):
+        """Removes previously rendered variant files from storage.
+
+        Args:
+            storage: The storage backend holding the files.
+            variants: A variants mapping as stored on the profile.
+        """
+        for formats in variants.values():
+            for name in formats.values():
+                storage.delete(name)
+
+    @classmethod
+    def _queued(cls, field):
+        """Filters profiles waiting for processing, including expired leases."""
+        status = f"{field}_status"
+        lease_start = cls._now() - timedelta(
+            seconds=settings.PROFILE_IMAGE_LEASE_SECONDS
+        )
+        return Q(**{status: ProfileImageStatusVocabulary.PENDING}) | Q(
+            **{
+                status: ProfileImageStatusVocabulary.PROCESSING,
+                "updated_at__lt": lease_start,
+            }
+        )
+
+    @classmethod
+    def _claim(cls, model, pk):
+        """Marks one queued profile as PROCESSING, False if someone else did."""
+        field, _ = cls.IMAGE_FIELDS[model]
+        return bool(
+            model.objects.filter(cls._queued(field), pk=pk).update(
+                **{f"{field}_status": ProfileImageStatusVocabulary.PROCESSING},
+                updated_at=cls._now(),
+            )
+        )
+
+    @classmethod
+    def process(cls, model, pk):
+        """Claims and processes the queued image of one profile.
+
+        Results are written with a conditional update, so an image replaced
+        while it was being processed is left for its own pass. The cached
+        responses showing the image are invalidated afterwards.
+
+        Args:
+            model: TrainerProfile or ClientProfile.
+            pk: The primary key of the profile.
+
+        Returns:
+            str | None: The resulting status, or None when the profile was
+                not queued or its image changed meanwhile.
+        """
+        if not cls._claim(model, pk):
+            return None
+
+        field, crop = cls.IMAGE_FIELDS[model]
+        status_field, variants_field = f"{field}_status", f"{field}_variants"
+        profile = model.objects.only("user_id", field, variants_field).get(pk=pk)
+        image = getattr(profile, field)
+        storage = image.storage
+        current = model.objects.filter(pk=pk, **{field: image.name})
+
+        if not image:
+            current.update(**{status_field: "", variants_field: {}})
+            return ""
+
+        try:
+            with image.open("rb") as source:
+                renditions = cls.render_variants(source, crop=crop)
+        except (ValidationError, FileNotFoundError):
+            if not current.update(
+                **{
+                    field: "",
+                    status_field: ProfileImageStatusVocabulary.FAILED,
+                    variants_field: {},
+                }
+            ):
+                return None
+            storage.delete(image.name)
+            cls.delete_variants(storage, getattr(profile, variants_field))
+            if model is TrainerProfile:
+                TrainerMatchingService.rebuild_for_trainers([pk])
+            cls._invalidate_cached_responses(model, profile.user_id)
+            return ProfileImageStatusVocabulary.FAILED
+
+        variants = {
+            size: {
+                extension: storage.save(
+                    cls.variant_name(image.name, size, extension),
+                    ContentFile(content),
+                )
+                for extension, content in formats.items()
+            }
+            for size, formats in renditions.items()
+        }
+        if not current.update(
+            **{
+                status_field: ProfileImageStatusVocabulary.READY,
+                variants_field: variants,
+            },
+            updated_at=cls._now(),
+        ):
+            cls.delete_variants(storage, variants)
+            return None
+
+        cls.delete_variants(storage, getattr(profile, variants_field))
+        cls._invalidate_cached_responses(model, profile.user_id)
+        return ProfileImageStatusVocabulary.READY
+
+    @staticmethod
+    def _invalidate_cached_responses(model, user_id):
+        """Invalidates the user's details and the rosters showing an avatar.
+
+        Args:
+            model: TrainerProfile or ClientProfile.
+            user_id: The profile's user.
+        """
+        UserDetailsCacheService.bump([user_id])
+        viewers = [user_id]
+        if model is ClientProfile:
+            viewers.extend(
+                TrainerClientMembership.objects.filter(
+                    client__user_id=user_id
+                ).values_list("trainer__user_id", flat=True)
+            )
+        invalidate_shared_tags(CacheTagVocabulary.PROFILE_IMAGES, owners=viewers)
+
+    @classmethod
+    def schedule(cls, model, pk):
+        """Processes a new upload after commit when PROFILE_IMAGE_EAGER is on.
+
+        Otherwise the upload stays PENDING for the process_profile_images
+        worker.
+
+        Args:
+            model: TrainerProfile or ClientProfile.
+            pk: The primary key of the profile with the new upload.
+        """
+        if settings.PROFILE_IMAGE_EAGER:
+            transaction.on_commit(lambda: cls.process(model, pk))
+
+    @classmethod
+    def process_queued(cls, batch_size=None):
+        """Processes one batch of queued images of each profile model.
+
+        Args:
+            batch_size: Maximum profiles per model. Defaults to
+                PROFILE_IMAGE_BATCH_SIZE.
+
+        Returns:
+            dict: Counts of images that became "ready" or "failed".
+        """
+        result = {"ready": 0, "failed": 0}
+        for model, (field, _) in cls.IMAGE_FIELDS.items():
+            pks = list(
+                model.objects.filter(cls._queued(field))
+                .order_by("updated_at")
+                .values_list("pk", flat=True)[
+                    : batch_size or settings.PROFILE_IMAGE_BATCH_SIZE
+                ]
+            )
+            for pk in pks:
+                status = cls.process(model, pk)
+                if status == ProfileImageStatusVocabulary.READY:
+                    result["ready"] += 1
+                elif status == ProfileImageStatusVocabulary.FAILED:
+                    result["failed"] += 1
+        return result
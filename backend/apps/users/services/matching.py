@@ -0,0 +1,199 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from apps.users.constants import MembershipVocabulary
+from apps.users.models import TrainerMatch, TrainerProfile
+
+
+class TrainerMatchingService:
+    """Maintains the precomputed TrainerMatch directory used for client matching.
+
+    Each trainer is expanded into one row per accepted (goal, level) pair so a
+    client's matches become a single indexed lookup. Rows carry the trainer's
+    capacity figures and a relevance score combining three signals:
+
+    - capacity: share of the trainer's client limit still free (1 when the
+      trainer has no limit).
+    - profile: how complete the public profile is (company, website, logo).
+    - responsiveness: penalises a backlog of unanswered requests.
+    """
+
+    SIGNAL_WEIGHTS = {
+        "capacity": Decimal("0.5"),
+        "profile": Decimal("0.3"),
+        "responsiveness": Decimal("0.2"),
+    }
+    SCORE_PRECISION = Decimal("0.0001")
+
+    @classmethod
+    def compute_signals(cls, trainer, active_count, pending_count):
+        """Computes the individual ranking signals for a trainer.
+
+        Args:
+            trainer: The TrainerProfile being scored.
+            active_count: Number of the trainer's active memberships.
+            pending_count: Number of the trainer's pending requests.
+
+        Returns:
+            A dict mapping each signal name in SIGNAL_WEIGHTS to a Decimal
+            between 0 and 1.
+        """
+        if trainer.max_clients is None:
+            capacity = Decimal("1")
+        elif trainer.max_clients == 0:
+            capacity = Decimal("0")
+        else:
+            free = max(trainer.max_clients - active_count, 0)
+            capacity = Decimal(free) / Decimal(trainer.max_clients)
+
+        filled = sum(bool(value) for value in (trainer.company, trainer.website))
+        filled += bool(trainer.logo)
+
+        return {
+            "capacity": capacity,
+            "profile": Decimal(filled) / Decimal(3),
+            "responsiveness": Decimal(1) / Decimal(1 + pending_count),
+        }
+
+    @classmethod
+    def compute_score(cls, signals):
+        """Combines ranking signals into a single weighted relevance score.
+
+        Args:
+            signals: A dict as returned by compute_signals.
+
+        Returns:
+            The weighted score as a Decimal rounded to four places.
+        """
+        score = sum(cls.SIGNAL_WEIGHTS[name] * value for name, value in signals.items())
+        return score.quantize(cls.SCORE_PRECISION)
+
+    @staticmethod
+    def _search_text(trainer):
+        user = trainer.user
+        parts = [
+            user.first_name,
+            user.last_name,
+            user.email,
+            trainer.company,
+            trainer.website,
+        ]
+        return " ".join(part for part in parts if part).lower()
+
+    @classmethod
+    def _build_rows(cls, trainer):
+        goal_ids = list(trainer.accepted_goals.values_list("id", flat=True))
+        level_ids = list(trainer.accepted_levels.values_list("id", flat=True))
+        if not goal_ids or not level_ids:
+            return []
+
+        counts = trainer.client_memberships.aggregate(
+            active=Count("id", filter=Q(status__code=MembershipVocabulary.ACTIVE)),
+            pending=Count("id", filter=Q(status__code=MembershipVocabulary.PENDING)),
+        )
+        signals = cls.compute_signals(trainer, counts["active"], counts["pending"])
+        has_capacity = (
+            trainer.max_clients is None or counts["active"] < trainer.max_clients
+        )
+
+        shared = {
+            "trainer": trainer,
+            "active_client_count": counts["active"],
+            "pending_request_count": counts["pending"],
+            "has_capacity": has_capacity,
+            "score": cls.compute_score(signals),
+            "search_text": cls._search_text(trainer),
+        }
+        return [
+            TrainerMatch(goal_id=goal_id, level_id=level_id, **shared)
+            for goal_id in goal_ids
+            for level_id in level_ids
+        ]
+
+    @classmethod
+    @transaction.atomic
+    def rebuild_for_trainers(cls, trainer_ids):
+        """Replaces the directory rows of the given trainers.
+
+        Args:
+            trainer_ids: Iterable of TrainerProfile IDs to rebuild.
+
+        Returns:
+            The number of rows written.
+        """
+        trainer_ids = set(trainer_ids)
+        if not trainer_ids:
+            return 0
+
+        TrainerMatch.objects.filter(trainer_id__in=trainer_ids).delete()
+
+        rows = []
+        trainers = TrainerProfile.objects.select_related("user").filter(
+            id__in=trainer_ids
+        )
+        for trainer in trainers:
+            rows.extend(cls._build_rows(trainer))
+
+        TrainerMatch.objects.bulk_create(rows, batch_size=500)
+        return len(rows)
+
+    @classmethod
+    def rebuild_all(cls):
+        """Rebuilds the directory for every trainer.
+
+        Returns:
+            The number of rows written.
+        """
+        return cls.rebuild_for_trainers(
+            TrainerProfile.objects.values_list("id", flat=True)
+        )
+
+    @staticmethod
+    def _annotate_match_fields(queryset):
+        return queryset.annotate(
+            match_score=F("match_entries__score"),
+            match_search_text=F("match_entries__search_text"),
+            active_client_count=F("match_entries__active_client_count"),
+            pending_request_count=F("match_entries__pending_request_count"),
+        )
+
+    @classmethod
+    def get_matches(cls, client_profile):
+        """Returns trainers matching a client's goal and level, best first.
+
+        Trainers without capacity and trainers the client already has a
+        pending or active membership with are excluded. Each trainer is
+        annotated with its directory figures (match_score, match_search_text,
+        active_client_count, pending_request_count).
+
+        Args:
+            client_profile: The ClientProfile looking for a trainer, or None
+                for users who cannot be matched.
+
+        Returns:
+            A QuerySet of TrainerProfile objects ordered by descending score.
+            Always annotated, even when empty, so it can be paginated.
+        """
+        if (
+            client_profile is None
+            or client_profile.goal_id is None
+            or client_profile.level_id is None
+        ):
+            return cls._annotate_match_fields(TrainerProfile.objects.none())
+
+        open_trainer_ids = client_profile.trainer_memberships.filter(
+            status__code__in=[
+                MembershipVocabulary.PENDING,
+                MembershipVocabulary.ACTIVE,
+            ]
+        ).values("trainer_id")
+
+        matches = TrainerProfile.objects.filter(
+            match_entries__goal_id=client_profile.goal_id,
+            match_entries__level_id=client_profile.level_id,
+            match_entries__has_capacity=True,
+        ).exclude(id__in=open_trainer_ids)
+
+        return cls._annotate_match_fields(matches).order_by("-match_score", "id")
@@ -3,8 +3,10 @@ from django.utils import timezone
 
 from apps.users.constants import MembershipVocabulary
 from apps.users.models import MembershipStatus, TrainerClientMembership
+from core.metrics import instrument
 
 
+@instrument
 class MembershipService:
     """Controls the lifecycle and business logic of trainer-client memberships.
 
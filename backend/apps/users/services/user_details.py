@@ -0,0 +1,86 @@
+import hashlib
+
+from django.db import transaction
+
+from core.reference_data import REFERENCE_VERSION_KEY
+from core.versioning import bump_version_stamps, get_version_stamp, get_version_stamps
+
+
+class UserDetailsCacheService:
+    """Versions and caches the serialized /auth/user/ payload per user.
+
+    Each user has an opaque profile version, held as a core.versioning stamp
+    so every worker and background service sees a bump at once. Writes to
+    the user, their profile or their memberships replace it, which
+    invalidates both the cached payload and the ETag clients revalidate with.
+    Keys also carry the reference data version, so renaming a goal or level
+    refreshes the nested labels too.
+    """
+
+    VERSION_KEY = "user-details:{user_id}"
+    PAYLOAD_CACHE_KEY = "user-details:payload:{digest}"
+
+    @classmethod
+    def get_version(cls, user_id):
+        """Returns the current profile version for a user.
+
+        Args:
+            user_id: The primary key of the user.
+
+        Returns:
+            str: The opaque version string.
+        """
+        return get_version_stamp(cls.VERSION_KEY.format(user_id=user_id))["version"]
+
+    @classmethod
+    def bump(cls, user_ids):
+        """Replaces the profile version of each given user.
+
+        Args:
+            user_ids: Primary keys of the users whose payload changed.
+        """
+        bump_version_stamps(
+            cls.VERSION_KEY.format(user_id=user_id) for user_id in user_ids
+        )
+
+    @classmethod
+    def schedule_bump(cls, user_ids):
+        """Bumps the profile versions once the current transaction commits.
+
+        Bumping before commit would let a concurrent request cache the old
+        payload under the new version.
+
+        Args:
+            user_ids: Primary keys of the users whose payload changed.
+        """
+        user_ids = list(user_ids)
+        transaction.on_commit(lambda: cls.bump(user_ids))
+
+    @classmethod
+    def payload_key(cls, user_id, *parts):
+        """Builds the cache key and ETag value for a user's payload.
+
+        The user's and the reference data's versions are read in one query.
+
+        Args:
+            user_id: The primary key of the user.
+            *parts: Anything else the representation depends on, such as the
+                request host used for absolute media URLs.
+
+        Returns:
+            A tuple of the cache key and its digest, which doubles as the ETag.
+        """
+        version_key = cls.VERSION_KEY.format(user_id=user_id)
+        stamps = get_version_stamps([version_key, REFERENCE_VERSION_KEY])
+        digest = hashlib.sha1(
+            "|".join(
+                (
+                    str(user_id),
+                    stamps[version_key]["version"],
+                    stamps[REFERENCE_VERSION_KEY]["version"],
+                    *parts,
+                )
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return cls.PAYLOAD_CACHE_KEY.format(digest=digest), digest
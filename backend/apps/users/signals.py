@@ -1,7 +1,19 @@
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import ClientProfile, CustomUser, TrainerProfile
+from .authentication import CLAIMS_VERSION_CACHE_KEY, cache_claims_version
+from .constants import ProfileImageStatusVocabulary
+from .models import (
+    ClientProfile,
+    CustomUser,
+    TrainerClientMembership,
+    TrainerProfile,
+)
+from .services.images import ProfileImageService
+from .services.matching import TrainerMatchingService
+from .services.user_details import UserDetailsCacheService
 
 
 @receiver(post_save, sender=CustomUser)
@@ -30,3 +42,219 @@ def create_user_profile(sender, instance, created, **kwargs):
             TrainerProfile.objects.create(user=instance)
         elif instance.is_client:
             ClientProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=CustomUser)
+def refresh_claims_version(sender, instance, **kwargs):
+    """Publishes a user's new claims version once the save commits.
+
+    Tokens issued before a password, role or activation change stop matching
+    the cached version and are rejected by ClaimsJWTCookieAuthentication.
+
+    Args:
+        sender: The CustomUser model class.
+        instance: The user that was saved.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    transaction.on_commit(lambda: cache_claims_version(instance))
+
+
+@receiver(post_delete, sender=CustomUser)
+def forget_claims_version(sender, instance, **kwargs):
+    """Drops a deleted user's claims version so their tokens stop resolving.
+
+    Args:
+        sender: The CustomUser model class.
+        instance: The user that was deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    key = CLAIMS_VERSION_CACHE_KEY.format(user_id=instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+@receiver(post_save, sender=CustomUser)
+def refresh_trainer_matches_for_user(sender, instance, created, **kwargs):
+    """Refreshes a trainer's directory rows after their name or email changes.
+
+    Args:
+        sender: The CustomUser model class.
+        instance: The user that was saved.
+        created: Whether the user is new, in which case no rows exist yet.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if created or not instance.is_trainer:
+        return
+    TrainerMatchingService.rebuild_for_trainers(
+        TrainerProfile.objects.filter(user=instance).values_list("id", flat=True)
+    )
+
+
+@receiver(post_save, sender=TrainerProfile)
+def refresh_trainer_matches_for_profile(sender, instance, created, **kwargs):
+    """Refreshes a trainer's directory rows after their profile changes.
+
+    Args:
+        sender: The TrainerProfile model class.
+        instance: The profile that was saved.
+        created: Whether the profile is new, in which case it accepts nothing.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if created:
+        return
+    TrainerMatchingService.rebuild_for_trainers([instance.pk])
+
+
+@receiver(m2m_changed, sender=TrainerProfile.accepted_goals.through)
+@receiver(m2m_changed, sender=TrainerProfile.accepted_levels.through)
+def refresh_trainer_matches_for_acceptance(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Refreshes directory rows when a trainer's accepted goals or levels change.
+
+    Args:
+        sender: The intermediate model of the accepted goals or levels relation.
+        instance: The trainer profile, or the goal/level when reverse is True.
+        action: The m2m_changed action, only post_* actions are handled.
+        reverse: True when the change was made from the goal or level side.
+        pk_set: Primary keys added or removed, None after a clear.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        TrainerMatchingService.rebuild_for_trainers([instance.pk])
+    elif pk_set is not None:
+        TrainerMatchingService.rebuild_for_trainers(pk_set)
+    else:
+        TrainerMatchingService.rebuild_all()
+
+
+@receiver(post_save, sender=TrainerClientMembership)
+@receiver(post_delete, sender=TrainerClientMembership)
+def refresh_trainer_matches_for_membership(sender, instance, **kwargs):
+    """Refreshes a trainer's capacity figures when a membership changes.
+
+    Args:
+        sender: The TrainerClientMembership model class.
+        instance: The membership that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    TrainerMatchingService.rebuild_for_trainers([instance.trainer_id])
+
+
+@receiver(post_save, sender=CustomUser)
+def bump_user_details_for_user(sender, instance, created, **kwargs):
+    """Invalidates a user's cached /auth/user/ payload after they are saved.
+
+    Args:
+        sender: The CustomUser model class.
+        instance: The user that was saved.
+        created: Whether the user is new, in which case nothing is cached yet.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if not created:
+        UserDetailsCacheService.schedule_bump([instance.pk])
+
+
+@receiver(post_save, sender=TrainerProfile)
+@receiver(post_save, sender=ClientProfile)
+def bump_user_details_for_profile(sender, instance, **kwargs):
+    """Invalidates the owner's cached /auth/user/ payload after a profile write.
+
+    Args:
+        sender: The TrainerProfile or ClientProfile model class.
+        instance: The profile that was saved.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    UserDetailsCacheService.schedule_bump([instance.user_id])
+
+
+@receiver(m2m_changed, sender=TrainerProfile.accepted_goals.through)
+@receiver(m2m_changed, sender=TrainerProfile.accepted_levels.through)
+def bump_user_details_for_acceptance(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Invalidates trainer payloads when their accepted goals or levels change.
+
+    Args:
+        sender: The intermediate model of the accepted goals or levels relation.
+        instance: The trainer profile, or the goal/level when reverse is True.
+        action: The m2m_changed action, only post_* actions are handled.
+        reverse: True when the change was made from the goal or level side.
+        pk_set: Primary keys added or removed, None after a clear.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        UserDetailsCacheService.schedule_bump([instance.user_id])
+        return
+
+    profiles = TrainerProfile.objects.all()
+    if pk_set is not None:
+        profiles = profiles.filter(pk__in=pk_set)
+    UserDetailsCacheService.schedule_bump(profiles.values_list("user_id", flat=True))
+
+
+@receiver(post_save, sender=TrainerClientMembership)
+@receiver(post_delete, sender=TrainerClientMembership)
+def bump_user_details_for_membership(sender, instance, **kwargs):
+    """Invalidates both parties' cached payloads when a membership changes.
+
+    Args:
+        sender: The TrainerClientMembership model class.
+        instance: The membership that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    trainer_users = TrainerProfile.objects.filter(pk=instance.trainer_id)
+    client_users = ClientProfile.objects.filter(pk=instance.client_id)
+    UserDetailsCacheService.schedule_bump(
+        trainer_users.values_list("user_id", flat=True).union(
+            client_users.values_list("user_id", flat=True)
+        )
+    )
+
+
+@receiver(pre_save, sender=TrainerProfile)
+@receiver(pre_save, sender=ClientProfile)
+def queue_profile_image(sender, instance, **kwargs):
+    """Marks a newly uploaded logo or avatar for background processing.
+
+    A file that has not been committed to storage yet is a fresh upload, so
+    no query is needed to detect the change. Clearing the image drops its
+    rendered variants once the save commits.
+
+    Args:
+        sender: The TrainerProfile or ClientProfile model class.
+        instance: The profile about to be saved.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    field, _ = ProfileImageService.IMAGE_FIELDS[sender]
+    image = getattr(instance, field)
+    variants_field = f"{field}_variants"
+
+    if image and not image._committed:
+        setattr(instance, f"{field}_status", ProfileImageStatusVocabulary.PENDING)
+        instance._profile_image_queued = True
+    elif not image:
+        storage, variants = image.storage, getattr(instance, variants_field)
+        if variants:
+            transaction.on_commit(
+                lambda: ProfileImageService.delete_variants(storage, variants)
+            )
+        setattr(instance, variants_field, {})
+        setattr(instance, f"{field}_status", "")
+
+
+@receiver(post_save, sender=TrainerProfile)
+@receiver(post_save, sender=ClientProfile)
+def schedule_profile_image(sender, instance, **kwargs):
+    """Hands a newly uploaded logo or avatar to the background stage.
+
+    Args:
+        sender: The TrainerProfile or ClientProfile model class.
+        instance: The profile that was saved.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if instance.__dict__.pop("_profile_image_queued", False):
+        ProfileImageService.schedule(sender, instance.pk)
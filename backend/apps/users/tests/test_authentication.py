@@ -0,0 +1,125 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import ClaimsUser
+from apps.users.serializers import ApexTokenObtainPairSerializer
+
+pytestmark = pytest.mark.django_db
+
+MEMBERSHIPS_URL = reverse("trainer-client-memberships-list")
+
+
+def _claims_token(user):
+    return str(ApexTokenObtainPairSerializer.get_token(user).access_token)
+
+
+def _authorize(api_client, token):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return api_client
+
+
+def _user_queries(queries):
+    return [
+        query["sql"]
+        for query in queries
+        if 'FROM "users_customuser"' in query["sql"]
+        or 'FROM "users_trainerprofile"' in query["sql"]
+    ]
+
+
+class TestClaimsTokens:
+
+    def test_token_carries_role_and_profile_claims(self, trainer_user):
+        token = ApexTokenObtainPairSerializer.get_token(trainer_user).access_token
+
+        assert token["role"] == "trainer"
+        assert token["is_trainer"] is True
+        assert token["is_client"] is False
+        assert token["trainer_profile_id"] == str(trainer_user.trainer_profile.pk)
+        assert token["client_profile_id"] is None
+        assert token["cv"]
+
+
+class TestClaimsAuthentication:
+
+    def test_request_user_is_built_from_claims(self, api_client, trainer_user):
+        _authorize(api_client, _claims_token(trainer_user))
+
+        response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.wsgi_request.user, ClaimsUser)
+        assert response.wsgi_request.user == trainer_user
+
+    def test_warm_request_skips_user_and_profile_queries(
+        self, api_client, trainer_user
+    ):
+        _authorize(api_client, _claims_token(trainer_user))
+        api_client.get(MEMBERSHIPS_URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _user_queries(queries.captured_queries) == []
+
+    def test_other_attributes_load_the_user_row(self, trainer_user):
+        token = ApexTokenObtainPairSerializer.get_token(trainer_user).access_token
+        user = ClaimsUser(token)
+
+        assert user.email == trainer_user.email
+
+    def test_missing_profile_behaves_like_custom_user(self, trainer_user):
+        token = ApexTokenObtainPairSerializer.get_token(trainer_user).access_token
+        user = ClaimsUser(token)
+
+        assert hasattr(user, "client_profile") is False
+        assert user.trainer_profile.pk == trainer_user.trainer_profile.pk
+
+    def test_password_change_revokes_token(
+        self, api_client, trainer_user, django_capture_on_commit_callbacks
+    ):
+        _authorize(api_client, _claims_token(trainer_user))
+        api_client.get(MEMBERSHIPS_URL)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            trainer_user.set_password("a-new-password")
+            trainer_user.save()
+
+        response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deactivation_revokes_token(
+        self, api_client, client_user, django_capture_on_commit_callbacks
+    ):
+        _authorize(api_client, _claims_token(client_user))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client_user.is_active = False
+            client_user.save()
+
+        response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_token_without_claims_uses_database_lookup(self, api_client, trainer_user):
+        _authorize(api_client, str(AccessToken.for_user(trainer_user)))
+
+        response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not isinstance(response.wsgi_request.user, ClaimsUser)
+
+    def test_fast_path_can_be_disabled(self, api_client, trainer_user, settings):
+        settings.AUTH_CLAIMS_FAST_PATH = False
+        _authorize(api_client, _claims_token(trainer_user))
+
+        response = api_client.get(MEMBERSHIPS_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not isinstance(response.wsgi_request.user, ClaimsUser)
@@ -1,9 +1,14 @@
+from decimal import Decimal
+
 import pytest
 from django.contrib.auth import get_user_model
 
 from apps.users.models import (
+    TrainerMatch,
     TrainerProfile,
 )
+from apps.users.services.matching import TrainerMatchingService
+from apps.users.services.membership import MembershipService
 
 User = get_user_model()
 pytestmark = pytest.mark.django_db
@@ -72,3 +77,95 @@ def test_client_has_choice_of_trainers(
     assert trainer_a_strength_beginner in matches
     assert trainer_d_strength_beginner in matches
     assert trainer_c_strength_intermediate not in matches
+
+
+class TestTrainerMatchingService:
+
+    def test_directory_has_row_per_goal_and_level(
+        self, trainer_a, goal_strength, goal_muscle_mass, level_beginner
+    ):
+        trainer_a.accepted_goals.add(goal_strength, goal_muscle_mass)
+        trainer_a.accepted_levels.add(level_beginner)
+
+        pairs = set(
+            TrainerMatch.objects.filter(trainer=trainer_a).values_list(
+                "goal__code", "level__code"
+            )
+        )
+        assert pairs == {("STRENGTH", "BEGINNER"), ("MUSCLE_MASS", "BEGINNER")}
+
+    def test_removing_goal_removes_rows(self, trainer_a_strength_beginner):
+        trainer_a_strength_beginner.accepted_goals.clear()
+
+        assert not TrainerMatch.objects.filter(
+            trainer=trainer_a_strength_beginner
+        ).exists()
+
+    def test_get_matches_returns_each_trainer_once(
+        self,
+        client_strength_beginner,
+        trainer_a_strength_beginner,
+        goal_muscle_mass,
+        level_intermediate,
+    ):
+        trainer_a_strength_beginner.accepted_goals.add(goal_muscle_mass)
+        trainer_a_strength_beginner.accepted_levels.add(level_intermediate)
+
+        matches = list(TrainerMatchingService.get_matches(client_strength_beginner))
+
+        assert matches == [trainer_a_strength_beginner]
+
+    def test_matches_are_ranked_by_score(
+        self,
+        client_strength_beginner,
+        trainer_a_strength_beginner,
+        trainer_d_strength_beginner,
+    ):
+        trainer_d_strength_beginner.company = "Apex Gym"
+        trainer_d_strength_beginner.website = "https://apex.example.com"
+        trainer_d_strength_beginner.save()
+
+        matches = list(TrainerMatchingService.get_matches(client_strength_beginner))
+
+        assert matches == [trainer_d_strength_beginner, trainer_a_strength_beginner]
+        assert matches[0].match_score > matches[1].match_score
+
+    def test_full_trainers_are_not_matched(
+        self, client_strength_beginner, trainer_a_strength_beginner
+    ):
+        trainer_a_strength_beginner.max_clients = 0
+        trainer_a_strength_beginner.save()
+
+        assert not TrainerMatchingService.get_matches(client_strength_beginner)
+
+    def test_membership_updates_counts_and_excludes_client(
+        self,
+        client_strength_beginner,
+        trainer_a_strength_beginner,
+    ):
+        MembershipService.request(
+            client_user=client_strength_beginner.user,
+            trainer_user=trainer_a_strength_beginner.user,
+        )
+
+        entry = TrainerMatch.objects.get(trainer=trainer_a_strength_beginner)
+        assert entry.pending_request_count == 1
+        assert entry.active_client_count == 0
+        assert not TrainerMatchingService.get_matches(client_strength_beginner)
+
+    @pytest.mark.parametrize(
+        "max_clients,active,pending,expected",
+        [
+            (None, 0, 0, Decimal("0.7000")),
+            (4, 2, 0, Decimal("0.4500")),
+            (None, 0, 1, Decimal("0.6000")),
+        ],
+        ids=["unlimited", "half full", "pending backlog"],
+    )
+    def test_score_combines_signals(
+        self, trainer_a, max_clients, active, pending, expected
+    ):
+        trainer_a.max_clients = max_clients
+        signals = TrainerMatchingService.compute_signals(trainer_a, active, pending)
+
+        assert TrainerMatchingService.compute_score(signals) == expected
@@ -0,0 +1,212 @@
+from io import BytesIO
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+
+from apps.users.constants import ProfileImageStatusVocabulary
+from apps.users.models import ClientProfile, TrainerProfile
+from apps.users.services.images import ProfileImageService
+
+pytestmark = pytest.mark.django_db
+
+AVATAR_URL = reverse("client-profile-me-update")
+LOGO_URL = reverse("trainer-profile-me-update")
+USER_URL = reverse("rest_user_details")
+ROSTER_URL = reverse("trainer-roster")
+
+WORKER_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "image-worker",
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def image_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PROFILE_IMAGE_EAGER = False
+    settings.PROFILE_IMAGE_SIZES = {"sm": 32, "md": 96}
+    return settings
+
+
+def make_image(size=(400, 300), mode="RGB", image_format="JPEG", exif=True):
+    image = Image.new(mode, size, "red" if mode == "RGB" else (255, 0, 0, 128))
+    buffer = BytesIO()
+    params = {}
+    if exif:
+        metadata = Image.Exif()
+        metadata[0x010F] = "Apex Camera"
+        params["exif"] = metadata.tobytes()
+    image.save(buffer, format=image_format, **params)
+    buffer.seek(0)
+    return buffer
+
+
+def upload(name="photo.jpg", **kwargs):
+    return SimpleUploadedFile(name, make_image(**kwargs).read(), "image/jpeg")
+
+
+class TestRenderVariants:
+
+    def test_renders_webp_and_jpeg_per_size(self):
+        variants = ProfileImageService.render_variants(make_image())
+
+        assert set(variants) == {"sm", "md"}
+        assert set(variants["md"]) == {"webp", "jpeg"}
+        with Image.open(BytesIO(variants["md"]["webp"])) as image:
+            assert image.format == "WEBP"
+            assert image.size == (96, 96)
+
+    def test_strips_metadata(self):
+        variants = ProfileImageService.render_variants(make_image())
+
+        with Image.open(BytesIO(variants["sm"]["jpeg"])) as image:
+            assert not image.getexif()
+            assert "exif" not in image.info
+
+    def test_logos_keep_their_aspect_ratio(self):
+        variants = ProfileImageService.render_variants(make_image(), crop=False)
+
+        with Image.open(BytesIO(variants["md"]["webp"])) as image:
+            assert image.size == (96, 72)
+
+    def test_transparent_images_fall_back_to_png(self):
+        source = make_image(mode="RGBA", image_format="PNG", exif=False)
+
+        variants = ProfileImageService.render_variants(source)
+
+        assert set(variants["sm"]) == {"webp", "png"}
+
+    def test_rejects_files_that_are_not_images(self):
+        with pytest.raises(ValidationError):
+            ProfileImageService.render_variants(BytesIO(b"not an image"))
+
+    def test_rejects_oversized_images(self, image_settings):
+        image_settings.PROFILE_IMAGE_MAX_PIXELS = 1000
+
+        with pytest.raises(ValidationError):
+            ProfileImageService.render_variants(make_image())
+
+
+class TestProfileImageProcessing:
+
+    def test_upload_is_queued_without_rendering(self, client_api_client):
+        response = client_api_client.patch(
+            AVATAR_URL, {"avatar": upload()}, format="multipart"
+        )
+
+        assert response.status_code == 200
+        assert response.data["avatar_status"] == ProfileImageStatusVocabulary.PENDING
+        assert response.data["avatar_variants"] == {}
+
+    def test_worker_renders_queued_upload(self, client_api_client, client_user):
+        client_api_client.patch(AVATAR_URL, {"avatar": upload()}, format="multipart")
+
+        result = ProfileImageService.process_queued()
+
+        assert result == {"ready": 1, "failed": 0}
+        profile = ClientProfile.objects.get(user=client_user)
+        assert profile.avatar_status == ProfileImageStatusVocabulary.READY
+        for formats in profile.avatar_variants.values():
+            for name in formats.values():
+                assert default_storage.exists(name)
+
+        data = client_api_client.get(reverse("client-profile-me")).data
+        assert data["avatar_variants"]["sm"]["webp"].endswith("-sm.webp")
+        assert data["avatar_variants"]["sm"]["webp"].startswith("http://testserver/")
+
+    def test_worker_refreshes_cached_user_details(self, client_api_client):
+        client_api_client.patch(AVATAR_URL, {"avatar": upload()}, format="multipart")
+        pending = client_api_client.get(USER_URL)
+
+        # The worker is a separate service with a cache of its own.
+        with override_settings(CACHES=WORKER_CACHES):
+            ProfileImageService.process_queued()
+
+        response = client_api_client.get(USER_URL, HTTP_IF_NONE_MATCH=pending["ETag"])
+
+        assert response.status_code == 200
+        assert response["ETag"] != pending["ETag"]
+
+    def test_worker_refreshes_cached_rosters(
+        self, api_client, client_user, trainer_user, active_membership
+    ):
+        api_client.force_authenticate(user=client_user)
+        api_client.patch(AVATAR_URL, {"avatar": upload()}, format="multipart")
+        api_client.force_authenticate(user=trainer_user)
+        (pending,) = api_client.get(ROSTER_URL).data
+
+        with override_settings(CACHES=WORKER_CACHES):
+            ProfileImageService.process_queued()
+
+        (ready,) = api_client.get(ROSTER_URL).data
+        assert pending["client_avatar_variants"] == {}
+        assert ready["client_avatar_variants"]["sm"]["webp"].endswith("-sm.webp")
+
+    def test_eager_mode_renders_after_commit(
+        self,
+        trainer_api_client,
+        trainer_user,
+        image_settings,
+        django_capture_on_commit_callbacks,
+    ):
+        image_settings.PROFILE_IMAGE_EAGER = True
+
+        with django_capture_on_commit_callbacks(execute=True):
+            trainer_api_client.patch(
+                LOGO_URL, {"logo": upload("logo.jpg")}, format="multipart"
+            )
+
+        profile = TrainerProfile.objects.get(user=trainer_user)
+        assert profile.logo_status == ProfileImageStatusVocabulary.READY
+        assert set(profile.logo_variants) == {"sm", "md"}
+
+    def test_replacing_an_image_removes_old_variants(
+        self, client_api_client, client_user
+    ):
+        client_api_client.patch(AVATAR_URL, {"avatar": upload()}, format="multipart")
+        ProfileImageService.process_queued()
+        old = ClientProfile.objects.get(user=client_user).avatar_variants
+
+        client_api_client.patch(
+            AVATAR_URL, {"avatar": upload("second.jpg")}, format="multipart"
+        )
+        ProfileImageService.process_queued()
+
+        assert not default_storage.exists(old["sm"]["webp"])
+        profile = ClientProfile.objects.get(user=client_user)
+        assert default_storage.exists(profile.avatar_variants["sm"]["webp"])
+
+    def test_corrupt_upload_is_rejected_and_removed(self, client_user):
+        profile = ClientProfile.objects.get(user=client_user)
+        profile.avatar = SimpleUploadedFile("broken.jpg", b"not an image")
+        profile.save()
+        name = profile.avatar.name
+
+        result = ProfileImageService.process_queued()
+
+        assert result == {"ready": 0, "failed": 1}
+        profile.refresh_from_db()
+        assert profile.avatar_status == ProfileImageStatusVocabulary.FAILED
+        assert not profile.avatar
+        assert not default_storage.exists(name)
+
+    def test_command_drains_the_queue(self, client_user, trainer_user):
+        for profile, field in (
+            (ClientProfile.objects.get(user=client_user), "avatar"),
+            (TrainerProfile.objects.get(user=trainer_user), "logo"),
+        ):
+            setattr(profile, field, upload())
+            profile.save()
+
+        call_command("process_profile_images")
+
+        assert ClientProfile.objects.get(user=client_user).avatar_status == "READY"
+        assert TrainerProfile.objects.get(user=trainer_user).logo_status == "READY"
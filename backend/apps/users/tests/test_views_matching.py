@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from model_bakery import baker
 from rest_framework import status
 
+from apps.users.pagination import TrainerMatchCursorPagination
+
 User = get_user_model()
 pytestmark = pytest.mark.django_db
 
@@ -100,3 +102,65 @@ def test_trainer_cannot_use_matches(trainer_a_matching_response, response_items)
 def test_matching_requires_authentication(api_client):
     response = api_client.get("/api/v1/users/find-trainers/")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_matching_exposes_ranking_fields(client_matching_response, response_items):
+    response, _ = client_matching_response
+
+    match = response_items(response)[0]
+
+    assert "match_score" in match
+    assert match["active_client_count"] == 0
+    assert match["pending_request_count"] == 0
+
+
+def test_matching_uses_keyset_pagination(client_matching_response):
+    response, _ = client_matching_response
+
+    assert "count" not in response.data
+    assert "next" in response.data
+
+
+def test_matching_pages_through_tied_scores(
+    api_client, matching_world, goal_strength, level_beginner, monkeypatch
+):
+    monkeypatch.setattr(TrainerMatchCursorPagination, "page_size", 1)
+    for _ in range(3):
+        other = baker.make(User, is_trainer=True)
+        other.trainer_profile.accepted_goals.add(goal_strength)
+        other.trainer_profile.accepted_levels.add(level_beginner)
+    api_client.force_authenticate(user=matching_world["client_user"])
+
+    seen = []
+    url = "/api/v1/users/find-trainers/"
+    while url:
+        response = api_client.get(url)
+        seen += [item["id"] for item in response.data["results"]]
+        url = response.data["next"]
+
+    assert len(seen) == 4
+    assert len(set(seen)) == 4
+    previous = api_client.get(response.data["previous"])
+    assert [item["id"] for item in previous.data["results"]] == [seen[-2]]
+
+
+def test_matching_rejects_malformed_cursors(api_client, matching_world):
+    api_client.force_authenticate(user=matching_world["client_user"])
+
+    response = api_client.get("/api/v1/users/find-trainers/?cursor=cD1ub3QtYS1rZXk=")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_matching_search_uses_directory_text(
+    api_client, matching_world, goal_strength, level_beginner, response_items
+):
+    other = baker.make(User, is_trainer=True, email="bob@elsewhere.com")
+    other.trainer_profile.accepted_goals.add(goal_strength)
+    other.trainer_profile.accepted_levels.add(level_beginner)
+
+    api_client.force_authenticate(user=matching_world["client_user"])
+    response = api_client.get("/api/v1/users/find-trainers/?search=ALICE")
+
+    returned_ids = [item["id"] for item in response_items(response)]
+    assert returned_ids == [str(matching_world["trainer_a"].trainer_profile.id)]
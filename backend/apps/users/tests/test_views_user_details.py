@@ -0,0 +1,135 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from apps.users.services.membership import MembershipService
+from apps.users.services.user_details import UserDetailsCacheService
+
+pytestmark = pytest.mark.django_db
+
+USER_URL = reverse("rest_user_details")
+
+OTHER_PROCESS_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "other-process",
+    }
+}
+
+
+class TestCachedUserDetails:
+
+    def test_response_carries_etag(self, trainer_api_client):
+        response = trainer_api_client.get(USER_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"]
+        assert response["Cache-Control"] == "private, no-cache"
+        assert response.data["role"] == "trainer"
+
+    def test_matching_etag_returns_not_modified(self, trainer_api_client):
+        etag = trainer_api_client.get(USER_URL)["ETag"]
+
+        response = trainer_api_client.get(USER_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_repeat_request_is_served_from_cache(
+        self, trainer_api_client, django_assert_num_queries
+    ):
+        first = trainer_api_client.get(USER_URL)
+
+        # The user's and the reference data's version stamps, in one query.
+        with django_assert_num_queries(1):
+            second = trainer_api_client.get(USER_URL)
+
+        assert second.data == first.data
+
+    def test_version_is_shared_beyond_the_local_cache(
+        self, trainer_api_client, trainer_user
+    ):
+        before = trainer_api_client.get(USER_URL)["ETag"]
+
+        # A bump from another service, whose cache this one never sees.
+        with override_settings(CACHES=OTHER_PROCESS_CACHES):
+            UserDetailsCacheService.bump([trainer_user.pk])
+
+        response = trainer_api_client.get(USER_URL, HTTP_IF_NONE_MATCH=before)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != before
+
+    def test_etag_is_per_user(self, api_client, trainer_user, client_user):
+        api_client.force_authenticate(user=trainer_user)
+        trainer_etag = api_client.get(USER_URL)["ETag"]
+        api_client.force_authenticate(user=client_user)
+
+        response = api_client.get(USER_URL, HTTP_IF_NONE_MATCH=trainer_etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["role"] == "client"
+
+    def test_trainer_profile_update_invalidates_payload(
+        self, trainer_api_client, django_capture_on_commit_callbacks
+    ):
+        before = trainer_api_client.get(USER_URL)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            trainer_api_client.patch(
+                reverse("trainer-profile-me-update"),
+                {"company": "Apex Gym"},
+                format="json",
+            )
+
+        after = trainer_api_client.get(USER_URL, HTTP_IF_NONE_MATCH=before["ETag"])
+
+        assert after.status_code == status.HTTP_200_OK
+        assert after.data["profile"]["company"] == "Apex Gym"
+
+    def test_client_profile_update_invalidates_payload(
+        self, client_api_client, goal_strength, django_capture_on_commit_callbacks
+    ):
+        before = client_api_client.get(USER_URL)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client_api_client.patch(
+                reverse("client-profile-me-update"),
+                {"goal_id": str(goal_strength.pk)},
+                format="json",
+            )
+
+        after = client_api_client.get(USER_URL)
+
+        assert after["ETag"] != before["ETag"]
+        assert after.data["profile"]["goal"]["id"] == str(goal_strength.pk)
+
+    def test_membership_write_invalidates_both_users(
+        self,
+        api_client,
+        trainer_user,
+        client_user,
+        django_capture_on_commit_callbacks,
+    ):
+        api_client.force_authenticate(user=trainer_user)
+        trainer_before = api_client.get(USER_URL)["ETag"]
+        api_client.force_authenticate(user=client_user)
+        client_before = api_client.get(USER_URL)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            MembershipService.request(client_user, trainer_user)
+
+        assert api_client.get(USER_URL)["ETag"] != client_before
+        api_client.force_authenticate(user=trainer_user)
+        assert api_client.get(USER_URL)["ETag"] != trainer_before
+
+    def test_user_update_invalidates_payload(
+        self, client_api_client, django_capture_on_commit_callbacks
+    ):
+        client_api_client.get(USER_URL)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client_api_client.patch(USER_URL, {"first_name": "Alex"}, format="json")
+
+        assert client_api_client.get(USER_URL).data["first_name"] == "Alex"
@@ -1,4 +1,10 @@
+from dj_rest_auth.views import UserDetailsView
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, parsers, permissions, status, viewsets
 from rest_framework.decorators import action
@@ -7,7 +13,6 @@ from rest_framework.response import Response
 
 from core.views import NormalisedLookupViewSet
 
-from .constants import MembershipVocabulary
 from .filters import TrainerClientMembershipFilter
 from .models import (
     ClientProfile,
@@ -16,6 +21,7 @@ from .models import (
     TrainerProfile,
     TrainingGoal,
 )
+from .pagination import TrainerMatchCursorPagination
 from .serializers import (
     ClientProfileSerializer,
     ExperienceLevelSerializer,
@@ -26,7 +32,9 @@ from .serializers import (
     TrainerProfileWriteSerializer,
     TrainingGoalSerializer,
 )
+from .services.matching import TrainerMatchingService
 from .services.membership import MembershipService
+from .services.user_details import UserDetailsCacheService
 
 
 class TrainerClientMembershipViewSet(
@@ -170,47 +178,33 @@ class TrainerClientMembershipViewSet(
 class TrainerMatchingViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for clients to find compatible trainers.
 
-    Filters trainers based on whether they accept the client's current
-    goal and experience level, excluding those with existing active memberships.
+    Reads the precomputed TrainerMatch directory for the client's current goal
+    and experience level, excluding full trainers and those the client already
+    has a pending or active membership with. Results are ranked by match score
+    and keyset paginated.
     """
 
     serializer_class = TrainerMatchingSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TrainerMatchCursorPagination
 
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
-    search_fields = ["user__email", "company", "website"]
+    search_fields = ["match_search_text"]
 
     def get_queryset(self):
         """Filters available trainers based on client compatibility.
 
         Returns:
             QuerySet: Trainers matching the client's profile, excluding
-                existing memberships.
+                existing memberships, best match first.
         """
         user = self.request.user
-
-        if not user.is_client:
-            return TrainerProfile.objects.none()
-
-        profile = user.client_profile
-        queryset = TrainerProfile.objects.select_related("user").prefetch_related(
-            "accepted_goals",
-            "accepted_levels",
-        )
+        profile = user.client_profile if user.is_client else None
 
         return (
-            queryset.filter(
-                accepted_goals=profile.goal,
-                accepted_levels=profile.level,
-            )
-            .distinct()
-            .exclude(
-                client_memberships__client=profile,
-                client_memberships__status__code__in=[
-                    MembershipVocabulary.PENDING,
-                    MembershipVocabulary.ACTIVE,
-                ],
-            )
+            TrainerMatchingService.get_matches(profile)
+            .select_related("user")
+            .prefetch_related("accepted_goals", "accepted_levels")
         )
 
 
@@ -347,3 +341,56 @@ class ExperienceLevelViewSet(NormalisedLookupViewSet):
 
     serializer_class = ExperienceLevelSerializer
     queryset = ExperienceLevel.objects.all()
+
+
+class CachedUserDetailsView(UserDetailsView):
+    """Serves /auth/user/ from a per-user cache with ETag revalidation.
+
+    The payload is keyed by the user's profile version, which is replaced
+    whenever the user, their profile or their memberships are written. A
+    client sending the current ETag gets a 304 without the user or profile
+    being loaded; otherwise the cached payload is returned if present.
+    """
+
+    def get_object(self):
+        """Loads the authenticated user with their profile in a few queries.
+
+        Only called when the payload is not cached. The request user may be a
+        claims-only stand-in, so the row and profile are always read fresh.
+
+        Returns:
+            CustomUser: The user with profile relations preloaded.
+        """
+        return (
+            get_user_model()
+            .objects.select_related(
+                "trainer_profile", "client_profile__goal", "client_profile__level"
+            )
+            .prefetch_related(
+                "trainer_profile__accepted_goals", "trainer_profile__accepted_levels"
+            )
+            .get(pk=self.request.user.pk)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Returns the authenticated user's details, cached per profile version.
+
+        Returns:
+            Response: The serialized user, or a 304 when the ETag matches.
+        """
+        key, digest = UserDetailsCacheService.payload_key(
+            request.user.pk, request.get_host()
+        )
+        etag = quote_etag(digest)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = cache.get(key)
+            if data is None:
+                data = super().retrieve(request, *args, **kwargs).data
+                cache.set(key, data, timeout=settings.USER_DETAILS_CACHE_TIMEOUT)
+            response = Response(data)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
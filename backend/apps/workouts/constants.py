@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+
+class WorkoutSessionStateVocabulary:
+    """Vocabulary describing where a planned workout is in its session lifecycle.
+
+    Derived from the workout's completion record rather than stored, so the
+    calendar can report it without touching the exercise or set records.
+
+    Attributes:
+        PLANNED (str): No session has been started for the workout.
+        IN_PROGRESS (str): A session has been started but not finished.
+        COMPLETED (str): The session was finished by the client.
+        SKIPPED (str): The client skipped the workout.
+    """
+
+    PLANNED = "PLANNED"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+    SKIPPED = "SKIPPED"
+
+    ALL = {PLANNED, IN_PROGRESS, COMPLETED, SKIPPED}
+    FINISHED_STATES = {COMPLETED, SKIPPED}
+
+
+# Upper bound on a single calendar query. Wide enough for a month view plus
+# the leading and trailing days of the surrounding weeks.
+CALENDAR_MAX_WINDOW = timedelta(days=62)
@@ -0,0 +1,130 @@
+import django_filters
+
+from .models import (
+    Workout,
+    WorkoutCompletionRecord,
+    WorkoutExerciseCompletionRecord,
+    WorkoutSetCompletionRecord,
+)
+
+
+class WorkoutFilter(django_filters.FilterSet):
+    """Filter set for Workout objects.
+
+    Adds inclusive planned date bounds and a program filter on top of the
+    exact phase and date matches so calendar-style reads can be served by
+    the (program_phase, planned_date) index.
+
+    Attributes:
+        planned_date_from: Earliest planned date to include (inclusive).
+        planned_date_to: Latest planned date to include (inclusive).
+        program: A UUID filter for workouts in any phase of a program.
+    """
+
+    planned_date_from = django_filters.DateFilter(
+        field_name="planned_date", lookup_expr="gte"
+    )
+    planned_date_to = django_filters.DateFilter(
+        field_name="planned_date", lookup_expr="lte"
+    )
+    program = django_filters.UUIDFilter(field_name="program_phase__program")
+
+    class Meta:
+        """Metadata options for WorkoutFilter."""
+
+        model = Workout
+        fields = [
+            "program_phase",
+            "planned_date",
+            "planned_date_from",
+            "planned_date_to",
+            "program",
+        ]
+
+
+class WorkoutSessionFilter(django_filters.FilterSet):
+    """Filter set for WorkoutCompletionRecord (session) objects.
+
+    Attributes:
+        completed_from: Earliest completion timestamp to include (inclusive).
+        completed_to: Latest completion timestamp to include (inclusive).
+    """
+
+    completed_from = django_filters.IsoDateTimeFilter(
+        field_name="completed_at", lookup_expr="gte"
+    )
+    completed_to = django_filters.IsoDateTimeFilter(
+        field_name="completed_at", lookup_expr="lte"
+    )
+
+    class Meta:
+        """Metadata options for WorkoutSessionFilter."""
+
+        model = WorkoutCompletionRecord
+        fields = [
+            "is_skipped",
+            "workout__program_phase",
+            "completed_from",
+            "completed_to",
+        ]
+
+
+class WorkoutExerciseRecordFilter(django_filters.FilterSet):
+    """Filter set for WorkoutExerciseCompletionRecord objects.
+
+    The start bounds filter on the table's partition column, so on
+    PostgreSQL only the matching months are scanned (see core.partitioning).
+
+    Attributes:
+        started_from: Earliest start timestamp to include (inclusive).
+        started_to: Latest start timestamp to include (inclusive).
+    """
+
+    started_from = django_filters.IsoDateTimeFilter(
+        field_name="started_at", lookup_expr="gte"
+    )
+    started_to = django_filters.IsoDateTimeFilter(
+        field_name="started_at", lookup_expr="lte"
+    )
+
+    class Meta:
+        """Metadata options for WorkoutExerciseRecordFilter."""
+
+        model = WorkoutExerciseCompletionRecord
+        fields = [
+            "workout_completion_record",
+            "is_skipped",
+            "started_from",
+            "started_to",
+        ]
+
+
+class WorkoutSetRecordFilter(django_filters.FilterSet):
+    """Filter set for WorkoutSetCompletionRecord objects.
+
+    The recorded bounds filter on created_at, the table's partition column,
+    so on PostgreSQL only the matching months are scanned (see
+    core.partitioning).
+
+    Attributes:
+        recorded_from: Earliest recording timestamp to include (inclusive).
+        recorded_to: Latest recording timestamp to include (inclusive).
+    """
+
+    recorded_from = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="gte"
+    )
+    recorded_to = django_filters.IsoDateTimeFilter(
+        field_name="created_at", lookup_expr="lte"
+    )
+
+    class Meta:
+        """Metadata options for WorkoutSetRecordFilter."""
+
+        model = WorkoutSetCompletionRecord
+        fields = [
+            "exercise_completion_record",
+            "is_skipped",
+            "recorded_from",
+            "recorded_to",
+        ]
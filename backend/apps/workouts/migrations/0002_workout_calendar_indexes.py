@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-19 00:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("programs", "0002_initial"),
+        ("workouts", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workout",
+            index=models.Index(
+                fields=["program_phase", "planned_date"],
+                name="workouts_wo_program_e7ea9a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutcompletionrecord",
+            index=models.Index(
+                fields=["client", "completed_at"], name="workouts_wo_client__4837b4_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:59
+
+from django.conf import settings
+from django.db import migrations
+
+from core.partitioning import partition_table, unpartition_table
+
+# Exercise records first: converting them drops the set records' foreign key
+# to them, and unpartitioning them last restores it.
+PARTITIONED_MODELS = ["WorkoutExerciseCompletionRecord", "WorkoutSetCompletionRecord"]
+
+
+def partition_completion_records(apps, schema_editor):
+    # Opt-in and PostgreSQL-only; partition_table skips everything else.
+    for model_name in PARTITIONED_MODELS:
+        partition_table(
+            schema_editor,
+            apps.get_model("workouts", model_name),
+            settings.PARTITION_MONTHS_AHEAD,
+        )
+
+
+def unpartition_completion_records(apps, schema_editor):
+    for model_name in reversed(PARTITIONED_MODELS):
+        unpartition_table(schema_editor, apps.get_model("workouts", model_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workouts", "0003_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partition_completion_records, unpartition_completion_records
+        ),
+    ]
@@ -34,6 +34,9 @@ class Workout(ApexModel):
 
     class Meta:
         ordering = ["planned_date"]
+        indexes = [
+            models.Index(fields=["program_phase", "planned_date"]),
+        ]
 
     def __str__(self):
         return self.workout_name
@@ -88,8 +91,8 @@ class WorkoutExercise(ApexModel):
             raise ValidationError("sets_prescribed must be greater than 0.")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     def __str__(self):
@@ -140,8 +143,8 @@ class WorkoutSet(ApexModel):
             raise ValidationError("weight_prescribed cannot be negative.")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     def __str__(self):
@@ -181,6 +184,9 @@ class WorkoutCompletionRecord(ApexModel):
 
     class Meta:
         ordering = ["started_at"]
+        indexes = [
+            models.Index(fields=["client", "completed_at"]),
+        ]
 
     def clean(self):
         """Ensures chronological consistency between start and completion.
@@ -197,8 +203,8 @@ class WorkoutCompletionRecord(ApexModel):
             raise ValidationError("completed_at cannot be before started_at.")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     @property
@@ -263,8 +269,8 @@ class WorkoutExerciseCompletionRecord(ApexModel):
             raise ValidationError("completed_at cannot be before started_at.")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     def __str__(self):
@@ -287,6 +293,8 @@ class WorkoutSetCompletionRecord(ApexModel):
         reps_in_reserve: Client-reported repetitions left in the tank.
     """
 
+    # Partitioning exercise records drops the database constraint of this
+    # key (see core.partitioning). Deletes still cascade through the ORM.
     exercise_completion_record = models.ForeignKey(
         to=WorkoutExerciseCompletionRecord,
         on_delete=models.CASCADE,
@@ -343,8 +351,8 @@ class WorkoutSetCompletionRecord(ApexModel):
             raise ValidationError("reps_in_reserve cannot be negative.")
 
     def save(self, *args, **kwargs):
-        """Performs full validation before saving the instance."""
-        self.full_clean()
+        """Validates the instance per the active validation mode before saving."""
+        self.validate_for_save(kwargs.get("update_fields"))
         return super().save(*args, **kwargs)
 
     @property
@@ -6,8 +6,9 @@ from rest_framework import serializers
 from apps.exercises.models import Exercise
 from apps.exercises.serializers import ExerciseSerializer
 from apps.programs.models import ProgramPhase
-from core.serializers import ApexSerializer
+from core.serializers import ApexSerializer, ValuesSerializer
 
+from .constants import CALENDAR_MAX_WINDOW, WorkoutSessionStateVocabulary
 from .models import (
     Workout,
     WorkoutCompletionRecord,
@@ -227,6 +228,112 @@ class WorkoutListSerializer(ApexSerializer):
         return WorkoutCompletionRecord.objects.filter(workout=obj).exists()
 
 
+class CalendarWindowSerializer(serializers.Serializer):
+    """Validates the date window requested from the workout calendar.
+
+    Both bounds are inclusive. The window is capped so a month view can never
+    turn into a scan of a client's whole training history.
+    """
+
+    start = serializers.DateField()
+    end = serializers.DateField()
+
+    def validate(self, attrs):
+        """Validates the ordering and width of the window.
+
+        Raises:
+            serializers.ValidationError: If end is before start or the window
+                exceeds CALENDAR_MAX_WINDOW.
+        """
+        if attrs["end"] < attrs["start"]:
+            raise serializers.ValidationError({"end": "end cannot be before start."})
+
+        if attrs["end"] - attrs["start"] > CALENDAR_MAX_WINDOW:
+            max_days = CALENDAR_MAX_WINDOW.days
+            raise serializers.ValidationError(
+                {"end": f"Calendar windows cannot exceed {max_days} days."}
+            )
+
+        return attrs
+
+
+class WorkoutCalendarSerializer(ApexSerializer):
+    """Flat calendar entry for a Workout and the state of its session.
+
+    Expects the queryset to select_related the program and completion record
+    so that each entry is built without additional queries.
+
+    Attributes:
+        program_phase_id: UUID of the parent program phase.
+        program_id: UUID of the program the phase belongs to.
+        program_name: Display name of the program.
+        session_id: UUID of the completion record, if one exists.
+        session_state: One of WorkoutSessionStateVocabulary.
+        started_at: When the session was started, if at all.
+        completed_at: When the session was finished or skipped, if at all.
+    """
+
+    program_phase_id = serializers.UUIDField(
+        source="program_phase.id",
+        read_only=True,
+    )
+    program_id = serializers.UUIDField(
+        source="program_phase.program.id",
+        read_only=True,
+    )
+    program_name = serializers.CharField(
+        source="program_phase.program.program_name",
+        read_only=True,
+    )
+    session_id = serializers.UUIDField(
+        source="completion_record.id",
+        read_only=True,
+        allow_null=True,
+    )
+    session_state = serializers.SerializerMethodField()
+    started_at = serializers.DateTimeField(
+        source="completion_record.started_at",
+        read_only=True,
+        allow_null=True,
+    )
+    completed_at = serializers.DateTimeField(
+        source="completion_record.completed_at",
+        read_only=True,
+        allow_null=True,
+    )
+
+    class Meta(ApexSerializer.Meta):
+        model = Workout
+        fields = ApexSerializer.Meta.fields + [
+            "workout_name",
+            "planned_date",
+            "program_phase_id",
+            "program_id",
+            "program_name",
+            "session_id",
+            "session_state",
+            "started_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
+
+    def get_session_state(self, obj):
+        """Derives the session state from the completion record.
+
+        Returns:
+            str: One of the WorkoutSessionStateVocabulary codes.
+        """
+        session = getattr(obj, "completion_record", None)
+
+        if session is None:
+            return WorkoutSessionStateVocabulary.PLANNED
+        if session.is_skipped:
+            return WorkoutSessionStateVocabulary.SKIPPED
+        if session.completed_at is None:
+            return WorkoutSessionStateVocabulary.IN_PROGRESS
+        return WorkoutSessionStateVocabulary.COMPLETED
+
+
 # Completion: Write serializers (client)
 
 
@@ -397,3 +504,69 @@ class WorkoutCompletionReadSerializer(ApexSerializer):
             "exercise_records",
         ]
         read_only_fields = fields
+
+
+# Completion: values() read serializers
+
+
+def _set_reps_diff(row):
+    if row["is_skipped"]:
+        return None
+    return row["reps_completed"] - row["workout_set__reps_prescribed"]
+
+
+def _set_weight_diff(row):
+    if row["is_skipped"]:
+        return None
+    return row["weight_completed"] - row["workout_set__weight_prescribed"]
+
+
+def _session_duration_s(row):
+    if row["started_at"] and row["completed_at"]:
+        return int((row["completed_at"] - row["started_at"]).total_seconds())
+    return None
+
+
+class WorkoutSetCompletionValuesSerializer(ValuesSerializer):
+    """values() counterpart of WorkoutSetCompletionReadSerializer."""
+
+    serializer_class = WorkoutSetCompletionReadSerializer
+    computed = {
+        "reps_diff": (
+            ("is_skipped", "reps_completed", "workout_set__reps_prescribed"),
+            _set_reps_diff,
+        ),
+        "weight_diff": (
+            ("is_skipped", "weight_completed", "workout_set__weight_prescribed"),
+            _set_weight_diff,
+        ),
+    }
+
+
+class WorkoutExerciseCompletionValuesSerializer(ValuesSerializer):
+    """values() counterpart of WorkoutExerciseCompletionReadSerializer."""
+
+    serializer_class = WorkoutExerciseCompletionReadSerializer
+    nested = {
+        "set_records": (
+            WorkoutSetCompletionValuesSerializer,
+            "exercise_completion_record",
+        ),
+    }
+    nested_bounds = {"set_records": ("created_at", "started_at")}
+
+
+class WorkoutCompletionValuesSerializer(ValuesSerializer):
+    """values() counterpart of WorkoutCompletionReadSerializer."""
+
+    serializer_class = WorkoutCompletionReadSerializer
+    computed = {
+        "duration_s": (("started_at", "completed_at"), _session_duration_s),
+    }
+    nested = {
+        "exercise_records": (
+            WorkoutExerciseCompletionValuesSerializer,
+            "workout_completion_record",
+        ),
+    }
+    nested_bounds = {"exercise_records": ("started_at", "started_at")}
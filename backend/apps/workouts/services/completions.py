@@ -11,8 +11,13 @@ from apps.workouts.models import (
     WorkoutSet,
     WorkoutSetCompletionRecord,
 )
+from core.constants import ValidationModeVocabulary
+from core.metrics import instrument
+from core.models import validation_mode
+from core.partitioning import not_before
 
 
+@instrument
 class WorkoutCompletionService:
     """Service layer for managing the lifecycle of workout completion records.
 
@@ -25,6 +30,26 @@ class WorkoutCompletionService:
         """Returns the current aware datetime."""
         return timezone.now()
 
+    @staticmethod
+    def _lock(instance):
+        """Locks a row until the current transaction ends.
+
+        Completion records are partitioned on PostgreSQL, where their unique
+        links to the prescribed exercise or set no longer reject duplicates.
+        Locking the prescribed row first makes concurrent writers of the
+        same record wait, so the existence check that follows sees the
+        record committed by the first one.
+
+        Args:
+            instance: The saved model instance to lock.
+        """
+        list(
+            type(instance)
+            .objects.select_for_update()
+            .filter(pk=instance.pk)
+            .values_list("pk")
+        )
+
     @classmethod
     def _validate_client(cls, client_user):
         """Validates that the user is a valid client capable of recording workouts.
@@ -121,17 +146,24 @@ class WorkoutCompletionService:
             raise ValidationError("This workout session is already completed.")
 
     @classmethod
-    def _validate_no_existing_exercise_record(cls, workout_exercise):
+    def _validate_no_existing_exercise_record(cls, workout_exercise, session):
         """Validates that no completion record already exists for the exercise.
 
+        Locks the exercise first, so the check holds until the transaction
+        creating the record commits. Any existing record belongs to the
+        workout's session, so only months from its start are searched.
+
         Args:
             workout_exercise: The WorkoutExercise instance.
+            session: The WorkoutCompletionRecord of the exercise's workout.
 
         Raises:
             ValidationError: If an exercise completion record is already found.
         """
+        cls._lock(workout_exercise)
         if WorkoutExerciseCompletionRecord.objects.filter(
-            workout_exercise=workout_exercise
+            workout_exercise=workout_exercise,
+            started_at__gte=not_before(session.started_at),
         ).exists():
             raise ValidationError(
                 "A completion record already exists for this exercise."
@@ -169,16 +201,26 @@ class WorkoutCompletionService:
             raise ValidationError("This exercise is already completed.")
 
     @classmethod
-    def _validate_no_existing_set_record(cls, workout_set):
+    def _validate_no_existing_set_record(cls, workout_set, exercise_record):
         """Validates that no completion record already exists for the set.
 
+        Locks the set first, so the check holds until the transaction
+        creating the record commits. Any existing record belongs to the
+        exercise record, so only months from its start are searched.
+
         Args:
             workout_set: The WorkoutSet instance.
+            exercise_record: The WorkoutExerciseCompletionRecord of the set's
+                exercise.
 
         Raises:
             ValidationError: If a set completion record is already found.
         """
-        if WorkoutSetCompletionRecord.objects.filter(workout_set=workout_set).exists():
+        cls._lock(workout_set)
+        if WorkoutSetCompletionRecord.objects.filter(
+            workout_set=workout_set,
+            created_at__gte=not_before(exercise_record.started_at),
+        ).exists():
             raise ValidationError("A completion record already exists for this set.")
 
     @classmethod
@@ -279,7 +321,8 @@ class WorkoutCompletionService:
             raise ValidationError("You can only finish your own workout sessions.")
 
         session.completed_at = cls._now()
-        session.save(update_fields=["completed_at", "updated_at"])
+        with validation_mode(ValidationModeVocabulary.FAST):
+            session.save(update_fields=["completed_at", "updated_at"])
 
         cls._compute_session_snapshots(session)
 
@@ -318,6 +361,7 @@ class WorkoutCompletionService:
 
     @classmethod
     @transaction.atomic
+    @validation_mode(ValidationModeVocabulary.FAST)
     def start_exercise(
         cls,
         *,
@@ -341,7 +385,7 @@ class WorkoutCompletionService:
         cls._validate_client(client_user)
         cls._validate_session_is_open(session)
         cls._validate_exercise_belongs_to_session(workout_exercise, session)
-        cls._validate_no_existing_exercise_record(workout_exercise)
+        cls._validate_no_existing_exercise_record(workout_exercise, session)
 
         return WorkoutExerciseCompletionRecord.objects.create(
             workout_completion_record=session,
@@ -352,6 +396,7 @@ class WorkoutCompletionService:
 
     @classmethod
     @transaction.atomic
+    @validation_mode(ValidationModeVocabulary.FAST)
     def skip_exercise(
         cls,
         *,
@@ -375,7 +420,7 @@ class WorkoutCompletionService:
         cls._validate_client(client_user)
         cls._validate_session_is_open(session)
         cls._validate_exercise_belongs_to_session(workout_exercise, session)
-        cls._validate_no_existing_exercise_record(workout_exercise)
+        cls._validate_no_existing_exercise_record(workout_exercise, session)
 
         now = cls._now()
         return WorkoutExerciseCompletionRecord.objects.create(
@@ -390,6 +435,7 @@ class WorkoutCompletionService:
 
     @classmethod
     @transaction.atomic
+    @validation_mode(ValidationModeVocabulary.FAST)
     def complete_set(
         cls,
         *,
@@ -421,7 +467,7 @@ class WorkoutCompletionService:
         cls._validate_client(client_user)
         cls._validate_exercise_record_is_open(exercise_record)
         cls._validate_set_belongs_to_exercise(workout_set, exercise_record)
-        cls._validate_no_existing_set_record(workout_set)
+        cls._validate_no_existing_set_record(workout_set, exercise_record)
 
         return WorkoutSetCompletionRecord.objects.create(
             exercise_completion_record=exercise_record,
@@ -436,6 +482,7 @@ class WorkoutCompletionService:
 
     @classmethod
     @transaction.atomic
+    @validation_mode(ValidationModeVocabulary.FAST)
     def skip_set(
         cls,
         *,
@@ -459,7 +506,7 @@ class WorkoutCompletionService:
         cls._validate_client(client_user)
         cls._validate_exercise_record_is_open(exercise_record)
         cls._validate_set_belongs_to_exercise(workout_set, exercise_record)
-        cls._validate_no_existing_set_record(workout_set)
+        cls._validate_no_existing_set_record(workout_set, exercise_record)
 
         return WorkoutSetCompletionRecord.objects.create(
             exercise_completion_record=exercise_record,
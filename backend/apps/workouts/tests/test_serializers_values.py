@@ -0,0 +1,191 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+
+from apps.workouts.models import (
+    Workout,
+    WorkoutCompletionRecord,
+    WorkoutExerciseCompletionRecord,
+    WorkoutSetCompletionRecord,
+)
+from apps.workouts.serializers import (
+    WorkoutCompletionReadSerializer,
+    WorkoutCompletionValuesSerializer,
+    WorkoutExerciseCompletionReadSerializer,
+    WorkoutExerciseCompletionValuesSerializer,
+    WorkoutSetCompletionReadSerializer,
+    WorkoutSetCompletionValuesSerializer,
+)
+from factories import (
+    WorkoutCompletionRecordFactory,
+    WorkoutExerciseCompletionRecordFactory,
+    WorkoutExerciseFactory,
+    WorkoutSetCompletionRecordFactory,
+    WorkoutSetFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def record_session(workout, client_user, exercise, finished=True):
+    """Creates a session with two exercises, one of them partly skipped."""
+    started_at = timezone.now() - timedelta(hours=1, microseconds=250)
+    session = WorkoutCompletionRecordFactory(
+        workout=workout,
+        client=client_user,
+        started_at=started_at,
+        completed_at=timezone.now() if finished else None,
+    )
+    for order in (1, 2):
+        workout_exercise = WorkoutExerciseFactory(
+            workout=workout, exercise=exercise, order=order
+        )
+        exercise_record = WorkoutExerciseCompletionRecordFactory(
+            workout_completion_record=session,
+            workout_exercise=workout_exercise,
+            started_at=started_at + timedelta(minutes=order),
+        )
+        for set_order in (2, 1, 3):
+            WorkoutSetCompletionRecordFactory(
+                exercise_completion_record=exercise_record,
+                workout_set=WorkoutSetFactory(
+                    workout_exercise=workout_exercise,
+                    set_order=set_order,
+                    weight_prescribed=Decimal("62.50"),
+                ),
+                is_skipped=set_order == 3,
+                reps_completed=4 + set_order,
+                weight_completed=Decimal("60.25"),
+                difficulty_rating=set_order,
+            )
+    return session
+
+
+@pytest.fixture
+def sessions(workout, client_user, exercise):
+    second = baker.make(
+        Workout,
+        workout_name="Thursday Lower",
+        program_phase=workout.program_phase,
+        planned_date=workout.planned_date,
+    )
+    return [
+        record_session(workout, client_user, exercise),
+        record_session(second, client_user, exercise, finished=False),
+    ]
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class TestValuesSerializerParity:
+
+    @pytest.mark.parametrize(
+        ("model", "read_serializer", "values_serializer"),
+        [
+            (
+                WorkoutSetCompletionRecord,
+                WorkoutSetCompletionReadSerializer,
+                WorkoutSetCompletionValuesSerializer,
+            ),
+            (
+                WorkoutExerciseCompletionRecord,
+                WorkoutExerciseCompletionReadSerializer,
+                WorkoutExerciseCompletionValuesSerializer,
+            ),
+            (
+                WorkoutCompletionRecord,
+                WorkoutCompletionReadSerializer,
+                WorkoutCompletionValuesSerializer,
+            ),
+        ],
+    )
+    def test_output_is_byte_identical(
+        self, sessions, model, read_serializer, values_serializer
+    ):
+        queryset = model.objects.all()
+
+        expected = render(read_serializer(queryset, many=True).data)
+        actual = render(
+            values_serializer.serialize(values_serializer.project(queryset))
+        )
+
+        assert actual == expected
+
+    def test_child_fetches_are_bounded_by_the_parent_stamps(self, sessions):
+        queryset = WorkoutCompletionRecord.objects.all()
+
+        with CaptureQueriesContext(connection) as context:
+            WorkoutCompletionValuesSerializer.serialize(
+                WorkoutCompletionValuesSerializer.project(queryset)
+            )
+
+        exercise_records, set_records = context.captured_queries[1:]
+        assert '"started_at" >=' in exercise_records["sql"]
+        assert '"created_at" >=' in set_records["sql"]
+
+    def test_empty_rows_serialize_to_an_empty_list(self):
+        queryset = WorkoutCompletionRecord.objects.none()
+
+        assert (
+            WorkoutCompletionValuesSerializer.serialize(
+                WorkoutCompletionValuesSerializer.project(queryset)
+            )
+            == []
+        )
+
+
+class TestValuesListEndpoints:
+
+    @pytest.mark.parametrize(
+        ("url_name", "read_serializer"),
+        [
+            ("workout-sessions-list", WorkoutCompletionReadSerializer),
+            ("exercise-records-list", WorkoutExerciseCompletionReadSerializer),
+            ("set-records-list", WorkoutSetCompletionReadSerializer),
+        ],
+    )
+    def test_list_matches_the_read_serializer(
+        self, client_api_client, sessions, url_name, read_serializer
+    ):
+        # Set records are ordered by set_order, so compare one exercise's sets.
+        exercise_record = WorkoutExerciseCompletionRecord.objects.first()
+        response = client_api_client.get(
+            reverse(url_name), {"exercise_completion_record": exercise_record.pk}
+        )
+        queryset = read_serializer.Meta.model.objects.all()
+        if url_name == "set-records-list":
+            queryset = queryset.filter(exercise_completion_record=exercise_record)
+
+        assert response.status_code == 200
+        assert render(response.data["results"]) == render(
+            read_serializer(queryset, many=True).data
+        )
+
+    def test_session_list_queries_do_not_grow_with_rows(
+        self, trainer_api_client, sessions, django_assert_max_num_queries
+    ):
+        # Count, page, exercise records and set records, plus auth lookups.
+        with django_assert_max_num_queries(6):
+            response = trainer_api_client.get(reverse("workout-sessions-list"))
+
+        assert len(response.data["results"]) == 2
+        assert (
+            len(response.data["results"][0]["exercise_records"][0]["set_records"]) == 3
+        )
+
+    def test_filters_apply_to_the_values_rows(self, client_api_client, sessions):
+        response = client_api_client.get(
+            reverse("set-records-list"), {"is_skipped": "true"}
+        )
+
+        assert response.data["count"] == 4
+        assert all(row["reps_diff"] is None for row in response.data["results"])
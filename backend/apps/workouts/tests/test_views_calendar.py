@@ -0,0 +1,181 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.workouts.constants import WorkoutSessionStateVocabulary
+from factories import WorkoutCompletionRecordFactory, WorkoutFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _calendar(api_client, start, end, **params):
+    url = reverse("workouts-calendar")
+    return api_client.get(
+        url, {"start": start.isoformat(), "end": end.isoformat(), **params}
+    )
+
+
+class TestWorkoutCalendar:
+
+    def test_returns_workouts_planned_in_window(self, client_api_client, active_phase):
+        today = timezone.localdate()
+        inside = WorkoutFactory(program_phase=active_phase, planned_date=today)
+        WorkoutFactory(program_phase=active_phase, planned_date=today + timedelta(40))
+
+        response = _calendar(client_api_client, today, today + timedelta(days=6))
+
+        assert response.status_code == 200
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [str(inside.id)]
+        assert response.data["results"][0]["session_state"] == (
+            WorkoutSessionStateVocabulary.PLANNED
+        )
+
+    def test_response_is_not_paginated(self, trainer_api_client, workout):
+        today = timezone.localdate()
+        response = _calendar(trainer_api_client, today, today)
+
+        assert response.status_code == 200
+        assert "count" not in response.data
+        assert response.data["start"] == today
+
+    def test_session_state_reflects_completion_record(
+        self, client_api_client, active_phase, client_user
+    ):
+        today = timezone.localdate()
+        now = timezone.now()
+        in_progress = WorkoutFactory(program_phase=active_phase, planned_date=today)
+        skipped = WorkoutFactory(program_phase=active_phase, planned_date=today)
+        completed = WorkoutFactory(program_phase=active_phase, planned_date=today)
+
+        WorkoutCompletionRecordFactory(workout=in_progress, client=client_user)
+        WorkoutCompletionRecordFactory(
+            workout=skipped,
+            client=client_user,
+            is_skipped=True,
+            started_at=now,
+            completed_at=now,
+        )
+        session = WorkoutCompletionRecordFactory(
+            workout=completed, client=client_user, started_at=now, completed_at=now
+        )
+
+        response = _calendar(client_api_client, today, today)
+
+        states = {
+            item["id"]: item["session_state"] for item in response.data["results"]
+        }
+        assert states == {
+            str(in_progress.id): WorkoutSessionStateVocabulary.IN_PROGRESS,
+            str(skipped.id): WorkoutSessionStateVocabulary.SKIPPED,
+            str(completed.id): WorkoutSessionStateVocabulary.COMPLETED,
+        }
+        completed_entry = next(
+            item for item in response.data["results"] if item["id"] == str(completed.id)
+        )
+        assert completed_entry["session_id"] == str(session.id)
+
+    def test_includes_workout_done_in_window_but_planned_outside(
+        self, client_api_client, active_phase, client_user
+    ):
+        today = timezone.localdate()
+        workout = WorkoutFactory(
+            program_phase=active_phase, planned_date=today - timedelta(days=10)
+        )
+        now = timezone.now()
+        WorkoutCompletionRecordFactory(
+            workout=workout, client=client_user, started_at=now, completed_at=now
+        )
+
+        response = _calendar(client_api_client, today, today)
+
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [str(workout.id)]
+
+    def test_can_be_combined_with_program_filter(
+        self, trainer_api_client, workout, completed_phase
+    ):
+        today = timezone.localdate()
+        WorkoutFactory(program_phase=completed_phase, planned_date=today)
+
+        response = _calendar(
+            trainer_api_client,
+            today,
+            today,
+            program=str(workout.program_phase.program_id),
+        )
+
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [str(workout.id)]
+
+    def test_other_trainer_sees_nothing(self, other_trainer_api_client, workout):
+        today = timezone.localdate()
+        response = _calendar(other_trainer_api_client, today, today)
+
+        assert response.status_code == 200
+        assert response.data["results"] == []
+
+    def test_missing_window_is_rejected(self, client_api_client):
+        response = client_api_client.get(reverse("workouts-calendar"))
+
+        assert response.status_code == 400
+
+    def test_end_before_start_is_rejected(self, client_api_client):
+        today = timezone.localdate()
+        response = _calendar(client_api_client, today, today - timedelta(days=1))
+
+        assert response.status_code == 400
+
+    def test_window_wider_than_limit_is_rejected(self, client_api_client):
+        today = timezone.localdate()
+        response = _calendar(client_api_client, today, today + timedelta(days=120))
+
+        assert response.status_code == 400
+
+
+class TestWorkoutDateRangeFilters:
+
+    def test_workouts_can_be_filtered_by_planned_date_range(
+        self, trainer_api_client, active_phase
+    ):
+        today = timezone.localdate()
+        inside = WorkoutFactory(program_phase=active_phase, planned_date=today)
+        WorkoutFactory(program_phase=active_phase, planned_date=today + timedelta(9))
+
+        response = trainer_api_client.get(
+            reverse("workouts-list"),
+            {
+                "planned_date_from": today.isoformat(),
+                "planned_date_to": (today + timedelta(days=6)).isoformat(),
+            },
+        )
+
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [str(inside.id)]
+
+    def test_sessions_can_be_filtered_by_completion_range(
+        self, client_api_client, active_phase, client_user
+    ):
+        now = timezone.now()
+        recent = WorkoutCompletionRecordFactory(
+            workout=WorkoutFactory(program_phase=active_phase),
+            client=client_user,
+            started_at=now,
+            completed_at=now,
+        )
+        WorkoutCompletionRecordFactory(
+            workout=WorkoutFactory(program_phase=active_phase),
+            client=client_user,
+            started_at=now - timedelta(days=30),
+            completed_at=now - timedelta(days=30),
+        )
+
+        response = client_api_client.get(
+            reverse("workout-sessions-list"),
+            {"completed_from": (now - timedelta(days=1)).isoformat()},
+        )
+
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [str(recent.id)]
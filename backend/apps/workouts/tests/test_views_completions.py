@@ -238,6 +238,20 @@ class TestWorkoutExerciseRecordViewSet:
 
         assert response.status_code == 400
 
+    def test_start_bounds_filter_the_list(
+        self, client_api_client, workout_exercise, workout, client_user
+    ):
+        session = WorkoutCompletionRecordFactory(workout=workout, client=client_user)
+        record = WorkoutExerciseCompletionRecordFactory(
+            workout_completion_record=session,
+            workout_exercise=workout_exercise,
+        )
+        url = reverse("exercise-records-list")
+        after = (record.started_at + timezone.timedelta(minutes=1)).isoformat()
+
+        assert client_api_client.get(url, {"started_to": after}).data["count"] == 1
+        assert client_api_client.get(url, {"started_from": after}).data["count"] == 0
+
 
 class TestWorkoutSetRecordViewSet:
 
@@ -265,6 +279,23 @@ class TestWorkoutSetRecordViewSet:
         assert response.data["reps_diff"] == 0
         assert response.data["weight_diff"] == "0.00"
 
+    def test_recorded_bounds_filter_the_list(
+        self, client_api_client, workout_set, workout_exercise, workout, client_user
+    ):
+        session = WorkoutCompletionRecordFactory(workout=workout, client=client_user)
+        exercise_record = WorkoutExerciseCompletionRecordFactory(
+            workout_completion_record=session,
+            workout_exercise=workout_exercise,
+        )
+        record = WorkoutSetCompletionRecordFactory(
+            exercise_completion_record=exercise_record, workout_set=workout_set
+        )
+        url = reverse("set-records-list")
+        after = (record.created_at + timezone.timedelta(minutes=1)).isoformat()
+
+        assert client_api_client.get(url, {"recorded_to": after}).data["count"] == 1
+        assert client_api_client.get(url, {"recorded_from": after}).data["count"] == 0
+
     def test_client_can_skip_set(
         self, client_api_client, workout_set, workout_exercise, workout, client_user
     ):
@@ -1,10 +1,20 @@
+from datetime import datetime, time, timedelta
+
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 
+from apps.workouts.filters import (
+    WorkoutExerciseRecordFilter,
+    WorkoutFilter,
+    WorkoutSessionFilter,
+    WorkoutSetRecordFilter,
+)
 from apps.workouts.models import (
     Workout,
     WorkoutCompletionRecord,
@@ -14,22 +24,28 @@ from apps.workouts.models import (
     WorkoutSetCompletionRecord,
 )
 from apps.workouts.serializers import (
+    CalendarWindowSerializer,
     CompleteSetSerializer,
     SkipSetSerializer,
     StartExerciseSerializer,
     StartWorkoutSerializer,
+    WorkoutCalendarSerializer,
     WorkoutCompletionReadSerializer,
+    WorkoutCompletionValuesSerializer,
     WorkoutExerciseCompletionReadSerializer,
+    WorkoutExerciseCompletionValuesSerializer,
     WorkoutExerciseReadSerializer,
     WorkoutExerciseWriteSerializer,
     WorkoutListSerializer,
     WorkoutReadSerializer,
     WorkoutSetCompletionReadSerializer,
+    WorkoutSetCompletionValuesSerializer,
     WorkoutSetReadSerializer,
     WorkoutSetWriteSerializer,
     WorkoutWriteSerializer,
 )
 from apps.workouts.services.completions import WorkoutCompletionService
+from core.views import ReplicaReadsMixin, ValuesListMixin
 
 
 def _raise_drf_validation_error(exc):
@@ -62,12 +78,12 @@ class WorkoutViewSet(
     Attributes:
         permission_classes: List of permission classes (IsAuthenticated).
         filter_backends: List of filter backend classes.
-        filterset_fields: Fields available for filtering.
+        filterset_class: Filter set providing phase, program and date filters.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["program_phase", "planned_date"]
+    filterset_class = WorkoutFilter
 
     def get_queryset(self):
         """Retrieves workouts scoped by the user's role and membership.
@@ -112,8 +128,59 @@ class WorkoutViewSet(
             return WorkoutWriteSerializer
         if self.action == "list":
             return WorkoutListSerializer
+        if self.action == "calendar":
+            return WorkoutCalendarSerializer
         return WorkoutReadSerializer
 
+    def _get_calendar_queryset(self, start, end):
+        """Retrieves workouts planned or done within a date window.
+
+        A workout is included when its planned date falls in the window, or when
+        its session was finished in the window even if it was planned for
+        another day. Only the program and completion record are joined, so the
+        result can be serialized without touching exercises or sets.
+
+        Args:
+            start: First date of the window (inclusive).
+            end: Last date of the window (inclusive).
+
+        Returns:
+            QuerySet: Workouts across all of the user's programs in the window.
+        """
+        user = self.request.user
+
+        window_start = timezone.make_aware(datetime.combine(start, time.min))
+        window_end = timezone.make_aware(
+            datetime.combine(end + timedelta(days=1), time.min)
+        )
+        done_in_window = Q(
+            completion_record__completed_at__gte=window_start,
+            completion_record__completed_at__lt=window_end,
+        )
+
+        queryset = Workout.objects.select_related(
+            "program_phase",
+            "program_phase__program",
+            "completion_record",
+        )
+
+        if user.is_trainer:
+            queryset = queryset.filter(
+                program_phase__program__trainer_client_membership__trainer=user.trainer_profile
+            )
+        elif user.is_client:
+            queryset = queryset.filter(
+                program_phase__program__trainer_client_membership__client=user.client_profile
+            )
+            # Lets the planner use the (client, completed_at) index.
+            done_in_window &= Q(completion_record__client=user)
+        else:
+            return queryset.none()
+
+        return queryset.filter(
+            Q(planned_date__range=(start, end)) | done_in_window
+        ).order_by("planned_date", "id")
+
     def _validate_trainer_owns_workout(self, workout):
         """Validates that the current user is the trainer for the workout.
 
@@ -220,6 +287,37 @@ class WorkoutViewSet(
         workout.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=["get"], url_path="calendar")
+    def calendar(self, request):
+        """Lists workouts and their session state within a date window.
+
+        Query parameters:
+            start (required): First date of the window (YYYY-MM-DD).
+            end (required): Last date of the window (YYYY-MM-DD).
+
+        The standard workout filters (program, program_phase) may be combined
+        with the window. Results are bounded by the window and returned
+        unpaginated.
+
+        Returns:
+            Response: The window bounds and the workouts within it.
+        """
+        window_serializer = CalendarWindowSerializer(data=request.query_params)
+        window_serializer.is_valid(raise_exception=True)
+        start = window_serializer.validated_data["start"]
+        end = window_serializer.validated_data["end"]
+
+        queryset = self.filter_queryset(self._get_calendar_queryset(start, end))
+
+        output_serializer = self.get_serializer(queryset, many=True)
+        return Response(
+            {
+                "start": start,
+                "end": end,
+                "results": output_serializer.data,
+            }
+        )
+
 
 class WorkoutExerciseViewSet(
     mixins.CreateModelMixin,
@@ -545,6 +643,8 @@ class WorkoutSetViewSet(
 
 
 class WorkoutSessionViewSet(
+    ReplicaReadsMixin,
+    ValuesListMixin,
     mixins.RetrieveModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet,
@@ -557,14 +657,16 @@ class WorkoutSessionViewSet(
     Attributes:
         permission_classes: List of permission classes (IsAuthenticated).
         filter_backends: List of filter backend classes.
-        filterset_fields: Fields available for filtering.
+        filterset_class: Filter set providing skip, phase and completion filters.
         serializer_class: Default serializer for read operations.
+        values_serializer_class: Serializer for the list action's rows.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["is_skipped", "workout__program_phase"]
+    filterset_class = WorkoutSessionFilter
     serializer_class = WorkoutCompletionReadSerializer
+    values_serializer_class = WorkoutCompletionValuesSerializer
 
     def get_queryset(self):
         """Retrieves session records for the client or trainer.
@@ -674,6 +776,8 @@ class WorkoutSessionViewSet(
 
 
 class WorkoutExerciseRecordViewSet(
+    ReplicaReadsMixin,
+    ValuesListMixin,
     mixins.RetrieveModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet,
@@ -683,14 +787,16 @@ class WorkoutExerciseRecordViewSet(
     Attributes:
         permission_classes: List of permission classes (IsAuthenticated).
         filter_backends: List of filter backend classes.
-        filterset_fields: Fields available for filtering.
+        filterset_class: Filter set providing record and start time filters.
         serializer_class: Default serializer for read operations.
+        values_serializer_class: Serializer for the list action's rows.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["workout_completion_record", "is_skipped"]
+    filterset_class = WorkoutExerciseRecordFilter
     serializer_class = WorkoutExerciseCompletionReadSerializer
+    values_serializer_class = WorkoutExerciseCompletionValuesSerializer
 
     def get_queryset(self):
         """Retrieves exercise records for the user.
@@ -765,6 +871,8 @@ class WorkoutExerciseRecordViewSet(
 
 
 class WorkoutSetRecordViewSet(
+    ReplicaReadsMixin,
+    ValuesListMixin,
     mixins.RetrieveModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet,
@@ -776,14 +884,16 @@ class WorkoutSetRecordViewSet(
     Attributes:
         permission_classes: List of permission classes (IsAuthenticated).
         filter_backends: List of filter backend classes.
-        filterset_fields: Fields available for filtering.
+        filterset_class: Filter set providing record and recording time filters.
         serializer_class: Default serializer for read operations.
+        values_serializer_class: Serializer for the list action's rows.
     """
 
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["exercise_completion_record", "is_skipped"]
+    filterset_class = WorkoutSetRecordFilter
     serializer_class = WorkoutSetCompletionReadSerializer
+    values_serializer_class = WorkoutSetCompletionValuesSerializer
 
     def get_queryset(self):
         """Retrieves set records for the user.
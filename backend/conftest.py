@@ -2,6 +2,7 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from model_bakery import baker
 from rest_framework.test import APIClient
@@ -58,6 +59,16 @@ from apps.workouts.models import Workout, WorkoutExercise, WorkoutSet
 User = get_user_model()
 
 
+# ── Cache isolation ───────────────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 # ── Vocabulary seeding ────────────────────────────────────────────────────────
 
 
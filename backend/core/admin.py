@@ -1,7 +1,129 @@
 from django.contrib import admin
+from django.http import FileResponse, Http404
+from django.urls import path, reverse
+from django.utils.html import format_html, format_html_join
+
+from .models import RequestProfile
 
 
 class NormalisedLookupAdmin(admin.ModelAdmin):
     list_display = ("id", "code", "label", "order_index")
     search_fields = ("code", "label", "description")
     ordering = ("order_index", "label")
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    """Admin interface for profiles captured by core.profiling.
+
+    Captures are read-only: the call tree is shown as preformatted text, the
+    SQL timeline as a table, and the raw stats file can be downloaded.
+
+    Attributes:
+        list_display: Fields to display in the admin list view.
+        list_filter: Fields available for sidebar filtering.
+        search_fields: Fields available for text-based searching.
+        fields: Fields shown, in order, on the detail page.
+    """
+
+    list_display = (
+        "created_at",
+        "method",
+        "path",
+        "view_name",
+        "status_code",
+        "duration_ms",
+        "query_count",
+        "query_time_ms",
+        "user",
+    )
+    list_filter = ("method", "status_code", "view_name")
+    search_fields = ("path", "view_name", "user__email")
+    list_select_related = ("user",)
+    fields = (
+        "created_at",
+        "user",
+        "method",
+        "path",
+        "query_string",
+        "view_name",
+        "status_code",
+        "duration_ms",
+        "query_count",
+        "query_time_ms",
+        "stats_download",
+        "call_tree_display",
+        "sql_timeline_display",
+    )
+    readonly_fields = fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        download = path(
+            "<uuid:object_id>/stats/",
+            self.admin_site.admin_view(self.download_stats),
+            name="core_requestprofile_stats",
+        )
+        return [download, *super().get_urls()]
+
+    def download_stats(self, request, object_id):
+        """Serves the raw cProfile stats file of a capture.
+
+        Args:
+            request: The admin request.
+            object_id: Primary key of the capture.
+
+        Returns:
+            FileResponse: The .prof file as an attachment.
+
+        Raises:
+            Http404: If the capture or its file does not exist.
+        """
+        capture = self.get_object(request, str(object_id))
+        if capture is None or not self.has_view_permission(request, capture):
+            raise Http404
+        if not capture.stats_file or not capture.stats_file.storage.exists(
+            capture.stats_file.name
+        ):
+            raise Http404
+        return FileResponse(
+            capture.stats_file.open("rb"),
+            as_attachment=True,
+            filename=capture.stats_file.name,
+        )
+
+    @admin.display(description="Stats file")
+    def stats_download(self, obj):
+        if not obj.stats_file:
+            return "-"
+        url = reverse("admin:core_requestprofile_stats", args=[obj.pk])
+        return format_html('<a href="{}">{}</a>', url, obj.stats_file.name)
+
+    @admin.display(description="Call tree")
+    def call_tree_display(self, obj):
+        return format_html(
+            '<pre style="font-size: 12px; overflow-x: auto;">{}</pre>', obj.call_tree
+        )
+
+    @admin.display(description="SQL timeline")
+    def sql_timeline_display(self, obj):
+        if not obj.sql_timeline:
+            return "-"
+        rows = format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td><code>{}</code></td></tr>",
+            (
+                (entry["offset_ms"], entry["duration_ms"], entry["alias"], entry["sql"])
+                for entry in obj.sql_timeline
+            ),
+        )
+        return format_html(
+            "<table><thead><tr><th>Offset (ms)</th><th>Duration (ms)</th>"
+            "<th>Database</th><th>SQL</th></tr></thead><tbody>{}</tbody></table>",
+            rows,
+        )
@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Configuration class for the core application.
+
+    Connects the signal handlers that keep the reference data version stamp
+    in step with writes to lookup and catalogue models.
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        """Imports signal handlers so they register with the dispatcher."""
+        # noqa Exception. Needs import but not used.
+        import core.signals  # noqa: F401
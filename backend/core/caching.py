@@ -0,0 +1,484 @@
+"""Tag-invalidated response caching for read-only API endpoints.
+
+Views declare the tags their data depends on, such as "programs" or
+"analytics". Each tag has an opaque version held in the API cache, and a
+cached response is stored under a key built from the view, the requesting
+user (for USER scope), the path, the sorted query parameters, the media type
+and the current version of every tag. Replacing the version of a tag makes
+every response depending on it miss from then on, without tracking
+individual keys. Entries still expire after API_CACHE_TIMEOUT.
+
+Tags are also scoped by owner. Rows are only shown to the trainer and
+client of the membership they belong to (CACHE_OWNERS_BY_MODEL), so saving
+or deleting one replaces the versions of those two users' copies of its
+tags, such as "workouts:user:<id>". USER-scoped responses depend on the
+requester's copies as well as the global tags, so a write leaves every
+other trainer's cached responses in place. The global tags are replaced for
+rows without a membership and for bulk writes that send no signals.
+
+Tag versions live in the API cache, which production keeps per machine, so
+only writes made by the web service itself reach its cached responses.
+Background workers and cron jobs invalidate shared tags instead: views list
+them in cache_shared_tags, and their versions are core.versioning stamps in
+the database, read with one query per cached read.
+
+Versions record when they were invalidated. A miss on a tag replaced within
+REPLICA_MAX_LAG_SECONDS is filled from the primary database, so a replica
+that has not caught up with the write cannot be cached under the new
+version.
+"""
+
+import functools
+import hashlib
+import inspect
+import time
+import uuid
+from contextlib import nullcontext
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import urlencode
+from rest_framework.response import Response
+
+from .constants import CacheScopeVocabulary, CacheTagVocabulary
+from .routers import primary_reads
+from .versioning import bump_version_stamps, get_version_stamps
+
+CACHE_TAGS_BY_MODEL = {
+    "programs.Program": (CacheTagVocabulary.PROGRAMS,),
+    "programs.ProgramPhase": (CacheTagVocabulary.PROGRAMS,),
+    "workouts.Workout": (CacheTagVocabulary.WORKOUTS,),
+    "workouts.WorkoutExercise": (CacheTagVocabulary.WORKOUTS,),
+    "workouts.WorkoutSet": (CacheTagVocabulary.WORKOUTS,),
+    "workouts.WorkoutCompletionRecord": (CacheTagVocabulary.WORKOUTS,),
+    "workouts.WorkoutExerciseCompletionRecord": (CacheTagVocabulary.WORKOUTS,),
+    "workouts.WorkoutSetCompletionRecord": (CacheTagVocabulary.WORKOUTS,),
+    "analytics.ExerciseSessionSnapshot": (CacheTagVocabulary.ANALYTICS,),
+    # Memberships decide which programs and clients a trainer can see.
+    "users.TrainerClientMembership": (CacheTagVocabulary.MEMBERSHIPS,),
+}
+
+# The path from each model in CACHE_TAGS_BY_MODEL to the membership whose
+# trainer and client can see its rows.
+CACHE_OWNERS_BY_MODEL = {
+    "programs.Program": "trainer_client_membership",
+    "programs.ProgramPhase": "program__trainer_client_membership",
+    "workouts.Workout": "program_phase__program__trainer_client_membership",
+    "workouts.WorkoutExercise": (
+        "workout__program_phase__program__trainer_client_membership"
+    ),
+    "workouts.WorkoutSet": (
+        "workout_exercise__workout__program_phase__program__trainer_client_membership"
+    ),
+    "workouts.WorkoutCompletionRecord": (
+        "workout__program_phase__program__trainer_client_membership"
+    ),
+    "workouts.WorkoutExerciseCompletionRecord": (
+        "workout_completion_record__workout__program_phase__program"
+        "__trainer_client_membership"
+    ),
+    "workouts.WorkoutSetCompletionRecord": (
+        "exercise_completion_record__workout_completion_record__workout"
+        "__program_phase__program__trainer_client_membership"
+    ),
+    "analytics.ExerciseSessionSnapshot": "program__trainer_client_membership",
+    "users.TrainerClientMembership": "",
+}
+
+TAG_VERSION_CACHE_KEY = "api-cache:tag:{tag}"
+USER_TAG = "{tag}:user:{user_id}"
+SHARED_TAG_STAMP_KEY = "api-cache:{tag}"
+
+_MISSING = object()
+
+
+def _new_tag_version(created_ms=None) -> str:
+    if created_ms is None:
+        created_ms = time.time_ns() // 1_000_000
+    return f"{created_ms:x}.{uuid.uuid4().hex}"
+
+
+def tags_changed_within(versions, seconds) -> bool:
+    """Returns whether any tag version was created in the last seconds.
+
+    Args:
+        versions: Version strings from get_tag_versions.
+        seconds: The window to check.
+
+    Returns:
+        True if a version is recent. Versions created for missing tags,
+        rather than by invalidate_tags, and those without a timestamp count
+        as old.
+    """
+    threshold = time.time_ns() // 1_000_000 - seconds * 1000
+    for version in versions:
+        created, _, _ = version.partition(".")
+        try:
+            if int(created, 16) > threshold:
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def api_cache():
+    """Returns the cache backend holding API responses and tag versions."""
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def model_cache_tags(model) -> tuple:
+    """Returns the tags invalidated by writes to a model.
+
+    Args:
+        model: The model class that sent a save or delete signal.
+
+    Returns:
+        The model's tags from CACHE_TAGS_BY_MODEL, empty for other models.
+    """
+    return CACHE_TAGS_BY_MODEL.get(model._meta.label, ())
+
+
+def cache_tag_owners(instance) -> list:
+    """Returns the ids of the users who can see a row in cached responses.
+
+    Args:
+        instance: A saved instance of a model in CACHE_OWNERS_BY_MODEL.
+
+    Returns:
+        The user ids of the trainer and client of the row's membership,
+        empty when it has none.
+    """
+    path = CACHE_OWNERS_BY_MODEL[instance._meta.label]
+    prefix = f"{path}__" if path else ""
+    rows = (
+        type(instance)
+        ._base_manager.using(instance._state.db)
+        .filter(pk=instance.pk)
+        .order_by()
+        .values_list(f"{prefix}trainer__user_id", f"{prefix}client__user_id")
+    )
+    return sorted({user_id for row in rows for user_id in row if user_id})
+
+
+def moves_cache_owners(instance, update_fields) -> bool:
+    """Returns whether a save may change who can see a row.
+
+    Args:
+        instance: An instance of a model in CACHE_OWNERS_BY_MODEL.
+        update_fields: The fields being saved, None for every field.
+
+    Returns:
+        False when only fields outside the row's path to its membership (or,
+        for a membership, its trainer and client) are saved.
+    """
+    if update_fields is None:
+        return True
+    path = CACHE_OWNERS_BY_MODEL[instance._meta.label]
+    fields = {path.split("__")[0]} if path else {"trainer", "client"}
+    return not fields.isdisjoint(update_fields)
+
+
+def owner_cache_tags(tags, owners) -> list:
+    """Returns each owner's copy of tags.
+
+    Args:
+        tags: The tag names.
+        owners: User ids, as returned by cache_tag_owners.
+
+    Returns:
+        Tags such as "workouts:user:<id>", in the order of owners and tags.
+    """
+    return [
+        USER_TAG.format(tag=tag, user_id=user_id) for user_id in owners for tag in tags
+    ]
+
+
+def request_cache_tags(request, tags, scope) -> list:
+    """Returns the tags a response to a request depends on.
+
+    Args:
+        request: The DRF request.
+        tags: The tags the view declares.
+        scope: A CacheScopeVocabulary value.
+
+    Returns:
+        The global tags, followed by the requesting user's copy of them for
+        USER scope.
+    """
+    user_id = getattr(request.user, "pk", None)
+    if scope == CacheScopeVocabulary.PUBLIC or user_id is None:
+        return list(tags)
+    return [*tags, *owner_cache_tags(tags, [user_id])]
+
+
+def get_tag_versions(tags) -> list:
+    """Fetches the current version of each tag, creating missing ones.
+
+    Args:
+        tags: The tag names.
+
+    Returns:
+        The version strings, in the order of tags.
+    """
+    cache = api_cache()
+    keys = [TAG_VERSION_CACHE_KEY.format(tag=tag) for tag in tags]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            # Not a write, so the version does not count as recent.
+            cache.add(key, _new_tag_version(created_ms=0), timeout=None)
+        versions.update(cache.get_many(missing))
+    return [versions.get(key, "") for key in keys]
+
+
+def invalidate_tags(*tags) -> None:
+    """Replaces the versions of tags, so responses cached under them miss.
+
+    Args:
+        *tags: The tag names.
+    """
+    api_cache().set_many(
+        {TAG_VERSION_CACHE_KEY.format(tag=tag): _new_tag_version() for tag in tags},
+        timeout=None,
+    )
+
+
+def invalidate_shared_tags(*tags, owners=None) -> None:
+    """Replaces the database versions of shared tags.
+
+    Args:
+        *tags: The shared tag names.
+        owners: User ids whose copies of tags are invalidated instead of
+            the global tags.
+    """
+    if owners is not None:
+        tags = owner_cache_tags(tags, owners)
+    bump_version_stamps(SHARED_TAG_STAMP_KEY.format(tag=tag) for tag in tags)
+
+
+def schedule_tag_invalidation(*tags, owners=None) -> None:
+    """Invalidates tags now and again once the current transaction commits.
+
+    The immediate bump makes this process's next read miss. A concurrent
+    reader may still cache the pre-commit rows under the new version, so
+    the tags are replaced a second time after the write is visible.
+
+    Args:
+        *tags: The tag names.
+        owners: User ids whose copies of tags are invalidated instead of
+            the global tags, which every response depends on.
+    """
+    if owners is not None:
+        tags = owner_cache_tags(tags, owners)
+    if not tags:
+        return
+    invalidate_tags(*tags)
+    transaction.on_commit(functools.partial(invalidate_tags, *tags))
+
+
+def response_cache_key(request, view_name, tags, scope, versions=None) -> str:
+    """Builds the cache key of one representation of a read endpoint.
+
+    Args:
+        request: The DRF request, after content negotiation.
+        view_name: Distinguishes views that share a path.
+        tags: The tags the response depends on.
+        scope: A CacheScopeVocabulary value.
+        versions: The current versions of tags, if already fetched.
+
+    Returns:
+        A short, cache-backend safe key.
+    """
+    owner = (
+        CacheScopeVocabulary.PUBLIC
+        if scope == CacheScopeVocabulary.PUBLIC
+        else str(request.user.pk)
+    )
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    parts = (
+        view_name,
+        owner,
+        request.path,
+        query,
+        request.accepted_media_type or "",
+        *(get_tag_versions(tags) if versions is None else versions),
+    )
+    digest = hashlib.sha1("|".join(parts).encode(), usedforsecurity=False)
+    return f"api-cache:{digest.hexdigest()}"
+
+
+def _lookup(view, request, tags, scope, shared_tags=()):
+    """Returns a response's cache key and whether its tags just changed."""
+    lag = settings.REPLICA_MAX_LAG_SECONDS
+    tags = request_cache_tags(request, tags, scope)
+    versions = get_tag_versions(tags)
+    changed = tags_changed_within(versions, lag)
+    if shared_tags:
+        stamps = get_version_stamps(
+            SHARED_TAG_STAMP_KEY.format(tag=tag)
+            for tag in request_cache_tags(request, shared_tags, scope)
+        ).values()
+        versions += [stamp["version"] for stamp in stamps]
+        changed = changed or any(
+            time.time() - stamp["updated_at"] < lag for stamp in stamps
+        )
+    key = response_cache_key(request, type(view).__name__, tags, scope, versions)
+    return key, changed
+
+
+def get_cached_response(
+    view, request, handler, tags, scope, timeout=None, shared_tags=()
+):
+    """Serves a GET handler's data from the API cache, filling it on a miss.
+
+    Only 200 responses are stored, as their data rather than the rendered
+    body, so cached and fresh responses go through the same renderer.
+
+    Args:
+        view: The view instance handling the request.
+        request: The DRF request.
+        handler: Callable producing the response on a miss.
+        tags: The tags the response depends on.
+        scope: A CacheScopeVocabulary value.
+        timeout: Seconds to keep the entry. Defaults to API_CACHE_TIMEOUT.
+        shared_tags: Tags invalidated by other services, through
+            invalidate_shared_tags.
+
+    Returns:
+        Response: The cached or freshly produced response.
+    """
+    if not settings.API_CACHE_ENABLED:
+        return handler()
+
+    cache = api_cache()
+    key, changed = _lookup(view, request, tags, scope, shared_tags)
+    data = cache.get(key, _MISSING)
+    if data is not _MISSING:
+        return Response(data)
+
+    with primary_reads() if changed else nullcontext():
+        response = handler()
+    if response.status_code == 200:
+        cache.set(
+            key,
+            response.data,
+            timeout=settings.API_CACHE_TIMEOUT if timeout is None else timeout,
+        )
+    return response
+
+
+async def aget_cached_response(view, request, handler, tags, scope, timeout=None):
+    """Async version of get_cached_response for coroutine handlers.
+
+    Args:
+        view: The view instance handling the request.
+        request: The DRF request.
+        handler: Coroutine function producing the response on a miss.
+        tags: The tags the response depends on.
+        scope: A CacheScopeVocabulary value.
+        timeout: Seconds to keep the entry. Defaults to API_CACHE_TIMEOUT.
+
+    Returns:
+        Response: The cached or freshly produced response.
+    """
+    if not settings.API_CACHE_ENABLED:
+        return await handler()
+
+    cache = api_cache()
+    key, changed = await sync_to_async(_lookup)(view, request, tags, scope)
+    data = await cache.aget(key, _MISSING)
+    if data is not _MISSING:
+        return Response(data)
+
+    with primary_reads() if changed else nullcontext():
+        response = await handler()
+    if response.status_code == 200:
+        await cache.aset(
+            key,
+            response.data,
+            timeout=settings.API_CACHE_TIMEOUT if timeout is None else timeout,
+        )
+    return response
+
+
+def cache_response(*tags, scope=CacheScopeVocabulary.USER, timeout=None):
+    """Decorates a view's GET handler to cache its response by tags.
+
+    Coroutine handlers are wrapped with aget_cached_response.
+
+    Args:
+        *tags: The tags the response depends on.
+        scope: A CacheScopeVocabulary value. Defaults to USER.
+        timeout: Seconds to keep entries. Defaults to API_CACHE_TIMEOUT.
+
+    Returns:
+        Callable: A decorator for methods taking (self, request, ...).
+    """
+
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(view, request, *args, **kwargs):
+                return await aget_cached_response(
+                    view,
+                    request,
+                    lambda: method(view, request, *args, **kwargs),
+                    tags,
+                    scope,
+                    timeout,
+                )
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            return get_cached_response(
+                view,
+                request,
+                lambda: method(view, request, *args, **kwargs),
+                tags,
+                scope,
+                timeout,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class CachedResponseMixin:
+    """Caches the list and retrieve responses of a DRF view by tags.
+
+    Attributes:
+        cache_tags: The tags the view's responses depend on.
+        cache_shared_tags: Tags invalidated by other services, through
+            invalidate_shared_tags.
+        cache_scope: A CacheScopeVocabulary value. Defaults to USER.
+        cache_timeout: Seconds to keep entries. Defaults to API_CACHE_TIMEOUT.
+    """
+
+    cache_tags = ()
+    cache_shared_tags = ()
+    cache_scope = CacheScopeVocabulary.USER
+    cache_timeout = None
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(request, super().retrieve, *args, **kwargs)
+
+    def _cached_response(self, request, handler, *args, **kwargs):
+        return get_cached_response(
+            self,
+            request,
+            lambda: handler(request, *args, **kwargs),
+            self.cache_tags,
+            self.cache_scope,
+            self.cache_timeout,
+            self.cache_shared_tags,
+        )
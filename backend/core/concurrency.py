@@ -0,0 +1,80 @@
+"""Concurrent database reads for async views.
+
+Django's async ORM methods (aget, afirst, ...) run every query on the one
+thread-sensitive executor thread of the request, so awaiting several of them
+with asyncio.gather still executes them one after another on one connection.
+gather_reads instead runs independent reads on separate worker threads, each
+with its own connection, so their round trips overlap.
+
+Reads fall back to running in order on the request's connection when
+CONCURRENT_DB_READS is off or a transaction is open, since other connections
+cannot see that transaction's uncommitted rows.
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from .profiling import profile_thread
+
+
+def _in_atomic_block() -> bool:
+    return any(connection.in_atomic_block for connection in connections.all())
+
+
+def _on_own_connection(read):
+    """Wraps a read so its thread's connection is recycled like a request's.
+
+    Worker threads outlive the request, so connections left open in them
+    would not be recycled by the request lifecycle. close_old_connections
+    applies the same CONN_MAX_AGE and health checks a request would. Reads
+    of a profiled request are profiled in their thread.
+    """
+
+    def run():
+        close_old_connections()
+        try:
+            return profile_thread(read)
+        finally:
+            close_old_connections()
+
+    return run
+
+
+async def gather_reads(*reads) -> list:
+    """Runs independent synchronous ORM reads concurrently.
+
+    Each read must evaluate its queryset fully, for example by calling get()
+    or list(), so no query runs lazily later in the async context.
+
+    Args:
+        *reads: Zero-argument callables performing one read each.
+
+    Returns:
+        The results of reads, in argument order.
+
+    Raises:
+        Exception: The first exception raised by a read, in argument order,
+            once every read has finished.
+    """
+    concurrent = (
+        settings.CONCURRENT_DB_READS
+        and len(reads) > 1
+        and not await sync_to_async(_in_atomic_block)()
+    )
+    if not concurrent:
+        return [await sync_to_async(read)() for read in reads]
+
+    results = await asyncio.gather(
+        *(
+            sync_to_async(_on_own_connection(read), thread_sensitive=False)()
+            for read in reads
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
@@ -0,0 +1,50 @@
+class ValidationModeVocabulary:
+    """Validation strategies applied by ApexModel before a save.
+
+    FULL runs full_clean() and suits untrusted input. FAST runs the touched
+    field rules and clean() but leaves database-backed checks (uniqueness,
+    constraints, foreign keys) to the database. SKIP runs nothing and is
+    meant for bulk paths that validated with ApexModel.clean_bulk().
+    """
+
+    FULL = "full"
+    FAST = "fast"
+    SKIP = "skip"
+
+    CHOICES = [
+        (FULL, "Full"),
+        (FAST, "Fast"),
+        (SKIP, "Skip"),
+    ]
+
+
+class CacheScopeVocabulary:
+    """Who may share a cached API response.
+
+    USER keeps one copy per authenticated user, for views whose querysets
+    are filtered by the requester. PUBLIC shares one copy with everyone and
+    is only for responses that do not depend on the user.
+    """
+
+    USER = "user"
+    PUBLIC = "public"
+
+
+class CacheTagVocabulary:
+    """Tags naming the data cached API responses depend on.
+
+    Writes to the models mapped in core.caching.CACHE_TAGS_BY_MODEL
+    invalidate the responses cached under their tags for the trainer and
+    client who can see the written row.
+
+    ADHERENCE and PROFILE_IMAGES are shared tags, invalidated by the cron
+    job refreshing the rollups and the worker rendering profile images (see
+    core.caching.invalidate_shared_tags).
+    """
+
+    PROGRAMS = "programs"
+    WORKOUTS = "workouts"
+    ANALYTICS = "analytics"
+    MEMBERSHIPS = "memberships"
+    ADHERENCE = "adherence"
+    PROFILE_IMAGES = "profile-images"
@@ -0,0 +1,208 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+from django.db.utils import load_backend
+
+MODES = ("persistent", "per-request", "pool")
+
+BENCHMARK_ALIAS = "db_pool_benchmark_{mode}"
+
+
+class Command(BaseCommand):
+    """Django management command comparing connection modes under threads.
+
+    Simulates a threaded worker: --threads threads serve --requests requests
+    between them. Each request follows Django's request lifecycle for its
+    thread's connection (recycle if obsolete, run --queries queries, spend
+    --work-ms holding the connection, recycle again). Threads connect with
+    a copy of the default database's settings in one of three modes:
+
+    - persistent: CONN_MAX_AGE as configured (600 if disabled) without a
+      pool, i.e. one long-lived connection per thread.
+    - per-request: CONN_MAX_AGE=0, a new connection for every request.
+    - pool: a psycopg 3 pool sized by the DB_POOL_* settings, shared by
+      every thread (PostgreSQL with psycopg[pool] only).
+
+    The command reports throughput, request latency percentiles and how
+    many distinct server connections each mode opened.
+    """
+
+    help = "Benchmarks persistent, per-request and pooled connections under threads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=16, help="Concurrent worker threads."
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Requests served per mode, across all threads.",
+        )
+        parser.add_argument(
+            "--queries", type=int, default=3, help="Queries run per request."
+        )
+        parser.add_argument(
+            "--work-ms",
+            type=float,
+            default=2.0,
+            help="Time each request holds its connection outside queries.",
+        )
+        parser.add_argument(
+            "--modes",
+            nargs="+",
+            choices=MODES,
+            default=list(MODES),
+            help="Connection modes to benchmark.",
+        )
+
+    def handle(self, *args, **options):
+        """Runs the simulated workload once per requested mode.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+
+        Raises:
+            CommandError: If --threads, --requests or --queries is not
+                positive, or --work-ms is negative.
+        """
+        if min(options["threads"], options["requests"], options["queries"]) < 1:
+            raise CommandError("--threads, --requests and --queries must be positive.")
+        if options["work_ms"] < 0:
+            raise CommandError("--work-ms cannot be negative.")
+
+        for mode in options["modes"]:
+            alias = BENCHMARK_ALIAS.format(mode=mode)
+            try:
+                database = self._database(mode)
+                result = self._run(database, alias, options)
+            except (DatabaseError, ImproperlyConfigured) as e:
+                self.stdout.write(self.style.WARNING(f"{mode}: skipped, {e}"))
+                continue
+            self._report(mode, result)
+
+    @staticmethod
+    def _database(mode):
+        """Returns a copy of the default database's settings for a mode.
+
+        Raises:
+            ImproperlyConfigured: If pool mode is requested on a database or
+                driver without pool support.
+        """
+        database = {
+            key: value
+            for key, value in connections["default"].settings_dict.items()
+            if key != "OPTIONS"
+        }
+        options = {
+            key: value
+            for key, value in connections["default"].settings_dict["OPTIONS"].items()
+            if key != "pool"
+        }
+
+        if mode == "pool":
+            if connections["default"].vendor != "postgresql":
+                raise ImproperlyConfigured("pooling requires PostgreSQL.")
+            try:
+                from psycopg_pool import ConnectionPool
+            except ImportError:
+                raise ImproperlyConfigured("pooling requires psycopg[pool].")
+            options["pool"] = {
+                "min_size": settings.DB_POOL_MIN_SIZE,
+                "max_size": settings.DB_POOL_MAX_SIZE,
+                "timeout": settings.DB_POOL_TIMEOUT,
+                "max_idle": settings.DB_POOL_MAX_IDLE,
+                "max_lifetime": settings.DB_POOL_MAX_LIFETIME,
+                "check": ConnectionPool.check_connection,
+            }
+            database["CONN_MAX_AGE"] = 0
+        elif mode == "per-request":
+            database["CONN_MAX_AGE"] = 0
+        else:
+            database["CONN_MAX_AGE"] = database["CONN_MAX_AGE"] or 600
+
+        database["OPTIONS"] = options
+        return database
+
+    def _run(self, database, alias, options):
+        """Serves the requests on worker threads and collects timings.
+
+        Each thread opens its own connection wrapper under alias, outside
+        django.db.connections, so the benchmark leaves the project's
+        connections untouched. Pooled wrappers share the alias's pool.
+
+        Returns:
+            dict: Wall time, request latencies in ms and connections opened.
+        """
+        lock = threading.Lock()
+        backends = set()
+        latencies = []
+        # Shared by the threads; advancing a range iterator is atomic.
+        remaining = iter(range(options["requests"]))
+        work = options["work_ms"] / 1000
+        postgres = connections["default"].vendor == "postgresql"
+        backend_module = load_backend(database["ENGINE"])
+        local = threading.local()
+
+        def request():
+            connection = local.connection
+            started = time.perf_counter()
+            connection.close_if_unusable_or_obsolete()
+            with connection.cursor() as cursor:
+                for _ in range(options["queries"]):
+                    cursor.execute(
+                        "SELECT pg_backend_pid()" if postgres else "SELECT 1"
+                    )
+                    row = cursor.fetchone()
+            # The server process on PostgreSQL, else the DB-API connection.
+            backend = row[0] if postgres else connection.connection
+            time.sleep(work)
+            connection.close_if_unusable_or_obsolete()
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                backends.add(backend)
+                latencies.append(elapsed)
+
+        def serve():
+            local.connection = backend_module.DatabaseWrapper(database, alias)
+            try:
+                while next(remaining, None) is not None:
+                    request()
+            finally:
+                local.connection.close()
+
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+                for future in [
+                    executor.submit(serve) for _ in range(options["threads"])
+                ]:
+                    future.result()
+        finally:
+            if database["OPTIONS"].get("pool"):
+                backend_module.DatabaseWrapper(database, alias).close_pool()
+        return {
+            "seconds": time.perf_counter() - started,
+            "latencies": latencies,
+            "connections": len(backends),
+        }
+
+    def _report(self, mode, result):
+        """Writes one benchmark result line."""
+        latencies = sorted(result["latencies"])
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{mode}: {len(latencies):,} requests in {result['seconds']:.2f} s "
+                f"({len(latencies) / result['seconds']:,.0f} req/s), "
+                f"p50 {statistics.median(latencies):.2f} ms, p95 {p95:.2f} ms, "
+                f"{result['connections']} connections opened"
+            )
+        )
@@ -0,0 +1,206 @@
+import gzip
+import io
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from django.db.models import Count
+from django.urls import resolve, reverse
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.analytics.models import ExerciseSessionSnapshot
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Django management command comparing DRF's JSON encoding with orjson.
+
+    Fetches the response data of the largest read endpoints once, as the
+    trainer given by --email (by default the one with the most analytics
+    snapshots): program list, workout sessions, roster, adherence and the
+    exercise load history with the most sessions. Each payload is then
+    rendered and parsed --iterations times with DRF's JSONRenderer and
+    JSONParser and with FastJSONRenderer and FastJSONParser. The command
+    reports the mean times, the body size plain and gzipped, and whether
+    both renderers produced identical bytes.
+
+    Run it after generate_load_dataset --snapshots for realistic payloads.
+    """
+
+    help = "Benchmarks DRF vs orjson rendering and parsing on the largest endpoints"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", help="Trainer whose data is rendered.")
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Renders and parses timed per payload and implementation.",
+        )
+
+    def handle(self, *args, **options):
+        """Fetches each endpoint's data and benchmarks encoding it.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+
+        Raises:
+            CommandError: If --iterations is not positive or no trainer is
+                found.
+        """
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+
+        trainer = self._trainer(options["email"])
+        for name, path in self._endpoints(trainer):
+            try:
+                data = self._fetch(trainer, path)
+            except DatabaseError as e:
+                # e.g. SQLite's expression depth limit on large prefetches.
+                self.stdout.write(self.style.WARNING(f"{name}: skipped, {e}."))
+                continue
+            if data is None:
+                self.stdout.write(f"{name}: skipped, the endpoint returned no data.")
+                continue
+            self._report(name, self._benchmark(data, options["iterations"]))
+
+    @staticmethod
+    def _trainer(email):
+        """Returns the trainer to benchmark as.
+
+        Raises:
+            CommandError: If no matching trainer exists.
+        """
+        trainers = User.objects.filter(is_trainer=True)
+        if email:
+            trainer = trainers.filter(email=email).first()
+        else:
+            busiest = (
+                ExerciseSessionSnapshot.objects.values(
+                    "program__trainer_client_membership__trainer__user"
+                )
+                .annotate(total=Count("id"))
+                .order_by("-total")
+                .first()
+            )
+            if busiest is not None:
+                trainers = trainers.filter(
+                    pk=busiest["program__trainer_client_membership__trainer__user"]
+                )
+            trainer = trainers.order_by("created_at").first()
+        if trainer is None:
+            raise CommandError("No trainer found; pass --email or seed data first.")
+        return trainer
+
+    @staticmethod
+    def _endpoints(trainer):
+        """Yields (name, path) for every benchmarked endpoint."""
+        yield "programs", reverse("programs-list")
+        yield "workout-sessions", reverse("workout-sessions-list")
+        yield "roster", reverse("trainer-roster")
+        yield "adherence", reverse("workout-adherence")
+
+        history = (
+            ExerciseSessionSnapshot.objects.filter(
+                program__trainer_client_membership__trainer__user=trainer
+            )
+            .values("program", "exercise")
+            .annotate(total=Count("id"))
+            .order_by("-total")
+            .first()
+        )
+        if history is not None:
+            yield "load-history", reverse(
+                "exercise-load-history",
+                kwargs={
+                    "program_id": history["program"],
+                    "exercise_id": history["exercise"],
+                },
+            )
+
+    @staticmethod
+    def _fetch(user, path):
+        """Runs the endpoint's view and returns its unrendered data.
+
+        The request is addressed to the first allowed host, as paginated
+        views build absolute links from it.
+
+        Returns:
+            The response data, or None unless the view answered 200.
+        """
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+            "localhost",
+        )
+        request = APIRequestFactory(SERVER_NAME=host, HTTP_HOST=host).get(
+            path, HTTP_ACCEPT="application/json"
+        )
+        force_authenticate(request, user=user)
+        match = resolve(path)
+        response = match.func(request, *match.args, **match.kwargs)
+        if response.status_code != 200:
+            return None
+        return response.data
+
+    @staticmethod
+    def _mean_ms(operation, iterations):
+        """Returns the mean duration of operation() in milliseconds."""
+        started = time.perf_counter()
+        for _ in range(iterations):
+            operation()
+        return (time.perf_counter() - started) * 1000 / iterations
+
+    def _benchmark(self, data, iterations):
+        """Times rendering and parsing data with both implementations.
+
+        Returns:
+            dict: Body sizes, mean times in ms and whether the bodies match.
+        """
+        drf_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        drf_parser, fast_parser = JSONParser(), FastJSONParser()
+        body = drf_renderer.render(data)
+        fast_body = fast_renderer.render(data)
+
+        return {
+            "bytes": len(body),
+            "gzip_bytes": len(gzip.compress(body, settings.API_GZIP_LEVEL)),
+            "identical": body == fast_body,
+            "drf_render": self._mean_ms(lambda: drf_renderer.render(data), iterations),
+            "fast_render": self._mean_ms(
+                lambda: fast_renderer.render(data), iterations
+            ),
+            "drf_parse": self._mean_ms(
+                lambda: drf_parser.parse(io.BytesIO(body)), iterations
+            ),
+            "fast_parse": self._mean_ms(
+                lambda: fast_parser.parse(io.BytesIO(body)), iterations
+            ),
+        }
+
+    def _report(self, name, result):
+        """Writes one benchmark result line."""
+
+        def speedup(drf, fast):
+            return f"{drf / fast:.1f}x" if fast else "n/a"
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{name}: {result['bytes']:,} bytes "
+                f"({result['gzip_bytes']:,} gzipped), "
+                f"render {result['drf_render']:.3f} -> "
+                f"{result['fast_render']:.3f} ms "
+                f"({speedup(result['drf_render'], result['fast_render'])}), "
+                f"parse {result['drf_parse']:.3f} -> "
+                f"{result['fast_parse']:.3f} ms "
+                f"({speedup(result['drf_parse'], result['fast_parse'])}), "
+                f"output {'identical' if result['identical'] else 'differs'}"
+            )
+        )
@@ -0,0 +1,185 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from core.models import uuid7
+
+KEY_GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+class Command(BaseCommand):
+    """Django management command comparing uuid4 and uuid7 primary keys.
+
+    For each key kind it creates a scratch table shaped like a completion
+    record (UUID primary key, timestamp, small payload), inserts --rows rows
+    in batches and reports the insert rate overall and for the final tenth
+    of the load, where random keys suffer most from page splits. On
+    PostgreSQL it also reports the size of the table and its primary key
+    index. Scratch tables are dropped afterwards unless --keep is given.
+
+    Run it against a disposable database, e.g. with --rows 5000000.
+    """
+
+    help = "Benchmarks insert rate and index size of uuid4 vs uuid7 primary keys"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=1_000_000,
+            help="Number of rows inserted per key kind.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Rows inserted per statement batch and transaction.",
+        )
+        parser.add_argument(
+            "--kinds",
+            nargs="+",
+            choices=sorted(KEY_GENERATORS),
+            default=sorted(KEY_GENERATORS),
+            help="Key kinds to benchmark.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the scratch tables for further inspection.",
+        )
+
+    def handle(self, *args, **options):
+        """Runs the benchmark for each requested key kind.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+
+        Raises:
+            CommandError: If --rows or --batch-size is not positive.
+        """
+        if options["rows"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--rows and --batch-size must be positive.")
+
+        for kind in options["kinds"]:
+            table = f"pk_benchmark_{kind}"
+            self._create_table(table)
+            try:
+                result = self._insert(
+                    table, KEY_GENERATORS[kind], options["rows"], options["batch_size"]
+                )
+                result.update(self._sizes(table))
+            finally:
+                if not options["keep"]:
+                    self._drop_table(table)
+            self._report(kind, result)
+
+    @staticmethod
+    def _create_table(table):
+        """Creates an empty scratch table, replacing any left by a prior run."""
+        id_type = "uuid" if connection.vendor == "postgresql" else "char(32)"
+        name = connection.ops.quote_name(table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {name}")
+            cursor.execute(
+                f"CREATE TABLE {name} ("
+                f"id {id_type} PRIMARY KEY, "
+                "created_at timestamp NOT NULL, "
+                "payload integer NOT NULL)"
+            )
+
+    @staticmethod
+    def _drop_table(table):
+        """Drops a scratch table."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {connection.ops.quote_name(table)}")
+
+    @staticmethod
+    def _insert(table, generate, rows, batch_size):
+        """Inserts rows in batches and times them.
+
+        Args:
+            table: The scratch table name.
+            generate: Callable returning a new uuid.UUID.
+            rows: Total number of rows to insert.
+            batch_size: Rows per executemany call and transaction.
+
+        Returns:
+            dict: "rows", "seconds", "rows_per_second" and
+                "tail_rows_per_second" for the final tenth of the rows.
+        """
+        to_db = str if connection.vendor == "postgresql" else (lambda key: key.hex)
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(table)} "
+            "(id, created_at, payload) VALUES (%s, %s, %s)"
+        )
+        tail_from = rows - max(rows // 10, 1)
+        tail_rows, tail_seconds, total_seconds = 0, 0.0, 0.0
+        inserted = 0
+
+        while inserted < rows:
+            count = min(batch_size, rows - inserted)
+            params = [
+                (to_db(generate()), "2026-01-01 00:00:00", inserted + offset)
+                for offset in range(count)
+            ]
+            started = time.perf_counter()
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(sql, params)
+            elapsed = time.perf_counter() - started
+
+            total_seconds += elapsed
+            if inserted >= tail_from:
+                tail_rows += count
+                tail_seconds += elapsed
+            inserted += count
+
+        return {
+            "rows": rows,
+            "seconds": total_seconds,
+            "rows_per_second": rows / total_seconds if total_seconds else None,
+            "tail_rows_per_second": (
+                tail_rows / tail_seconds if tail_seconds else None
+            ),
+        }
+
+    @staticmethod
+    def _sizes(table):
+        """Returns table and primary key index sizes in bytes on PostgreSQL.
+
+        Other backends report None, as they expose no portable size function.
+        """
+        if connection.vendor != "postgresql":
+            return {"table_bytes": None, "index_bytes": None}
+
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM ANALYZE " + connection.ops.quote_name(table))
+            cursor.execute(
+                "SELECT pg_relation_size(%s::regclass), "
+                "pg_relation_size(i.indexrelid) "
+                "FROM pg_index i WHERE i.indrelid = %s::regclass AND i.indisprimary",
+                [table, table],
+            )
+            table_bytes, index_bytes = cursor.fetchone()
+        return {"table_bytes": table_bytes, "index_bytes": index_bytes}
+
+    def _report(self, kind, result):
+        """Writes one benchmark result line."""
+
+        def mib(value):
+            return "n/a" if value is None else f"{value / 1024 / 1024:.1f} MiB"
+
+        def rate(value):
+            return "n/a" if value is None else f"{value:,.0f} rows/s"
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{kind}: {result['rows']:,} rows in {result['seconds']:.2f}s, "
+                f"{rate(result['rows_per_second'])} overall, "
+                f"{rate(result['tail_rows_per_second'])} for the last 10%, "
+                f"table {mib(result['table_bytes'])}, "
+                f"primary key index {mib(result['index_bytes'])}"
+            )
+        )
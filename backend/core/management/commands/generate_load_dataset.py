@@ -0,0 +1,156 @@
+import time
+from datetime import date
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from core.caching import CACHE_TAGS_BY_MODEL, invalidate_tags
+from core.synthetic import SyntheticDataset
+
+
+class Command(BaseCommand):
+    """Django management command generating a large synthetic dataset.
+
+    Creates --trainers trainers with --clients-per-trainer clients each, and
+    for every client --programs consecutive programs of --weeks weeks with
+    --sessions-per-week sessions, --exercises-per-session exercises and
+    --sets-per-exercise sets, plus completion history up to one week before
+    the end. Rows are streamed with COPY on PostgreSQL and bulk_create
+    elsewhere, --batch-size instances per transaction. The same --seed and
+    --start-date always produce the same rows; users sign in with
+    --password.
+
+    Requires the reference data from seed_db. The derived trainer match and
+    adherence tables are rebuilt afterwards; pass --snapshots to also
+    backfill the analytics snapshots, which is slow on large datasets.
+    """
+
+    help = "Generates a deterministic high-volume workout dataset for load tests"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=1, help="Random seed.")
+        parser.add_argument("--trainers", type=int, default=10)
+        parser.add_argument("--clients-per-trainer", type=int, default=10)
+        parser.add_argument(
+            "--programs", type=int, default=2, help="Consecutive programs per client."
+        )
+        parser.add_argument("--weeks", type=int, default=12, help="Weeks per program.")
+        parser.add_argument("--sessions-per-week", type=int, default=3)
+        parser.add_argument("--exercises-per-session", type=int, default=5)
+        parser.add_argument("--sets-per-exercise", type=int, default=4)
+        parser.add_argument(
+            "--skip-rate",
+            type=float,
+            default=0.08,
+            help="Share of past sessions skipped; misses and skipped exercises "
+            "and sets occur at fractions of it.",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=date.fromisoformat,
+            help="First program day (YYYY-MM-DD). Defaults to the date that "
+            "puts the final week in the current week.",
+        )
+        parser.add_argument("--password", default="apex-load-test")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Instances buffered before each write transaction.",
+        )
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="Check every batch with clean_bulk() before writing it.",
+        )
+        parser.add_argument(
+            "--snapshots",
+            action="store_true",
+            help="Backfill analytics snapshots for the generated sessions.",
+        )
+        parser.add_argument(
+            "--allow-production",
+            action="store_true",
+            help="Allow running against a production environment.",
+        )
+
+    def handle(self, *args, **options):
+        """Generates the dataset and rebuilds the derived tables.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+
+        Raises:
+            CommandError: If a count is out of range, the environment is
+                production without --allow-production, a dataset with this
+                seed already exists, or the reference data is missing.
+        """
+        if settings.IS_PROD and not options["allow_production"]:
+            raise CommandError(
+                "Refusing to generate load test data in production without "
+                "--allow-production."
+            )
+
+        counts = {
+            name: options[name]
+            for name in (
+                "trainers",
+                "clients_per_trainer",
+                "programs",
+                "weeks",
+                "exercises_per_session",
+                "sets_per_exercise",
+                "batch_size",
+            )
+        }
+        if min(counts.values()) < 1:
+            raise CommandError("Counts and --batch-size must be positive.")
+        if not 1 <= options["sessions_per_week"] <= 7:
+            raise CommandError("--sessions-per-week must be between 1 and 7.")
+        if not 0 <= options["skip_rate"] <= 1:
+            raise CommandError("--skip-rate must be between 0 and 1.")
+
+        dataset = SyntheticDataset(
+            seed=options["seed"],
+            sessions_per_week=options["sessions_per_week"],
+            skip_rate=options["skip_rate"],
+            start_date=options["start_date"],
+            password=options["password"],
+            validate=options["validate"],
+            **counts,
+        )
+        if dataset.existing_users():
+            raise CommandError(
+                f"A dataset with seed {options['seed']} already exists; "
+                "use another --seed."
+            )
+
+        self.stdout.write(
+            f"Generating dataset {options['seed']} from {dataset.start_date}..."
+        )
+        started = time.perf_counter()
+        try:
+            written = dataset.generate()
+        except LookupError as e:
+            raise CommandError(str(e)) from e
+        elapsed = time.perf_counter() - started
+
+        for label, rows in written.items():
+            self.stdout.write(f"    {label}: {rows:,}")
+
+        call_command("rebuild_trainer_matches")
+        call_command("rebuild_adherence_rollups")
+        if options["snapshots"]:
+            call_command("backfill_snapshots")
+        # Rows were written without signals, so cached API reads are dropped.
+        invalidate_tags(*{tag for tags in CACHE_TAGS_BY_MODEL.values() for tag in tags})
+
+        total = sum(written.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {total:,} rows in {elapsed:.1f}s "
+                f"({total / elapsed if elapsed else 0:,.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,118 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from django.utils import timezone
+
+from core.partitioning import (
+    PARTITIONED_TABLES,
+    add_months,
+    create_partition,
+    default_partition_rows,
+    existing_partitions,
+    is_partitioned,
+    month_start,
+    partition_column,
+    partition_name,
+)
+
+
+class Command(BaseCommand):
+    """Django management command creating monthly partitions ahead of time.
+
+    For every table in core.partitioning.PARTITIONED_TABLES it creates the
+    partitions of the current month and the --months-ahead months after it
+    that do not exist yet, so new rows never land in the default partition.
+    Rows already in the default partition for those months are moved into
+    the new partitions. Rows left in the default partition are reported,
+    as they fall outside every monthly partition.
+
+    Safe to run repeatedly, e.g. daily from a scheduler. Partitioning is
+    PostgreSQL-only; on other databases the command does nothing.
+    """
+
+    help = "Creates monthly partitions of the completion and snapshot tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.PARTITION_MONTHS_AHEAD,
+            help="Months after the current one to create partitions for.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the partitions that would be created without creating them.",
+        )
+
+    def handle(self, *args, **options):
+        """Creates the missing partitions of every partitioned table.
+
+        Args:
+            *args: Positional arguments passed to the command.
+            **options: Parsed command options.
+
+        Raises:
+            CommandError: If --months-ahead is negative.
+        """
+        if options["months_ahead"] < 0:
+            raise CommandError("--months-ahead cannot be negative.")
+
+        current = month_start(timezone.now())
+        months = [
+            add_months(current, offset) for offset in range(options["months_ahead"] + 1)
+        ]
+        for label in PARTITIONED_TABLES:
+            model = apps.get_model(label)
+            connection = connections[router.db_for_write(model)]
+            table = model._meta.db_table
+
+            if connection.vendor != "postgresql":
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{table}: skipped, partitioning requires PostgreSQL."
+                    )
+                )
+                continue
+            if not is_partitioned(connection, table):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{table}: skipped, not partitioned; run migrate."
+                    )
+                )
+                continue
+
+            self._maintain(connection, model, table, months, options["dry_run"])
+
+    def _maintain(self, connection, model, table, months, dry_run):
+        """Creates one table's missing partitions and reports the outcome."""
+        existing = existing_partitions(connection, table)
+        missing = [
+            month for month in months if partition_name(table, month) not in existing
+        ]
+
+        if dry_run:
+            names = ", ".join(partition_name(table, month) for month in missing)
+            self.stdout.write(f"{table}: would create {len(missing)} ({names or '-'})")
+            return
+
+        column = partition_column(model)
+        created = sum(
+            create_partition(connection, table, column, month) for month in missing
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{table}: created {created} partitions, "
+                f"covered through {months[-1]:%Y-%m}"
+            )
+        )
+
+        stray = default_partition_rows(connection, table)
+        if stray:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{table}: {stray} rows in the default partition "
+                    "are outside every monthly partition."
+                )
+            )
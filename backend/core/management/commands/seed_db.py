@@ -1,11 +1,21 @@
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
+from apps.exercises.services.muscle_index import ExerciseMuscleIndexService
+
 
 class Command(BaseCommand):
     help = "Master command — seeds all lookup tables across the application"
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what each seed would change without writing it.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
         self.stdout.write(self.style.MIGRATE_HEADING("Starting Database Seeding..."))
 
         seed_commands = [
@@ -15,12 +25,35 @@ class Command(BaseCommand):
             "seed_exercises",
         ]
 
-        for command_name in seed_commands:
-            try:
-                self.stdout.write(f"\nRunning {command_name}...")
-                call_command(command_name)
-                self.stdout.write(self.style.SUCCESS(f"{command_name} completed"))
-            except Exception as e:
-                self.stderr.write(self.style.ERROR(f"{command_name} failed: {e}"))
+        # Later seeds resolve the codes seeded by earlier ones, including the
+        # rows a dry run only plans to create.
+        key_maps = {}
+
+        # Biomechanics writes would each reindex their exercises; rebuild the
+        # muscle index once at the end instead.
+        with ExerciseMuscleIndexService.deferred():
+            for command_name in seed_commands:
+                try:
+                    self.stdout.write(f"\nRunning {command_name}...")
+                    call_command(
+                        command_name,
+                        dry_run=dry_run,
+                        key_maps=key_maps,
+                        verbosity=options["verbosity"],
+                    )
+                    self.stdout.write(self.style.SUCCESS(f"{command_name} completed"))
+                except Exception as e:
+                    self.stderr.write(self.style.ERROR(f"{command_name} failed: {e}"))
+
+        if dry_run:
+            self.stdout.write(
+                self.style.SUCCESS("\nDry run complete, nothing written.")
+            )
+            return
+
+        # Trainers and workouts created before the precomputed tables existed
+        # have no rows yet.
+        call_command("rebuild_trainer_matches")
+        call_command("rebuild_adherence_rollups")
 
         self.stdout.write(self.style.SUCCESS("\nDatabase seeded successfully!"))
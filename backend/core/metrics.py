@@ -0,0 +1,299 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Histograms are kept in memory per process. When METRICS_DIR is set, every
+process also writes its totals to its own JSON file in that directory at
+most once per METRICS_FLUSH_SECONDS, and the /metrics endpoint sums the
+files of all processes, so gunicorn workers report as one without any
+external service. Without METRICS_DIR only the serving process is
+reported.
+"""
+
+import atexit
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+_lock = threading.Lock()
+
+
+class Histogram:
+    """A labelled histogram with cumulative buckets.
+
+    Attributes:
+        name: Metric name.
+        documentation: HELP text.
+        labelnames: Names of the labels every observation carries.
+        buckets: Upper bounds of the buckets, ascending.
+    """
+
+    def __init__(self, name, documentation, labelnames, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """Records one observation under the given label values.
+
+        Only records in memory. Callers flush with registry.flush_if_due(),
+        or off the event loop when observing from async code.
+
+        Args:
+            value: The observed value, e.g. a duration in seconds.
+            **labels: One value for each of the histogram's label names.
+        """
+        registry.observe(self, value, tuple(str(labels[n]) for n in self.labelnames))
+
+    def empty(self):
+        """Returns the state of a series with no observations."""
+        return {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0}
+
+
+class Registry:
+    """Holds the histograms and this process's observations."""
+
+    def __init__(self):
+        self.histograms = {}
+        self._series = {}
+        self._pid = os.getpid()
+        self._flushed_at = 0.0
+
+    def histogram(self, name, documentation, labelnames, buckets):
+        """Registers a histogram, returning the existing one of that name."""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name, documentation, labelnames, buckets)
+        return self.histograms[name]
+
+    def _local(self):
+        """Returns this process's series, dropping state inherited over fork."""
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._series = {}
+            self._flushed_at = 0.0
+        return self._series
+
+    def observe(self, histogram, value, label_values):
+        """Adds one observation to a series."""
+        with _lock:
+            series = self._local().setdefault(histogram.name, {})
+            state = series.get(label_values)
+            if state is None:
+                state = series[label_values] = histogram.empty()
+            index = len(histogram.buckets)
+            for position, bound in enumerate(histogram.buckets):
+                if value <= bound:
+                    index = position
+                    break
+            state["counts"][index] += 1
+            state["sum"] += value
+
+    def flush_due(self):
+        """Returns whether a flush is due, claiming it for the caller if so.
+
+        Claiming it keeps concurrent requests from all flushing at once.
+        """
+        with _lock:
+            if time.monotonic() - self._flushed_at < settings.METRICS_FLUSH_SECONDS:
+                return False
+            self._flushed_at = time.monotonic()
+            return True
+
+    def flush_if_due(self):
+        """Flushes when METRICS_FLUSH_SECONDS have passed since the last one."""
+        if self.flush_due():
+            self.flush()
+
+    @staticmethod
+    def directory():
+        """Returns the shared metrics directory, or None when not configured."""
+        return Path(settings.METRICS_DIR) if settings.METRICS_DIR else None
+
+    def snapshot(self):
+        """Returns a JSON-ready copy of this process's series."""
+        with _lock:
+            return {
+                name: [[list(labels), state] for labels, state in series.items()]
+                for name, series in self._local().items()
+            }
+
+    def flush(self):
+        """Writes this process's totals to its file in the shared directory."""
+        directory = self.directory()
+        self._flushed_at = time.monotonic()
+        if directory is None:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(self.snapshot())
+        # Written beside the target and renamed, so readers never see a
+        # partial file.
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(handle, "w") as f:
+            f.write(data)
+        os.replace(temporary, directory / f"{os.getpid()}.json")
+
+    def collect(self):
+        """Sums the series of every process sharing the metrics directory.
+
+        Returns:
+            dict: Series state keyed by metric name and then label values.
+        """
+        directory = self.directory()
+        if directory is None:
+            sources = [self.snapshot()]
+        else:
+            self.flush()
+            sources = []
+            for path in directory.glob("*.json"):
+                try:
+                    sources.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    continue
+
+        totals = {}
+        for source in sources:
+            for name, series in source.items():
+                histogram = self.histograms.get(name)
+                if histogram is None:
+                    continue
+                merged = totals.setdefault(name, {})
+                for labels, state in series:
+                    total = merged.setdefault(tuple(labels), histogram.empty())
+                    total["counts"] = [
+                        a + b for a, b in zip(total["counts"], state["counts"])
+                    ]
+                    total["sum"] += state["sum"]
+        return totals
+
+    def reset(self):
+        """Discards this process's observations and its shared file."""
+        with _lock:
+            self._series = {}
+        directory = self.directory()
+        if directory is not None:
+            (directory / f"{os.getpid()}.json").unlink(missing_ok=True)
+
+    def render(self):
+        """Renders every histogram in the Prometheus text format (0.0.4).
+
+        Returns:
+            str: The exposition document.
+        """
+        totals = self.collect()
+        lines = []
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"# HELP {name} {histogram.documentation}")
+            lines.append(f"# TYPE {name} histogram")
+            for label_values, state in sorted(totals.get(name, {}).items()):
+                labels = ",".join(
+                    f'{label}="{_escape(value)}"'
+                    for label, value in zip(histogram.labelnames, label_values)
+                )
+                prefix = f"{labels}," if labels else ""
+                cumulative = 0
+                bounds = [*map(_format_bound, histogram.buckets), "+Inf"]
+                for bound, count in zip(bounds, state["counts"]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {state['sum']!r}")
+                lines.append(f"{name}_count{suffix} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    """Escapes a label value for the text format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_bound(bound):
+    """Formats a bucket bound the way Prometheus clients do."""
+    return repr(float(bound))
+
+
+registry = Registry()
+atexit.register(lambda: registry.flush() if registry._series else None)
+
+REQUEST_LATENCY = registry.histogram(
+    "apex_http_request_duration_seconds",
+    "Time spent handling requests, by DRF view and action.",
+    ["view", "action", "method", "status"],
+    settings.METRICS_LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = registry.histogram(
+    "apex_http_request_db_queries",
+    "Database queries executed per request, by DRF view and action.",
+    ["view", "action"],
+    settings.METRICS_QUERY_BUCKETS,
+)
+SERVICE_LATENCY = registry.histogram(
+    "apex_service_duration_seconds",
+    "Time spent in domain service calls.",
+    ["service", "operation", "outcome"],
+    settings.METRICS_LATENCY_BUCKETS,
+)
+
+
+def timed(service, operation=None):
+    """Decorates a function so each call is recorded in SERVICE_LATENCY.
+
+    Args:
+        service: The service label, e.g. the class or module name.
+        operation: The operation label. Defaults to the function name.
+
+    Returns:
+        Callable: A decorator.
+    """
+
+    def decorator(func):
+        name = operation or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            outcome = "error"
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                if settings.METRICS_ENABLED:
+                    SERVICE_LATENCY.observe(
+                        time.perf_counter() - started,
+                        service=service,
+                        operation=name,
+                        outcome=outcome,
+                    )
+                    registry.flush_if_due()
+
+        return wrapper
+
+    return decorator
+
+
+def instrument(cls):
+    """Class decorator timing every public method of a service class.
+
+    Class and static methods are wrapped in place and keep their kind.
+    Private helpers, whose names start with an underscore, are not timed.
+
+    Args:
+        cls: The service class.
+
+    Returns:
+        type: The same class.
+    """
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if isinstance(attribute, (classmethod, staticmethod)):
+            wrapped = timed(cls.__name__, name)(attribute.__func__)
+            setattr(cls, name, type(attribute)(wrapped))
+        elif callable(attribute):
+            setattr(cls, name, timed(cls.__name__, name)(attribute))
+    return cls
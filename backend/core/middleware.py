@@ -0,0 +1,204 @@
+import itertools
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.utils.functional import LazyObject, empty
+
+from .metrics import REQUEST_LATENCY, REQUEST_QUERIES, registry
+from .profiling import profile_request, profiling_requested, staff_user
+from .routers import pin_to_primary, replica_configured, routing_scope
+
+# Holds the query counter of the request being measured. Context variables
+# follow the request into sync_to_async threads, including the separate
+# threads of core.concurrency.gather_reads.
+_request_queries = ContextVar("request_queries", default=None)
+
+
+def count_request_query(execute, sql, params, many, context):
+    """Execute wrapper counting queries towards the current request.
+
+    Installed on every connection when it is created (core.signals), since
+    under ASGI a request's queries run on connections of other threads.
+    """
+    counter = _request_queries.get()
+    if counter is not None:
+        next(counter)
+    return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """Records the latency and database query count of every request.
+
+    Requests are labelled with the DRF view class and viewset action (the
+    HTTP method for plain API views), resolved in process_view. Requests
+    that match no view are labelled "unresolved", and scrapes of the
+    metrics endpoint itself are not recorded.
+
+    Works under both WSGI and ASGI. Under ASGI the only thread hop is the
+    periodic flush to METRICS_DIR, which runs off the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self._measured(request):
+            return self.get_response(request)
+
+        counter = itertools.count()
+        token = _request_queries.set(counter)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, counter)
+        registry.flush_if_due()
+        return response
+
+    async def __acall__(self, request):
+        if not self._measured(request):
+            return await self.get_response(request)
+
+        counter = itertools.count()
+        token = _request_queries.set(counter)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._record(request, response, time.perf_counter() - started, counter)
+        # Flushing writes a file, so it runs off the event loop.
+        if registry.flush_due():
+            await sync_to_async(registry.flush, thread_sensitive=False)()
+        return response
+
+    @staticmethod
+    def _measured(request):
+        return settings.METRICS_ENABLED and request.path != settings.METRICS_PATH
+
+    @staticmethod
+    def _record(request, response, elapsed, counter):
+        view, action = getattr(request, "_metrics_view", ("unresolved", ""))
+        REQUEST_LATENCY.observe(
+            elapsed,
+            view=view,
+            action=action,
+            method=request.method,
+            status=response.status_code,
+        )
+        # Each counted query advanced the counter once.
+        REQUEST_QUERIES.observe(next(counter), view=view, action=action)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Labels the request with the view class and action about to run."""
+        method = request.method.lower()
+        view_class = getattr(view_func, "cls", None)
+        if view_class is not None:
+            actions = getattr(view_func, "actions", None) or {}
+            request._metrics_view = (view_class.__name__, actions.get(method, method))
+        else:
+            request._metrics_view = (getattr(view_func, "__name__", "view"), method)
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """Tracks database routing for each request.
+
+    Installs a fresh core.routers.RoutingState, so the router knows whether
+    the request opted into replica reads and whether it has written yet.
+    When the request wrote and its user is known, the user is pinned to the
+    primary while the replica catches up.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with routing_scope() as state:
+            response = self.get_response(request)
+        user_id = self._pin_user_id(request, state)
+        if user_id is not None:
+            pin_to_primary(user_id)
+        return response
+
+    async def __acall__(self, request):
+        with routing_scope() as state:
+            response = await self.get_response(request)
+        user_id = self._pin_user_id(request, state)
+        if user_id is not None:
+            await sync_to_async(pin_to_primary)(user_id)
+        return response
+
+    @staticmethod
+    def _pin_user_id(request, state):
+        if not state.wrote or not replica_configured():
+            return None
+        # DRF sets the authenticated user on the request; an unevaluated
+        # lazy user is left alone rather than resolved here.
+        user = request.__dict__.get("user")
+        if isinstance(user, LazyObject) and user._wrapped is empty:
+            return None
+        if user is None or not user.is_authenticated:
+            return None
+        return user.pk
+
+
+class ProfilerMiddleware:
+    """Profiles requests that ask for it when they come from staff users.
+
+    Untriggered requests pass straight through after the trigger check.
+    Triggered requests from anyone else are served normally, unprofiled.
+    See core.profiling for the trigger and what a capture holds. Under ASGI
+    a profiled request is captured from a worker thread, which runs the rest
+    of the chain on an event loop of its own.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not profiling_requested(request):
+            return self.get_response(request)
+        user = staff_user(request)
+        if user is None:
+            return self.get_response(request)
+        return profile_request(request, self.get_response, user)
+
+    async def __acall__(self, request):
+        if not profiling_requested(request):
+            return await self.get_response(request)
+        user = await sync_to_async(staff_user)(request)
+        if user is None:
+            return await self.get_response(request)
+        return await sync_to_async(profile_request)(request, self.get_response, user)
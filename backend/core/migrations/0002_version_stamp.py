@@ -0,0 +1,36 @@
+# Generated by Django 5.2.11 on 2026-10-19 02:22
+
+from django.db import migrations, models
+
+import core.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VersionStamp",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=core.models.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("key", models.CharField(max_length=100, unique=True)),
+                ("version", models.CharField(max_length=32)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
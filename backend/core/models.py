@@ -1,21 +1,190 @@
+import os
+import secrets
+import threading
+import time
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 
+from core.constants import ValidationModeVocabulary
+
+_uuid7_lock = threading.Lock()
+_uuid7_state = {"ms": 0, "counter": 0}
+
+
+def uuid7():
+    """Generates a time-ordered UUID following the RFC 9562 version 7 layout.
+
+    The first 48 bits are the Unix time in milliseconds, so new keys land at
+    the right-hand edge of B-tree indexes instead of random pages. The 12-bit
+    rand_a field holds a counter seeded randomly each millisecond, keeping
+    keys generated by this process strictly increasing. The remaining 62 bits
+    are random. Values are ordinary UUIDs, so existing uuid4 columns, foreign
+    keys and serializers accept them unchanged.
+
+    Returns:
+        uuid.UUID: A version 7 UUID.
+    """
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _uuid7_state["ms"]:
+            ms = _uuid7_state["ms"]
+            counter = _uuid7_state["counter"] + 1
+            if counter > 0xFFF:
+                # Counter exhausted within this millisecond; borrow the next.
+                ms += 1
+                counter = secrets.randbits(11)
+        else:
+            # Half the counter space is left free for keys within this ms.
+            counter = secrets.randbits(11)
+        _uuid7_state.update(ms=ms, counter=counter)
+
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+_validation_mode = ContextVar(
+    "apex_validation_mode", default=ValidationModeVocabulary.FULL
+)
+
+
+@contextmanager
+def validation_mode(mode):
+    """Sets how ApexModel saves validate within a block or decorated function.
+
+    FULL (the default) keeps full_clean() for untrusted input. FAST suits
+    service-layer writes whose input was already checked: only the touched
+    non-relational fields and the model's clean() rules run, leaving
+    uniqueness, constraints and foreign keys to the database. SKIP runs
+    nothing, for bulk paths that validated with ApexModel.clean_bulk().
+
+    Args:
+        mode: A ValidationModeVocabulary value.
+
+    Yields:
+        None
+    """
+    token = _validation_mode.set(mode)
+    try:
+        yield
+    finally:
+        _validation_mode.reset(token)
+
 
 class ApexModel(models.Model):
     """
     Abstract model that provides a base UUID instead of integer for the primary key
     It also adds a created at and updated at field automatically to reduce duplication
+    Keys are time-ordered (uuid7) so inserts append to the primary key index
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
 
+    def _fast_clean_exclude(self, update_fields=None, exclude=None):
+        """Returns the fields the fast path skips: relations and untouched ones."""
+        excluded = set(exclude or ())
+        touched = None if update_fields is None else set(update_fields)
+        for field in self._meta.concrete_fields:
+            if field.is_relation or (
+                touched is not None
+                and field.name not in touched
+                and field.attname not in touched
+            ):
+                excluded.add(field.name)
+        return excluded
+
+    def validate_for_save(self, update_fields=None, exclude=None):
+        """Validates the instance before a save according to validation_mode.
+
+        Args:
+            update_fields: The fields being saved, None for all of them.
+            exclude: Field names never validated, as for full_clean().
+
+        Raises:
+            ValidationError: If the checks run by the active mode fail.
+        """
+        mode = _validation_mode.get()
+        if mode == ValidationModeVocabulary.SKIP:
+            return
+        if mode == ValidationModeVocabulary.FULL:
+            self.full_clean(exclude=exclude)
+            return
+
+        self.clean_fields(exclude=self._fast_clean_exclude(update_fields, exclude))
+        self.clean()
+
+    @classmethod
+    def clean_bulk(cls, instances, exclude=None):
+        """Validates a list of instances with one query per foreign key.
+
+        Runs each instance's field rules and clean(), then checks every
+        foreign key value with a single IN query per relation instead of one
+        query per instance and field. Uniqueness is left to the database.
+
+        Args:
+            instances: The unsaved model instances to validate.
+            exclude: Field names that are not validated.
+
+        Raises:
+            ValidationError: Keyed by the position of each invalid instance,
+                with the list of its error messages.
+        """
+        instances = list(instances)
+        excluded = set(exclude or ())
+        errors = {}
+
+        for index, instance in enumerate(instances):
+            try:
+                instance.clean_fields(
+                    exclude=instance._fast_clean_exclude(None, exclude)
+                )
+                instance.clean()
+            except ValidationError as error:
+                errors.setdefault(index, []).extend(error.messages)
+
+        for field in cls._meta.concrete_fields:
+            if not field.many_to_one and not field.one_to_one:
+                continue
+            if field.name in excluded:
+                continue
+
+            values = {getattr(instance, field.attname) for instance in instances}
+            values.discard(None)
+            if not values:
+                continue
+
+            target = field.target_field
+            existing = set(
+                field.remote_field.model._base_manager.filter(
+                    **{f"{target.attname}__in": values}
+                ).values_list(target.attname, flat=True)
+            )
+            for index, instance in enumerate(instances):
+                value = getattr(instance, field.attname)
+                if value is not None and value not in existing:
+                    errors.setdefault(index, []).append(
+                        f"{field.verbose_name} {value} does not exist."
+                    )
+
+        if errors:
+            raise ValidationError(errors)
+
 
 class NormalisedLookupModel(ApexModel):
     """
@@ -33,3 +202,62 @@ class NormalisedLookupModel(ApexModel):
 
     def __str__(self) -> str:
         return self.label
+
+
+class ProfileStorage(FileSystemStorage):
+    """Local storage for raw request profile stats, rooted at PROFILER_DIR."""
+
+    @property
+    def base_location(self):
+        return settings.PROFILER_DIR
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+
+class RequestProfile(ApexModel):
+    """
+    A profile captured for one staff request by core.profiling
+    Holds the rendered call tree and SQL timeline, plus the raw cProfile stats
+    file for tools such as snakeviz
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="request_profiles",
+    )
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    query_string = models.CharField(max_length=500, blank=True)
+    view_name = models.CharField(max_length=200, blank=True)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    query_time_ms = models.FloatField(default=0)
+    call_tree = models.TextField(blank=True)
+    sql_timeline = models.JSONField(default=list, blank=True)
+    stats_file = models.FileField(storage=ProfileStorage(), blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+class VersionStamp(ApexModel):
+    """
+    The current version of data that cached representations are derived from
+    Held in the database so every process and service agrees on it, whatever
+    cache backend each one uses. Managed through core.versioning
+    """
+
+    key = models.CharField(max_length=100, unique=True)
+    version = models.CharField(max_length=32)
+
+    def __str__(self) -> str:
+        return f"{self.key} ({self.version})"
@@ -0,0 +1,43 @@
+"""JSON request parsing backed by orjson."""
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer
+
+
+class FastJSONParser(JSONParser):
+    """Drop-in replacement for DRF's JSONParser decoding with orjson.
+
+    orjson only reads UTF-8, so bodies declared in another charset are
+    decoded by DRF's parser instead. Like DRF's strict mode, NaN and
+    Infinity are rejected.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parses the request body as JSON.
+
+        Args:
+            stream: The request body stream.
+            media_type: The request's media type.
+            parser_context: The view, request and declared encoding.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            ParseError: If the body is not valid JSON.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
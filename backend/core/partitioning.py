@@ -0,0 +1,336 @@
+"""Monthly range partitioning of append-mostly history tables (PostgreSQL).
+
+PARTITIONED_TABLES lists the tables and the timestamp column each one is
+partitioned on. Migrations convert a table with partition_table(), which
+rebuilds it as PARTITION BY RANGE on that column, with one partition per
+month of existing rows, PARTITION_MONTHS_AHEAD future months and a default
+partition for anything outside them. The maintain_partitions command keeps
+the future months created ahead of time.
+
+Queries filtering on the partition column only touch the months they can
+match, and vacuum and index maintenance work on one month at a time, so
+their cost stays flat as history grows. Rows are never stamped before the
+row they belong to (a program, session or exercise record), so reads
+without explicit time bounds still pass not_before() of the parent's
+timestamp as a lower bound and skip every older month.
+
+PostgreSQL requires every unique constraint of a partitioned table to
+include the partition column, so on PostgreSQL:
+
+- The primary key is (id, <column>). ids are uuid7 and unique on their own.
+- Other unique constraints, such as the one-to-one links to the prescribed
+  exercise or set, only hold together with the column, which is set per
+  insert, so they no longer reject duplicates. The completion and snapshot
+  services lock the parent row before checking for an existing record, so
+  concurrent writers of the same record are serialised instead.
+- A foreign key to a partitioned table must reference a unique key that
+  includes the partition column, so converting exercise records drops the
+  set records' foreign key constraint, and set records point at them by id
+  alone. unpartition_table restores it. Migrations altering that field
+  must run while the tables are plain.
+
+Converting the tables is opt-in with PARTITIONING_ENABLED, as the
+migrations and maintain_partitions rewrite live tables: rehearse them,
+including the reverse migrations, on a copy of the production database
+before enabling it.
+
+Other databases keep the tables as they are.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+
+# Set records are partitioned on created_at: completed_at is nullable, and
+# sets are recorded when completed or skipped, so the two share a month.
+PARTITIONED_TABLES = {
+    "workouts.WorkoutExerciseCompletionRecord": "started_at",
+    "workouts.WorkoutSetCompletionRecord": "created_at",
+    "analytics.ExerciseSessionSnapshot": "computed_at",
+}
+
+# Margin for clock differences between the servers stamping related rows.
+PARTITION_BOUND_SLACK = datetime.timedelta(days=1)
+
+
+def partition_column(model) -> str:
+    """Returns the column a partitioned model's table is partitioned on.
+
+    Args:
+        model: A model listed in PARTITIONED_TABLES.
+    """
+    return PARTITIONED_TABLES[model._meta.label]
+
+
+def not_before(value):
+    """Returns the lower partition bound for rows belonging to a parent row.
+
+    Args:
+        value: The parent's timestamp, a datetime or a query expression.
+
+    Returns:
+        The timestamp less PARTITION_BOUND_SLACK, of the same kind.
+    """
+    return value - PARTITION_BOUND_SLACK
+
+
+def month_start(value) -> datetime.date:
+    """Returns the first day of the UTC month containing a date or datetime."""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.UTC)
+        value = value.date()
+    return value.replace(day=1)
+
+
+def add_months(month, count) -> datetime.date:
+    """Returns the first day of the month count months after month."""
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table, month) -> str:
+    """Returns the name of a table's partition for one month."""
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table) -> str:
+    """Returns the name of a table's default partition."""
+    return f"{table}_default"
+
+
+def is_partitioned(connection, table) -> bool:
+    """Returns whether a table exists as a partitioned table.
+
+    Args:
+        connection: A PostgreSQL connection.
+        table: The table name.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table]
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def existing_partitions(connection, table) -> set:
+    """Returns the names of a partitioned table's partitions.
+
+    Args:
+        connection: A PostgreSQL connection.
+        table: The partitioned table's name.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = to_regclass(%s)",
+            [table],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def default_partition_rows(connection, table) -> int:
+    """Counts the rows a partitioned table holds in its default partition.
+
+    Args:
+        connection: A PostgreSQL connection.
+        table: The partitioned table's name.
+    """
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {quote(default_partition_name(table))}")
+        return cursor.fetchone()[0]
+
+
+def create_partition(connection, table, column, month) -> bool:
+    """Creates a table's partition for one month if it does not exist yet.
+
+    Rows of that month already in the default partition are moved into the
+    new partition, which PostgreSQL requires before attaching it.
+
+    Args:
+        connection: A PostgreSQL connection.
+        table: The partitioned table's name.
+        column: The partition column.
+        month: The first day of the month.
+
+    Returns:
+        bool: Whether the partition was created.
+    """
+    name = partition_name(table, month)
+    if name in existing_partitions(connection, table):
+        return False
+
+    quote = connection.ops.quote_name
+    start, end = _bound(month), _bound(add_months(month, 1))
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} "
+            f"(LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {quote(default_partition_name(table))} "
+            f"WHERE {quote(column)} >= {start} AND {quote(column)} < {end} "
+            f"RETURNING *) INSERT INTO {quote(name)} SELECT * FROM moved"
+        )
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+    return True
+
+
+def partition_table(schema_editor, model, months_ahead):
+    """Rebuilds a model's table as a monthly range-partitioned table.
+
+    Creates a partition for every month from the oldest row through
+    months_ahead months from now, plus the default partition, copies the
+    rows across and recreates the table's keys and indexes with the
+    partition column added to the unique ones. Foreign key constraints
+    referencing the table are dropped. Does nothing unless
+    PARTITIONING_ENABLED is set, outside PostgreSQL or when the table is
+    already partitioned.
+
+    Args:
+        schema_editor: The migration's schema editor.
+        model: The historical model of a table in PARTITIONED_TABLES.
+        months_ahead: Future months to create partitions for.
+    """
+    connection = schema_editor.connection
+    table = model._meta.db_table
+    if (
+        not settings.PARTITIONING_ENABLED
+        or connection.vendor != "postgresql"
+        or is_partitioned(connection, table)
+    ):
+        return
+
+    column = partition_column(model)
+    quote = schema_editor.quote_name
+    staging = f"{table}__partitioned"
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT min({quote(column)}) FROM {quote(table)}")
+        oldest = cursor.fetchone()[0]
+
+    current = month_start(datetime.datetime.now(datetime.UTC))
+    month = min(month_start(oldest), current) if oldest else current
+    last = add_months(current, months_ahead)
+
+    schema_editor.execute(
+        f"CREATE TABLE {quote(staging)} "
+        f"(LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({quote(column)})"
+    )
+    schema_editor.execute(
+        f"CREATE TABLE {quote(default_partition_name(table))} "
+        f"PARTITION OF {quote(staging)} DEFAULT"
+    )
+    while month <= last:
+        schema_editor.execute(
+            f"CREATE TABLE {quote(partition_name(table, month))} "
+            f"PARTITION OF {quote(staging)} FOR VALUES "
+            f"FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+        )
+        month = add_months(month, 1)
+    _swap_tables(schema_editor, table, staging, column, partitioned=True)
+
+
+def unpartition_table(schema_editor, model):
+    """Rebuilds a table converted by partition_table as a plain table.
+
+    Restores the foreign key constraints referencing the table that
+    partition_table dropped. Does nothing outside PostgreSQL or when the
+    table is not partitioned.
+
+    Args:
+        schema_editor: The migration's schema editor.
+        model: The historical model of a table in PARTITIONED_TABLES.
+    """
+    connection = schema_editor.connection
+    table = model._meta.db_table
+    if connection.vendor != "postgresql" or not is_partitioned(connection, table):
+        return
+
+    quote = schema_editor.quote_name
+    staging = f"{table}__unpartitioned"
+    schema_editor.execute(
+        f"CREATE TABLE {quote(staging)} "
+        f"(LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    _swap_tables(
+        schema_editor, table, staging, partition_column(model), partitioned=False
+    )
+    for relation in model._meta.related_objects:
+        field = relation.field
+        if relation.many_to_many or not field.db_constraint:
+            continue
+        # Named the way Django names the constraint, so later migrations of
+        # the field find it.
+        schema_editor.execute(
+            schema_editor._create_fk_sql(
+                relation.related_model, field, "_fk_%(to_table)s_%(to_column)s"
+            )
+        )
+
+
+def _bound(month):
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def _swap_tables(schema_editor, table, staging, column, partitioned):
+    """Moves a table's rows, keys and indexes to staging, then renames it.
+
+    Keys are rebuilt from the catalog: unique ones gain the partition
+    column when partitioning and lose it again when unpartitioning.
+    """
+    quote = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT con.conname, con.contype, pg_get_constraintdef(con.oid), "
+            "ARRAY(SELECT att.attname::text FROM unnest(con.conkey) "
+            "WITH ORDINALITY AS key(attnum, position) "
+            "JOIN pg_attribute AS att "
+            "ON att.attrelid = con.conrelid AND att.attnum = key.attnum "
+            "ORDER BY key.position) "
+            "FROM pg_constraint AS con "
+            "WHERE con.conrelid = to_regclass(%s) AND con.contype IN ('p', 'u', 'f') "
+            "ORDER BY con.contype DESC, con.conname",
+            [table],
+        )
+        constraints = cursor.fetchall()
+        # Indexes that do not back a key, e.g. on foreign key columns.
+        cursor.execute(
+            "SELECT pg_get_indexdef(ind.indexrelid) FROM pg_index AS ind "
+            "WHERE ind.indrelid = to_regclass(%s) AND NOT EXISTS ("
+            "SELECT 1 FROM pg_constraint AS con "
+            "WHERE con.conindid = ind.indexrelid AND con.conrelid = ind.indrelid)",
+            [table],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+
+    schema_editor.execute(f"INSERT INTO {quote(staging)} SELECT * FROM {quote(table)}")
+    # CASCADE drops foreign keys referencing the table: their single-column
+    # reference would no longer match a unique key of a partitioned table.
+    schema_editor.execute(f"DROP TABLE {quote(table)} CASCADE")
+    schema_editor.execute(f"ALTER TABLE {quote(staging)} RENAME TO {quote(table)}")
+
+    for name, kind, definition, columns in constraints:
+        if kind == "f":
+            schema_editor.execute(
+                f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} "
+                f"{definition}"
+            )
+            continue
+        if partitioned:
+            columns = [*columns, column]
+        elif len(columns) > 1 and columns[-1] == column:
+            columns = columns[:-1]
+        key = "PRIMARY KEY" if kind == "p" else "UNIQUE"
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} "
+            f"{key} ({', '.join(quote(c) for c in columns)})"
+        )
+    for definition in indexes:
+        schema_editor.execute(definition)
@@ -0,0 +1,344 @@
+"""On-demand request profiling for staff users.
+
+A request is profiled when it carries the PROFILER_HEADER header or the
+PROFILER_QUERY_PARAM query flag and is made by a staff user, signed in to
+the admin or presenting an API token. The response is produced under
+cProfile while every SQL statement is timed, and the capture is saved as a
+RequestProfile: an indented call tree, the SQL timeline and the raw stats
+file in PROFILER_DIR. Untriggered requests only pay for the trigger check.
+
+cProfile only sees the thread it runs in, so each thread doing work for a
+profiled request gets a profiler of its own and their stats are merged.
+Under ASGI the middleware chain runs on an event loop of its own, profiled
+like a thread, with thread-sensitive sync code sent back to the profiling
+thread instead of the request's executor thread. Queries are recorded by
+an execute wrapper on every connection, whichever thread runs them.
+"""
+
+import cProfile
+import marshal
+import pstats
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import SyncToAsync, async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.files.base import ContentFile
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .models import RequestProfile
+
+PROFILE_ID_HEADER = "X-Apex-Profile-Id"
+
+# The capture of the request being profiled. Context variables follow the
+# request onto its event loop and into sync_to_async threads.
+_current_capture = ContextVar("profile_capture", default=None)
+
+
+def profiling_requested(request):
+    """Checks whether a request asks to be profiled.
+
+    Args:
+        request: The incoming HttpRequest.
+
+    Returns:
+        bool: True when profiling is enabled and the trigger is present.
+    """
+    if not settings.PROFILER_ENABLED:
+        return False
+    header = "HTTP_" + settings.PROFILER_HEADER.upper().replace("-", "_")
+    if header in request.META:
+        return True
+    # The substring test keeps the query string unparsed on normal requests.
+    param = settings.PROFILER_QUERY_PARAM
+    return param in request.META.get("QUERY_STRING", "") and param in request.GET
+
+
+def staff_user(request):
+    """Returns the staff user making a request, or None.
+
+    The admin session user is used when there is one; otherwise the
+    request is authenticated with the API's authentication classes.
+
+    Args:
+        request: The incoming HttpRequest.
+
+    Returns:
+        The user when it is staff, otherwise None.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        user = None
+        drf_request = Request(request)
+        for authenticator_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+            try:
+                result = authenticator_class().authenticate(drf_request)
+            except APIException:
+                return None
+            if result is not None:
+                user = result[0]
+                break
+    if user is None or not user.is_staff:
+        return None
+    return user
+
+
+class SQLTimeline:
+    """Database execute wrapper recording when each statement ran.
+
+    Attributes:
+        started: perf_counter() value the offsets are relative to.
+        entries: One dict per statement, in execution order.
+        count: Statements executed, including those past the recorded limit.
+        total_ms: Time spent in all statements.
+    """
+
+    def __init__(self, started):
+        self.started = started
+        self.entries = []
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        offset = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - offset) * 1000
+            # Concurrent reads of one request record from several threads.
+            with self._lock:
+                self.count += 1
+                self.total_ms += duration_ms
+                if len(self.entries) < settings.PROFILER_MAX_QUERIES:
+                    self.entries.append(
+                        {
+                            "offset_ms": round((offset - self.started) * 1000, 3),
+                            "duration_ms": round(duration_ms, 3),
+                            "alias": context["connection"].alias,
+                            "sql": sql,
+                            "many": many,
+                        }
+                    )
+
+
+class _Capture:
+    """The SQL timeline and per-thread profilers of one profiled request."""
+
+    def __init__(self):
+        self.timeline = SQLTimeline(time.perf_counter())
+        self.profilers = []
+
+    def profiler(self):
+        """Returns a new profiler whose stats are part of the capture."""
+        profiler = cProfile.Profile()
+        self.profilers.append(profiler)
+        return profiler
+
+
+def record_profiled_query(execute, sql, params, many, context):
+    """Execute wrapper adding queries to the profiled request's SQL timeline.
+
+    Installed on every connection when it is created (core.signals), since
+    a request's queries can run on connections of other threads.
+    """
+    capture = _current_capture.get()
+    if capture is None:
+        return execute(sql, params, many, context)
+    return capture.timeline(execute, sql, params, many, context)
+
+
+def profile_thread(func):
+    """Runs func under a profiler of its own when its request is profiled.
+
+    For work a request hands to another thread, such as the concurrent reads
+    of core.concurrency.gather_reads.
+
+    Args:
+        func: A zero-argument callable.
+
+    Returns:
+        The result of func.
+    """
+    capture = _current_capture.get()
+    if capture is None:
+        return func()
+    return capture.profiler().runcall(_run_thread, func)
+
+
+def _label(func):
+    """Formats a pstats function key as "name (file:line)"."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    parts = Path(filename).parts
+    return f"{name} ({'/'.join(parts[-3:])}:{line})"
+
+
+def _respond(get_response, request):
+    """Runs the middleware chain; the root frame of every call tree."""
+    return get_response(request)
+
+
+async def _respond_async(get_response, request):
+    """Runs the async middleware chain; the root frame on its event loop."""
+    return await get_response(request)
+
+
+def _run_thread(func):
+    """Runs work handed to another thread; the root frame in that thread."""
+    return func()
+
+
+def _key(func):
+    code = func.__code__
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+_ROOTS = [_key(_respond), _key(_respond_async), _key(_run_thread)]
+
+
+def _on_own_loop(get_response, capture):
+    """Wraps the async middleware chain to run on a profiled event loop.
+
+    The loop runs in a new thread serving only this request, so profiling
+    it does not pick up other requests. Thread-sensitive sync_to_async calls
+    would otherwise run on the request's executor thread; with its context
+    unset they run in the thread waiting in async_to_sync, which is itself
+    profiled.
+
+    Args:
+        get_response: The rest of the middleware chain, a coroutine function.
+        capture: The request's _Capture.
+
+    Returns:
+        A synchronous callable producing the response.
+    """
+
+    async def respond(request):
+        token = SyncToAsync.thread_sensitive_context.set(None)
+        profiler = capture.profiler()
+        profiler.enable()
+        try:
+            return await _respond_async(get_response, request)
+        finally:
+            profiler.disable()
+            SyncToAsync.thread_sensitive_context.reset(token)
+
+    return async_to_sync(respond, force_new_loop=True)
+
+
+def render_call_tree(stats, total_seconds):
+    """Renders profiler stats as an indented call tree.
+
+    Each line shows the cumulative time spent below a call edge, the number
+    of calls and the function. Branches under PROFILER_TREE_MIN_FRACTION of
+    the request time or deeper than PROFILER_TREE_MAX_DEPTH are left out.
+    Timings are per caller and callee pair, so a recursive chain such as
+    the middleware stack is followed until a pair repeats.
+
+    Args:
+        stats: The pstats.Stats of a request profiled through _respond, with
+            one tree per root: the request, its event loop and each kind of
+            work handed to other threads.
+        total_seconds: Wall time of the request.
+
+    Returns:
+        str: The call tree, one call per line.
+    """
+    callees = defaultdict(dict)
+    for func, (*_, callers) in stats.stats.items():
+        for caller, timing in callers.items():
+            callees[caller][func] = timing
+
+    threshold = total_seconds * settings.PROFILER_TREE_MIN_FRACTION
+    lines = []
+
+    def walk(func, timing, depth, path):
+        calls, cumulative = timing[1], timing[3]
+        if cumulative < threshold:
+            return
+        lines.append(
+            f"{cumulative * 1000:10.1f} ms {calls:>7}  {'  ' * depth}{_label(func)}"
+        )
+        if depth >= settings.PROFILER_TREE_MAX_DEPTH:
+            return
+        children = sorted(callees[func].items(), key=lambda item: -item[1][3])
+        for child, child_timing in children:
+            edge = (func, child)
+            if edge in path:
+                # pstats aggregates per function, so a repeated edge would
+                # only print the same subtree again.
+                continue
+            walk(child, child_timing, depth + 1, path | {edge})
+
+    for root in _ROOTS:
+        if root in stats.stats:
+            walk(root, stats.stats[root][:4], 0, frozenset())
+    return "\n".join(lines)
+
+
+def profile_request(request, get_response, user):
+    """Produces the response under the profiler and saves the capture.
+
+    Called synchronously, in a worker thread under ASGI.
+
+    Args:
+        request: The HttpRequest being profiled.
+        get_response: The rest of the middleware chain, a coroutine function
+            under ASGI.
+        user: The staff user who asked for the profile.
+
+    Returns:
+        HttpResponse: The response, with the capture id in PROFILE_ID_HEADER.
+    """
+    capture = _Capture()
+    timeline = capture.timeline
+    profiler = capture.profiler()
+    if iscoroutinefunction(get_response):
+        get_response = _on_own_loop(get_response, capture)
+    token = _current_capture.set(capture)
+    try:
+        response = profiler.runcall(_respond, get_response, request)
+    finally:
+        _current_capture.reset(token)
+    elapsed = time.perf_counter() - timeline.started
+
+    stats = pstats.Stats(*capture.profilers)
+    view, action = getattr(request, "_metrics_view", ("", ""))
+    capture = RequestProfile(
+        user_id=user.pk,
+        method=request.method,
+        path=request.path[:500],
+        query_string=request.META.get("QUERY_STRING", "")[:500],
+        view_name=f"{view}.{action}" if view else "",
+        status_code=response.status_code,
+        duration_ms=round(elapsed * 1000, 3),
+        query_count=timeline.count,
+        query_time_ms=round(timeline.total_ms, 3),
+        call_tree=render_call_tree(stats, elapsed),
+        sql_timeline=timeline.entries,
+    )
+    # The format pstats.Stats.dump_stats() writes.
+    capture.stats_file.save(
+        f"{capture.pk}.prof", ContentFile(marshal.dumps(stats.stats)), save=False
+    )
+    capture.save()
+    prune_captures()
+
+    response[PROFILE_ID_HEADER] = str(capture.pk)
+    return response
+
+
+def prune_captures():
+    """Deletes the captures beyond the newest PROFILER_MAX_CAPTURES."""
+    stale = RequestProfile.objects.order_by("-created_at")[
+        settings.PROFILER_MAX_CAPTURES :
+    ]
+    for capture in stale:
+        capture.delete()
@@ -0,0 +1,170 @@
+"""Versioning for the seeded reference data served by the lookup endpoints.
+
+Lookup tables and the exercise catalogue only change when they are seeded or
+edited through the admin. A single version stamp, held in the database (see
+core.versioning) so every worker and service agrees on it, identifies the
+current state of all of them. Views derive their ETags and server-side cache
+keys from it, so bumping the stamp invalidates everything at once without
+having to track individual keys.
+"""
+
+import gzip
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import NormalisedLookupModel
+from .versioning import bump_version_stamps, get_version_stamp
+
+REFERENCE_VERSION_KEY = "reference-data"
+REFERENCE_BUNDLE_CACHE_KEY = "reference-data:bundle"
+
+# Tables served by the /reference/ bundle: key -> (serializer, select_related).
+REFERENCE_BUNDLE_TABLES = {
+    "training_goals": ("apps.users.serializers.TrainingGoalSerializer", ()),
+    "experience_levels": ("apps.users.serializers.ExperienceLevelSerializer", ()),
+    "program_statuses": (
+        "apps.programs.serializers.ProgramStatusOptionSerializer",
+        (),
+    ),
+    "phase_options": ("apps.programs.serializers.ProgramPhaseOptionSerializer", ()),
+    "phase_statuses": (
+        "apps.programs.serializers.ProgramPhaseStatusOptionSerializer",
+        (),
+    ),
+    "equipment": ("apps.exercises.serializers.EquipmentSerializer", ()),
+    "muscle_groups": ("apps.biology.serializers.MuscleGroupSerializer", ()),
+    "muscles": (
+        "apps.biology.serializers.MuscleSerializer",
+        ("muscle_group", "anatomical_direction"),
+    ),
+}
+
+# Non-lookup models whose rows are part of the public exercise catalogue.
+REFERENCE_MODEL_LABELS = {
+    "biology.JointAction",
+    "biology.MuscleInvolvement",
+    "exercises.Exercise",
+    "exercises.ExerciseMovement",
+    "exercises.JointContribution",
+    "exercises.Exercise_equipment",
+}
+
+
+def is_reference_model(model) -> bool:
+    """Returns whether writes to the given model change the reference data.
+
+    Args:
+        model: The model class that sent a save or delete signal.
+
+    Returns:
+        True for every NormalisedLookupModel subclass and for the catalogue
+        models listed in REFERENCE_MODEL_LABELS.
+    """
+    if issubclass(model, NormalisedLookupModel):
+        return True
+    return model._meta.label in REFERENCE_MODEL_LABELS
+
+
+def get_reference_version() -> dict:
+    """Fetches the current reference data version stamp.
+
+    Returns:
+        A dict with the opaque "version" string and the "updated_at" Unix
+        timestamp used for Last-Modified.
+    """
+    return get_version_stamp(REFERENCE_VERSION_KEY)
+
+
+def bump_reference_version() -> dict:
+    """Replaces the version stamp, invalidating every cached reference payload.
+
+    Returns:
+        The newly stored version stamp.
+    """
+    return bump_version_stamps([REFERENCE_VERSION_KEY])[REFERENCE_VERSION_KEY]
+
+
+def schedule_reference_version_bump() -> None:
+    """Bumps the version stamp once the current transaction commits.
+
+    Bumping before commit would let a concurrent reader cache the old rows
+    under the new version, so the stamp is only replaced after the write is
+    visible.
+    """
+    transaction.on_commit(bump_reference_version)
+
+
+def reference_cache_key(version: str, *parts: str) -> str:
+    """Builds a cache key scoped to a reference data version.
+
+    Args:
+        version: The version string from the current stamp.
+        *parts: Anything else that distinguishes the representation, such as
+            the request path and negotiated media type.
+
+    Returns:
+        A short, cache-backend safe key. Its digest changes with the version,
+        so it doubles as an ETag for the representation.
+    """
+    digest = hashlib.sha1("|".join((version, *parts)).encode(), usedforsecurity=False)
+    return f"reference-data:{digest.hexdigest()}"
+
+
+def reference_cache_control() -> str:
+    """Returns the Cache-Control header value for reference data responses."""
+    return f"public, max-age={settings.REFERENCE_DATA_MAX_AGE}"
+
+
+def _serialize_bundle_tables() -> dict:
+    tables = {}
+    for name, (serializer_path, related) in REFERENCE_BUNDLE_TABLES.items():
+        serializer_class = import_string(serializer_path)
+        queryset = serializer_class.Meta.model.objects.select_related(*related)
+        queryset = queryset.order_by("order_index", "label")
+        tables[name] = serializer_class(queryset, many=True).data
+    return tables
+
+
+def build_reference_bundle(version: str) -> dict:
+    """Serializes every bundled lookup table into a single precomputed payload.
+
+    Args:
+        version: The reference data version the bundle is built for.
+
+    Returns:
+        A dict with the bundle "version", its content "hash" and the encoded
+        JSON "body" in both plain and gzip-compressed form.
+    """
+    tables = _serialize_bundle_tables()
+    canonical = json.dumps(tables, cls=JSONEncoder, sort_keys=True)
+    content_hash = hashlib.sha256(canonical.encode()).hexdigest()
+
+    body = json.dumps(
+        {"hash": content_hash, **tables}, cls=JSONEncoder, separators=(",", ":")
+    ).encode()
+    return {
+        "version": version,
+        "hash": content_hash,
+        "body": body,
+        "gzip_body": gzip.compress(body, mtime=0),
+    }
+
+
+def get_reference_bundle() -> dict:
+    """Returns the bundle for the current version, rebuilding it if stale.
+
+    Returns:
+        The cached bundle, as produced by build_reference_bundle.
+    """
+    version = get_reference_version()["version"]
+    bundle = cache.get(REFERENCE_BUNDLE_CACHE_KEY)
+    if bundle is None or bundle["version"] != version:
+        bundle = build_reference_bundle(version)
+        cache.set(REFERENCE_BUNDLE_CACHE_KEY, bundle, timeout=None)
+    return bundle
@@ -0,0 +1,111 @@
+"""JSON rendering backed by orjson, with optional gzip compression.
+
+FastJSONRenderer produces the same bytes as DRF's JSONRenderer for compact
+output, except for some floats: str and dict subclasses (ErrorDetail,
+ReturnDict), UUIDs, lists and numbers are encoded natively in Rust, while
+datetimes, Decimals and lazy strings go through DRF's JSONEncoder so their
+formats do not change. Indented output (the browsable API, "; indent="
+media types) and payloads orjson rejects, such as integers wider than 64
+bits, fall back to DRF's renderer.
+
+Payloads are not inspected before encoding, so floats keep orjson's
+formatting. Floats Python writes with an exponent are written without a
+"+" in it or in full (1e16 for 1e+16, 0.00001 for 1e-05), which parses to
+the same value. NaN and infinities, which DRF refuses to encode, become
+null.
+
+With API_GZIP_ENABLED, bodies of at least API_GZIP_MIN_BYTES are gzipped
+for clients that accept it. The renderer sets Content-Encoding and Vary on
+the response itself, so only JSON API responses are compressed.
+"""
+
+import gzip
+
+import orjson
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_encoder = JSONEncoder()
+
+
+def dumps(data) -> bytes:
+    """Encodes data as compact JSON, formatting values but floats as DRF does.
+
+    Args:
+        data: The data to encode.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+
+    Raises:
+        orjson.JSONEncodeError: If the data cannot be encoded.
+    """
+    body = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    # DRF escapes these so the output is also valid JavaScript.
+    if b"\xe2\x80\xa8" in body or b"\xe2\x80\xa9" in body:
+        body = body.replace(b"\xe2\x80\xa8", b"\\u2028")
+        body = body.replace(b"\xe2\x80\xa9", b"\\u2029")
+    return body
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Drop-in replacement for DRF's JSONRenderer encoding with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Renders data into JSON, compressing it when configured.
+
+        Args:
+            data: The response data.
+            accepted_media_type: The negotiated media type.
+            renderer_context: The view, request and response, when rendered
+                for a response.
+
+        Returns:
+            bytes: The JSON body, gzipped when the response was marked so.
+        """
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            body = dumps(data)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return self.compress(body, renderer_context)
+
+    @staticmethod
+    def compress(body, renderer_context):
+        """Gzips a rendered body when enabled and accepted by the client.
+
+        Args:
+            body: The rendered JSON.
+            renderer_context: The view, request and response.
+
+        Returns:
+            bytes: The body, compressed or unchanged.
+        """
+        if not settings.API_GZIP_ENABLED:
+            return body
+        request = renderer_context.get("request")
+        response = renderer_context.get("response")
+        if request is None or response is None:
+            return body
+
+        patch_vary_headers(response, ["Accept-Encoding"])
+        if (
+            len(body) < settings.API_GZIP_MIN_BYTES
+            or response.has_header("Content-Encoding")
+            or "gzip" not in request.META.get("HTTP_ACCEPT_ENCODING", "")
+        ):
+            return body
+        response["Content-Encoding"] = "gzip"
+        return gzip.compress(body, compresslevel=settings.API_GZIP_LEVEL, mtime=0)
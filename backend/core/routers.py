@@ -0,0 +1,191 @@
+"""Primary/replica database routing.
+
+Writes always go to the primary. Reads go to the replica only where it was
+asked for: inside views using core.views.ReplicaReadsMixin (safe methods
+only) and inside replica_reads() blocks. Everything else, including
+lifecycle services, reads from the primary. primary_reads() forces the
+primary inside a replica scope.
+
+Read-your-writes is kept at three levels:
+
+- Within a request, the first write sends every later read to the primary.
+  ReplicaRoutingMiddleware tracks this per request, and replica_reads()
+  does the same for a block outside requests.
+- Reads inside an open transaction go to the primary.
+- After a request that wrote, its user reads from the primary for
+  REPLICA_MAX_LAG_SECONDS, so the next request sees the write too.
+
+Replica reads need REPLICA_READS_ENABLED and a REPLICA_DATABASE_ALIAS
+entry in DATABASES. Outside production that alias is a stand-in pointing
+at the primary database, so routing can be exercised without a replica.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY_DATABASE_ALIAS = DEFAULT_DB_ALIAS
+
+PRIMARY_PIN_CACHE_KEY = "replica-routing:pin:{user_id}"
+
+_PRIMARY = "primary"
+_REPLICA = "replica"
+
+
+class RoutingState:
+    """Routing decisions of one request or replica_reads() block.
+
+    Shared by reference with sync_to_async and gather_reads threads, so a
+    write on any of them is seen by the others.
+
+    Attributes:
+        replica_reads: Whether reads may use the replica.
+        wrote: Whether anything was written since the state was created.
+    """
+
+    def __init__(self, replica_reads=False):
+        self.replica_reads = replica_reads
+        self.wrote = False
+
+
+_routing_state = ContextVar("apex_routing_state", default=None)
+_read_target = ContextVar("apex_read_target", default=None)
+
+
+def current_routing_state():
+    """Returns the RoutingState of the current request or block, if any."""
+    return _routing_state.get()
+
+
+@contextmanager
+def routing_scope(state=None):
+    """Tracks routing for a request or unit of work.
+
+    Args:
+        state: The RoutingState to install. Defaults to a new one.
+
+    Yields:
+        RoutingState: The installed state.
+    """
+    state = state or RoutingState()
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+@contextmanager
+def replica_reads():
+    """Sends reads in a block or decorated function to the replica.
+
+    Outside a request, the block tracks its own writes: reads after the
+    first write in it go to the primary.
+
+    Yields:
+        None
+    """
+    with _scope_state():
+        token = _read_target.set(_REPLICA)
+        try:
+            yield
+        finally:
+            _read_target.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Sends reads in a block or decorated function to the primary.
+
+    Yields:
+        None
+    """
+    token = _read_target.set(_PRIMARY)
+    try:
+        yield
+    finally:
+        _read_target.reset(token)
+
+
+@contextmanager
+def _scope_state():
+    if _routing_state.get() is not None:
+        yield
+        return
+    with routing_scope():
+        yield
+
+
+def replica_configured() -> bool:
+    """Returns whether replica reads are enabled and the alias exists."""
+    return (
+        settings.REPLICA_READS_ENABLED
+        and settings.REPLICA_DATABASE_ALIAS in settings.DATABASES
+    )
+
+
+def pin_to_primary(user_id) -> None:
+    """Sends a user's replica reads to the primary while the replica lags.
+
+    Args:
+        user_id: The primary key of the user who wrote.
+    """
+    cache.set(
+        PRIMARY_PIN_CACHE_KEY.format(user_id=user_id),
+        True,
+        timeout=settings.REPLICA_MAX_LAG_SECONDS,
+    )
+
+
+def is_pinned_to_primary(user) -> bool:
+    """Returns whether a user wrote within REPLICA_MAX_LAG_SECONDS.
+
+    Args:
+        user: The requesting user, possibly anonymous.
+    """
+    if not user or not user.is_authenticated:
+        return False
+    return bool(cache.get(PRIMARY_PIN_CACHE_KEY.format(user_id=user.pk)))
+
+
+class PrimaryReplicaRouter:
+    """Routes opted-in reads to the replica and everything else to primary."""
+
+    def db_for_read(self, model, **hints):
+        target = _read_target.get()
+        state = _routing_state.get()
+        if target is None and state is not None and state.replica_reads:
+            target = _REPLICA
+
+        if target is None:
+            return None
+        if (
+            target == _PRIMARY
+            or not replica_configured()
+            or (state is not None and state.wrote)
+            or connections[PRIMARY_DATABASE_ALIAS].in_atomic_block
+        ):
+            return PRIMARY_DATABASE_ALIAS
+        return settings.REPLICA_DATABASE_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY_DATABASE_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows, so objects may relate across them.
+        databases = {PRIMARY_DATABASE_ALIAS, settings.REPLICA_DATABASE_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive schema changes through replication.
+        if db == settings.REPLICA_DATABASE_ALIAS:
+            return False
+        return None
@@ -0,0 +1,228 @@
+"""Idempotent bulk upserts for the seeded reference data.
+
+Seed commands describe each table as a list of rows keyed by its natural
+unique fields. BulkSeeder reads the table once, diffs it against the rows in
+memory and writes only new or changed rows with bulk_create(update_conflicts),
+so re-running a seed on an up to date database costs one SELECT per table and
+no writes. Foreign keys are resolved through the key -> pk maps returned by
+earlier upserts instead of a lookup per row. Seeders can share those maps,
+so a dry run spanning several commands resolves the rows an earlier command
+would have created.
+"""
+
+from django.core.exceptions import ValidationError
+
+from .reference_data import is_reference_model, schedule_reference_version_bump
+
+
+class BulkSeeder:
+    """Upserts seed rows table by table and records what changed.
+
+    Attributes:
+        dry_run: When True, diffs are computed but nothing is written.
+        batch_size: Rows per INSERT statement.
+        diffs: Per model label, the keys of created and updated rows and the
+            number of unchanged ones.
+
+    Seeders given the same key_maps dict share the key -> pk map of every
+    table seeded or read so far, including the rows a dry run would create.
+    """
+
+    def __init__(self, dry_run=False, batch_size=500, key_maps=None):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.diffs = {}
+        self._key_maps = {} if key_maps is None else key_maps
+
+    @staticmethod
+    def _attnames(model, field_names):
+        return [model._meta.get_field(name).attname for name in field_names]
+
+    def key_map(self, model, *fields):
+        """Returns {key: pk} for a table, loaded once per set of key maps.
+
+        Args:
+            model: The model.
+            *fields: The unique field names, foreign keys holding primary keys.
+
+        Returns:
+            dict: Primary keys keyed by the field values, a single value when
+                there is one field.
+        """
+        key = (model, fields)
+        if key not in self._key_maps:
+            attnames = self._attnames(model, fields)
+            self._key_maps[key] = {
+                values[0] if len(fields) == 1 else values[:-1]: values[-1]
+                for values in model.objects.values_list(*attnames, "pk")
+            }
+        return self._key_maps[key]
+
+    def code_map(self, model, field="code"):
+        """Returns {code: pk} for a lookup table.
+
+        Args:
+            model: The lookup model.
+            field: The natural key field. Defaults to "code".
+
+        Returns:
+            dict: Primary keys keyed by natural key.
+        """
+        return self.key_map(model, field)
+
+    def upsert(self, model, rows, unique_fields, update_fields=(), insert_fields=()):
+        """Creates missing rows and updates changed ones in bulk.
+
+        Rows use field names as keys, with primary keys as the values of
+        foreign keys. Values are normalised with each field's to_python(), so
+        JSON strings and floats compare equal to stored Decimals and UUIDs.
+
+        Args:
+            model: The model to seed.
+            rows: Iterable of dicts holding the unique, update and insert
+                fields.
+            unique_fields: Field names forming a unique constraint.
+            update_fields: Field names overwritten on existing rows.
+            insert_fields: Field names only written on new rows, so edits made
+                to existing rows are kept.
+
+        Returns:
+            dict: The primary key of every seeded row keyed by its unique
+                field values, a single value when there is one unique field.
+
+        Raises:
+            ValidationError: If any row fails the model's field rules or
+                clean(), keyed by its position in rows.
+        """
+        unique_fields, update_fields = list(unique_fields), list(update_fields)
+        fields = [model._meta.get_field(name) for name in unique_fields + update_fields]
+        attnames = [field.attname for field in fields]
+        unique_count = len(unique_fields)
+        insert_only = [model._meta.get_field(name) for name in insert_fields]
+
+        def key_of(values):
+            key = tuple(values[:unique_count])
+            return key[0] if unique_count == 1 else key
+
+        existing = {
+            key_of(values[1:]): (values[0], values[unique_count + 1 :])
+            for values in model.objects.values_list("pk", *attnames)
+        }
+
+        pks, created, updated, pending = {}, [], [], []
+        unchanged = 0
+        for row in rows:
+            values = [field.to_python(row[field.name]) for field in fields]
+            key = key_of(values)
+            instance = model(
+                **dict(zip(attnames, values)),
+                **{
+                    field.attname: field.to_python(row[field.name])
+                    for field in insert_only
+                },
+            )
+
+            if key not in existing:
+                created.append(key)
+            elif tuple(values[unique_count:]) != tuple(existing[key][1]):
+                instance.pk = existing[key][0]
+                updated.append(key)
+            else:
+                pks[key] = existing[key][0]
+                unchanged += 1
+                continue
+
+            pks[key] = instance.pk
+            pending.append(instance)
+
+        if pending and hasattr(model, "clean_bulk"):
+            relations = [
+                field.name for field in fields + insert_only if field.is_relation
+            ]
+            model.clean_bulk(pending, exclude=relations)
+
+        if pending and not self.dry_run:
+            self._write(model, pending, unique_fields, update_fields)
+            if is_reference_model(model):
+                schedule_reference_version_bump()
+
+        self.diffs[model._meta.label] = {
+            "created": created,
+            "updated": updated,
+            "unchanged": unchanged,
+        }
+        # Primary keys default to uuid7, so a dry run knows the rows it would
+        # create and later seeds can resolve them.
+        self._key_maps[(model, tuple(unique_fields))] = {
+            **{key: pk for key, (pk, _) in existing.items()},
+            **pks,
+        }
+        return pks
+
+    def _write(self, model, instances, unique_fields, update_fields):
+        """Inserts instances, updating the given fields on conflicting rows."""
+        if not update_fields:
+            model.objects.bulk_create(
+                instances, batch_size=self.batch_size, ignore_conflicts=True
+            )
+            return
+
+        touched = list(update_fields)
+        if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+            touched.append("updated_at")
+        model.objects.bulk_create(
+            instances,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=touched,
+        )
+
+    def changed(self, *models):
+        """Returns whether any row of the given models was created or updated."""
+        return any(
+            self.diffs.get(model._meta.label, {}).get(kind)
+            for model in models
+            for kind in ("created", "updated")
+        )
+
+    def report(self, verbose=False):
+        """Describes the diff of every seeded table.
+
+        Args:
+            verbose: Whether to list the keys of created and updated rows.
+
+        Returns:
+            list[str]: One summary line per table, followed by the changed
+                keys when verbose.
+        """
+        lines = []
+        for label, diff in self.diffs.items():
+            lines.append(
+                f"    {label}: {len(diff['created'])} created, "
+                f"{len(diff['updated'])} updated, {diff['unchanged']} unchanged"
+            )
+            if verbose:
+                lines.extend(f"        + {key}" for key in diff["created"])
+                lines.extend(f"        ~ {key}" for key in diff["updated"])
+        return lines
+
+
+def resolve(code_map, code, model_name):
+    """Looks up a seeded code, failing with the code and table when missing.
+
+    Args:
+        code_map: A {code: pk} map from BulkSeeder.
+        code: The code referenced by a seed row.
+        model_name: The referenced model's name for the error message.
+
+    Returns:
+        The primary key of the referenced row.
+
+    Raises:
+        ValidationError: If the code is not in the map.
+    """
+    try:
+        return code_map[code]
+    except KeyError:
+        raise ValidationError(f"{model_name} '{code}' not found") from None
@@ -1,5 +1,10 @@
+from operator import itemgetter
+
+from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
+from .partitioning import not_before
+
 CORE_BASE_FIELDS = ["id", "created_at", "updated_at"]
 LOOKUP_BASE_FIELDS = ["code", "label", "order_index", "description"]
 
@@ -20,3 +25,133 @@ class LabelLookupSerializer(ApexSerializer):
     class Meta(ApexSerializer.Meta):
         fields = ["id", "label"]
         read_only_fields = fields
+
+
+def _identity(value):
+    return value
+
+
+def _converter(field):
+    """Returns the cheapest callable giving field.to_representation's result.
+
+    Database values of UUID, integer, boolean and text columns already have
+    the represented type (UUIDs only need str()); anything else, such as
+    datetimes and decimals, uses the field's own to_representation.
+    """
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) in (
+        serializers.IntegerField,
+        serializers.BooleanField,
+        serializers.CharField,
+    ):
+        return _identity
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """Read-only serialization of values() rows matching a DRF serializer.
+
+    Reproduces the output of serializer_class for list endpoints without
+    building model instances or running the serializer per row. The
+    serializer's fields are compiled once into a plan of values() lookups
+    (following each field's source) and converters, and rows are mapped to
+    dicts in the same key order, so the rendered JSON is byte-identical.
+
+    Attributes:
+        serializer_class: The ModelSerializer whose output is reproduced.
+        computed: Fields whose source is not a column, mapped to the lookups
+            they read and a function computing the source value from a row.
+        nested: Fields holding a list of child records, mapped to the child
+            ValuesSerializer and the child's foreign key to this model.
+        nested_bounds: Nested fields whose children are never stamped before
+            their parent, mapped to the child's and the parent's timestamp
+            columns. Child fetches are bounded by the earliest parent, so
+            partitioned child tables skip older months.
+    """
+
+    serializer_class = None
+    computed = {}
+    nested = {}
+    nested_bounds = {}
+
+    @classmethod
+    def _plan(cls):
+        """Compiles and caches the lookups and per-field converters."""
+        if "_compiled" not in cls.__dict__:
+            lookups = {"id"}
+            plan = []
+            for name, field in cls.serializer_class().fields.items():
+                if name in cls.nested:
+                    plan.append((name, None, None))
+                    continue
+                if name in cls.computed:
+                    columns, getter = cls.computed[name]
+                    lookups.update(columns)
+                else:
+                    lookup = "__".join(field.source_attrs)
+                    lookups.add(lookup)
+                    getter = itemgetter(lookup)
+                plan.append((name, getter, _converter(field)))
+            lookups.update(parent for _, parent in cls.nested_bounds.values())
+            cls._compiled = (sorted(lookups), plan)
+        return cls._compiled
+
+    @classmethod
+    def project(cls, queryset, *extra):
+        """Turns a model queryset into the values() rows serialize() reads.
+
+        Args:
+            queryset: The filtered and ordered model queryset.
+            *extra: Additional lookups to include in each row.
+
+        Returns:
+            QuerySet: A values() queryset with prefetches removed.
+        """
+        lookups, _ = cls._plan()
+        return queryset.prefetch_related(None).values(*lookups, *extra)
+
+    @classmethod
+    def serialize(cls, rows):
+        """Maps rows from project() to the serializer's representation.
+
+        Nested records are fetched with one query per nested field.
+
+        Args:
+            rows: An iterable of rows produced by project().
+
+        Returns:
+            list[dict]: One representation per row, in row order.
+        """
+        rows = list(rows)
+        _, plan = cls._plan()
+        children = {}
+        if cls.nested and rows:
+            parent_ids = [row["id"] for row in rows]
+            for name, (child, foreign_key) in cls.nested.items():
+                model = child.serializer_class.Meta.model
+                queryset = model.objects.filter(**{f"{foreign_key}__in": parent_ids})
+                if name in cls.nested_bounds:
+                    column, parent = cls.nested_bounds[name]
+                    stamps = [row[parent] for row in rows if row[parent] is not None]
+                    if stamps:
+                        queryset = queryset.filter(
+                            **{f"{column}__gte": not_before(min(stamps))}
+                        )
+                grouped = {}
+                child_rows = list(child.project(queryset, foreign_key))
+                for row, data in zip(child_rows, child.serialize(child_rows)):
+                    grouped.setdefault(row[foreign_key], []).append(data)
+                children[name] = grouped
+
+        output = []
+        for row in rows:
+            data = {}
+            for name, getter, convert in plan:
+                if getter is None:
+                    data[name] = children.get(name, {}).get(row["id"], [])
+                    continue
+                value = getter(row)
+                data[name] = None if value is None else convert(value)
+            output.append(data)
+        return output
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import dj_database_url
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 
 warnings.filterwarnings("ignore", "app_settings.*is_deprecated")
 
@@ -57,6 +58,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",  # Full-text and trigram search (no-op on SQLite)
     # Third Party Libraries
     "rest_framework",  # API Toolkit
     "rest_framework_simplejwt",  # JSON Web Token Support
@@ -79,11 +81,14 @@ INSTALLED_APPS = [
     "apps.workouts",  # Workouts App
     "apps.users",  # Users App
     "apps.programs",  # Programs App
+    "apps.notifications",  # Transactional Email Outbox
 ]
 
 SITE_ID = 1  # Required for Site Identification and mapping by django.contrib.sites
 
 MIDDLEWARE = [
+    # Outermost, so request timings cover every other middleware
+    "core.middleware.MetricsMiddleware",
     # CORS Requirement to come top level for preflight requests
     "corsheaders.middleware.CorsMiddleware",
     # Base Django Middleware
@@ -92,6 +97,10 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Tracks replica reads and writes of the view, around it only
+    "core.middleware.ReplicaRoutingMiddleware",
+    # After authentication, so staff sessions can trigger a profile
+    "core.middleware.ProfilerMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # Required Middleware by allauth
@@ -155,20 +164,102 @@ LOGGING = {
 }
 
 
+# --- Server Interface ---
+
+# Set ASGI_ENABLED when serving core.asgi:application (see render.yaml). Async
+# views then run on the event loop, and persistent connections are disabled
+# because each request's sync work runs on its own thread; reuse connections
+# through DB_POOL_ENABLED instead. CONCURRENT_DB_READS lets async views run
+# independent reads on separate connections (core.concurrency).
+ASGI_ENABLED = config("ASGI_ENABLED", default=False, cast=bool)
+CONCURRENT_DB_READS = config("CONCURRENT_DB_READS", default=True, cast=bool)
+
 # --- Database Configuration ---
 
 # Fail Early Here are Postgres is a Core Requirement
 USE_POSTGRES = config("USE_POSTGRES", default=True, cast=bool)
 DATABASE_URL = config("DATABASE_URL", cast=str)
 
+# Connection pooling (PostgreSQL only). With DB_POOL_ENABLED each process
+# shares a psycopg 3 pool between its threads and async tasks instead of
+# holding a connection per thread. Every process opens up to
+# DB_POOL_MAX_SIZE connections per database, so keep processes x
+# DB_POOL_MAX_SIZE below each server's max_connections. Connections are
+# checked before being handed out and recycled after DB_POOL_MAX_LIFETIME
+# seconds. Compare the modes with the benchmark_db_pool command.
+DB_POOL_ENABLED = config("DB_POOL_ENABLED", default=False, cast=bool)
+DB_POOL_MIN_SIZE = config("DB_POOL_MIN_SIZE", default=2, cast=int)
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", default=8, cast=int)
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=10.0, cast=float)
+DB_POOL_MAX_IDLE = config("DB_POOL_MAX_IDLE", default=300.0, cast=float)
+DB_POOL_MAX_LIFETIME = config("DB_POOL_MAX_LIFETIME", default=1800.0, cast=float)
+
+# Completion records and exercise snapshots can be partitioned by month on
+# PostgreSQL (core.partitioning). Off by default: the migrations only
+# convert the tables when PARTITIONING_ENABLED is set, so rehearse them on
+# a copy of the database first. maintain_partitions keeps partitions for
+# the current month and PARTITION_MONTHS_AHEAD months after it.
+PARTITIONING_ENABLED = config("PARTITIONING_ENABLED", default=False, cast=bool)
+PARTITION_MONTHS_AHEAD = config("PARTITION_MONTHS_AHEAD", default=3, cast=int)
+
+# Read replica. Views and services that opt in (core.routers) read from the
+# replica alias when REPLICA_READS_ENABLED; writes and all other reads use
+# the primary. Outside production the alias defaults to a stand-in
+# connection to DATABASE_URL, so routing can be exercised locally; point
+# REPLICA_DATABASE_URL at a second database to test against a real copy.
+# Users who wrote read from the primary for REPLICA_MAX_LAG_SECONDS after.
+REPLICA_DATABASE_URL = config("REPLICA_DATABASE_URL", default="")
+REPLICA_DATABASE_ALIAS = "replica"
+REPLICA_READS_ENABLED = config(
+    "REPLICA_READS_ENABLED", default=bool(REPLICA_DATABASE_URL), cast=bool
+)
+REPLICA_MAX_LAG_SECONDS = config("REPLICA_MAX_LAG_SECONDS", default=5, cast=int)
+
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+
 # Use dj_database_url to parse the connection string.
 if DATABASE_URL:
     DATABASES = {
         "default": dj_database_url.parse(
-            str(DATABASE_URL), conn_max_age=600, ssl_require=IS_PROD
+            str(DATABASE_URL),
+            conn_max_age=0 if ASGI_ENABLED else 600,
+            conn_health_checks=True,
+            ssl_require=IS_PROD,
         )
     }
 
+    if REPLICA_DATABASE_URL or not IS_PROD:
+        DATABASES[REPLICA_DATABASE_ALIAS] = dj_database_url.parse(
+            str(REPLICA_DATABASE_URL or DATABASE_URL),
+            conn_max_age=0 if ASGI_ENABLED else 600,
+            conn_health_checks=True,
+            ssl_require=IS_PROD,
+        )
+        # Tests run against one database; the replica reads it too.
+        DATABASES[REPLICA_DATABASE_ALIAS]["TEST"] = {"MIRROR": "default"}
+
+    if (
+        DB_POOL_ENABLED
+        and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql"
+    ):
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            raise ImproperlyConfigured("DB_POOL_ENABLED requires psycopg[pool].")
+
+        # Each alias gets its own pool. Pooled connections go back to the
+        # pool when Django closes them.
+        for database in DATABASES.values():
+            database["CONN_MAX_AGE"] = 0
+            database.setdefault("OPTIONS", {})["pool"] = {
+                "min_size": DB_POOL_MIN_SIZE,
+                "max_size": DB_POOL_MAX_SIZE,
+                "timeout": DB_POOL_TIMEOUT,
+                "max_idle": DB_POOL_MAX_IDLE,
+                "max_lifetime": DB_POOL_MAX_LIFETIME,
+                "check": ConnectionPool.check_connection,
+            }
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # --- Authentication and Authorisation
@@ -176,13 +267,93 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "dj_rest_auth.jwt_auth.JWTCookieAuthentication",
+        "apps.users.authentication.ClaimsJWTCookieAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
 }
 
+# --- JSON Encoding
+# API_FAST_JSON swaps DRF's JSON renderer and parser for the orjson-backed
+# ones in core.renderers and core.parsers, which produce the same bytes but
+# for some floats. Off until benchmark_json_rendering shows a speedup on every
+# endpoint.
+# With API_FAST_JSON, API_GZIP_ENABLED compresses JSON responses of at least
+# API_GZIP_MIN_BYTES for clients sending "Accept-Encoding: gzip".
+API_FAST_JSON = config("API_FAST_JSON", default=False, cast=bool)
+API_GZIP_ENABLED = config("API_GZIP_ENABLED", default=False, cast=bool)
+API_GZIP_MIN_BYTES = config("API_GZIP_MIN_BYTES", default=1024, cast=int)
+API_GZIP_LEVEL = config("API_GZIP_LEVEL", default=5, cast=int)
+
+if API_FAST_JSON:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
+# --- Caching
+# CACHE_BACKEND picks the default cache: "locmem" (per process), "file" (shared
+# by the workers of one machine) or "redis" (any Redis-compatible server at
+# CACHE_LOCATION). Cached API reads are invalidated by tag on writes (see
+# core.caching), which only reaches every worker through a shared backend, so
+# production defaults to the file cache.
+
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "apex"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", "/tmp/apex-cache"),
+    "redis": (
+        "django.core.cache.backends.redis.RedisCache",
+        "redis://localhost:6379/0",
+    ),
+}
+CACHE_BACKEND = config("CACHE_BACKEND", default="file" if IS_PROD else "locmem")
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND must be one of: {', '.join(CACHE_BACKENDS)}."
+    )
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": config("CACHE_LOCATION", default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+        "KEY_PREFIX": "apex",
+    }
+}
+
+# Cached API responses are also dropped after API_CACHE_TIMEOUT seconds, which
+# bounds how stale time-dependent reads ("this week") can get.
+API_CACHE_ENABLED = config("API_CACHE_ENABLED", default=True, cast=bool)
+API_CACHE_ALIAS = "default"
+API_CACHE_TIMEOUT = config("API_CACHE_TIMEOUT", default=5 * 60, cast=int)
+
+# --- Reference Data Caching
+# Lookup and exercise catalogue responses are versioned (see core.reference_data),
+# so browsers may reuse them for max-age and revalidate cheaply afterwards.
+
+REFERENCE_DATA_MAX_AGE = config("REFERENCE_DATA_MAX_AGE", default=60 * 60, cast=int)
+REFERENCE_DATA_CACHE_TIMEOUT = config(
+    "REFERENCE_DATA_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
+
+# --- Claims Authentication
+# Access tokens carry role and profile claims so requests skip the user query.
+# The claims version cached per user is how long a revoked token can linger on
+# another worker before it is rejected.
+
+AUTH_CLAIMS_FAST_PATH = config("AUTH_CLAIMS_FAST_PATH", default=True, cast=bool)
+AUTH_CLAIMS_CACHE_TIMEOUT = config("AUTH_CLAIMS_CACHE_TIMEOUT", default=60, cast=int)
+
+# /auth/user/ payloads are cached per user under a profile version that is
+# replaced on every profile or membership write.
+USER_DETAILS_CACHE_TIMEOUT = config(
+    "USER_DETAILS_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
+
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
@@ -228,7 +399,7 @@ REST_AUTH = {
         "dj_rest_auth.serializers.JWTSerializerWithExpiration"
     ),
     "JWT_TOKEN_CLAIMS_SERIALIZER": (
-        "rest_framework_simplejwt.serializers.TokenObtainPairSerializer"
+        "apps.users.serializers.ApexTokenObtainPairSerializer"
     ),
     "USER_DETAILS_SERIALIZER": "apps.users.serializers.CustomUserSerializer",
     "PASSWORD_RESET_SERIALIZER": "apps.users.serializers.ApexPasswordResetSerializer",
@@ -323,6 +494,57 @@ else:
     EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
     DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="dev@localhost")
 
+# --- Transactional Email Outbox
+# Emails are queued in the request transaction and sent by the deliver_outbox
+# worker. Outside production they are also sent right after commit, so the
+# console backend shows them without running the worker.
+EMAIL_OUTBOX_EAGER = config("EMAIL_OUTBOX_EAGER", default=not IS_PROD, cast=bool)
+EMAIL_OUTBOX_BATCH_SIZE = config("EMAIL_OUTBOX_BATCH_SIZE", default=50, cast=int)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=6, cast=int)
+EMAIL_OUTBOX_BACKOFF_SECONDS = config(
+    "EMAIL_OUTBOX_BACKOFF_SECONDS", default=30, cast=int
+)
+EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = config(
+    "EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", default=60 * 60, cast=int
+)
+EMAIL_OUTBOX_LEASE_SECONDS = config("EMAIL_OUTBOX_LEASE_SECONDS", default=300, cast=int)
+EMAIL_OUTBOX_POLL_SECONDS = config("EMAIL_OUTBOX_POLL_SECONDS", default=5, cast=float)
+# Sent and failed messages are deleted by deliver_outbox after this long.
+EMAIL_OUTBOX_RETENTION_DAYS = config("EMAIL_OUTBOX_RETENTION_DAYS", default=7, cast=int)
+# Repeated reset requests within this window send a single email.
+PASSWORD_RESET_EMAIL_DEDUP_SECONDS = config(
+    "PASSWORD_RESET_EMAIL_DEDUP_SECONDS", default=60, cast=int
+)
+
+# --- Metrics
+# Request, query and service histograms served at METRICS_PATH in the
+# Prometheus text format. Set METRICS_DIR to a directory shared by the
+# gunicorn workers so the endpoint reports all of them, and METRICS_TOKEN to
+# require "Authorization: Bearer <token>" from the scraper. In production
+# the endpoint refuses every scrape until METRICS_TOKEN is set.
+METRICS_ENABLED = config("METRICS_ENABLED", default=True, cast=bool)
+METRICS_PATH = "/metrics"
+METRICS_DIR = config("METRICS_DIR", default="")
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+METRICS_FLUSH_SECONDS = config("METRICS_FLUSH_SECONDS", default=1.0, cast=float)
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+METRICS_QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+# --- Request Profiling
+# Staff requests carrying the PROFILER_HEADER header or the
+# PROFILER_QUERY_PARAM query flag run under cProfile; the call tree, SQL
+# timeline and raw stats are saved to PROFILER_DIR and listed in the admin.
+# Only the newest PROFILER_MAX_CAPTURES captures are kept.
+PROFILER_ENABLED = config("PROFILER_ENABLED", default=True, cast=bool)
+PROFILER_HEADER = "X-Apex-Profile"
+PROFILER_QUERY_PARAM = "_profile"
+PROFILER_DIR = config("PROFILER_DIR", default=str(BASE_DIR / "profiles"))
+PROFILER_MAX_CAPTURES = config("PROFILER_MAX_CAPTURES", default=200, cast=int)
+PROFILER_MAX_QUERIES = 2000
+# Call tree branches under this share of the request time are folded away.
+PROFILER_TREE_MIN_FRACTION = 0.005
+PROFILER_TREE_MAX_DEPTH = 60
+
 # Password Validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -392,6 +614,22 @@ else:
 
 # Cloudinary Configuration
 
+# --- Profile Images
+# Uploaded logos and avatars are resized into these square edge lengths (px)
+# by the process_profile_images worker. Outside production they are processed
+# right after the upload commits so no worker is needed locally.
+PROFILE_IMAGE_SIZES = {"sm": 64, "md": 160, "lg": 480}
+PROFILE_IMAGE_EAGER = config("PROFILE_IMAGE_EAGER", default=not IS_PROD, cast=bool)
+PROFILE_IMAGE_MAX_PIXELS = config(
+    "PROFILE_IMAGE_MAX_PIXELS", default=40_000_000, cast=int
+)
+PROFILE_IMAGE_QUALITY = config("PROFILE_IMAGE_QUALITY", default=80, cast=int)
+PROFILE_IMAGE_BATCH_SIZE = config("PROFILE_IMAGE_BATCH_SIZE", default=20, cast=int)
+PROFILE_IMAGE_LEASE_SECONDS = config(
+    "PROFILE_IMAGE_LEASE_SECONDS", default=300, cast=int
+)
+PROFILE_IMAGE_POLL_SECONDS = config("PROFILE_IMAGE_POLL_SECONDS", default=5, cast=float)
+
 # --- Internationalization & Static Files ---
 
 LANGUAGE_CODE = "en-us"
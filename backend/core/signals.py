@@ -0,0 +1,126 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from .caching import (
+    cache_tag_owners,
+    model_cache_tags,
+    moves_cache_owners,
+    schedule_tag_invalidation,
+)
+from .middleware import count_request_query
+from .models import RequestProfile
+from .profiling import record_profiled_query
+from .reference_data import is_reference_model, schedule_reference_version_bump
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_reference_data(sender, **kwargs):
+    """Bumps the reference data version when a lookup or catalogue row changes.
+
+    Args:
+        sender: The model class that sent the signal.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if is_reference_model(sender):
+        schedule_reference_version_bump()
+
+
+@receiver(pre_save)
+@receiver(pre_delete)
+def record_api_cache_owners(sender, instance, update_fields=None, **kwargs):
+    """Records who can see a cached row before it is changed or deleted.
+
+    The owners found by an earlier write of the same instance are reused
+    unless this save may move the row to another membership.
+
+    Args:
+        sender: The model class that sent the signal.
+        instance: The row about to be written.
+        update_fields: The fields being saved, None for every field.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if not model_cache_tags(sender) or instance._state.adding:
+        return
+    known = "_cache_tag_owners" in instance.__dict__
+    if not known or (
+        kwargs["signal"] is pre_save and moves_cache_owners(instance, update_fields)
+    ):
+        instance._cache_tag_owners = cache_tag_owners(instance)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_api_cache_tags(sender, instance, update_fields=None, **kwargs):
+    """Invalidates the cached API responses that depend on a written row.
+
+    Only the copies of the tags of the users who could see the row, before
+    or after the write, are invalidated. Rows without a membership
+    invalidate the global tags.
+
+    Args:
+        sender: The model class that sent the signal.
+        instance: The written row.
+        update_fields: The fields saved, None for every field.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    tags = model_cache_tags(sender)
+    if not tags:
+        return
+    before = instance.__dict__.get("_cache_tag_owners", [])
+    after = before
+    if kwargs["signal"] is post_save and (
+        kwargs["created"] or moves_cache_owners(instance, update_fields)
+    ):
+        after = instance._cache_tag_owners = cache_tag_owners(instance)
+    owners = sorted({*before, *after})
+    schedule_tag_invalidation(*tags, owners=owners or None)
+
+
+@receiver(m2m_changed)
+def invalidate_reference_relations(sender, action, **kwargs):
+    """Bumps the reference data version when a catalogue relation changes.
+
+    Args:
+        sender: The intermediate model of the many-to-many relation.
+        action: The m2m_changed action, only post_* actions are handled.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if action.startswith("post_") and is_reference_model(sender):
+        schedule_reference_version_bump()
+
+
+@receiver(post_delete, sender=RequestProfile)
+def delete_profile_stats_file(sender, instance, **kwargs):
+    """Removes the raw stats file of a deleted request profile.
+
+    Args:
+        sender: The RequestProfile model class.
+        instance: The deleted capture.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    if instance.stats_file:
+        instance.stats_file.delete(save=False)
+
+
+@receiver(connection_created)
+def install_query_counter(sender, connection, **kwargs):
+    """Counts the new connection's queries towards the current request.
+
+    Also records them in the request's profile when it is being profiled.
+
+    Args:
+        sender: The database backend's connection wrapper class.
+        connection: The connection that was opened.
+        **kwargs: Additional keyword arguments passed by the signal.
+    """
+    for wrapper in (count_request_query, record_profiled_query):
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(wrapper)
@@ -0,0 +1,679 @@
+"""Deterministic high-volume workout datasets for load testing.
+
+SyntheticDataset builds trainers, clients, memberships, programs, phases,
+workouts and completion history in memory and hands them to BulkWriter,
+which streams them to the database in dependency order: COPY on
+PostgreSQL, bulk_create elsewhere. Nothing goes through Model.save(), so
+full_clean() and post_save signals never run per row; the rows are valid by
+construction and can optionally be checked per batch with clean_bulk().
+
+All randomness comes from one random.Random seeded by the caller, and
+primary keys are version 7 UUIDs built from each row's own timestamp and
+that generator, so the same seed and start date always produce the same
+rows.
+"""
+
+import csv
+import io
+import json
+import random
+import uuid
+from datetime import UTC, datetime, time, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from apps.exercises.models import Exercise
+from apps.programs.constants import (
+    ProgramPhaseStatusesVocabulary,
+    ProgramStatusesVocabulary,
+)
+from apps.programs.models import (
+    Program,
+    ProgramPhase,
+    ProgramPhaseOption,
+    ProgramPhaseStatusOption,
+    ProgramStatusOption,
+)
+from apps.users.constants import MembershipVocabulary
+from apps.users.models import (
+    ClientProfile,
+    ExperienceLevel,
+    MembershipStatus,
+    TrainerClientMembership,
+    TrainerProfile,
+    TrainingGoal,
+)
+from apps.workouts.models import (
+    Workout,
+    WorkoutCompletionRecord,
+    WorkoutExercise,
+    WorkoutExerciseCompletionRecord,
+    WorkoutSet,
+    WorkoutSetCompletionRecord,
+)
+
+User = get_user_model()
+
+EMAIL_DOMAIN = "loadtest.apex.invalid"
+PHASE_WEEKS = 4
+DEFAULT_REP_RANGE = (6, 12)
+DEFAULT_WEEKLY_PROGRESSION = Decimal("0.025")
+DELOAD_FACTOR = Decimal("0.90")
+WEIGHT_STEP = Decimal("1.25")
+SESSION_TIME = time(17, 0)
+
+
+class BulkWriter:
+    """Buffers unsaved instances and writes them in dependency order.
+
+    Attributes:
+        batch_size: Buffered instances that trigger a flush.
+        validate: Whether each batch is checked with clean_bulk() first.
+        counts: Rows written per model label.
+    """
+
+    def __init__(self, models_in_order, batch_size=10_000, validate=False):
+        self.models = list(models_in_order)
+        self.batch_size = batch_size
+        self.validate = validate
+        self.counts = {model._meta.label: 0 for model in self.models}
+        self._buffers = {model: [] for model in self.models}
+        self._pending = 0
+
+    def add(self, instance):
+        """Buffers an instance, flushing every buffer once the batch is full."""
+        self._buffers[type(instance)].append(instance)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Writes every buffer, parents before children, in one transaction."""
+        with transaction.atomic():
+            for model in self.models:
+                instances = self._buffers[model]
+                if not instances:
+                    continue
+                if self.validate and hasattr(model, "clean_bulk"):
+                    model.clean_bulk(instances)
+                if connection.vendor == "postgresql":
+                    self._copy(model, instances)
+                else:
+                    model.objects.bulk_create(instances, batch_size=self.batch_size)
+                self.counts[model._meta.label] += len(instances)
+                self._buffers[model] = []
+        self._pending = 0
+
+    @staticmethod
+    def _copy(model, instances):
+        """Streams instances into their table with COPY ... FROM STDIN.
+
+        Timestamps are written as given, unlike bulk_create(), which stamps
+        auto_now fields with the current time.
+        """
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not (field.primary_key and instances[0].pk is None)
+        ]
+
+        def encode(field, value):
+            if value is None:
+                return r"\N"
+            if isinstance(field, models.JSONField):
+                return json.dumps(value)
+            if isinstance(value, bool):
+                return "t" if value else "f"
+            return str(value)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for instance in instances:
+            writer.writerow(
+                [encode(field, getattr(instance, field.attname)) for field in fields]
+            )
+        buffer.seek(0)
+
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        sql = (
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            r"FROM STDIN WITH (FORMAT csv, NULL '\N')"
+        )
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, "copy_expert"):
+                raw.copy_expert(sql, buffer)
+            else:
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+
+class SyntheticDataset:
+    """Generates a realistic training history for many trainers and clients.
+
+    Every client has an active membership and a run of back-to-back
+    programs. Programs are split into phases of up to four weeks whose
+    fourth week is a deload; prescribed weights rise each week by a share of
+    the client's experience level progression cap. Sessions before the
+    dataset's cut-off date carry completion records, with sessions missed
+    outright, skipped, or partially skipped at rates derived from
+    skip_rate. The final week is left in the future.
+
+    Attributes:
+        counts: Rows written per model label, filled in by generate().
+    """
+
+    WRITE_ORDER = [
+        User,
+        TrainerProfile,
+        TrainerProfile.accepted_goals.through,
+        TrainerProfile.accepted_levels.through,
+        ClientProfile,
+        TrainerClientMembership,
+        Program,
+        ProgramPhase,
+        Workout,
+        WorkoutExercise,
+        WorkoutSet,
+        WorkoutCompletionRecord,
+        WorkoutExerciseCompletionRecord,
+        WorkoutSetCompletionRecord,
+    ]
+
+    def __init__(
+        self,
+        *,
+        seed,
+        trainers,
+        clients_per_trainer,
+        programs,
+        weeks,
+        sessions_per_week,
+        exercises_per_session,
+        sets_per_exercise,
+        skip_rate=0.08,
+        start_date=None,
+        password="apex-load-test",
+        batch_size=10_000,
+        validate=False,
+    ):
+        self.seed = seed
+        self.trainers = trainers
+        self.clients_per_trainer = clients_per_trainer
+        self.programs = programs
+        self.weeks = weeks
+        self.sessions_per_week = sessions_per_week
+        self.exercises_per_session = exercises_per_session
+        self.sets_per_exercise = sets_per_exercise
+        self.skip_rate = skip_rate
+        self.password = password
+
+        total_weeks = programs * weeks
+        if start_date is None:
+            today = timezone.localdate()
+            this_monday = today - timedelta(days=today.weekday())
+            start_date = this_monday - timedelta(weeks=total_weeks - 1)
+        self.start_date = start_date
+        # History stops one week before the last program ends.
+        self.cutoff = start_date + timedelta(weeks=total_weeks - 1)
+
+        self.rng = random.Random(seed)
+        self._columns = {}
+        self.writer = BulkWriter(self.WRITE_ORDER, batch_size, validate)
+        self.counts = self.writer.counts
+
+    @classmethod
+    def session_days(cls, sessions_per_week):
+        """Spreads the weekly sessions across the week as evenly as possible.
+
+        Args:
+            sessions_per_week: Number of sessions, from 1 to 7.
+
+        Returns:
+            list[int]: Day offsets from the start of the week.
+        """
+        return sorted({i * 7 // sessions_per_week for i in range(sessions_per_week)})
+
+    def email(self, role, index):
+        """Returns the deterministic address of a generated user."""
+        return f"{role}-{self.seed}-{index:05d}@{EMAIL_DOMAIN}"
+
+    def existing_users(self):
+        """Returns whether users from a dataset with this seed already exist."""
+        return User.objects.filter(
+            email__startswith=f"trainer-{self.seed}-", email__endswith=EMAIL_DOMAIN
+        ).exists()
+
+    def _key(self, moment):
+        """Builds a deterministic version 7 UUID for a row dated at moment."""
+        ms = int(moment.timestamp() * 1000)
+        value = (
+            (ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | self.rng.getrandbits(12) << 64
+            | 0b10 << 62
+            | self.rng.getrandbits(62)
+        )
+        return uuid.UUID(int=value)
+
+    def _new(self, model, moment, **fields):
+        """Creates an unsaved instance keyed and stamped at moment.
+
+        Instances given only column values (foreign keys by attname) are
+        built positionally, which skips Model.__init__'s keyword handling and
+        roughly halves the cost of the high-volume workout rows.
+        """
+        fields.update(id=self._key(moment), created_at=moment, updated_at=moment)
+        if model not in self._columns:
+            self._columns[model] = [
+                (field.attname, field) for field in model._meta.concrete_fields
+            ]
+        columns = self._columns[model]
+        if not fields.keys() <= {attname for attname, _ in columns}:
+            return model(**fields)
+        return model(
+            *[
+                fields[attname] if attname in fields else field.get_default()
+                for attname, field in columns
+            ]
+        )
+
+    @staticmethod
+    def _at(day, minutes=0):
+        """Returns the session start on day, shifted by minutes."""
+        return datetime.combine(day, SESSION_TIME, tzinfo=UTC) + timedelta(
+            minutes=minutes
+        )
+
+    @staticmethod
+    def _round_weight(weight):
+        """Rounds a weight to the nearest plate increment."""
+        steps = (weight / WEIGHT_STEP).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        return max(steps, 1) * WEIGHT_STEP
+
+    def _load_lookups(self):
+        """Reads the seeded reference data the dataset builds on.
+
+        Raises:
+            LookupError: If a required lookup table has not been seeded.
+        """
+
+        def by_code(model):
+            rows = {row.code: row for row in model.objects.order_by("code")}
+            if not rows:
+                raise LookupError(f"No {model.__name__} rows; run seed_db first.")
+            return rows
+
+        self.goals = list(by_code(TrainingGoal).values())
+        self.levels = list(by_code(ExperienceLevel).values())
+        self.phase_options = list(by_code(ProgramPhaseOption).values())
+        self.program_statuses = by_code(ProgramStatusOption)
+        self.phase_statuses = by_code(ProgramPhaseStatusOption)
+        self.active_membership = by_code(MembershipStatus).get(
+            MembershipVocabulary.ACTIVE
+        )
+        self.exercise_ids = list(
+            Exercise.objects.order_by("exercise_name").values_list("pk", flat=True)
+        )
+        if not self.exercise_ids or self.active_membership is None:
+            raise LookupError("Exercises are not seeded; run seed_db first.")
+
+    def generate(self):
+        """Generates and writes the whole dataset.
+
+        Returns:
+            dict: Rows written per model label.
+
+        Raises:
+            LookupError: If the reference data has not been seeded.
+        """
+        self._load_lookups()
+        password = make_password(self.password)
+        joined = self._at(self.start_date - timedelta(days=14))
+
+        for t in range(self.trainers):
+            trainer = self._new(
+                User,
+                joined,
+                email=self.email("trainer", t),
+                password=password,
+                first_name="Trainer",
+                last_name=f"{self.seed}-{t}",
+                is_trainer=True,
+                is_active=True,
+            )
+            profile = self._new(
+                TrainerProfile, joined, user=trainer, company=f"Load Test Gym {t}"
+            )
+            self.writer.add(trainer)
+            self.writer.add(profile)
+            for goal in self.goals:
+                self.writer.add(
+                    TrainerProfile.accepted_goals.through(
+                        trainerprofile_id=profile.pk, traininggoal_id=goal.pk
+                    )
+                )
+            for level in self.levels:
+                self.writer.add(
+                    TrainerProfile.accepted_levels.through(
+                        trainerprofile_id=profile.pk, experiencelevel_id=level.pk
+                    )
+                )
+
+            for c in range(self.clients_per_trainer):
+                index = t * self.clients_per_trainer + c
+                self._client(index, trainer, profile, password)
+
+        self.writer.flush()
+        return self.counts
+
+    def _client(self, index, trainer, trainer_profile, password):
+        """Generates one client, their membership and program history."""
+        rng = self.rng
+        offset = timedelta(days=rng.randrange(7))
+        joined = self._at(self.start_date - timedelta(days=7) + offset)
+        goal = rng.choice(self.goals)
+        level = rng.choice(self.levels)
+
+        user = self._new(
+            User,
+            joined,
+            email=self.email("client", index),
+            password=password,
+            first_name="Client",
+            last_name=f"{self.seed}-{index}",
+            is_client=True,
+            is_active=True,
+        )
+        profile = self._new(ClientProfile, joined, user=user, goal=goal, level=level)
+        membership = self._new(
+            TrainerClientMembership,
+            joined,
+            trainer=trainer_profile,
+            client=profile,
+            status=self.active_membership,
+            requested_at=joined,
+            responded_at=joined,
+            started_at=joined,
+            is_active=True,
+        )
+        self.writer.add(user)
+        self.writer.add(profile)
+        self.writer.add(membership)
+
+        cap = level.progression_cap_percent or DEFAULT_WEEKLY_PROGRESSION
+        history = {
+            "client": user,
+            "trainer": trainer,
+            "membership": membership,
+            "goal": goal,
+            "level": level,
+            "weekly_rate": cap * Decimal(rng.randint(50, 100)) / 100,
+            # Working weight and the plateau it levels off at, per exercise.
+            "weights": {},
+            "ceilings": {},
+        }
+        for number in range(self.programs):
+            start = self.start_date + offset + timedelta(weeks=number * self.weeks)
+            self._program(number, start, history)
+
+    def _routine(self, goal, history):
+        """Picks the exercises and rep targets of each weekly session slot.
+
+        Returns:
+            list[list[tuple]]: (exercise id, reps) pairs per session slot.
+        """
+        rng = self.rng
+        rep_min, rep_max = DEFAULT_REP_RANGE
+        if goal.rep_range_min and goal.rep_range_max:
+            rep_min, rep_max = goal.rep_range_min, goal.rep_range_max
+        per_session = min(self.exercises_per_session, len(self.exercise_ids))
+        routine = [
+            [
+                (exercise_id, rng.randint(rep_min, rep_max))
+                for exercise_id in rng.sample(self.exercise_ids, per_session)
+            ]
+            for _ in range(self.sessions_per_week)
+        ]
+        for slot in routine:
+            for exercise_id, _ in slot:
+                if exercise_id not in history["weights"]:
+                    start = self._round_weight(Decimal(rng.randint(16, 80) * 5) / 4)
+                    history["weights"][exercise_id] = start
+                    history["ceilings"][exercise_id] = start * 2
+        return routine
+
+    def _program(self, number, start, history):
+        """Generates one program with its phases, workouts and history."""
+        end = start + timedelta(weeks=self.weeks)
+        finished = end <= self.cutoff
+        program = self._new(
+            Program,
+            self._at(start - timedelta(days=4)),
+            program_name=f"Load Test Block {number + 1}",
+            trainer_client_membership=history["membership"],
+            training_goal=history["goal"],
+            experience_level=history["level"],
+            status=self.program_statuses[
+                (
+                    ProgramStatusesVocabulary.COMPLETED
+                    if finished
+                    else ProgramStatusesVocabulary.IN_PROGRESS
+                )
+            ],
+            created_by_trainer=history["trainer"],
+            submitted_for_review_at=self._at(start - timedelta(days=3)),
+            reviewed_at=self._at(start - timedelta(days=2)),
+            started_at=self._at(start, -60),
+            completed_at=self._at(end - timedelta(days=1), 180) if finished else None,
+        )
+        self.writer.add(program)
+
+        # Each weekly session slot keeps its exercises and rep targets for
+        # the whole program.
+        routine = self._routine(history["goal"], history)
+        exercise_ids = {exercise_id for slot in routine for exercise_id, _ in slot}
+        days = self.session_days(self.sessions_per_week)
+        next_assigned = False
+
+        for index, first_week in enumerate(range(0, self.weeks, PHASE_WEEKS)):
+            weeks = min(PHASE_WEEKS, self.weeks - first_week)
+            phase_start = start + timedelta(weeks=first_week)
+            status, next_assigned = self._phase_status(
+                phase_start, phase_start + timedelta(weeks=weeks), next_assigned
+            )
+            phase = self._phase(index, program, status, phase_start, weeks)
+            self.writer.add(phase)
+
+            for week in range(weeks):
+                week_start = phase_start + timedelta(weeks=week)
+                deload = week == PHASE_WEEKS - 1
+                for slot_index, day in enumerate(days):
+                    name = f"Session {chr(65 + slot_index)}"
+                    self._workout(
+                        phase,
+                        week_start + timedelta(days=day),
+                        f"{name} — Week {first_week + week + 1}",
+                        routine[slot_index],
+                        history,
+                        deload,
+                    )
+                if deload:
+                    continue
+                for exercise_id in exercise_ids:
+                    history["weights"][exercise_id] = min(
+                        self._round_weight(
+                            history["weights"][exercise_id]
+                            * (1 + history["weekly_rate"])
+                        ),
+                        history["ceilings"][exercise_id],
+                    )
+
+    def _phase_status(self, start, end, next_assigned):
+        """Derives a phase status from its dates relative to the cut-off."""
+        if end <= self.cutoff:
+            return ProgramPhaseStatusesVocabulary.COMPLETED, next_assigned
+        if start <= self.cutoff:
+            return ProgramPhaseStatusesVocabulary.ACTIVE, next_assigned
+        if not next_assigned:
+            return ProgramPhaseStatusesVocabulary.NEXT, True
+        return ProgramPhaseStatusesVocabulary.PLANNED, True
+
+    def _phase(self, index, program, status, start, weeks):
+        """Builds one phase with the timestamps its status requires."""
+        end = start + timedelta(weeks=weeks)
+        option = self.phase_options[index % len(self.phase_options)]
+        begun = status in {
+            ProgramPhaseStatusesVocabulary.ACTIVE,
+            ProgramPhaseStatusesVocabulary.COMPLETED,
+        }
+        completed = status == ProgramPhaseStatusesVocabulary.COMPLETED
+        return self._new(
+            ProgramPhase,
+            program.created_at,
+            phase_option=option,
+            phase_name=f"{option.label} {index + 1}",
+            phase_goal=f"Progress the main lifts through {option.label.lower()}.",
+            program=program,
+            sequence_order=index + 1,
+            status=self.phase_statuses[status],
+            planned_start_date=start,
+            planned_end_date=end,
+            actual_start_date=start if begun else None,
+            actual_end_date=end - timedelta(days=1) if completed else None,
+            started_at=self._at(start, -60) if begun else None,
+            completed_at=self._at(end - timedelta(days=1), 180) if completed else None,
+            created_by_trainer=program.created_by_trainer,
+        )
+
+    def _workout(self, phase, day, name, slot, history, deload):
+        """Generates one workout and, when it is in the past, its history.
+
+        Rows are added parents first once complete, so a flush never writes
+        a child before its parent or a record before its final timestamps.
+        """
+        rng = self.rng
+        rows = []
+        workout = self._new(
+            Workout,
+            phase.created_at,
+            workout_name=name,
+            planned_date=day,
+            program_phase_id=phase.pk,
+        )
+        rows.append(workout)
+
+        prescriptions = []
+        for order, (exercise_id, reps) in enumerate(slot, start=1):
+            weight = history["weights"][exercise_id]
+            if deload:
+                weight = self._round_weight(weight * DELOAD_FACTOR)
+            exercise = self._new(
+                WorkoutExercise,
+                phase.created_at,
+                exercise_id=exercise_id,
+                workout_id=workout.pk,
+                order=order,
+                sets_prescribed=self.sets_per_exercise,
+            )
+            sets = [
+                self._new(
+                    WorkoutSet,
+                    phase.created_at,
+                    workout_exercise_id=exercise.pk,
+                    set_order=set_order,
+                    reps_prescribed=reps,
+                    weight_prescribed=weight,
+                )
+                for set_order in range(1, self.sets_per_exercise + 1)
+            ]
+            rows.append(exercise)
+            rows.extend(sets)
+            prescriptions.append((exercise, sets))
+
+        # Future sessions, and sessions the client never opened, have no
+        # records.
+        if day < self.cutoff and rng.random() >= self.skip_rate / 2:
+            rows.extend(
+                self._session_history(workout, history["client"], prescriptions)
+            )
+
+        for row in rows:
+            self.writer.add(row)
+
+    def _session_history(self, workout, client, prescriptions):
+        """Generates the completion records of one past session.
+
+        Returns:
+            list: The session record followed by its exercise and set records.
+        """
+        rng = self.rng
+        started = self._at(workout.planned_date, rng.randint(-30, 90))
+        session = self._new(
+            WorkoutCompletionRecord,
+            started,
+            workout_id=workout.pk,
+            client_id=client.pk,
+            started_at=started,
+        )
+        if rng.random() < self.skip_rate:
+            session.is_skipped = True
+            session.completed_at = started
+            return [session]
+
+        rows = [session]
+        clock = started
+        for exercise, sets in prescriptions:
+            clock += timedelta(minutes=2)
+            record = self._new(
+                WorkoutExerciseCompletionRecord,
+                clock,
+                workout_completion_record_id=session.pk,
+                workout_exercise_id=exercise.pk,
+                started_at=clock,
+            )
+            rows.append(record)
+            if rng.random() < self.skip_rate / 2:
+                record.is_skipped = True
+                record.completed_at = clock
+                continue
+
+            # A bad day lowers the load on every set of the exercise.
+            load = Decimal("0.95") if rng.random() < 0.1 else Decimal("1")
+            for workout_set in sets:
+                clock += timedelta(minutes=rng.randint(2, 4))
+                rows.append(self._set_record(record, workout_set, clock, load))
+            clock += timedelta(minutes=1)
+            record.completed_at = record.updated_at = clock
+
+        session.completed_at = session.updated_at = clock + timedelta(minutes=5)
+        return rows
+
+    def _set_record(self, record, workout_set, completed_at, load):
+        """Generates the completion record of one set, occasionally skipped."""
+        rng = self.rng
+        fields = {"is_skipped": True}
+        if rng.random() >= self.skip_rate / 3:
+            reserve = rng.choice((0, 1, 1, 2, 2, 3))
+            fields = {
+                "reps_completed": max(
+                    1, workout_set.reps_prescribed + rng.choice((-2, -1, 0, 0, 1))
+                ),
+                "weight_completed": self._round_weight(
+                    workout_set.weight_prescribed * load
+                ),
+                "reps_in_reserve": reserve,
+                "difficulty_rating": 10 - reserve + rng.choice((-1, 0)),
+            }
+        return self._new(
+            WorkoutSetCompletionRecord,
+            completed_at,
+            exercise_completion_record_id=record.pk,
+            workout_set_id=workout_set.pk,
+            completed_at=completed_at,
+            **fields,
+        )
@@ -0,0 +1,124 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.workouts.models import WorkoutSetCompletionRecord
+from core.caching import (
+    get_tag_versions,
+    model_cache_tags,
+    schedule_tag_invalidation,
+)
+from core.constants import CacheTagVocabulary
+
+pytestmark = pytest.mark.django_db
+
+PROGRAMS_URL = reverse("programs-list")
+ROSTER_URL = reverse("trainer-roster")
+
+
+def program_names(response):
+    return [program["program_name"] for program in response.data["results"]]
+
+
+class TestTagInvalidation:
+
+    def test_workout_models_invalidate_the_workouts_tag(self):
+        assert model_cache_tags(WorkoutSetCompletionRecord) == (
+            CacheTagVocabulary.WORKOUTS,
+        )
+
+    def test_invalidates_again_on_commit(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            before = get_tag_versions([CacheTagVocabulary.PROGRAMS])
+            schedule_tag_invalidation(CacheTagVocabulary.PROGRAMS)
+            immediate = get_tag_versions([CacheTagVocabulary.PROGRAMS])
+
+        callbacks[0]()
+
+        assert (
+            len({*before, *immediate, *get_tag_versions([CacheTagVocabulary.PROGRAMS])})
+            == 3
+        )
+
+
+class TestCachedResponses:
+
+    def test_repeated_reads_skip_the_database(
+        self, trainer_api_client, active_phase, django_assert_num_queries
+    ):
+        first = trainer_api_client.get(PROGRAMS_URL, {"page": 1, "ordering": "id"})
+
+        with django_assert_num_queries(0):
+            second = trainer_api_client.get(PROGRAMS_URL, {"ordering": "id", "page": 1})
+
+        assert second.data == first.data
+
+    def test_model_writes_invalidate_cached_reads(
+        self, trainer_api_client, active_phase
+    ):
+        program = active_phase.program
+        trainer_api_client.get(PROGRAMS_URL)
+
+        program.program_name = "Renamed Block"
+        program.save(update_fields=["program_name"])
+
+        assert program_names(trainer_api_client.get(PROGRAMS_URL)) == ["Renamed Block"]
+
+    def test_responses_are_cached_per_user(
+        self, api_client, trainer_user, other_trainer_user, active_phase
+    ):
+        api_client.force_authenticate(user=trainer_user)
+        assert len(program_names(api_client.get(PROGRAMS_URL))) == 1
+
+        api_client.force_authenticate(user=other_trainer_user)
+        assert program_names(api_client.get(PROGRAMS_URL)) == []
+
+    def test_writes_only_invalidate_the_owners_cached_reads(
+        self,
+        api_client,
+        trainer_user,
+        other_trainer_user,
+        active_phase,
+        django_assert_num_queries,
+    ):
+        api_client.force_authenticate(user=other_trainer_user)
+        api_client.get(PROGRAMS_URL)
+
+        active_phase.program.program_name = "Renamed Block"
+        active_phase.program.save(update_fields=["program_name"])
+
+        with django_assert_num_queries(0):
+            api_client.get(PROGRAMS_URL)
+        api_client.force_authenticate(user=trainer_user)
+        assert program_names(api_client.get(PROGRAMS_URL)) == ["Renamed Block"]
+
+    def test_completions_invalidate_analytics_views(
+        self, trainer_api_client, workout, client_user
+    ):
+        before = trainer_api_client.get(ROSTER_URL).data
+        baker.make(
+            "workouts.WorkoutCompletionRecord",
+            workout=workout,
+            client=client_user,
+            started_at=timezone.now(),
+            completed_at=timezone.now(),
+        )
+
+        after = trainer_api_client.get(ROSTER_URL).data
+
+        assert after != before
+
+    def test_disabled_cache_always_reads_the_database(
+        self, trainer_api_client, active_phase, settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        trainer_api_client.get(PROGRAMS_URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = trainer_api_client.get(PROGRAMS_URL)
+
+        assert response.status_code == 200
+        assert len(queries) > 0
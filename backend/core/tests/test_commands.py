@@ -0,0 +1,82 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from rest_framework.pagination import PageNumberPagination
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBenchmarkPrimaryKeys:
+
+    def test_reports_each_key_kind_and_drops_tables(self, capsys):
+        call_command("benchmark_primary_keys", rows=500, batch_size=200)
+
+        output = capsys.readouterr().out
+        assert "uuid4: 500 rows" in output
+        assert "uuid7: 500 rows" in output
+        tables = connection.introspection.table_names()
+        assert not [name for name in tables if name.startswith("pk_benchmark_")]
+
+    def test_rejects_empty_runs(self):
+        with pytest.raises(CommandError):
+            call_command("benchmark_primary_keys", rows=0)
+
+
+class TestBenchmarkDbPool:
+
+    def test_reports_each_connection_mode(self, capsys):
+        call_command("benchmark_db_pool", threads=4, requests=20, work_ms=0)
+
+        output = capsys.readouterr().out
+        assert "persistent: 20 requests" in output
+        assert "per-request: 20 requests" in output
+        # Pooling needs PostgreSQL; the test database is SQLite.
+        assert "pool: " in output
+
+    def test_rejects_empty_runs(self):
+        with pytest.raises(CommandError):
+            call_command("benchmark_db_pool", threads=0)
+
+
+class TestMaintainPartitions:
+
+    def test_skips_tables_outside_postgres(self, capsys):
+        call_command("maintain_partitions")
+
+        output = capsys.readouterr().out
+        # The test database is SQLite.
+        assert "workouts_workoutsetcompletionrecord: skipped" in output
+        assert "analytics_exercisesessionsnapshot: skipped" in output
+
+    def test_rejects_negative_months_ahead(self):
+        with pytest.raises(CommandError):
+            call_command("maintain_partitions", months_ahead=-1)
+
+
+class TestBenchmarkJsonRendering:
+
+    def test_reports_each_endpoint_with_identical_output(
+        self, capsys, active_phase, trainer_user
+    ):
+        call_command("benchmark_json_rendering", email=trainer_user.email, iterations=2)
+
+        output = capsys.readouterr().out
+        for endpoint in ("programs", "workout-sessions", "roster", "adherence"):
+            assert f"{endpoint}: " in output
+        assert "differs" not in output
+
+    def test_paginated_links_use_an_allowed_host(
+        self, capsys, active_phase, completed_phase, trainer_user, settings, monkeypatch
+    ):
+        # The test runner allows "testserver", which the command must not need.
+        settings.ALLOWED_HOSTS = ["localhost"]
+        monkeypatch.setattr(PageNumberPagination, "page_size", 1)
+
+        call_command("benchmark_json_rendering", email=trainer_user.email, iterations=1)
+
+        assert "programs: " in capsys.readouterr().out
+
+    def test_requires_a_trainer(self):
+        with pytest.raises(CommandError, match="No trainer"):
+            call_command("benchmark_json_rendering")
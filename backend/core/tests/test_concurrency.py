@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from core.concurrency import gather_reads
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+
+def thread_id():
+    return threading.get_ident()
+
+
+class TestGatherReads:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_reads_run_concurrently_outside_transactions(self):
+        # Each read waits for the other, so serial reads would time out.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def count_users():
+            barrier.wait()
+            return User.objects.count()
+
+        assert async_to_sync(gather_reads)(count_users, count_users) == [0, 0]
+
+    def test_reads_share_the_request_thread_inside_a_transaction(self):
+        results = async_to_sync(gather_reads)(thread_id, thread_id)
+
+        assert results == [threading.get_ident()] * 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_disabled_setting_runs_reads_in_order(self, settings):
+        settings.CONCURRENT_DB_READS = False
+
+        results = async_to_sync(gather_reads)(thread_id, thread_id)
+
+        assert results == [threading.get_ident()] * 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_raises_the_first_error_in_argument_order(self):
+        def missing():
+            raise NotFound("Program not found.")
+
+        def denied():
+            raise PermissionDenied("Not your client.")
+
+        with pytest.raises(NotFound):
+            async_to_sync(gather_reads)(missing, denied)
@@ -0,0 +1,147 @@
+import json
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+from apps.users.services.membership import MembershipService
+from apps.workouts.services.completions import WorkoutCompletionService
+from core.metrics import SERVICE_LATENCY, Registry, registry, timed
+
+pytestmark = pytest.mark.django_db
+
+METRICS_URL = reverse("metrics")
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(settings):
+    settings.METRICS_DIR = ""
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestRegistry:
+
+    def test_renders_cumulative_buckets(self):
+        local = Registry()
+        histogram = local.histogram("test_seconds", "Test.", ["name"], [0.1, 1])
+        for value in (0.05, 0.5, 5):
+            local.observe(histogram, value, ("a",))
+
+        output = local.render()
+
+        assert "# TYPE test_seconds histogram" in output
+        assert 'test_seconds_bucket{name="a",le="0.1"} 1' in output
+        assert 'test_seconds_bucket{name="a",le="1.0"} 2' in output
+        assert 'test_seconds_bucket{name="a",le="+Inf"} 3' in output
+        assert 'test_seconds_count{name="a"} 3' in output
+        assert 'test_seconds_sum{name="a"} 5.55' in output
+
+    def test_sums_every_worker_in_the_shared_directory(self, settings, tmp_path):
+        settings.METRICS_DIR = str(tmp_path)
+        counts = [0] * (len(SERVICE_LATENCY.buckets) + 1)
+        counts[0] = 4
+        other_worker = {
+            SERVICE_LATENCY.name: [
+                [["Svc", "op", "ok"], {"counts": counts, "sum": 0.01}],
+            ]
+        }
+        (tmp_path / "99999.json").write_text(json.dumps(other_worker))
+        SERVICE_LATENCY.observe(0.001, service="Svc", operation="op", outcome="ok")
+
+        output = registry.render()
+
+        assert (
+            'apex_service_duration_seconds_count{service="Svc",operation="op",'
+            'outcome="ok"} 5' in output
+        )
+
+    def test_a_due_flush_is_claimed_once(self, settings):
+        settings.METRICS_FLUSH_SECONDS = 60
+        local = Registry()
+
+        assert local.flush_due() is True
+        assert local.flush_due() is False
+
+
+class TestServiceTimings:
+
+    def test_timed_records_outcome(self):
+        @timed("Demo")
+        def fail():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            fail()
+
+        output = registry.render()
+        assert 'service="Demo",operation="fail",outcome="error"' in output
+
+    def test_service_classes_are_instrumented(self, client_user):
+        assert hasattr(WorkoutCompletionService.start_workout, "__wrapped__")
+
+        with pytest.raises(ValidationError):
+            MembershipService.request(client_user, client_user)
+
+        output = registry.render()
+        assert 'service="MembershipService",operation="request"' in output
+
+
+class TestMetricsEndpoint:
+
+    def test_records_requests_by_view_and_action(self, trainer_api_client):
+        trainer_api_client.get(reverse("programs-list"))
+
+        response = trainer_api_client.get(METRICS_URL)
+
+        body = response.content.decode()
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'apex_http_request_duration_seconds_count{view="ProgramViewSet",'
+            'action="list",method="GET",status="200"} 1' in body
+        )
+        assert 'apex_http_request_db_queries_count{view="ProgramViewSet"' in body
+        assert 'view="metrics_view"' not in body
+
+    @pytest.mark.django_db(transaction=True)
+    def test_counts_queries_of_concurrent_reads(
+        self, trainer_api_client, active_phase, exercise, settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        url = reverse(
+            "next-session-recommendation",
+            kwargs={"program_id": active_phase.program.id, "exercise_id": exercise.id},
+        )
+
+        response = trainer_api_client.get(url)
+
+        # Program, exercise and snapshot, each read on its own thread.
+        assert response.status_code == 204
+        assert (
+            'apex_http_request_db_queries_sum{view="NextSessionRecommendationView",'
+            'action="get"} 3' in registry.render()
+        )
+
+    def test_requires_the_token_when_configured(self, api_client, settings):
+        settings.METRICS_TOKEN = "scrape-secret"
+
+        denied = api_client.get(METRICS_URL)
+        allowed = api_client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer scrape-secret")
+
+        assert denied.status_code == 403
+        assert allowed.status_code == 200
+
+    def test_production_requires_a_token(self, api_client, settings):
+        settings.IS_PROD = True
+        settings.METRICS_TOKEN = ""
+
+        response = api_client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer ")
+
+        assert response.status_code == 403
+
+    def test_disabled_metrics_are_not_served(self, api_client, settings):
+        settings.METRICS_ENABLED = False
+
+        assert api_client.get(METRICS_URL).status_code == 404
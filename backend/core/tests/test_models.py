@@ -5,7 +5,7 @@ from django.db import models
 from django.test import TestCase
 from model_bakery import baker
 
-from core.models import ApexModel, NormalisedLookupModel
+from core.models import ApexModel, NormalisedLookupModel, uuid7
 
 
 class DummyModel(ApexModel):
@@ -43,6 +43,15 @@ class TestApexModel(TestCase):
 
         self.assertNotEqual(obj.updated_at, original_time)
 
+    def test_primary_keys_are_time_ordered(self):
+        """New rows get version 7 keys that sort in creation order."""
+
+        first = DummyModel.objects.create(name="First")
+        second = DummyModel.objects.create(name="Second")
+
+        self.assertEqual(first.id.version, 7)
+        self.assertLess(first.id, second.id)
+
 
 class DummyLookupModel(NormalisedLookupModel):
     class Meta:
@@ -67,3 +76,34 @@ class TestNormalisationModel:
         assert obj.order_index == 1
         assert obj.description == "Test Description"
         assert str(obj) == "Active"
+
+
+class TestUuid7:
+    def test_layout_follows_rfc_9562(self):
+        """The version and variant bits identify a version 7 UUID"""
+
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_the_current_unix_milliseconds(self, monkeypatch):
+        """The first 48 bits hold the generation time in milliseconds"""
+
+        monkeypatch.setattr("core.models._uuid7_state", {"ms": 0, "counter": 0})
+        monkeypatch.setattr(
+            "core.models.time.time_ns", lambda: 1_767_225_600_000 * 1_000_000
+        )
+
+        assert uuid7().int >> 80 == 1_767_225_600_000
+
+    def test_keys_are_strictly_increasing_within_a_millisecond(self, monkeypatch):
+        """Keys generated in the same millisecond still sort in order"""
+
+        monkeypatch.setattr("core.models._uuid7_state", {"ms": 0, "counter": 0})
+        monkeypatch.setattr("core.models.time.time_ns", lambda: 10**18)
+
+        keys = [uuid7() for _ in range(5000)]
+
+        assert keys == sorted(keys)
+        assert len(set(keys)) == len(keys)
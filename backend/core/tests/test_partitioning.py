@@ -0,0 +1,97 @@
+import datetime
+
+import pytest
+from django.db import connection
+
+from apps.analytics.models import ExerciseSessionSnapshot
+from apps.workouts.models import (
+    WorkoutExerciseCompletionRecord,
+    WorkoutSetCompletionRecord,
+)
+from core.partitioning import (
+    PARTITION_BOUND_SLACK,
+    add_months,
+    is_partitioned,
+    month_start,
+    not_before,
+    partition_column,
+    partition_name,
+    partition_table,
+    unpartition_table,
+)
+
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Partitioning needs PostgreSQL."
+)
+
+
+class TestMonths:
+
+    def test_month_start_uses_the_utc_month(self):
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+        value = datetime.datetime(2026, 10, 31, 22, 0, tzinfo=eastern)
+
+        assert month_start(value) == datetime.date(2026, 11, 1)
+
+    def test_add_months_crosses_years(self):
+        assert add_months(datetime.date(2026, 11, 1), 3) == datetime.date(2027, 2, 1)
+        assert add_months(datetime.date(2026, 1, 1), -1) == datetime.date(2025, 12, 1)
+
+    def test_not_before_allows_for_clock_differences(self):
+        value = datetime.datetime(2026, 10, 1, tzinfo=datetime.UTC)
+
+        assert not_before(value) == value - PARTITION_BOUND_SLACK
+
+    def test_partition_names_sort_by_month(self):
+        names = [
+            partition_name("records", datetime.date(2026, month, 1))
+            for month in (9, 10, 11)
+        ]
+
+        assert names == sorted(names)
+        assert names[0] == "records_p202609"
+
+
+class TestPartitionTable:
+
+    def test_partition_columns(self):
+        assert partition_column(WorkoutSetCompletionRecord) == "created_at"
+        assert partition_column(ExerciseSessionSnapshot) == "computed_at"
+
+    # The SQLite schema editor cannot run inside the test transaction.
+    @pytest.mark.django_db(transaction=True)
+    def test_leaves_tables_alone_outside_postgres(self):
+        table = ExerciseSessionSnapshot._meta.db_table
+
+        with connection.schema_editor() as schema_editor:
+            partition_table(schema_editor, ExerciseSessionSnapshot, 3)
+
+        assert table in connection.introspection.table_names()
+        assert partition_name(table, month_start(datetime.date.today())) not in (
+            connection.introspection.table_names()
+        )
+
+    @postgres_only
+    @pytest.mark.django_db(transaction=True)
+    def test_round_trip_keeps_rows_and_restores_foreign_keys(self, settings):
+        settings.PARTITIONING_ENABLED = True
+        models = [WorkoutExerciseCompletionRecord, WorkoutSetCompletionRecord]
+        sets = WorkoutSetCompletionRecord._meta.db_table
+
+        with connection.schema_editor() as schema_editor:
+            for model in models:
+                partition_table(schema_editor, model, 3)
+        assert all(is_partitioned(connection, m._meta.db_table) for m in models)
+
+        with connection.schema_editor() as schema_editor:
+            for model in reversed(models):
+                unpartition_table(schema_editor, model)
+        assert not any(is_partitioned(connection, m._meta.db_table) for m in models)
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, sets)
+        assert any(
+            constraint["foreign_key"]
+            == (WorkoutExerciseCompletionRecord._meta.db_table, "id")
+            for constraint in constraints.values()
+        )
@@ -0,0 +1,125 @@
+import marshal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+
+from apps.users.serializers import ApexTokenObtainPairSerializer
+from core.models import RequestProfile
+from core.profiling import PROFILE_ID_HEADER
+
+pytestmark = pytest.mark.django_db
+
+PROGRAMS_URL = reverse("programs-list")
+
+
+@pytest.fixture(autouse=True)
+def profiler_dir(settings, tmp_path):
+    settings.PROFILER_DIR = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def staff_api_client(api_client, trainer_user):
+    trainer_user.is_staff = True
+    trainer_user.save()
+    token = ApexTokenObtainPairSerializer.get_token(trainer_user).access_token
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return api_client
+
+
+class TestProfilerMiddleware:
+
+    def test_staff_header_captures_a_profile(self, staff_api_client, profiler_dir):
+        response = staff_api_client.get(PROGRAMS_URL, HTTP_X_APEX_PROFILE="1")
+
+        capture = RequestProfile.objects.get()
+        assert response.status_code == 200
+        assert response[PROFILE_ID_HEADER] == str(capture.pk)
+        assert capture.view_name == "ProgramViewSet.list"
+        assert capture.query_count == len(capture.sql_timeline) > 0
+        assert "list" in capture.call_tree
+        stats = marshal.loads((profiler_dir / capture.stats_file.name).read_bytes())
+        assert stats
+
+    def test_query_flag_triggers_a_profile(self, staff_api_client):
+        response = staff_api_client.get(PROGRAMS_URL, {"_profile": "1"})
+
+        assert PROFILE_ID_HEADER in response
+        assert RequestProfile.objects.get().query_string == "_profile=1"
+
+    def test_untriggered_requests_are_not_profiled(self, staff_api_client):
+        response = staff_api_client.get(PROGRAMS_URL, {"profiled": "no"})
+
+        assert PROFILE_ID_HEADER not in response
+        assert not RequestProfile.objects.exists()
+
+    def test_non_staff_users_cannot_trigger_a_profile(self, api_client, client_user):
+        token = ApexTokenObtainPairSerializer.get_token(client_user).access_token
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = api_client.get(PROGRAMS_URL, HTTP_X_APEX_PROFILE="1")
+
+        assert response.status_code == 200
+        assert PROFILE_ID_HEADER not in response
+        assert not RequestProfile.objects.exists()
+
+    def test_keeps_only_the_newest_captures(
+        self, staff_api_client, settings, profiler_dir
+    ):
+        settings.PROFILER_MAX_CAPTURES = 2
+        for _ in range(3):
+            staff_api_client.get(PROGRAMS_URL, HTTP_X_APEX_PROFILE="1")
+
+        assert RequestProfile.objects.count() == 2
+        assert len(list(profiler_dir.glob("*.prof"))) == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_async_views_are_profiled_on_their_loop(
+        self, settings, trainer_user, active_phase, exercise
+    ):
+        settings.API_CACHE_ENABLED = False
+        trainer_user.is_staff = True
+        trainer_user.save()
+        token = ApexTokenObtainPairSerializer.get_token(trainer_user).access_token
+        url = reverse(
+            "next-session-recommendation",
+            kwargs={"program_id": active_phase.program.id, "exercise_id": exercise.id},
+        )
+
+        response = async_to_sync(AsyncClient().get)(
+            url, headers={"Authorization": f"Bearer {token}", "X-Apex-Profile": "1"}
+        )
+
+        capture = RequestProfile.objects.get()
+        assert response.status_code == 204
+        assert response[PROFILE_ID_HEADER] == str(capture.pk)
+        assert capture.view_name == "NextSessionRecommendationView.get"
+        # Program, exercise and snapshot, each read on its own thread.
+        assert capture.query_count == len(capture.sql_timeline) >= 3
+        assert "get (apps/analytics/views.py" in capture.call_tree
+        assert "_get_program_for_trainer" in capture.call_tree
+
+
+class TestRequestProfileAdmin:
+
+    def test_shows_and_downloads_a_capture(self, client, staff_api_client):
+        staff_api_client.get(PROGRAMS_URL, HTTP_X_APEX_PROFILE="1")
+        capture = RequestProfile.objects.get()
+        superuser = capture.user
+        superuser.is_superuser = True
+        superuser.save()
+        client.force_login(superuser)
+
+        change = client.get(
+            reverse("admin:core_requestprofile_change", args=[capture.pk])
+        )
+        download = client.get(
+            reverse("admin:core_requestprofile_stats", args=[capture.pk])
+        )
+
+        assert change.status_code == 200
+        assert "SQL timeline" in change.content.decode()
+        assert download.status_code == 200
+        assert b"".join(download.streaming_content)
@@ -0,0 +1,183 @@
+import gzip
+import json
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from apps.exercises.models import Equipment
+from core.reference_data import (
+    REFERENCE_BUNDLE_TABLES,
+    bump_reference_version,
+    get_reference_version,
+)
+from core.versioning import INITIAL_VERSION
+
+pytestmark = pytest.mark.django_db
+
+EQUIPMENT_URL = "/api/v1/exercises/equipment/"
+EXERCISES_URL = "/api/v1/exercises/exercises/"
+
+OTHER_PROCESS_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "other-process",
+    }
+}
+
+
+class TestReferenceDataCaching:
+
+    def test_lookup_response_carries_cache_headers(
+        self, api_client, dumbbell_equipment
+    ):
+        response = api_client.get(EQUIPMENT_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        assert response["Cache-Control"].startswith("public, max-age=")
+
+    def test_matching_etag_returns_not_modified(self, api_client, dumbbell_equipment):
+        etag = api_client.get(EQUIPMENT_URL)["ETag"]
+
+        response = api_client.get(EQUIPMENT_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_etag_differs_per_query(self, api_client, dumbbell_equipment):
+        plain = api_client.get(EQUIPMENT_URL)["ETag"]
+        searched = api_client.get(EQUIPMENT_URL, {"search": "dumb"})["ETag"]
+
+        assert plain != searched
+
+    def test_repeat_request_is_served_from_cache(
+        self, api_client, dumbbell_equipment, django_assert_num_queries
+    ):
+        first = api_client.get(EQUIPMENT_URL)
+
+        # Only the version stamp is read.
+        with django_assert_num_queries(1):
+            second = api_client.get(EQUIPMENT_URL)
+
+        assert second.data == first.data
+
+    def test_lookup_write_bumps_version_after_commit(
+        self, api_client, dumbbell_equipment, django_capture_on_commit_callbacks
+    ):
+        before = api_client.get(EQUIPMENT_URL)
+        version = get_reference_version()["version"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Equipment.objects.create(code="KETTLEBELL", label="Kettlebell")
+
+        after = api_client.get(EQUIPMENT_URL, HTTP_IF_NONE_MATCH=before["ETag"])
+
+        assert get_reference_version()["version"] != version
+        assert after.status_code == status.HTTP_200_OK
+        assert after["ETag"] != before["ETag"]
+        labels = [item["label"] for item in after.data["results"]]
+        assert "Kettlebell" in labels
+
+    def test_non_reference_write_keeps_version(
+        self, trainer_user, django_capture_on_commit_callbacks
+    ):
+        version = get_reference_version()["version"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            trainer_user.save()
+
+        assert get_reference_version()["version"] == version
+
+    def test_version_is_shared_beyond_the_local_cache(self):
+        assert get_reference_version()["version"] == INITIAL_VERSION
+
+        # A bump from another process, whose cache this one never sees.
+        with override_settings(CACHES=OTHER_PROCESS_CACHES):
+            stamp = bump_reference_version()
+
+        assert get_reference_version() == stamp
+        assert stamp["version"] != INITIAL_VERSION
+
+    def test_exercise_catalogue_is_cached(
+        self, api_client, dumbbell_bicep_curl_exercise
+    ):
+        etag = api_client.get(EXERCISES_URL)["ETag"]
+
+        response = api_client.get(EXERCISES_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_missing_detail_is_not_cached(self, api_client):
+        response = api_client.get(
+            f"{EQUIPMENT_URL}00000000-0000-0000-0000-000000000000/"
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "ETag" not in response
+
+
+class TestReferenceBundle:
+
+    def test_bundle_contains_every_lookup_table(self, api_client, dumbbell_equipment):
+        response = api_client.get(reverse("reference"))
+        payload = json.loads(response.content)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(REFERENCE_BUNDLE_TABLES) <= set(payload)
+        assert payload["hash"]
+        assert [item["label"] for item in payload["equipment"]] == ["Dumbbell"]
+        assert payload["program_statuses"]
+
+    def test_bundle_etag_is_content_hash(self, api_client):
+        response = api_client.get(reverse("reference"))
+
+        assert response["ETag"] == f'"{json.loads(response.content)["hash"]}"'
+
+    def test_bundle_is_compressed_for_gzip_clients(self, api_client):
+        plain = api_client.get(reverse("reference"))
+        compressed = api_client.get(reverse("reference"), HTTP_ACCEPT_ENCODING="gzip")
+
+        assert compressed["Content-Encoding"] == "gzip"
+        assert gzip.decompress(compressed.content) == plain.content
+        assert "Accept-Encoding" in compressed["Vary"]
+
+    def test_matching_etag_returns_not_modified(self, api_client):
+        etag = api_client.get(reverse("reference"))["ETag"]
+
+        response = api_client.get(reverse("reference"), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_bundle_is_served_from_cache_once_built(
+        self, api_client, django_assert_num_queries
+    ):
+        api_client.get(reverse("reference"))
+
+        # Only the version stamp is read.
+        with django_assert_num_queries(1):
+            api_client.get(reverse("reference"))
+
+    def test_bundle_rebuilds_when_lookups_change(
+        self, api_client, django_capture_on_commit_callbacks
+    ):
+        before = api_client.get(reverse("reference"))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Equipment.objects.create(code="KETTLEBELL", label="Kettlebell")
+
+        after = api_client.get(reverse("reference"))
+
+        assert after["ETag"] != before["ETag"]
+        assert "Kettlebell" in [
+            item["label"] for item in json.loads(after.content)["equipment"]
+        ]
+
+    def test_version_bump_without_changes_keeps_hash(self, api_client):
+        before = api_client.get(reverse("reference"))["ETag"]
+
+        bump_reference_version()
+
+        assert api_client.get(reverse("reference"))["ETag"] == before
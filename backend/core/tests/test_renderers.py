@@ -0,0 +1,126 @@
+import gzip
+import io
+import json
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+from rest_framework.views import APIView
+
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+pytestmark = pytest.mark.django_db
+
+PROGRAMS_URL = reverse("programs-list")
+
+PAYLOAD = {
+    "id": uuid.UUID("0192f0c4-1a2b-7c3d-8e4f-5a6b7c8d9e0f"),
+    "weight": Decimal("102.50"),
+    "completed_at": datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=UTC),
+    "planned_date": date(2026, 3, 1),
+    "label": gettext_lazy("Strength"),
+    "notes": "line separator",
+    "by_week": {1: [1.5, None, True], 2: ("a", "ü")},
+    "nested": ReturnDict({"sets": [{"reps": 5}]}, serializer=None),
+}
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    # Views read the renderer classes when they are defined, so
+    # API_FAST_JSON cannot be toggled per test.
+    monkeypatch.setattr(APIView, "renderer_classes", [FastJSONRenderer])
+
+
+class TestFastJSONRenderer:
+
+    def test_matches_drf_byte_for_byte(self):
+        assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_falls_back_for_integers_orjson_cannot_encode(self):
+        data = {"big": 2**70}
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    @pytest.mark.parametrize(
+        "value", [1e16, 1e-05, -2.5e22, 1.7976931348623157e308, 5e-324, 0.0, 0.0001]
+    )
+    def test_floats_parse_to_the_same_values(self, value):
+        data = {"value": value, "nested": [{"value": value}]}
+
+        assert json.loads(FastJSONRenderer().render(data)) == data
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_out_of_range_floats_become_null(self, value):
+        assert FastJSONRenderer().render({"value": value}) == b'{"value":null}'
+
+    def test_indented_output_matches_drf(self):
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(PAYLOAD, media_type) == (
+            JSONRenderer().render(PAYLOAD, media_type)
+        )
+
+    def test_api_responses_use_it_when_enabled(
+        self, trainer_api_client, active_phase, fast_json
+    ):
+        response = trainer_api_client.get(PROGRAMS_URL)
+
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        assert response.json()["count"] == 1
+
+
+class TestCompression:
+
+    def test_gzips_large_bodies_when_enabled(
+        self, trainer_api_client, active_phase, settings, fast_json
+    ):
+        settings.API_GZIP_ENABLED = True
+        settings.API_GZIP_MIN_BYTES = 10
+
+        response = trainer_api_client.get(PROGRAMS_URL, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert b'"count":1' in gzip.decompress(response.content)
+
+    def test_leaves_small_or_unaccepted_bodies_alone(
+        self, trainer_api_client, active_phase, settings, fast_json
+    ):
+        settings.API_GZIP_ENABLED = True
+        settings.API_GZIP_MIN_BYTES = 10**9
+
+        small = trainer_api_client.get(PROGRAMS_URL, HTTP_ACCEPT_ENCODING="gzip")
+        settings.API_GZIP_MIN_BYTES = 10
+        unaccepted = trainer_api_client.get(PROGRAMS_URL)
+
+        assert not small.has_header("Content-Encoding")
+        assert not unaccepted.has_header("Content-Encoding")
+
+
+class TestFastJSONParser:
+
+    def test_matches_drf(self):
+        body = JSONRenderer().render(PAYLOAD)
+
+        assert FastJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(
+            io.BytesIO(body)
+        )
+
+    def test_rejects_invalid_json(self, trainer_api_client):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"reps": NaN}'))
+
+        response = trainer_api_client.post(
+            PROGRAMS_URL, data="{", content_type="application/json"
+        )
+        assert response.status_code == 400
+        assert "JSON parse error" in response.json()["detail"]
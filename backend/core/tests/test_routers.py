@@ -0,0 +1,156 @@
+import uuid
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.caching import invalidate_tags
+from core.constants import CacheTagVocabulary
+from core.middleware import ReplicaRoutingMiddleware
+from core.routers import (
+    PrimaryReplicaRouter,
+    is_pinned_to_primary,
+    pin_to_primary,
+    primary_reads,
+    replica_reads,
+    routing_scope,
+)
+
+User = get_user_model()
+
+router = PrimaryReplicaRouter()
+
+
+@pytest.fixture
+def replica_enabled(settings):
+    settings.REPLICA_READS_ENABLED = True
+    return settings
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPrimaryReplicaRouter:
+
+    def test_reads_outside_replica_scopes_are_not_routed(self, replica_enabled):
+        assert router.db_for_read(User) is None
+
+    def test_replica_scope_reads_from_the_replica(self, replica_enabled):
+        with replica_reads():
+            assert router.db_for_read(User) == "replica"
+
+    def test_reads_after_a_write_use_the_primary(self, replica_enabled):
+        with replica_reads():
+            assert router.db_for_write(User) == "default"
+            assert router.db_for_read(User) == "default"
+
+        with replica_reads():
+            assert router.db_for_read(User) == "replica"
+
+    def test_primary_reads_override_a_replica_scope(self, replica_enabled):
+        with replica_reads(), primary_reads():
+            assert router.db_for_read(User) == "default"
+
+    def test_disabled_replica_reads_use_the_primary(self, settings):
+        settings.REPLICA_READS_ENABLED = False
+
+        with replica_reads():
+            assert router.db_for_read(User) == "default"
+
+    def test_reads_inside_transactions_use_the_primary(self, replica_enabled):
+        with transaction.atomic(), replica_reads():
+            assert router.db_for_read(User) == "default"
+
+    def test_writes_are_tracked_per_request(self, replica_enabled):
+        with routing_scope() as state:
+            state.replica_reads = True
+            with routing_scope():
+                router.db_for_write(User)
+
+            assert state.wrote is False
+            assert router.db_for_read(User) == "replica"
+
+    def test_replica_is_never_migrated(self):
+        assert router.allow_migrate("replica", "users") is False
+        assert router.allow_migrate("default", "users") is None
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestReplicaRoutedViews:
+
+    def test_safe_requests_read_from_the_replica(
+        self, trainer_api_client, replica_enabled
+    ):
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = trainer_api_client.get(reverse("programs-list"))
+
+        assert response.status_code == 200
+        assert len(replica) > 0
+
+    def test_async_views_read_from_the_replica(
+        self, trainer_api_client, replica_enabled
+    ):
+        # Serial reads run on this thread, where the capture can see them.
+        replica_enabled.CONCURRENT_DB_READS = False
+        url = reverse("exercise-load-history", args=[uuid.uuid4(), uuid.uuid4()])
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = trainer_api_client.get(url)
+
+        assert response.status_code == 404
+        assert len(replica) > 0
+
+    def test_views_without_the_mixin_read_from_the_primary(
+        self, trainer_api_client, replica_enabled
+    ):
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = trainer_api_client.get(reverse("workouts-list"))
+
+        assert response.status_code == 200
+        assert len(replica) == 0
+
+    def test_pinned_users_read_from_the_primary(
+        self, trainer_api_client, trainer_user, replica_enabled
+    ):
+        pin_to_primary(trainer_user.pk)
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = trainer_api_client.get(reverse("programs-list"))
+
+        assert response.status_code == 200
+        assert len(replica) == 0
+
+    def test_recently_invalidated_responses_fill_from_the_primary(
+        self, trainer_api_client, replica_enabled
+    ):
+        invalidate_tags(CacheTagVocabulary.PROGRAMS)
+
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = trainer_api_client.get(reverse("programs-list"))
+
+        assert response.status_code == 200
+        assert len(replica) == 0
+
+
+@pytest.mark.django_db
+class TestReplicaRoutingMiddleware:
+
+    def test_pins_users_who_wrote(self, trainer_user, replica_enabled):
+        def write(request):
+            request.user.save(update_fields=["last_login"])
+            return HttpResponse()
+
+        request = RequestFactory().post("/")
+        request.user = trainer_user
+        ReplicaRoutingMiddleware(write)(request)
+
+        assert is_pinned_to_primary(trainer_user)
+
+    def test_does_not_pin_readers(self, trainer_user, replica_enabled):
+        request = RequestFactory().get("/")
+        request.user = trainer_user
+        ReplicaRoutingMiddleware(lambda request: HttpResponse())(request)
+
+        assert not is_pinned_to_primary(trainer_user)
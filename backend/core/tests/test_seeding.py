@@ -0,0 +1,168 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.biology.models import MuscleInvolvement
+from apps.exercises.models import Exercise, JointContribution
+from apps.programs.models import ProgramStatusOption
+from apps.users.models import ExperienceLevel, TrainingGoal
+from core.seeding import BulkSeeder, resolve
+
+pytestmark = pytest.mark.django_db
+
+LEVELS = [
+    {"code": "SEED_NOVICE", "label": "Novice", "progression_cap_percent": "0.10"},
+    {"code": "SEED_EXPERT", "label": "Expert", "progression_cap_percent": "0.05"},
+]
+
+
+def upsert_levels(seeder, rows=LEVELS):
+    return seeder.upsert(
+        ExperienceLevel,
+        rows,
+        unique_fields=["code"],
+        update_fields=["label", "progression_cap_percent"],
+    )
+
+
+def count_writes(callback):
+    with CaptureQueriesContext(connection) as context:
+        callback()
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if not query["sql"].startswith(("SELECT", "SAVEPOINT", "RELEASE"))
+    ]
+
+
+class TestBulkSeeder:
+
+    def test_creates_missing_rows_and_returns_their_keys(self):
+        seeder = BulkSeeder()
+
+        pks = upsert_levels(seeder)
+
+        assert pks == dict(
+            ExperienceLevel.objects.filter(code__startswith="SEED_").values_list(
+                "code", "pk"
+            )
+        )
+        assert seeder.diffs["users.ExperienceLevel"]["created"] == [
+            "SEED_NOVICE",
+            "SEED_EXPERT",
+        ]
+
+    def test_unchanged_rows_cost_one_select_and_no_writes(self):
+        upsert_levels(BulkSeeder())
+        seeder = BulkSeeder()
+
+        with CaptureQueriesContext(connection) as context:
+            upsert_levels(seeder)
+
+        assert len(context.captured_queries) == 1
+        assert seeder.diffs["users.ExperienceLevel"]["unchanged"] == 2
+        assert not seeder.changed(ExperienceLevel)
+
+    def test_updates_only_changed_rows(self):
+        pks = upsert_levels(BulkSeeder())
+        seeder = BulkSeeder()
+        rows = [LEVELS[0], {**LEVELS[1], "label": "Elite"}]
+
+        writes = count_writes(lambda: upsert_levels(seeder, rows))
+
+        assert len(writes) == 1
+        assert seeder.diffs["users.ExperienceLevel"]["updated"] == ["SEED_EXPERT"]
+        expert = ExperienceLevel.objects.get(code="SEED_EXPERT")
+        assert expert.label == "Elite"
+        assert expert.pk == pks["SEED_EXPERT"]
+
+    def test_dry_run_reports_without_writing(self):
+        seeder = BulkSeeder(dry_run=True)
+
+        upsert_levels(seeder)
+
+        assert seeder.changed(ExperienceLevel)
+        assert not ExperienceLevel.objects.filter(code__startswith="SEED_").exists()
+        assert "users.ExperienceLevel: 2 created, 0 updated, 0 unchanged" in (
+            seeder.report()[0]
+        )
+
+    def test_invalid_rows_are_rejected_by_position(self):
+        rows = [
+            LEVELS[0],
+            {"code": "SEED_BAD", "label": "Bad", "progression_cap_percent": "-1"},
+        ]
+
+        with pytest.raises(ValidationError) as error:
+            upsert_levels(BulkSeeder(), rows)
+
+        assert set(error.value.message_dict) == {1}
+        assert not ExperienceLevel.objects.filter(code__startswith="SEED_").exists()
+
+    def test_resolve_names_the_missing_code(self):
+        with pytest.raises(ValidationError, match="TrainingGoal 'NOPE' not found"):
+            resolve({}, "NOPE", "TrainingGoal")
+
+
+class TestSeedDb:
+
+    def test_second_run_writes_nothing(self, settings, capsys):
+        settings.NINJA_API_KEY = None
+        call_command("seed_db")
+        assert Exercise.objects.exists()
+        assert JointContribution.objects.exists()
+        assert MuscleInvolvement.objects.exists()
+        capsys.readouterr()
+
+        writes = count_writes(
+            lambda: [
+                call_command(name)
+                for name in (
+                    "seed_users",
+                    "seed_programs",
+                    "seed_biology",
+                    "seed_exercises",
+                )
+            ]
+        )
+
+        assert writes == []
+        output = capsys.readouterr().out
+        assert "Error" not in output
+        diffs = [line for line in output.splitlines() if " created, " in line]
+        assert diffs
+        assert all(": 0 created, 0 updated, " in line for line in diffs)
+
+    def test_dry_run_leaves_the_database_untouched(self):
+        TrainingGoal.objects.all().delete()
+
+        call_command("seed_db", dry_run=True)
+
+        assert not TrainingGoal.objects.exists()
+        assert not Exercise.objects.exists()
+        assert ProgramStatusOption.objects.count() == 6
+
+    def test_dry_run_resolves_rows_earlier_seeds_would_create(self, settings, capsys):
+        settings.NINJA_API_KEY = None
+        ExperienceLevel.objects.all().delete()
+
+        call_command("seed_db", dry_run=True)
+
+        captured = capsys.readouterr()
+        assert "failed" not in captured.err
+        assert "Error" not in captured.out
+        assert "exercises.JointContribution: 0 created" not in captured.out
+        assert not ExperienceLevel.objects.exists()
+
+    def test_reseeding_keeps_exercise_edits(self, settings):
+        settings.NINJA_API_KEY = None
+        call_command("seed_db")
+        exercise = Exercise.objects.order_by("exercise_name").first()
+        Exercise.objects.filter(pk=exercise.pk).update(instructions="Edited.")
+
+        call_command("seed_exercises")
+
+        exercise.refresh_from_db()
+        assert exercise.instructions == "Edited."
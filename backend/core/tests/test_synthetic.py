@@ -0,0 +1,136 @@
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Max
+
+from apps.programs.constants import (
+    ProgramPhaseStatusesVocabulary,
+    ProgramStatusesVocabulary,
+)
+from apps.programs.models import Program, ProgramPhase
+from apps.users.models import CustomUser, TrainerClientMembership
+from apps.workouts.models import (
+    Workout,
+    WorkoutCompletionRecord,
+    WorkoutSet,
+    WorkoutSetCompletionRecord,
+)
+from core.synthetic import SyntheticDataset
+
+pytestmark = pytest.mark.django_db
+
+START = date(2026, 1, 5)
+CUTOFF = date(2026, 3, 9)
+OPTIONS = {
+    "trainers": 1,
+    "clients_per_trainer": 2,
+    "programs": 2,
+    "weeks": 5,
+    "sessions_per_week": 2,
+    "exercises_per_session": 2,
+    "sets_per_exercise": 3,
+    "start_date": START,
+    "skip_rate": 0.2,
+    "validate": True,
+}
+
+
+@pytest.fixture
+def reference_data():
+    call_command("seed_db")
+
+
+def generate(**overrides):
+    call_command("generate_load_dataset", **{**OPTIONS, **overrides})
+
+
+def dataset_rows():
+    return sorted(
+        WorkoutSetCompletionRecord.objects.values_list(
+            "pk",
+            "workout_set_id",
+            "is_skipped",
+            "reps_completed",
+            "weight_completed",
+            "completed_at",
+        )
+    )
+
+
+class TestSessionDays:
+
+    def test_spreads_sessions_across_the_week(self):
+        assert SyntheticDataset.session_days(3) == [0, 2, 4]
+        assert SyntheticDataset.session_days(7) == list(range(7))
+
+
+class TestGenerateLoadDataset:
+
+    def test_generates_the_requested_volume(self, reference_data):
+        generate()
+
+        assert CustomUser.objects.filter(email__endswith=".invalid").count() == 3
+        assert TrainerClientMembership.objects.filter(is_active=True).count() == 2
+        assert Workout.objects.count() == 2 * 2 * 5 * 2
+        assert WorkoutSet.objects.count() == 40 * 2 * 3
+        assert 0 < WorkoutSetCompletionRecord.objects.count() < 240
+
+    def test_history_follows_the_program_lifecycle(self, reference_data):
+        generate()
+
+        statuses = set(Program.objects.values_list("status__code", flat=True))
+        assert statuses == {
+            ProgramStatusesVocabulary.COMPLETED,
+            ProgramStatusesVocabulary.IN_PROGRESS,
+        }
+        assert ProgramPhase.objects.filter(
+            status__code=ProgramPhaseStatusesVocabulary.ACTIVE
+        ).exists()
+
+        # The final week of the ten is left in the future.
+        assert Workout.objects.filter(planned_date__gte=CUTOFF).exists()
+        assert not WorkoutCompletionRecord.objects.filter(
+            workout__planned_date__gte=CUTOFF
+        ).exists()
+
+        skipped = WorkoutCompletionRecord.objects.filter(is_skipped=True)
+        assert skipped.exists()
+        assert not skipped.filter(exercise_records__isnull=False).exists()
+
+    def test_prescribed_weights_progress(self, reference_data):
+        generate(programs=1, weeks=3)
+
+        first, last = (
+            WorkoutSet.objects.filter(
+                workout_exercise__workout__workout_name__endswith=f"Week {week}"
+            ).aggregate(total=Max("weight_prescribed"))["total"]
+            for week in (1, 3)
+        )
+        assert last > first
+
+    def test_same_seed_produces_the_same_rows(self, reference_data):
+        generate(seed=7)
+        rows = dataset_rows()
+        Program.objects.all().delete()
+        CustomUser.objects.filter(email__endswith=".invalid").delete()
+
+        generate(seed=7)
+
+        assert rows
+        assert dataset_rows() == rows
+
+    def test_rejects_a_seed_already_generated(self, reference_data):
+        generate()
+
+        with pytest.raises(CommandError, match="already exists"):
+            generate()
+
+    def test_rejects_invalid_counts(self):
+        with pytest.raises(CommandError):
+            generate(sessions_per_week=8)
+
+    def test_requires_reference_data(self):
+        with pytest.raises(CommandError, match="seed_db"):
+            generate()
@@ -0,0 +1,153 @@
+from decimal import Decimal
+from itertools import count
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.workouts.models import WorkoutSetCompletionRecord
+from core.constants import ValidationModeVocabulary
+from core.models import _validation_mode, uuid7, validation_mode
+from factories import (
+    WorkoutCompletionRecordFactory,
+    WorkoutExerciseCompletionRecordFactory,
+    WorkoutSetCompletionRecordFactory,
+    WorkoutSetFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def exercise_record(workout, workout_exercise, client_user):
+    session = WorkoutCompletionRecordFactory(workout=workout, client=client_user)
+    return WorkoutExerciseCompletionRecordFactory(
+        workout_completion_record=session, workout_exercise=workout_exercise
+    )
+
+
+@pytest.fixture
+def set_record(exercise_record, workout_set):
+    return WorkoutSetCompletionRecordFactory(
+        exercise_completion_record=exercise_record, workout_set=workout_set
+    )
+
+
+def count_queries(callback):
+    with CaptureQueriesContext(connection) as context:
+        callback()
+    return len(context.captured_queries)
+
+
+class TestValidationMode:
+
+    def test_full_is_the_default(self):
+        assert _validation_mode.get() == ValidationModeVocabulary.FULL
+
+    def test_mode_is_restored_after_the_block(self):
+        with validation_mode(ValidationModeVocabulary.FAST):
+            assert _validation_mode.get() == ValidationModeVocabulary.FAST
+
+        assert _validation_mode.get() == ValidationModeVocabulary.FULL
+
+    def test_can_decorate_a_function(self):
+        @validation_mode(ValidationModeVocabulary.SKIP)
+        def current():
+            return _validation_mode.get()
+
+        assert current() == ValidationModeVocabulary.SKIP
+        assert _validation_mode.get() == ValidationModeVocabulary.FULL
+
+
+class TestValidateForSave:
+
+    def test_fast_mode_skips_database_checks(self, set_record):
+        set_record.reps_completed = 8
+
+        full = count_queries(lambda: set_record.save(update_fields=["reps_completed"]))
+        with validation_mode(ValidationModeVocabulary.FAST):
+            fast = count_queries(
+                lambda: set_record.save(update_fields=["reps_completed"])
+            )
+
+        assert fast == 1
+        assert full > fast
+
+    def test_fast_mode_still_runs_model_rules(self, set_record):
+        set_record.reps_completed = 0
+
+        with validation_mode(ValidationModeVocabulary.FAST):
+            with pytest.raises(ValidationError):
+                set_record.save(update_fields=["reps_completed"])
+
+    def test_fast_mode_validates_touched_fields(self, set_record):
+        set_record.weight_completed = Decimal("123456.00")
+
+        with validation_mode(ValidationModeVocabulary.FAST):
+            with pytest.raises(ValidationError):
+                set_record.save(update_fields=["weight_completed"])
+
+    def test_full_mode_validates_untouched_fields(self, set_record):
+        set_record.weight_completed = Decimal("123456.00")
+
+        with pytest.raises(ValidationError):
+            set_record.save(update_fields=["reps_completed"])
+
+    def test_skip_mode_runs_nothing(self, set_record):
+        set_record.reps_completed = 0
+
+        with validation_mode(ValidationModeVocabulary.SKIP):
+            set_record.save(update_fields=["reps_completed"])
+
+        set_record.refresh_from_db()
+        assert set_record.reps_completed == 0
+
+
+class TestCleanBulk:
+
+    set_orders = count(start=2)
+
+    def build(self, exercise_record, workout_exercise, **overrides):
+        fields = {
+            "exercise_completion_record": exercise_record,
+            "workout_set": WorkoutSetFactory(
+                workout_exercise=workout_exercise, set_order=next(self.set_orders)
+            ),
+            "reps_completed": 5,
+            "weight_completed": Decimal("80.00"),
+        }
+        fields.update(overrides)
+        return WorkoutSetCompletionRecordFactory.build(**fields)
+
+    def test_valid_instances_cost_one_query_per_foreign_key(
+        self, exercise_record, workout_exercise
+    ):
+        records = [self.build(exercise_record, workout_exercise) for _ in range(10)]
+
+        queries = count_queries(lambda: WorkoutSetCompletionRecord.clean_bulk(records))
+
+        assert queries == 2
+
+    def test_errors_are_keyed_by_position(self, exercise_record, workout_exercise):
+        missing_set = self.build(exercise_record, workout_exercise)
+        missing_set.workout_set_id = uuid7()
+        records = [
+            self.build(exercise_record, workout_exercise),
+            self.build(exercise_record, workout_exercise, reps_completed=0),
+            missing_set,
+        ]
+
+        with pytest.raises(ValidationError) as error:
+            WorkoutSetCompletionRecord.clean_bulk(records)
+
+        assert set(error.value.message_dict) == {1, 2}
+        assert "does not exist" in error.value.message_dict[2][0]
+
+    def test_excluded_relations_are_not_checked(
+        self, exercise_record, workout_exercise
+    ):
+        record = self.build(exercise_record, workout_exercise)
+        record.workout_set_id = uuid7()
+
+        WorkoutSetCompletionRecord.clean_bulk([record], exclude=["workout_set"])
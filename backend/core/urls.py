@@ -1,15 +1,27 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
+
+from apps.users.views import CachedUserDetailsView
+
+from .views import ReferenceBundleView, metrics_view
 
 api_base = "api/v1"
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path(settings.METRICS_PATH.lstrip("/"), metrics_view, name="metrics"),
     # Auth Endpoints
+    re_path(
+        rf"^{api_base}/auth/user/?$",
+        CachedUserDetailsView.as_view(),
+        name="rest_user_details",
+    ),
     path(f"{api_base}/auth/", include("dj_rest_auth.urls")),
     path(f"{api_base}/auth/registration/", include("dj_rest_auth.registration.urls")),
+    # Reference Data Endpoints
+    path(f"{api_base}/reference/", ReferenceBundleView.as_view(), name="reference"),
     # App Endpoints
     path(f"{api_base}/users/", include("apps.users.urls")),
     path(f"{api_base}/programs/", include("apps.programs.urls")),
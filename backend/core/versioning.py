@@ -0,0 +1,79 @@
+"""Database-backed version stamps for cached representations.
+
+Caches that serve a representation under a version, and ETags derived from
+it, are only correct if every process sees the same version. Per-process
+and per-service caches (LocMem, a file cache in one container's /tmp) do
+not share writes, so the versions live in the VersionStamp table instead:
+a bump from a gunicorn worker, a background worker or a management
+command is seen by every other process on its next read.
+
+Reading a stamp that was never bumped does not write. It reports
+INITIAL_VERSION, so a GET never creates rows.
+"""
+
+import uuid
+
+from .models import VersionStamp
+
+INITIAL_VERSION = "0"
+
+
+def get_version_stamps(keys) -> dict:
+    """Fetches the current stamps of several keys in one query.
+
+    Args:
+        keys: The stamp keys.
+
+    Returns:
+        dict: Keyed by stamp key, each a dict with the opaque "version"
+            string and the "updated_at" Unix timestamp of the last bump
+            (0 for keys never bumped).
+    """
+    keys = list(keys)
+    stamps = {
+        key: {"version": version, "updated_at": int(updated_at.timestamp())}
+        for key, version, updated_at in VersionStamp.objects.filter(
+            key__in=keys
+        ).values_list("key", "version", "updated_at")
+    }
+    for key in keys:
+        stamps.setdefault(key, {"version": INITIAL_VERSION, "updated_at": 0})
+    return stamps
+
+
+def get_version_stamp(key) -> dict:
+    """Fetches the current stamp of one key.
+
+    Args:
+        key: The stamp key.
+
+    Returns:
+        dict: The stamp, as returned by get_version_stamps.
+    """
+    return get_version_stamps([key])[key]
+
+
+def bump_version_stamps(keys) -> dict:
+    """Replaces the stamps of several keys in one upsert.
+
+    Args:
+        keys: The stamp keys.
+
+    Returns:
+        dict: The new stamps, keyed by stamp key.
+    """
+    rows = [
+        VersionStamp(key=key, version=uuid.uuid4().hex) for key in dict.fromkeys(keys)
+    ]
+    if rows:
+        VersionStamp.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["key"],
+            update_fields=["version", "updated_at"],
+        )
+    # bulk_create sets updated_at on each row, as save() would.
+    return {
+        row.key: {"version": row.version, "updated_at": int(row.updated_at.timestamp())}
+        for row in rows
+    }
@@ -1,16 +1,229 @@
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.crypto import constant_time_compare
+from django.utils.http import http_date, quote_etag
 from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import SAFE_METHODS, AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from .metrics import registry
+from .reference_data import (
+    get_reference_bundle,
+    get_reference_version,
+    reference_cache_control,
+    reference_cache_key,
+)
+from .routers import current_routing_state, is_pinned_to_primary
+
 
 class ApexReadOnlyModelViewSet(ReadOnlyModelViewSet):
     ordering_fields = ["created_at", "updated_at", "id"]
     ordering = ["id"]
 
 
-class NormalisedLookupViewSet(ReadOnlyModelViewSet):
+class ValuesListMixin:
+    """Serves a view's list action from values() rows.
+
+    The filtered queryset is projected and paginated as usual, and the page
+    is mapped by values_serializer_class instead of instantiating models and
+    running serializer_class per row. Other actions are unaffected.
+
+    Attributes:
+        values_serializer_class: ValuesSerializer mirroring serializer_class.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.values_serializer_class
+        queryset = values_serializer.project(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(values_serializer.serialize(page))
+        return Response(values_serializer.serialize(queryset))
+
+
+class ReplicaReadsMixin:
+    """Serves a view's safe-method requests from the read replica.
+
+    Applies once authentication has run, and only to GET, HEAD and OPTIONS.
+    Reads still go to the primary after the request writes, and for users
+    who wrote within REPLICA_MAX_LAG_SECONDS. See core.routers.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        state = current_routing_state()
+        if (
+            state is not None
+            and request.method in SAFE_METHODS
+            and not is_pinned_to_primary(request.user)
+        ):
+            state.replica_reads = True
+
+
+class AsyncAPIViewMixin:
+    """Lets a DRF API view define its handlers as coroutines.
+
+    DRF's dispatch is synchronous, so this mixin replaces it for views
+    whose get/post/... handlers are async def. Authentication, permission
+    and throttle checks still run synchronously, in the request's
+    thread-sensitive executor thread, before the handler is awaited. Under
+    ASGI the view then runs on the event loop without holding a thread;
+    under WSGI Django runs it with async_to_sync.
+
+    Handlers must not trigger queries directly; use the async ORM or
+    core.concurrency.gather_reads.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            method = request.method.lower()
+            handler = self.http_method_not_allowed
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        return await sync_to_async(super().options)(request, *args, **kwargs)
+
+
+class ReferenceDataCacheMixin:
+    """Serves read-only reference data with HTTP and server-side caching.
+
+    Responses carry an ETag and Last-Modified derived from the reference data
+    version stamp, so unchanged clients get a 304 without the queryset being
+    touched. Serialized payloads are cached per URL and media type under the
+    same version, so a lookup write invalidates both layers at once.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._reference_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._reference_response(request, super().retrieve, *args, **kwargs)
+
+    def _reference_response(self, request, handler, *args, **kwargs):
+        stamp = get_reference_version()
+        representation = (request.accepted_media_type, request.build_absolute_uri())
+        key = reference_cache_key(stamp["version"], *representation)
+        etag = quote_etag(key.rsplit(":", 1)[-1])
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=stamp["updated_at"]
+        )
+        if not_modified is not None:
+            return self._with_reference_headers(not_modified, etag, stamp)
+
+        data = cache.get(key)
+        if data is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            data = response.data
+            cache.set(key, data, timeout=settings.REFERENCE_DATA_CACHE_TIMEOUT)
+
+        return self._with_reference_headers(Response(data), etag, stamp)
+
+    @staticmethod
+    def _with_reference_headers(response, etag, stamp):
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(stamp["updated_at"])
+        response["Cache-Control"] = reference_cache_control()
+        return response
+
+
+class NormalisedLookupViewSet(
+    ReplicaReadsMixin, ReferenceDataCacheMixin, ReadOnlyModelViewSet
+):
     permission_classes = [AllowAny]
     filter_backends = [SearchFilter, OrderingFilter]
     search_fields = ["code", "label", "description"]
     ordering_fields = ["order_index", "label", "code"]
     ordering = ["order_index", "label"]
+
+
+class ReferenceBundleView(ReplicaReadsMixin, APIView):
+    """Serves every lookup table the frontend needs on boot in one response.
+
+    The bundle is built once per reference data version and cached as
+    pre-encoded JSON, with a gzip copy for clients that accept it. Its content
+    hash is the ETag, so re-seeding identical data keeps client caches valid.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        bundle = get_reference_bundle()
+        etag = quote_etag(bundle["hash"])
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+                response = HttpResponse(
+                    bundle["gzip_body"], content_type="application/json"
+                )
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(bundle["body"], content_type="application/json")
+
+        response["ETag"] = etag
+        response["Cache-Control"] = reference_cache_control()
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+
+def metrics_view(request):
+    """Serves the metrics of every worker in the Prometheus text format.
+
+    Args:
+        request: The scrape request.
+
+    Returns:
+        HttpResponse: The exposition document, or 403 when the request does
+            not carry METRICS_TOKEN as a bearer token. Outside production
+            the endpoint is open while METRICS_TOKEN is unset; in production
+            it is closed until the token is configured.
+
+    Raises:
+        Http404: If metrics are disabled.
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    if settings.METRICS_TOKEN or settings.IS_PROD:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not settings.METRICS_TOKEN or not constant_time_compare(
+            request.headers.get("Authorization", ""), expected
+        ):
+            return HttpResponse(status=403)
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )